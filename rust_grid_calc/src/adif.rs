@@ -11,6 +11,10 @@ use std::collections::HashMap;
 
 /// Parse ADIF (.adi) text format file
 /// 
+/// Produces exactly what the Python reference (src.adif.parser.parse_adi_content)
+/// returns. The text is scanned with the GIL released; only building the
+/// result dicts needs it.
+/// 
 /// Args:
 ///     content: String content of ADI file
 /// 
@@ -20,33 +24,76 @@ use std::collections::HashMap;
 ///       header: Dict with header fields
 #[pyfunction]
 pub fn parse_adi<'py>(py: Python<'py>, content: &str) -> PyResult<(Vec<Bound<'py, PyDict>>, Bound<'py, PyDict>)> {
-    // Split header and records at <EOH>
-    let (header_str, records_str) = if let Some(pos) = content.find("<EOH>") {
-        let (h, r) = content.split_at(pos);
-        (h, &r[5..]) // Skip "<EOH>"
-    } else {
-        ("", content)
-    };
+    let (header_fields, record_fields) = py.allow_threads(|| {
+        // Split header and records at <EOH>
+        let (header_str, records_str) = match content.find("<EOH>") {
+            Some(pos) => (&content[..pos], &content[pos + 5..]),
+            None => ("", content),
+        };
 
-    // Parse header
-    let header = parse_fields_internal(py, header_str)?;
+        let records: Vec<Vec<(&str, &str)>> = records_str
+            .split("<EOR>")
+            .map(scan_adi_fields)
+            .filter(|fields| !fields.is_empty())
+            .collect();
+        (scan_adi_fields(header_str), records)
+    });
 
-    // Parse records (split by <EOR>)
-    let mut records = Vec::new();
-    
-    for record_str in records_str.split("<EOR>") {
-        let trimmed = record_str.trim();
-        if trimmed.is_empty() {
+    let header = fields_to_dict(py, &header_fields)?;
+    let records = record_fields
+        .iter()
+        .map(|fields| fields_to_dict(py, fields))
+        .collect::<PyResult<Vec<_>>>()?;
+
+    Ok((records, header))
+}
+
+/// Scan <FIELDNAME:length>value fields the way the Python reference pattern
+/// <([A-Z_0-9]+):(\d+)>([^<]*) does: the value runs to the next '<' and is
+/// kept untrimmed; tags that don't match (e.g. with a type specifier) are skipped
+fn scan_adi_fields(text: &str) -> Vec<(&str, &str)> {
+    let bytes = text.as_bytes();
+    let mut fields = Vec::new();
+    let mut pos = 0;
+
+    while let Some(offset) = text[pos..].find('<') {
+        let name_start = pos + offset + 1;
+        pos = name_start;
+
+        let mut i = name_start;
+        while i < bytes.len() && (bytes[i].is_ascii_uppercase() || bytes[i].is_ascii_digit() || bytes[i] == b'_') {
+            i += 1;
+        }
+        if i == name_start || i >= bytes.len() || bytes[i] != b':' {
             continue;
         }
-        
-        let record = parse_fields_internal(py, trimmed)?;
-        if !record.is_empty() {
-            records.push(record);
+        let name_end = i;
+
+        i += 1;
+        let length_start = i;
+        while i < bytes.len() && bytes[i].is_ascii_digit() {
+            i += 1;
         }
+        if i == length_start || i >= bytes.len() || bytes[i] != b'>' {
+            continue;
+        }
+
+        let value_start = i + 1;
+        let value_end = text[value_start..].find('<').map_or(text.len(), |o| value_start + o);
+        fields.push((&text[name_start..name_end], &text[value_start..value_end]));
+        pos = value_end;
     }
 
-    Ok((records, header))
+    fields
+}
+
+/// Build a dict from scanned fields (later duplicates win, like the reference)
+fn fields_to_dict<'py>(py: Python<'py>, fields: &[(&str, &str)]) -> PyResult<Bound<'py, PyDict>> {
+    let dict = PyDict::new_bound(py);
+    for (name, value) in fields {
+        dict.set_item(*name, *value)?;
+    }
+    Ok(dict)
 }
 
 /// Parse ADIF fields from a string (internal implementation)
@@ -287,6 +334,12 @@ mod tests {
         });
     }
 
+    #[test]
+    fn test_scan_adi_fields() {
+        let fields = scan_adi_fields("<CALL:5>W4GNS <call:3>K3Y <QSO_DATE:8:D>20240101 <NAME:0><BAND:3>40M");
+        assert_eq!(fields, vec![("CALL", "W4GNS "), ("NAME", ""), ("BAND", "40M")]);
+    }
+
     #[test]
     fn test_parse_multiple_fields() {
         let text = "<CALL:5>W4GNS<QSO_DATE:8>20240101<TIME_ON:4>1234";
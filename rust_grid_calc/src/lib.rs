@@ -1,5 +1,4 @@
 use pyo3::prelude::*;
-use std::f64::consts::PI;
 
 mod awards;
 use awards::{
@@ -18,74 +17,78 @@ use adif::{
     batch_parse_records, validate_record
 };
 
-/// Convert degrees to radians
+const EARTH_RADIUS_KM: f64 = 6371.0;
+
+/// Maidenhead letter index ('A'..=last, case-insensitive)
 #[inline]
-fn deg_to_rad(degrees: f64) -> f64 {
-    degrees * PI / 180.0
+fn letter_index(c: char, last: char) -> Option<f64> {
+    let c = c.to_ascii_uppercase();
+    if ('A'..=last).contains(&c) {
+        Some((c as u32 - 'A' as u32) as f64)
+    } else {
+        None
+    }
 }
 
-/// Convert Maidenhead grid square to latitude/longitude
-/// 
-/// Supports 4, 6, 8, or 10 character grid squares
-/// Returns (latitude, longitude) in degrees
-fn grid_to_latlon(grid: &str) -> PyResult<(f64, f64)> {
-    let grid = grid.to_uppercase();
-    let chars: Vec<char> = grid.chars().collect();
-    
-    if chars.len() < 4 || chars.len() > 10 {
-        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-            format!("Grid square must be 4, 6, 8, or 10 characters, got {}", chars.len())
-        ));
+/// Convert Maidenhead grid square to the latitude/longitude of its center
+///
+/// Matches src.utils.geodesy.grid_to_latlon (the Python reference): 2, 4, 6
+/// or 8 characters, case-insensitive, center of the smallest square given.
+/// Returns (latitude, longitude) in degrees, or None if the grid is invalid
+fn grid_to_latlon(grid: &str) -> Option<(f64, f64)> {
+    let chars: Vec<char> = grid.trim().chars().collect();
+    if ![2, 4, 6, 8].contains(&chars.len()) {
+        return None;
+    }
+    let digit = |c: char| c.to_digit(10).map(|d| d as f64);
+
+    // Field: 20° longitude, 10° latitude
+    let mut lon = letter_index(chars[0], 'R')? * 20.0 - 180.0;
+    let mut lat = letter_index(chars[1], 'R')? * 10.0 - 90.0;
+    let mut size = (20.0, 10.0);
+
+    // Square: 2° longitude, 1° latitude
+    if chars.len() >= 4 {
+        lon += digit(chars[2])? * 2.0;
+        lat += digit(chars[3])? * 1.0;
+        size = (2.0, 1.0);
     }
 
-    // Field (first 2 characters): 20° longitude, 10° latitude
-    let lon_field = (chars[0] as i32 - 'A' as i32) as f64 * 20.0;
-    let lat_field = (chars[1] as i32 - 'A' as i32) as f64 * 10.0;
-
-    // Square (characters 3-4): 2° longitude, 1° latitude
-    let lon_square = chars[2].to_digit(10).ok_or_else(|| {
-        PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid grid square digit")
-    })? as f64 * 2.0;
-    let lat_square = chars[3].to_digit(10).ok_or_else(|| {
-        PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid grid square digit")
-    })? as f64 * 1.0;
-
-    let mut lon = -180.0 + lon_field + lon_square;
-    let mut lat = -90.0 + lat_field + lat_square;
-
-    // Subsquare (characters 5-6): 5' longitude, 2.5' latitude
+    // Subsquare: 5' longitude, 2.5' latitude
     if chars.len() >= 6 {
-        let lon_subsq = (chars[4] as i32 - 'A' as i32) as f64 * (2.0 / 24.0);
-        let lat_subsq = (chars[5] as i32 - 'A' as i32) as f64 * (1.0 / 24.0);
-        lon += lon_subsq;
-        lat += lat_subsq;
+        lon += letter_index(chars[4], 'X')? * (2.0 / 24.0);
+        lat += letter_index(chars[5], 'X')? * (1.0 / 24.0);
+        size = (2.0 / 24.0, 1.0 / 24.0);
     }
 
-    // Extended square (characters 7-8)
-    if chars.len() >= 8 {
-        let lon_ext = chars[6].to_digit(10).ok_or_else(|| {
-            PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid extended square digit")
-        })? as f64 * (2.0 / 240.0);
-        let lat_ext = chars[7].to_digit(10).ok_or_else(|| {
-            PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid extended square digit")
-        })? as f64 * (1.0 / 240.0);
-        lon += lon_ext;
-        lat += lat_ext;
+    // Extended square
+    if chars.len() == 8 {
+        lon += digit(chars[6])? * (2.0 / 240.0);
+        lat += digit(chars[7])? * (1.0 / 240.0);
+        size = (2.0 / 240.0, 1.0 / 240.0);
     }
 
-    // Super extended (characters 9-10)
-    if chars.len() >= 10 {
-        let lon_super = (chars[8] as i32 - 'A' as i32) as f64 * (2.0 / 5760.0);
-        let lat_super = (chars[9] as i32 - 'A' as i32) as f64 * (1.0 / 5760.0);
-        lon += lon_super;
-        lat += lat_super;
-    }
+    Some((lat + size.1 / 2.0, lon + size.0 / 2.0))
+}
 
-    // Center of grid square
-    lon += 1.0;
-    lat += 0.5;
+/// Parse a grid square, raising ValueError if it is invalid
+fn require_grid(grid: &str) -> PyResult<(f64, f64)> {
+    grid_to_latlon(grid).ok_or_else(|| {
+        PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid grid square: {}", grid))
+    })
+}
 
-    Ok((lat, lon))
+/// Great circle distance in kilometers (Haversine, same operation order as
+/// src.utils.geodesy.haversine_km)
+#[inline]
+fn haversine_km((lat1, lon1): (f64, f64), (lat2, lon2): (f64, f64)) -> f64 {
+    let phi1 = lat1.to_radians();
+    let phi2 = lat2.to_radians();
+    let dphi = phi2 - phi1;
+    let dlambda = (lon2 - lon1).to_radians();
+
+    let a = (dphi / 2.0).sin().powi(2) + phi1.cos() * phi2.cos() * (dlambda / 2.0).sin().powi(2);
+    2.0 * EARTH_RADIUS_KM * a.sqrt().min(1.0).asin()
 }
 
 /// Calculate great circle distance using Haversine formula
@@ -98,46 +101,29 @@ fn grid_to_latlon(grid: &str) -> PyResult<(f64, f64)> {
 ///     Distance in kilometers
 #[pyfunction]
 fn calculate_distance(grid1: &str, grid2: &str) -> PyResult<f64> {
-    let (lat1, lon1) = grid_to_latlon(grid1)?;
-    let (lat2, lon2) = grid_to_latlon(grid2)?;
-
-    // Earth radius in kilometers
-    const EARTH_RADIUS: f64 = 6371.0;
-
-    let lat1_rad = deg_to_rad(lat1);
-    let lat2_rad = deg_to_rad(lat2);
-    let delta_lat = deg_to_rad(lat2 - lat1);
-    let delta_lon = deg_to_rad(lon2 - lon1);
-
-    let a = (delta_lat / 2.0).sin().powi(2)
-        + lat1_rad.cos() * lat2_rad.cos() * (delta_lon / 2.0).sin().powi(2);
-    
-    let c = 2.0 * a.sqrt().atan2((1.0 - a).sqrt());
-    let distance = EARTH_RADIUS * c;
-
-    Ok(distance)
+    Ok(haversine_km(require_grid(grid1)?, require_grid(grid2)?))
 }
 
 /// Batch calculate distances for multiple grid pairs
 /// 
+/// The GIL is released for the whole batch, so other Python threads keep
+/// running while it is computed.
+/// 
 /// Args:
 ///     home_grid: Home station grid square
-///     grids: List of contact grid squares
+///     grids: List of contact grid squares (None allowed)
 /// 
 /// Returns:
 ///     List of distances in kilometers (None for invalid grids)
 #[pyfunction]
-fn batch_calculate_distances(home_grid: &str, grids: Vec<String>) -> PyResult<Vec<Option<f64>>> {
-    let mut results = Vec::with_capacity(grids.len());
-    
-    for grid in grids.iter() {
-        match calculate_distance(home_grid, grid) {
-            Ok(dist) => results.push(Some(dist)),
-            Err(_) => results.push(None),
-        }
-    }
-    
-    Ok(results)
+fn batch_calculate_distances(py: Python<'_>, home_grid: &str, grids: Vec<Option<String>>) -> PyResult<Vec<Option<f64>>> {
+    Ok(py.allow_threads(|| {
+        let home = grid_to_latlon(home_grid);
+        grids
+            .iter()
+            .map(|grid| Some(haversine_km(home?, grid_to_latlon(grid.as_deref()?)?)))
+            .collect()
+    }))
 }
 
 /// Calculate bearing from grid1 to grid2
@@ -146,12 +132,12 @@ fn batch_calculate_distances(home_grid: &str, grids: Vec<String>) -> PyResult<Ve
 ///     Bearing in degrees (0-360)
 #[pyfunction]
 fn calculate_bearing(grid1: &str, grid2: &str) -> PyResult<f64> {
-    let (lat1, lon1) = grid_to_latlon(grid1)?;
-    let (lat2, lon2) = grid_to_latlon(grid2)?;
+    let (lat1, lon1) = require_grid(grid1)?;
+    let (lat2, lon2) = require_grid(grid2)?;
 
-    let lat1_rad = deg_to_rad(lat1);
-    let lat2_rad = deg_to_rad(lat2);
-    let delta_lon = deg_to_rad(lon2 - lon1);
+    let lat1_rad = lat1.to_radians();
+    let lat2_rad = lat2.to_radians();
+    let delta_lon = (lon2 - lon1).to_radians();
 
     let y = delta_lon.sin() * lat2_rad.cos();
     let x = lat1_rad.cos() * lat2_rad.sin()
@@ -205,17 +191,23 @@ mod tests {
 
     #[test]
     fn test_grid_to_latlon() {
-        // FM06ew (W4GNS location)
+        // Center of the FM06ew subsquare
         let (lat, lon) = grid_to_latlon("FM06ew").unwrap();
-        assert!((lat - 36.229).abs() < 0.1);
-        assert!((lon - (-86.729)).abs() < 0.1);
+        assert!((lat - 36.9375).abs() < 1e-9);
+        assert!((lon - (-79.625)).abs() < 1e-9);
+
+        // Case-insensitive; 2-character fields; invalid letters rejected
+        assert_eq!(grid_to_latlon("fm06EW"), grid_to_latlon("FM06ew"));
+        assert_eq!(grid_to_latlon("FN"), Some((45.0, -70.0)));
+        assert_eq!(grid_to_latlon("ZZ00"), None);
+        assert_eq!(grid_to_latlon("FN2"), None);
     }
 
     #[test]
     fn test_distance_calculation() {
-        // FM06ew to EM29nf (roughly Nashville to Atlanta area)
+        // FM06ew (Virginia) to EM29nf (Kansas City area)
         let dist = calculate_distance("FM06ew", "EM29nf").unwrap();
-        assert!(dist > 900.0 && dist < 1100.0); // ~1000 km
+        assert!((dist - 1357.108).abs() < 0.01);
     }
 
     #[test]
@@ -16,19 +16,77 @@ Supports generating applications for:
 - SKCC DX
 
 Each application is formatted according to award-specific submission requirements.
+generate_all_applications() builds any set of them from one pass over the log.
 """
 
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Any, NamedTuple, Optional, Set, Tuple
 from pathlib import Path
 
 from src.database.repository import DatabaseRepository
 from src.database.models import Contact
+from src.database.read_model import ContactRecord
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Application keys and award names, in the order a full batch is generated
+APPLICATION_AWARDS: Dict[str, str] = {
+    'centurion': 'Centurion',
+    'tribune': 'Tribune',
+    'senator': 'Senator',
+    'was': 'WAS',
+    'wac': 'WAC',
+    'rag_chew': 'Rag Chew',
+    'dxcc': 'DXCC',
+    'canadian_maple': 'Canadian Maple',
+    'pfx': 'PFX',
+    'triple_key': 'Triple Key',
+    'skcc_dx': 'SKCC DX',
+}
+
+# Member awards whose credited contacts come from the award timeline replay
+TIMELINE_AWARDS = ('centurion', 'tribune', 'senator')
+
+# Applications with an official SKCC submission form
+OFFICIAL_FORMS = ('centurion', 'tribune')
+
+FILE_EXTENSIONS = {'text': 'txt', 'skcc': 'txt', 'csv': 'csv', 'html': 'html'}
+
+
+class SharedPass(NamedTuple):
+    """Contacts loaded once for a batch and the qualifying contacts per award"""
+
+    records: List[ContactRecord]
+    qualified: Dict[str, List[ContactRecord]]
+
+
+def render_application(
+    my_callsign: str,
+    my_skcc: str,
+    application_data: Dict[str, Any],
+    format: str,
+    official_form: Optional[str] = None
+) -> str:
+    """
+    Render collected application data (runs in batch worker processes)
+
+    Args:
+        my_callsign: Operator's call sign
+        my_skcc: Operator's SKCC number
+        application_data: Data collected by the generator
+        format: Output format ('text', 'csv', 'html', 'skcc')
+        official_form: Award key of the official SKCC form, if it has one
+
+    Returns:
+        Formatted application
+    """
+    generator = AwardApplicationGenerator(None, my_callsign, my_skcc)
+    return generator._render(application_data, format, official_form)
+
 
 class AwardApplicationGenerator:
     """Generate award applications for all SKCC awards"""
@@ -45,62 +103,186 @@ class AwardApplicationGenerator:
         self.db = db
         self.my_callsign = my_callsign
         self.my_skcc = my_skcc
+        self._shared: Optional[SharedPass] = None  # Set while a batch is generated
 
-    def generate_centurion_application(self, format: str = 'text') -> str:
+    def generate_all_applications(
+        self,
+        format: str = 'text',
+        awards: Optional[Iterable[str]] = None,
+        output_dir: Optional[str] = None,
+        max_workers: int = 0
+    ) -> Dict[str, str]:
         """
-        Generate Centurion award application (100+ SKCC members)
+        Generate several award applications from one pass over the log
+
+        The log is loaded once in date order and every contact is offered to
+        each award's qualifier in the same loop, instead of one scan per award.
 
         Args:
-            format: Output format ('text', 'csv', 'html')
+            format: Output format ('text', 'csv', 'html', 'skcc')
+            awards: Application keys (see APPLICATION_AWARDS); None for all
+            output_dir: If set, each application is written to <key>_application.<ext> here
+            max_workers: Worker processes rendering the documents; 0 renders in
+                this process (rendering is cheap next to process start-up on small logs)
 
         Returns:
-            Formatted application
+            Application text per key; an error message for any that failed
+
+        Raises:
+            ValueError: If an award key is unknown
         """
+        keys = list(awards) if awards is not None else list(APPLICATION_AWARDS)
+        unknown = [key for key in keys if key not in APPLICATION_AWARDS]
+        if unknown:
+            raise ValueError(f"Unknown award applications: {', '.join(unknown)}")
+
+        results: Dict[str, str] = {}
+        collected: Dict[str, Dict[str, Any]] = {}
         session = self.db.get_session()
         try:
-            from src.awards.centurion import CenturionAward
-            centurion = CenturionAward(session)
-
-            contacts = self._get_award_contacts(session, 'centurion')
-            progress = self._calculate_progress(session, contacts, centurion)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'Centurion',
-                'award_manager': 'See SKCC website for current manager',
-                'requirement': f"100 unique SKCC members (Current: {progress['current']})",
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'Both operators must hold SKCC membership at time of contact',
-                    'CW mode only',
-                    'SKCC number exchange required',
-                    'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
-                    'Club calls and special event calls don\'t count after Dec 1, 2009',
-                    'Any band allowed',
-                    'Each call sign counts only once'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            elif format.lower() == 'skcc':
-                result = self._format_application_skcc_official(application_data, 'centurion')
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+            self._shared = self._qualify_contacts(session, keys)
+            for key in keys:
+                try:
+                    collected[key] = getattr(self, f"_{key}_application_data")(session)
+                except Exception as e:
+                    logger.error(f"Error generating {APPLICATION_AWARDS[key]} application: {e}", exc_info=True)
+                    results[key] = f"Error generating application: {str(e)}"
+        finally:
+            self._shared = None
+            session.close()
+
+        jobs = [
+            (key, data, format, key if key in OFFICIAL_FORMS else None)
+            for key, data in collected.items()
+        ]
+        if max_workers > 1 and len(jobs) > 1:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+                futures = {
+                    key: pool.submit(render_application, self.my_callsign, self.my_skcc, data, fmt, form)
+                    for key, data, fmt, form in jobs
+                }
+                for key, future in futures.items():
+                    results[key] = future.result()
+        else:
+            for key, data, fmt, form in jobs:
+                results[key] = self._render(data, fmt, form)
+
+        if output_dir:
+            extension = FILE_EXTENSIONS.get(format.lower(), 'txt')
+            for key in collected:
+                self.export_application_to_file(
+                    results[key], str(Path(output_dir) / f"{key}_application.{extension}")
+                )
+
+        logger.info(f"Generated {len(collected)} of {len(keys)} award applications from one pass")
+        return {key: results[key] for key in keys}
+
+    def _qualify_contacts(self, session: Session, keys: List[str]) -> SharedPass:
+        """
+        Load the log once and fan each contact out to the award qualifiers
+
+        Args:
+            session: Database session (award classes read member data from it)
+            keys: Application keys of the batch
 
+        Returns:
+            Shared records and the qualifying contacts per award
+        """
+        records = self.db.get_contact_records(order_by=(Contact.qso_date, Contact.time_on))
+        qualifiers = [
+            (key, self._award_instance(session, key)) for key in keys if key not in TIMELINE_AWARDS
+        ]
+        qualified: Dict[str, List[ContactRecord]] = {key: [] for key, _ in qualifiers}
+        for record in records:
+            for key, award in qualifiers:
+                if award.validate(record):
+                    qualified[key].append(record)
+        return SharedPass(records, qualified)
+
+    def _generate(
+        self,
+        award_name: str,
+        collect,
+        format: str,
+        official_form: Optional[str] = None
+    ) -> str:
+        """
+        Collect one application's data and render it
+
+        Args:
+            award_name: Award name for log messages
+            collect: Method taking a session and returning the application data
+            format: Output format ('text', 'csv', 'html', 'skcc')
+            official_form: Award key of the official SKCC form, if it has one
+
+        Returns:
+            Formatted application
+        """
+        session = self.db.get_session()
+        try:
+            return self._render(collect(session), format, official_form)
         except Exception as e:
-            logger.error(f"Error generating Centurion application: {e}", exc_info=True)
+            logger.error(f"Error generating {award_name} application: {e}", exc_info=True)
             raise
         finally:
             session.close()
 
+    def _render(
+        self,
+        application_data: Dict[str, Any],
+        format: str,
+        official_form: Optional[str] = None
+    ) -> str:
+        """Format application data ('skcc' falls back to text without an official form)"""
+        if format.lower() == 'csv':
+            return self._format_application_csv(application_data)
+        elif format.lower() == 'html':
+            return self._format_application_html(application_data)
+        elif format.lower() == 'skcc' and official_form:
+            return self._format_application_skcc_official(application_data, official_form)
+        return self._format_application_text(application_data)
+
+    def generate_centurion_application(self, format: str = 'text') -> str:
+        """
+        Generate Centurion award application (100+ SKCC members)
+
+        Args:
+            format: Output format ('text', 'csv', 'html')
+
+        Returns:
+            Formatted application
+        """
+        return self._generate('Centurion', self._centurion_application_data, format, official_form='centurion')
+
+    def _centurion_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the Centurion application data"""
+        contacts = self._get_award_contacts(session, 'centurion')
+        progress = self._timeline_progress('centurion', 100)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'Centurion',
+            'award_manager': 'See SKCC website for current manager',
+            'requirement': f"100 unique SKCC members (Current: {progress['current']})",
+            'endorsement': progress['endorsement'],
+            'milestones': progress['milestones'],
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'Both operators must hold SKCC membership at time of contact',
+                'CW mode only',
+                'SKCC number exchange required',
+                'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
+                'Club calls and special event calls don\'t count after Dec 1, 2009',
+                'Any band allowed',
+                'Each call sign counts only once'
+            ]
+        }
+
+        return application_data
+
     def generate_tribune_application(
         self,
         format: str = 'text',
@@ -118,59 +300,43 @@ class AwardApplicationGenerator:
         Returns:
             Formatted application
         """
-        session = self.db.get_session()
-        try:
-            from src.awards.tribune import TribuneAward
-            tribune = TribuneAward(session)
-
-            # Get official Tribune achievement date from database (not user input)
-            tribune_progress = self.db.analyze_tribune_award_progress()
-            official_achievement_date = tribune_progress.get('tribune_achievement_date')
-
-            contacts = self._get_award_contacts(session, 'tribune', official_achievement_date)
-            progress = self._calculate_progress(session, contacts, tribune)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'Tribune',
-                'award_manager': 'TX1: AC2C@skccgroup.com | TX2+: TX2manager@skccgroup.com',
-                'requirement': f"50 unique Tribune/Senator members (Current: {progress['current']})",
-                'endorsement': progress.get('endorsement', 'Not Yet'),
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'Must be Centurion first (100+ SKCC members)',
-                    'Contact 50+ Tribune/Senator/Senators',
-                    'Both operators must hold Centurion status at time of contact',
-                    'CW mode only',
-                    'SKCC number exchange required',
-                    'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
-                    'Club calls and special event calls excluded after Oct 1, 2008',
-                    'Contacts valid on or after March 1, 2007',
-                    'Any band allowed',
-                    'Each call sign counts only once',
-                    'Multi-band and single-band endorsements available'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            elif format.lower() == 'skcc':
-                result = self._format_application_skcc_official(application_data, 'tribune')
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+        return self._generate('Tribune', self._tribune_application_data, format, official_form='tribune')
+
+    def _tribune_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the Tribune application data"""
+        # Get official Tribune achievement date from database (not user input)
+        tribune_progress = self.db.analyze_tribune_award_progress()
+        official_achievement_date = tribune_progress.get('tribune_achievement_date')
+
+        contacts = self._get_award_contacts(session, 'tribune', official_achievement_date)
+        progress = self._timeline_progress('tribune', 50)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'Tribune',
+            'award_manager': 'TX1: AC2C@skccgroup.com | TX2+: TX2manager@skccgroup.com',
+            'requirement': f"50 unique Tribune/Senator members (Current: {progress['current']})",
+            'endorsement': progress.get('endorsement', 'Not Yet'),
+            'milestones': progress['milestones'],
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'Must be Centurion first (100+ SKCC members)',
+                'Contact 50+ Tribune/Senator/Senators',
+                'Both operators must hold Centurion status at time of contact',
+                'CW mode only',
+                'SKCC number exchange required',
+                'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
+                'Club calls and special event calls excluded after Oct 1, 2008',
+                'Contacts valid on or after March 1, 2007',
+                'Any band allowed',
+                'Each call sign counts only once',
+                'Multi-band and single-band endorsements available'
+            ]
+        }
 
-        except Exception as e:
-            logger.error(f"Error generating Tribune application: {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+        return application_data
 
     def generate_senator_application(
         self,
@@ -187,57 +353,41 @@ class AwardApplicationGenerator:
         Returns:
             Formatted application
         """
-        session = self.db.get_session()
-        try:
-            from src.awards.senator import SenatorAward
-            senator = SenatorAward(session)
-
-            # Get official Tribune x8 achievement date from database (not user input)
-            senator_progress = self.db.analyze_senator_award_progress()
-            official_achievement_date = senator_progress.get('tribune_x8_achievement_date')
-
-            contacts = self._get_award_contacts(session, 'senator', official_achievement_date)
-            progress = self._calculate_progress(session, contacts, senator)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'Senator',
-                'award_manager': 'TX2manager@skccgroup.com',
-                'requirement': f"200 unique Tribune/Senator contacts after Tribune x8 (Current: {progress['current']})",
-                'prerequisite': 'Tribune x8 (400+ Tribune/Senator contacts)',
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'Must achieve Tribune x8 first (400+ Tribune/Senator contacts)',
-                    'Contact 200+ Tribune/Senator on or after Tribune x8 achievement',
-                    'Both operators must hold Tribune status at time of contact',
-                    'CW mode only',
-                    'SKCC number exchange required',
-                    'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
-                    'Club calls and special event calls excluded',
-                    'Contacts valid on or after August 1, 2013',
-                    'Any band allowed',
-                    'Each call sign counts only once',
-                    'Multi-band and single-band endorsements available'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+        return self._generate('Senator', self._senator_application_data, format)
+
+    def _senator_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the Senator application data"""
+        # Senator credits start at the Tribune x8 date reached in the award timeline replay
+        contacts = self._get_award_contacts(session, 'senator')
+        progress = self._timeline_progress('senator', 200)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'Senator',
+            'award_manager': 'TX2manager@skccgroup.com',
+            'requirement': f"200 unique Tribune/Senator contacts after Tribune x8 (Current: {progress['current']})",
+            'prerequisite': 'Tribune x8 (400+ Tribune/Senator contacts)',
+            'endorsement': progress['endorsement'],
+            'milestones': progress['milestones'],
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'Must achieve Tribune x8 first (400+ Tribune/Senator contacts)',
+                'Contact 200+ Tribune/Senator on or after Tribune x8 achievement',
+                'Both operators must hold Tribune status at time of contact',
+                'CW mode only',
+                'SKCC number exchange required',
+                'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
+                'Club calls and special event calls excluded',
+                'Contacts valid on or after August 1, 2013',
+                'Any band allowed',
+                'Each call sign counts only once',
+                'Multi-band and single-band endorsements available'
+            ]
+        }
 
-        except Exception as e:
-            logger.error(f"Error generating Senator application: {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+        return application_data
 
     def generate_was_application(self, format: str = 'text') -> str:
         """
@@ -249,49 +399,37 @@ class AwardApplicationGenerator:
         Returns:
             Formatted application
         """
-        session = self.db.get_session()
-        try:
-            from src.awards.was import WASAward
-            was = WASAward(session)
-
-            contacts = self._get_award_contacts(session, 'was')
-            progress = self._calculate_progress(session, contacts, was)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'WAS (Worked All States)',
-                'requirement': f"All 50 US states (Current: {progress['current']}/50)",
-                'missing_states': progress.get('missing_states', []),
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'Both operators must hold SKCC membership',
-                    'CW mode only',
-                    'SKCC number exchange required',
-                    'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
-                    'Contact required with members in all 50 US states',
-                    'Any band allowed',
-                    'Single-band endorsements available',
-                    'WAS-QRP endorsement available (≤5W power)'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+        return self._generate('WAS', self._was_application_data, format)
 
-        except Exception as e:
-            logger.error(f"Error generating WAS application: {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+    def _was_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the WAS application data"""
+        from src.awards.was import WASAward
+        was = WASAward(session)
+
+        contacts = self._get_award_contacts(session, 'was')
+        progress = self._calculate_progress(session, contacts, was)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'WAS (Worked All States)',
+            'requirement': f"All 50 US states (Current: {progress['current']}/50)",
+            'missing_states': progress.get('missing_states', []),
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'Both operators must hold SKCC membership',
+                'CW mode only',
+                'SKCC number exchange required',
+                'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
+                'Contact required with members in all 50 US states',
+                'Any band allowed',
+                'Single-band endorsements available',
+                'WAS-QRP endorsement available (≤5W power)'
+            ]
+        }
+
+        return application_data
 
     def generate_wac_application(self, format: str = 'text') -> str:
         """
@@ -303,50 +441,38 @@ class AwardApplicationGenerator:
         Returns:
             Formatted application
         """
-        session = self.db.get_session()
-        try:
-            from src.awards.wac import WACAward
-            wac = WACAward(session)
-
-            contacts = self._get_award_contacts(session, 'wac')
-            progress = self._calculate_progress(session, contacts, wac)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'WAC (Worked All Continents)',
-                'requirement': f"All 6 continents (Current: {progress['current']}/6)",
-                'missing_continents': progress.get('missing_continents', []),
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'Both operators must hold SKCC membership',
-                    'CW mode only',
-                    'SKCC number exchange required',
-                    'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
-                    'Contacts required with members in all 6 continents',
-                    'Contacts valid on or after October 9, 2011',
-                    'Any band allowed',
-                    'Band endorsements available (per band worked)',
-                    'QRP endorsement available (≤5W power)'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+        return self._generate('WAC', self._wac_application_data, format)
 
-        except Exception as e:
-            logger.error(f"Error generating WAC application: {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+    def _wac_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the WAC application data"""
+        from src.awards.wac import WACAward
+        wac = WACAward(session)
+
+        contacts = self._get_award_contacts(session, 'wac')
+        progress = self._calculate_progress(session, contacts, wac)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'WAC (Worked All Continents)',
+            'requirement': f"All 6 continents (Current: {progress['current']}/6)",
+            'missing_continents': progress.get('missing_continents', []),
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'Both operators must hold SKCC membership',
+                'CW mode only',
+                'SKCC number exchange required',
+                'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
+                'Contacts required with members in all 6 continents',
+                'Contacts valid on or after October 9, 2011',
+                'Any band allowed',
+                'Band endorsements available (per band worked)',
+                'QRP endorsement available (≤5W power)'
+            ]
+        }
+
+        return application_data
 
     def generate_rag_chew_application(self, format: str = 'text') -> str:
         """
@@ -358,50 +484,38 @@ class AwardApplicationGenerator:
         Returns:
             Formatted application
         """
-        session = self.db.get_session()
-        try:
-            from src.awards.rag_chew import RagChewAward
-            rag_chew = RagChewAward(session)
-
-            contacts = self._get_award_contacts(session, 'rag_chew')
-            progress = self._calculate_progress(session, contacts, rag_chew)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'Rag Chew Award',
-                'requirement': f"300+ minutes CW conversation (Current: {progress['current']} min)",
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'Both operators must hold SKCC membership',
-                    'CW mode exclusively',
-                    'Minimum 30 minutes per contact (40 minutes for multi-station)',
-                    'SKCC number exchange required',
-                    'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
-                    'Back-to-back contacts with same member prohibited',
-                    'Contacts valid on or after July 1, 2013',
-                    'Any band allowed',
-                    'Duration must be logged in minutes',
-                    'Endorsements: x2 (600 min), x3 (900 min), etc.'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+        return self._generate('Rag Chew', self._rag_chew_application_data, format)
 
-        except Exception as e:
-            logger.error(f"Error generating Rag Chew application: {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+    def _rag_chew_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the Rag Chew application data"""
+        from src.awards.rag_chew import RagChewAward
+        rag_chew = RagChewAward(session)
+
+        contacts = self._get_award_contacts(session, 'rag_chew')
+        progress = self._calculate_progress(session, contacts, rag_chew)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'Rag Chew Award',
+            'requirement': f"300+ minutes CW conversation (Current: {progress['current']} min)",
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'Both operators must hold SKCC membership',
+                'CW mode exclusively',
+                'Minimum 30 minutes per contact (40 minutes for multi-station)',
+                'SKCC number exchange required',
+                'Mechanical key required (STRAIGHT, BUG, SIDESWIPER)',
+                'Back-to-back contacts with same member prohibited',
+                'Contacts valid on or after July 1, 2013',
+                'Any band allowed',
+                'Duration must be logged in minutes',
+                'Endorsements: x2 (600 min), x3 (900 min), etc.'
+            ]
+        }
+
+        return application_data
 
     def generate_dxcc_application(self, format: str = 'text') -> str:
         """
@@ -413,48 +527,36 @@ class AwardApplicationGenerator:
         Returns:
             Formatted application
         """
-        session = self.db.get_session()
-        try:
-            from src.awards.dxcc import DXCCAward
-            dxcc = DXCCAward()
-
-            contacts = self._get_award_contacts(session, 'dxcc')
-            progress = self._calculate_progress(session, contacts, dxcc)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'DXCC Award',
-                'requirement': f"100+ countries worked (Current: {progress['current']})",
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'CW mode only',
-                    'Any band allowed',
-                    'At least 100 different countries',
-                    'ARRL DXCC entity list used for validation',
-                    'Both operators must be licensed amateurs',
-                    'Contacts must be two-way valid',
-                    'Contacts can be mixed bands and modes (CW for this logger)',
-                    'Endorsements available: x2 (150), x3 (200), etc.'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+        return self._generate('DXCC', self._dxcc_application_data, format)
 
-        except Exception as e:
-            logger.error(f"Error generating DXCC application: {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+    def _dxcc_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the DXCC application data"""
+        from src.awards.dxcc import DXCCAward
+        dxcc = DXCCAward()
+
+        contacts = self._get_award_contacts(session, 'dxcc')
+        progress = self._calculate_progress(session, contacts, dxcc)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'DXCC Award',
+            'requirement': f"100+ countries worked (Current: {progress['current']})",
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'CW mode only',
+                'Any band allowed',
+                'At least 100 different countries',
+                'ARRL DXCC entity list used for validation',
+                'Both operators must be licensed amateurs',
+                'Contacts must be two-way valid',
+                'Contacts can be mixed bands and modes (CW for this logger)',
+                'Endorsements available: x2 (150), x3 (200), etc.'
+            ]
+        }
+
+        return application_data
 
     def generate_canadian_maple_application(self, format: str = 'text') -> str:
         """
@@ -466,49 +568,37 @@ class AwardApplicationGenerator:
         Returns:
             Formatted application
         """
-        session = self.db.get_session()
-        try:
-            from src.awards.canadian_maple import CanadianMapleAward
-            maple = CanadianMapleAward(session)
-
-            contacts = self._get_award_contacts(session, 'canadian_maple')
-            progress = self._calculate_progress(session, contacts, maple)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'Canadian Maple Award',
-                'requirement': f"All Canadian provinces and territories (Level: {progress.get('current_level', 'None')})",
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'CW mode only',
-                    'All 10 Canadian provinces and 3 territories must be worked',
-                    'Two-way communication required',
-                    'Mechanical key required',
-                    'SKCC number exchange preferred but not required',
-                    'Provinces: AB, BC, MB, NB, NS, ON, PE, QC, SK, NL',
-                    'Territories: NT, NU, YT',
-                    'Any band allowed',
-                    'Contacts on or after January 1, 2000'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+        return self._generate('Canadian Maple', self._canadian_maple_application_data, format)
 
-        except Exception as e:
-            logger.error(f"Error generating Canadian Maple application: {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+    def _canadian_maple_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the Canadian Maple application data"""
+        from src.awards.canadian_maple import CanadianMapleAward
+        maple = CanadianMapleAward(session)
+
+        contacts = self._get_award_contacts(session, 'canadian_maple')
+        progress = self._calculate_progress(session, contacts, maple)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'Canadian Maple Award',
+            'requirement': f"All Canadian provinces and territories (Level: {progress.get('current_level', 'None')})",
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'CW mode only',
+                'All 10 Canadian provinces and 3 territories must be worked',
+                'Two-way communication required',
+                'Mechanical key required',
+                'SKCC number exchange preferred but not required',
+                'Provinces: AB, BC, MB, NB, NS, ON, PE, QC, SK, NL',
+                'Territories: NT, NU, YT',
+                'Any band allowed',
+                'Contacts on or after January 1, 2000'
+            ]
+        }
+
+        return application_data
 
     def generate_pfx_application(self, format: str = 'text') -> str:
         """
@@ -520,47 +610,35 @@ class AwardApplicationGenerator:
         Returns:
             Formatted application
         """
-        session = self.db.get_session()
-        try:
-            from src.awards.pfx import PFXAward
-            pfx = PFXAward(session)
-
-            contacts = self._get_award_contacts(session, 'pfx')
-            progress = self._calculate_progress(session, contacts, pfx)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'PFX Award',
-                'requirement': f"Prefix challenge (Current: {progress['current']})",
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'CW mode only',
-                    'Unique amateur radio call sign prefixes collected',
-                    'Two-way communication required',
-                    'Any band allowed',
-                    'Mechanical key required',
-                    'Scoring based on cumulative prefixes worked',
-                    'Multiple endorsement levels available'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+        return self._generate('PFX', self._pfx_application_data, format)
 
-        except Exception as e:
-            logger.error(f"Error generating PFX application: {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+    def _pfx_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the PFX application data"""
+        from src.awards.pfx import PFXAward
+        pfx = PFXAward(session)
+
+        contacts = self._get_award_contacts(session, 'pfx')
+        progress = self._calculate_progress(session, contacts, pfx)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'PFX Award',
+            'requirement': f"Prefix challenge (Current: {progress['current']})",
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'CW mode only',
+                'Unique amateur radio call sign prefixes collected',
+                'Two-way communication required',
+                'Any band allowed',
+                'Mechanical key required',
+                'Scoring based on cumulative prefixes worked',
+                'Multiple endorsement levels available'
+            ]
+        }
+
+        return application_data
 
     def generate_triple_key_application(self, format: str = 'text') -> str:
         """
@@ -572,50 +650,38 @@ class AwardApplicationGenerator:
         Returns:
             Formatted application
         """
-        session = self.db.get_session()
-        try:
-            from src.awards.triple_key import TripleKeyAward
-            triple_key = TripleKeyAward(session)
-
-            contacts = self._get_award_contacts(session, 'triple_key')
-            progress = self._calculate_progress(session, contacts, triple_key)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'Triple Key Award',
-                'requirement': f"CW with three key types (Current: {progress['current']})",
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'CW mode only',
-                    'Contacts using three different key types:',
-                    '  - Straight key',
-                    '  - Bug/semi-automatic',
-                    '  - Fully automatic/keyer',
-                    'Two-way communication with each key type required',
-                    'SKCC number exchange required',
-                    'Mechanical key required (at least one contact)',
-                    'Any band allowed',
-                    'Minimum 1 contact with each key type'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+        return self._generate('Triple Key', self._triple_key_application_data, format)
 
-        except Exception as e:
-            logger.error(f"Error generating Triple Key application: {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+    def _triple_key_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the Triple Key application data"""
+        from src.awards.triple_key import TripleKeyAward
+        triple_key = TripleKeyAward(session)
+
+        contacts = self._get_award_contacts(session, 'triple_key')
+        progress = self._calculate_progress(session, contacts, triple_key)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'Triple Key Award',
+            'requirement': f"CW with three key types (Current: {progress['current']})",
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'CW mode only',
+                'Contacts using three different key types:',
+                '  - Straight key',
+                '  - Bug/semi-automatic',
+                '  - Fully automatic/keyer',
+                'Two-way communication with each key type required',
+                'SKCC number exchange required',
+                'Mechanical key required (at least one contact)',
+                'Any band allowed',
+                'Minimum 1 contact with each key type'
+            ]
+        }
+
+        return application_data
 
     def generate_skcc_dx_application(self, format: str = 'text') -> str:
         """
@@ -627,49 +693,37 @@ class AwardApplicationGenerator:
         Returns:
             Formatted application
         """
-        session = self.db.get_session()
-        try:
-            from src.awards.skcc_dx import DXQAward
-            skcc_dx = DXQAward(session)
-
-            contacts = self._get_award_contacts(session, 'skcc_dx')
-            progress = self._calculate_progress(session, contacts, skcc_dx)
-
-            # Convert contacts to dictionaries BEFORE session closes
-            contact_list = [self._contact_to_dict(c) for c in contacts]
-
-            application_data = {
-                'award_name': 'SKCC DX Award',
-                'requirement': f"DX SKCC members worked (Current: {progress['current']})",
-                'contacts': contact_list,
-                'summary': progress,
-                'rules': [
-                    'CW mode only',
-                    'DX (outside US/Canada) SKCC members only',
-                    'SKCC number exchange required',
-                    'Two-way communication required',
-                    'Mechanical key required',
-                    'Any HF band allowed',
-                    'Includes countries as recognized by ARRL DXCC list',
-                    'Contacts on or after January 1, 2000',
-                    'Multiple endorsement levels: x2, x3, x4, etc.'
-                ]
-            }
-
-            if format.lower() == 'csv':
-                result = self._format_application_csv(application_data)
-            elif format.lower() == 'html':
-                result = self._format_application_html(application_data)
-            else:
-                result = self._format_application_text(application_data)
-            
-            return result
+        return self._generate('SKCC DX', self._skcc_dx_application_data, format)
 
-        except Exception as e:
-            logger.error(f"Error generating SKCC DX application: {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+    def _skcc_dx_application_data(self, session: Session) -> Dict[str, Any]:
+        """Collect the SKCC DX application data"""
+        from src.awards.skcc_dx import DXQAward
+        skcc_dx = DXQAward(session)
+
+        contacts = self._get_award_contacts(session, 'skcc_dx')
+        progress = self._calculate_progress(session, contacts, skcc_dx)
+
+        contact_list = [c.to_dict() for c in contacts]
+
+        application_data = {
+            'award_name': 'SKCC DX Award',
+            'requirement': f"DX SKCC members worked (Current: {progress['current']})",
+            'contacts': contact_list,
+            'summary': progress,
+            'rules': [
+                'CW mode only',
+                'DX (outside US/Canada) SKCC members only',
+                'SKCC number exchange required',
+                'Two-way communication required',
+                'Mechanical key required',
+                'Any HF band allowed',
+                'Includes countries as recognized by ARRL DXCC list',
+                'Contacts on or after January 1, 2000',
+                'Multiple endorsement levels: x2, x3, x4, etc.'
+            ]
+        }
+
+        return application_data
 
     def generate_application(
         self,
@@ -731,11 +785,33 @@ class AwardApplicationGenerator:
         session: Session,
         award_type: str,
         achievement_date: Optional[str] = None
-    ) -> List[Contact]:
+    ) -> List[ContactRecord]:
         """Get contacts that qualify for a specific award"""
-        from src.awards.centurion import CenturionAward
-        from src.awards.tribune import TribuneAward
-        from src.awards.senator import SenatorAward
+        award_type = award_type.lower()
+        if award_type in TIMELINE_AWARDS:
+            return self._get_timeline_contacts(session, award_type, achievement_date)
+
+        if self._shared is not None and award_type in self._shared.qualified:
+            valid_contacts = self._shared.qualified[award_type]
+        else:
+            award = self._award_instance(session, award_type)
+            if award is None:
+                return []
+            # Get all contacts
+            all_contacts = self.db.get_contact_records(order_by=(Contact.qso_date, Contact.time_on))
+            valid_contacts = [contact for contact in all_contacts if award.validate(contact)]
+
+        # Filter by achievement date if provided
+        if achievement_date:
+            valid_contacts = [
+                contact for contact in valid_contacts
+                if contact.qso_date is None or str(contact.qso_date) >= str(achievement_date)
+            ]
+
+        return valid_contacts
+
+    def _award_instance(self, session: Session, award_type: str) -> Optional[Any]:
+        """Create the award class validating contacts for an application (None if unknown)"""
         from src.awards.was import WASAward
         from src.awards.wac import WACAward
         from src.awards.rag_chew import RagChewAward
@@ -745,90 +821,81 @@ class AwardApplicationGenerator:
         from src.awards.triple_key import TripleKeyAward
         from src.awards.skcc_dx import DXQAward
 
-        # Get all contacts
-        all_contacts = session.query(Contact).order_by(Contact.qso_date.asc()).all()
+        if award_type == 'was':
+            return WASAward(session)
+        elif award_type == 'wac':
+            return WACAward(session)
+        elif award_type == 'rag_chew':
+            return RagChewAward(session)
+        elif award_type == 'dxcc':
+            return DXCCAward()
+        elif award_type == 'canadian_maple':
+            return CanadianMapleAward(session)
+        elif award_type == 'pfx':
+            return PFXAward(session)
+        elif award_type == 'triple_key':
+            return TripleKeyAward(session)
+        elif award_type == 'skcc_dx':
+            return DXQAward(session)
+        return None
+
+    def _get_timeline_contacts(
+        self,
+        session: Session,
+        award_type: str,
+        achievement_date: Optional[str] = None
+    ) -> List[ContactRecord]:
+        """
+        Get the contacts credited to a member award by the award timeline replay
 
-        # Create award instance
-        if award_type.lower() == 'centurion':
-            award = CenturionAward(session)
-        elif award_type.lower() == 'tribune':
-            award = TribuneAward(session)
-        elif award_type.lower() == 'senator':
-            award = SenatorAward(session)
-        elif award_type.lower() == 'was':
-            award = WASAward(session)
-        elif award_type.lower() == 'wac':
-            award = WACAward(session)
-        elif award_type.lower() == 'rag_chew':
-            award = RagChewAward(session)
-        elif award_type.lower() == 'dxcc':
-            award = DXCCAward()
-        elif award_type.lower() == 'canadian_maple':
-            award = CanadianMapleAward(session)
-        elif award_type.lower() == 'pfx':
-            award = PFXAward(session)
-        elif award_type.lower() == 'triple_key':
-            award = TripleKeyAward(session)
-        elif award_type.lower() == 'skcc_dx':
-            award = DXQAward(session)
+        Args:
+            session: Database session
+            award_type: 'centurion', 'tribune' or 'senator'
+            achievement_date: Leave out contacts before this date (YYYYMMDD)
+
+        Returns:
+            First qualifying contact per member, in timeline order
+        """
+        track = getattr(self.db.replay_award_timeline(), award_type)
+        credited_ids = [c['id'] for c in track.credited
+                        if not achievement_date or c['qso_date'] >= str(achievement_date)]
+        wanted = set(credited_ids)
+        if self._shared is not None:
+            candidates = self._shared.records
         else:
-            return []
+            candidates = self.db.iter_contact_records(Contact.mode == "CW", Contact.skcc_number.isnot(None))
+        by_id = {c.id: c for c in candidates if c.id in wanted}
+        return [by_id[contact_id] for contact_id in credited_ids if contact_id in by_id]
 
-        # Filter valid contacts
-        # For awards that count unique members (Centurion, Tribune, Senator),
-        # we need to track which members we've already counted
-        valid_contacts = []
-        seen_members = set()  # Track unique SKCC numbers for deduplication
-        
-        for contact in all_contacts:
-            contact_dict = self._contact_to_dict(contact)
-            if award.validate(contact_dict):
-                # Filter by achievement date if provided
-                if achievement_date and contact.qso_date is not None:
-                    if str(contact.qso_date) < str(achievement_date):
-                        continue
-                
-                # For Tribune/Centurion/Senator: only include first qualifying contact per member
-                if award_type.lower() in ['centurion', 'tribune', 'senator']:
-                    from src.utils.skcc_number import extract_base_skcc_number
-                    base_skcc = extract_base_skcc_number(contact.skcc_number or '')
-                    if base_skcc:
-                        if base_skcc in seen_members:
-                            continue  # Skip duplicate member
-                        seen_members.add(base_skcc)
-                
-                valid_contacts.append(contact)
+    def _timeline_progress(self, award_type: str, required: int) -> Dict[str, Any]:
+        """
+        Progress of a member award from the award timeline replay
 
-        return valid_contacts
+        Args:
+            award_type: 'centurion', 'tribune' or 'senator'
+            required: Count needed for the base award
 
-    def _contact_to_dict(self, contact: Contact) -> Dict[str, Any]:
-        """Convert Contact ORM object to dictionary"""
+        Returns:
+            Progress dict (current, required, achieved, progress_pct, endorsement, milestones)
+        """
+        track = getattr(self.db.replay_award_timeline(), award_type)
         return {
-            'callsign': contact.callsign,
-            'qso_date': contact.qso_date,
-            'time_on': contact.time_on,
-            'band': contact.band,
-            'mode': contact.mode,
-            'skcc_number': contact.skcc_number,
-            'rst_sent': contact.rst_sent,
-            'rst_rcvd': contact.rst_rcvd,
-            'notes': contact.notes,
-            'key_type': contact.key_type,
-            'state': contact.state if contact.state else '',
-            'country': contact.country if contact.country else '',
-            'dxcc': contact.dxcc if contact.dxcc else '',
-            'tx_power': contact.tx_power
+            'current': track.count,
+            'required': required,
+            'achieved': track.count >= required,
+            'progress_pct': min(100.0, (track.count / required) * 100),
+            'endorsement': track.level,
+            'milestones': track.milestones,
         }
 
     def _calculate_progress(
         self,
         session: Session,
-        contacts: List[Contact],
+        contacts: List[ContactRecord],
         award: Any
     ) -> Dict[str, Any]:
         """Calculate award progress"""
-        contact_dicts = [self._contact_to_dict(c) for c in contacts]
-        return award.calculate_progress(contact_dicts)
+        return award.calculate_progress(contacts)
 
     def _format_application_text(self, app_data: Dict[str, Any]) -> str:
         """Format application as plain text"""
@@ -888,6 +955,16 @@ class AwardApplicationGenerator:
             lines.append(f"Progress Percentage: {progress_pct:.1f}%")
             lines.append("")
 
+        # Endorsement History
+        if app_data.get('milestones'):
+            lines.append("ENDORSEMENT HISTORY")
+            lines.append("-" * 90)
+            lines.append(f"{'Level':<14} {'Date':<12} {'Call':<12} {'Time':<6}")
+            for milestone in app_data['milestones']:
+                lines.append(f"{milestone.level:<14} {milestone.qso_date:<12} "
+                             f"{milestone.callsign:<12} {milestone.time_on:<6}")
+            lines.append("")
+
         # Contact List
         lines.append("CONTACT LIST")
         lines.append("-" * 90)
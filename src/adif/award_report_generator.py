@@ -11,21 +11,151 @@ Report Formats:
 - Text: Simple text report with summary and contact list
 
 Dynamically discovers and uses award rules from award implementations.
+
+write_report() streams qualifying contacts from a projected query through
+the award validator to a file, socket or other stream in chunks (optionally
+gzip-compressed), so large reports are never held in memory as one string.
 """
 # pyright: reportOptionalMemberAccess=false, reportUnknownVariableType=false, reportGeneralTypeIssues=false, reportOptionalSubscript=false, reportIncompatibleMethodOverride=false
 
+import gzip
+import io
 import logging
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Tuple, Type
+from typing import Dict, List, Any, Optional, Tuple, Type, Callable, IO, Iterable, Iterator, TextIO, Union
 from pathlib import Path
 import importlib
 
 from src.database.repository import DatabaseRepository
 from src.database.models import Contact
+from src.database.read_model import ContactRecord
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+REPORT_FORMATS = ('text', 'csv', 'tsv', 'html')
+
+# Report lines buffered per write when streaming
+WRITE_CHUNK_LINES = 500
+
+# Candidate contacts validated between progress callbacks
+PROGRESS_INTERVAL = 500
+
+# progress(done, total): candidate contacts processed so far and in all
+ProgressCallback = Callable[[int, int], None]
+
+
+class ReportSummary:
+    """Running summary statistics of the contacts in a report"""
+
+    __slots__ = ('total', 'callsigns', 'skcc_numbers', 'first_date', 'last_date')
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.callsigns: set = set()
+        self.skcc_numbers: set = set()
+        self.first_date: Optional[str] = None
+        self.last_date: Optional[str] = None
+
+    @classmethod
+    def of(cls, contacts: Iterable[ContactRecord]) -> 'ReportSummary':
+        """Summarize contacts (consumes the iterable)"""
+        summary = cls()
+        for contact in contacts:
+            summary.add(contact)
+        return summary
+
+    def add(self, contact: ContactRecord) -> None:
+        """Count one report contact"""
+        self.total += 1
+        self.callsigns.add(contact.callsign)
+        if contact.skcc_number is not None:
+            self.skcc_numbers.add(contact.skcc_number)
+        if contact.qso_date is not None:
+            date = str(contact.qso_date)
+            if self.first_date is None or date < self.first_date:
+                self.first_date = date
+            if self.last_date is None or date > self.last_date:
+                self.last_date = date
+
+    @property
+    def date_range(self) -> Optional[Tuple[str, str]]:
+        """First and last QSO date, or None without dated contacts"""
+        if self.first_date is None:
+            return None
+        return (self.first_date, self.last_date)
+
+
+def write_lines(stream: TextIO, lines: Iterable[str], chunk_lines: int = WRITE_CHUNK_LINES) -> None:
+    """
+    Write newline-joined lines in chunks
+
+    The output equals stream.write("\n".join(lines)) without building the
+    whole string.
+
+    Args:
+        stream: Text stream to write to
+        lines: Report lines (no trailing newlines)
+        chunk_lines: Lines joined per write call
+    """
+    chunk: List[str] = []
+    separator = ""
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_lines:
+            stream.write(separator + "\n".join(chunk))
+            separator = "\n"
+            chunk.clear()
+    if chunk:
+        stream.write(separator + "\n".join(chunk))
+
+
+@contextmanager
+def open_report_stream(destination: Union[str, Path, IO], compress: bool = False) -> Iterator[TextIO]:
+    """
+    Open a report destination as a UTF-8 text stream
+
+    Paths are created (with parent folders) and closed afterwards. Streams
+    passed in, such as open files or socket.makefile('wb'), are flushed but
+    left open for the caller.
+
+    Args:
+        destination: File path, text stream or binary stream
+        compress: gzip-compress the report (paths and binary streams only)
+
+    Yields:
+        Text stream to write the report to
+
+    Raises:
+        ValueError: If compression is requested for a text stream
+    """
+    if isinstance(destination, (str, Path)):
+        path = Path(destination)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        opener = gzip.open if compress else open
+        with opener(path, 'wt', encoding='utf-8') as stream:
+            yield stream
+        return
+
+    if isinstance(destination, io.TextIOBase):
+        if compress:
+            raise ValueError("Compressed reports need a file path or a binary stream")
+        yield destination
+        destination.flush()
+        return
+
+    raw = gzip.GzipFile(fileobj=destination, mode='wb') if compress else destination
+    stream = io.TextIOWrapper(raw, encoding='utf-8')
+    try:
+        yield stream
+        stream.flush()
+    finally:
+        stream.detach()  # Keep the caller's stream open
+        if compress:
+            raw.close()  # Writes the gzip trailer
+
 
 class AwardReportGenerator:
     """Generate formatted award reports for submission to award managers"""
@@ -130,7 +260,8 @@ class AwardReportGenerator:
         award_name: str,
         format: str = 'text',
         include_summary: bool = True,
-        achievement_date: Optional[str] = None
+        achievement_date: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None
     ) -> str:
         """
         Generate award report for any SKCC award
@@ -140,82 +271,144 @@ class AwardReportGenerator:
             format: Report format ('text', 'csv', 'html', 'tsv')
             include_summary: Include summary statistics
             achievement_date: Date award was achieved (YYYYMMDD) for endorsements
+            progress: Optional progress(done, total) callback
 
         Returns:
             Formatted report string
         """
+        if not self.get_award_class(award_name):
+            return f"Error: Award '{award_name}' not found"
+
+        try:
+            buffer = io.StringIO()
+            self.write_report(
+                award_name, buffer, format, include_summary, achievement_date, progress=progress
+            )
+            return buffer.getvalue()
+
+        except Exception as e:
+            logger.error(f"Error generating report for {award_name}: {e}", exc_info=True)
+            return f"Error generating report: {str(e)}"
+
+    def write_report(
+        self,
+        award_name: str,
+        destination: Union[str, Path, IO],
+        format: str = 'text',
+        include_summary: bool = True,
+        achievement_date: Optional[str] = None,
+        compress: bool = False,
+        progress: Optional[ProgressCallback] = None
+    ) -> int:
+        """
+        Stream an award report to a file or stream
+
+        Qualifying contacts are streamed from the database through the award
+        validator and written in chunks. Text and HTML summaries need totals
+        before the contact list, so those reports validate the log twice
+        instead of keeping the contacts in memory.
+
+        Args:
+            award_name: Name of award ('Tribune', 'Centurion', 'Senator', etc.)
+            destination: File path, text stream or binary stream (e.g. a socket file)
+            format: Report format ('text', 'csv', 'html', 'tsv'; unknown formats fall back to 'text')
+            include_summary: Include summary statistics
+            achievement_date: Date award was achieved (YYYYMMDD) for endorsements
+            compress: gzip-compress the report
+            progress: Optional progress(done, total) callback
+
+        Returns:
+            Number of contacts in the report
+
+        Raises:
+            ValueError: If the award is unknown
+        """
+        award_class = self.get_award_class(award_name)
+        if not award_class:
+            raise ValueError(f"Award '{award_name}' not found")
+        format = format.lower()
+        if format not in REPORT_FORMATS:
+            format = 'text'
+
+        # Get all contacts that could be valid for this award
+        criteria = [Contact.mode == 'CW', Contact.skcc_number.isnot(None)]
+        if achievement_date:
+            # Endorsements only list contacts made after the achievement date
+            criteria.append(Contact.qso_date >= str(achievement_date))
+
         session = self.db.get_session()
         try:
-            # Get award class
-            award_class = self.get_award_class(award_name)
-            if not award_class:
-                return f"Error: Award '{award_name}' not found"
-
-            # Get all contacts that could be valid for this award
-            contacts = session.query(Contact).filter(
-                Contact.mode == 'CW',
-                Contact.skcc_number.isnot(None)
-            ).order_by(Contact.qso_date.asc()).all()
-
-            # Validate contacts using award rules
             # Special handling for DXCC which doesn't take session parameter
             if award_name == 'DXCC':
                 award_instance = award_class()
             else:
                 award_instance = award_class(session)
-            
-            # Track validation results for user visibility
-            valid_contacts = []
-            failed_validations = []
-            
-            for contact in contacts:
-                try:
-                    contact_dict = self._contact_to_dict(contact)
-                    if award_instance.validate(contact_dict):
-                        valid_contacts.append(contact)
-                    else:
-                        # Track why contact didn't qualify (for debugging)
-                        failed_validations.append((contact.callsign, "Did not meet award requirements"))
-                except Exception as e:
-                    # Track validation errors
-                    failed_validations.append((contact.callsign, str(e)))
-                    logger.warning(f"Validation error for {contact.callsign}: {e}")
-                    continue
-            
-            # Report significant validation failures to help user identify issues
-            if len(failed_validations) > 0:
-                logger.info(f"Award '{award_name}': {len(valid_contacts)} contacts qualified, "
-                          f"{len(failed_validations)} contacts did not qualify")
-                if len(failed_validations) <= 10:
-                    # Show details for small number of failures
-                    for call, reason in failed_validations:
-                        logger.debug(f"  {call}: {reason}")
-
-            # Filter by achievement date if provided (for endorsements)
-            if achievement_date:
-                filtered_contacts = [
-                    c for c in valid_contacts
-                    if c.qso_date is not None and str(c.qso_date) >= str(achievement_date)
-                ]
-            else:
-                filtered_contacts = valid_contacts
 
-            # Generate report in requested format
-            if format.lower() == 'csv':
-                return self._format_csv(filtered_contacts, award_name)
-            elif format.lower() == 'tsv':
-                return self._format_tsv(filtered_contacts, award_name)
-            elif format.lower() == 'html':
-                return self._format_html(filtered_contacts, award_name, include_summary)
-            else:  # default to text
-                return self._format_text(filtered_contacts, award_name, include_summary)
+            candidates = session.scalar(select(func.count()).select_from(Contact).where(*criteria)) or 0
+            passes = 2 if include_summary and format in ('text', 'html') else 1
+            total = candidates * passes
+            if progress:
+                progress(0, total)
+
+            summary = None
+            if passes == 2:
+                summary = ReportSummary.of(self._iter_qualifying(
+                    award_name, award_instance, criteria, progress, 0, total
+                ))
+            contacts = self._iter_qualifying(
+                award_name, award_instance, criteria, progress, total - candidates, total
+            )
+
+            written = 0
+
+            def counted(records: Iterable[ContactRecord]) -> Iterator[ContactRecord]:
+                nonlocal written
+                for record in records:
+                    written += 1
+                    yield record
+
+            with open_report_stream(destination, compress) as stream:
+                write_lines(stream, self._report_lines(format, counted(contacts), award_name, summary))
+
+            logger.info(f"Award '{award_name}' {format} report written: {written} contacts")
+            return written
 
-        except Exception as e:
-            logger.error(f"Error generating report for {award_name}: {e}", exc_info=True)
-            return f"Error generating report: {str(e)}"
         finally:
             session.close()
 
+    def _iter_qualifying(
+        self,
+        award_name: str,
+        award_instance: Any,
+        criteria: List[Any],
+        progress: Optional[ProgressCallback],
+        done: int,
+        total: int
+    ) -> Iterator[ContactRecord]:
+        """Stream the candidate contacts that pass the award validator, oldest first"""
+        qualified = 0
+        failed = 0
+        records = self.db.iter_contact_records(*criteria, order_by=(Contact.qso_date, Contact.time_on))
+        for checked, contact in enumerate(records, 1):
+            try:
+                valid = award_instance.validate(contact)
+            except Exception as e:
+                logger.warning(f"Validation error for {contact.callsign}: {e}")
+                valid = False
+            if valid:
+                qualified += 1
+                yield contact
+            else:
+                failed += 1
+            if progress and checked % PROGRESS_INTERVAL == 0:
+                progress(done + checked, total)
+
+        if progress:
+            progress(done + qualified + failed, total)
+        if failed:
+            logger.info(f"Award '{award_name}': {qualified} contacts qualified, "
+                        f"{failed} contacts did not qualify")
+
     def generate_tribune_report(
         self,
         format: str = 'text',
@@ -335,7 +528,7 @@ class AwardReportGenerator:
     def generate_generic_award_report(
         self,
         award_name: str,
-        contacts: List[Contact],
+        contacts: List[ContactRecord],
         format: str = 'text',
         include_summary: bool = True
     ) -> str:
@@ -344,7 +537,7 @@ class AwardReportGenerator:
 
         Args:
             award_name: Name of award (e.g., 'Tribune', 'WAC', 'DXCC')
-            contacts: List of Contact objects
+            contacts: List of contact records
             format: Report format ('text', 'csv', 'html', 'tsv')
             include_summary: Include summary statistics
 
@@ -360,198 +553,183 @@ class AwardReportGenerator:
         else:
             return self._format_text(contacts, award_name, include_summary)
 
-    def _get_tribune_contacts(self, session: Session) -> List[Contact]:
+    def _get_tribune_contacts(self, session: Session) -> List[ContactRecord]:
         """Get all Tribune-eligible contacts"""
         from src.awards.tribune import TribuneAward
 
         tribune = TribuneAward(session)
 
-        # Get all CW contacts with SKCC numbers
-        contacts = session.query(Contact).filter(
-            Contact.mode == 'CW',
-            Contact.skcc_number.isnot(None)
-        ).order_by(Contact.qso_date.asc()).all()
-
-        # Filter to valid Tribune contacts
-        valid_contacts = []
-        for contact in contacts:
-            if tribune.validate(self._contact_to_dict(contact)):
-                valid_contacts.append(contact)
-
-        return valid_contacts
+        # Filter CW contacts with SKCC numbers to valid Tribune contacts
+        return [contact for contact in self._get_skcc_cw_records() if tribune.validate(contact)]
 
-    def _get_centurion_contacts(self, session: Session) -> List[Contact]:
+    def _get_centurion_contacts(self, session: Session) -> List[ContactRecord]:
         """Get all Centurion-eligible contacts"""
         from src.awards.centurion import CenturionAward
 
         centurion = CenturionAward(session)
 
-        # Get all CW contacts with SKCC numbers
-        contacts = session.query(Contact).filter(
-            Contact.mode == 'CW',
-            Contact.skcc_number.isnot(None)
-        ).order_by(Contact.qso_date.asc()).all()
+        # Filter CW contacts with SKCC numbers to valid Centurion contacts
+        return [contact for contact in self._get_skcc_cw_records() if centurion.validate(contact)]
 
-        # Filter to valid Centurion contacts
-        valid_contacts = []
-        for contact in contacts:
-            if centurion.validate(self._contact_to_dict(contact)):
-                valid_contacts.append(contact)
-
-        return valid_contacts
-
-    def _get_senator_contacts(self, session: Session) -> List[Contact]:
+    def _get_senator_contacts(self, session: Session) -> List[ContactRecord]:
         """Get all Senator-eligible contacts"""
         from src.awards.senator import SenatorAward
 
         senator = SenatorAward(session)
 
-        # Get all CW contacts with SKCC numbers
-        contacts = session.query(Contact).filter(
+        # Filter CW contacts with SKCC numbers to valid Senator contacts
+        return [contact for contact in self._get_skcc_cw_records() if senator.validate(contact)]
+
+    def _get_skcc_cw_records(self) -> List[ContactRecord]:
+        """Get CW contacts with SKCC numbers as read-only records, oldest first"""
+        return self.db.get_contact_records(
             Contact.mode == 'CW',
-            Contact.skcc_number.isnot(None)
-        ).order_by(Contact.qso_date.asc()).all()
+            Contact.skcc_number.isnot(None),
+            order_by=(Contact.qso_date, Contact.time_on),
+        )
 
-        # Filter to valid Senator contacts
-        valid_contacts = []
-        for contact in contacts:
-            if senator.validate(self._contact_to_dict(contact)):
-                valid_contacts.append(contact)
-
-        return valid_contacts
-
-    def _contact_to_dict(self, contact: Contact) -> Dict[str, Any]:
-        """Convert Contact ORM object to dictionary"""
-        return {
-            'callsign': contact.callsign,
-            'qso_date': contact.qso_date,
-            'time_on': contact.time_on,
-            'band': contact.band,
-            'mode': contact.mode,
-            'skcc_number': contact.skcc_number,
-            'rst_sent': contact.rst_sent,
-            'rst_rcvd': contact.rst_rcvd,
-            'notes': contact.notes,
-            'key_type': contact.key_type,
-            'frequency': contact.frequency
-        }
+    def _report_lines(
+        self,
+        format: str,
+        contacts: Iterable[ContactRecord],
+        award_name: str,
+        summary: Optional[ReportSummary] = None
+    ) -> Iterator[str]:
+        """Lines of a report in the given format ('text' if unknown)"""
+        if format == 'csv':
+            return self._csv_lines(contacts)
+        elif format == 'tsv':
+            return self._tsv_lines(contacts)
+        elif format == 'html':
+            return self._html_lines(contacts, award_name, summary)
+        else:
+            return self._text_lines(contacts, award_name, summary)
 
     def _format_text(
         self,
-        contacts: List[Contact],
+        contacts: List[ContactRecord],
         award_name: str,
         include_summary: bool = True
     ) -> str:
         """Format report as plain text with sections"""
-        lines: List[str] = []
+        summary = ReportSummary.of(contacts) if include_summary else None
+        return "\n".join(self._text_lines(contacts, award_name, summary))
+
+    def _format_csv(self, contacts: List[ContactRecord], award_name: str) -> str:
+        """Format report as CSV"""
+        return "\n".join(self._csv_lines(contacts))
+
+    def _format_tsv(self, contacts: List[ContactRecord], award_name: str) -> str:
+        """Format report as Tab-Separated Values"""
+        return "\n".join(self._tsv_lines(contacts))
+
+    def _format_html(
+        self,
+        contacts: List[ContactRecord],
+        award_name: str,
+        include_summary: bool = True
+    ) -> str:
+        """Format report as HTML"""
+        summary = ReportSummary.of(contacts) if include_summary else None
+        return "\n".join(self._html_lines(contacts, award_name, summary))
 
+    def _text_lines(
+        self,
+        contacts: Iterable[ContactRecord],
+        award_name: str,
+        summary: Optional[ReportSummary] = None
+    ) -> Iterator[str]:
+        """Plain text report lines (summary section only if a summary is given)"""
         # Header
-        lines.append("=" * 80)
-        lines.append(f"SKCC {award_name} AWARD APPLICATION REPORT")
-        lines.append("=" * 80)
-        lines.append("")
+        yield "=" * 80
+        yield f"SKCC {award_name} AWARD APPLICATION REPORT"
+        yield "=" * 80
+        yield ""
 
         # Operator Information
-        lines.append("OPERATOR INFORMATION")
-        lines.append("-" * 80)
-        lines.append(f"Call Sign: {self.my_callsign}")
-        lines.append(f"SKCC Number: {self.my_skcc}")
-        lines.append(f"Report Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        lines.append("")
+        yield "OPERATOR INFORMATION"
+        yield "-" * 80
+        yield f"Call Sign: {self.my_callsign}"
+        yield f"SKCC Number: {self.my_skcc}"
+        yield f"Report Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
+        yield ""
 
         # Summary
-        if include_summary:
-            unique_calls = len(set(c.callsign for c in contacts))
-            unique_skcc = len(set(c.skcc_number for c in contacts if c.skcc_number is not None))
-            date_range = self._get_date_range(contacts)
-
-            lines.append("SUMMARY")
-            lines.append("-" * 80)
-            lines.append(f"Total QSOs: {len(contacts)}")
-            lines.append(f"Unique Call Signs: {unique_calls}")
-            lines.append(f"Unique SKCC Members: {unique_skcc}")
+        if summary is not None:
+            date_range = summary.date_range
+
+            yield "SUMMARY"
+            yield "-" * 80
+            yield f"Total QSOs: {summary.total}"
+            yield f"Unique Call Signs: {len(summary.callsigns)}"
+            yield f"Unique SKCC Members: {len(summary.skcc_numbers)}"
             if date_range:
-                lines.append(f"Date Range: {date_range[0]} to {date_range[1]}")
-            lines.append("")
+                yield f"Date Range: {date_range[0]} to {date_range[1]}"
+            yield ""
 
         # Contact List Header
-        lines.append("CONTACT LIST")
-        lines.append("-" * 80)
-        lines.append(self._format_table_header())
+        yield "CONTACT LIST"
+        yield "-" * 80
+        yield self._format_table_header()
 
         # Contact List
-        for i, contact in enumerate(contacts, 1):
-            lines.append(self._format_contact_row(contact, i))
-
-        lines.append("-" * 80)
-        lines.append(f"Total Contacts: {len(contacts)}")
-        lines.append("=" * 80)
-
-        return "\n".join(lines)
+        count = 0
+        for count, contact in enumerate(contacts, 1):
+            yield self._format_contact_row(contact, count)
 
-    def _format_csv(self, contacts: List[Contact], award_name: str) -> str:
-        """Format report as CSV"""
-        output_lines: List[str] = []
+        yield "-" * 80
+        yield f"Total Contacts: {count}"
+        yield "=" * 80
 
+    def _csv_lines(self, contacts: Iterable[ContactRecord]) -> Iterator[str]:
+        """CSV report lines"""
         # Header row
-        output_lines.append(','.join(self.REPORT_COLUMNS))
+        yield ','.join(self.REPORT_COLUMNS)
 
         # Data rows
         for contact in contacts:
-            row: List[str] = [
-                str(contact.qso_date) if contact.qso_date is not None else '',
-                str(contact.callsign) if contact.callsign is not None else '',
-                str(contact.skcc_number) if contact.skcc_number is not None else '',
-                str(contact.band) if contact.band is not None else '',
-                str(contact.mode) if contact.mode is not None else '',
-                str(contact.time_on) if contact.time_on is not None else '',
-                str(contact.rst_sent) if contact.rst_sent is not None else '',
-                str(contact.rst_rcvd) if contact.rst_rcvd is not None else '',
-                (str(contact.notes) if contact.notes is not None else '').replace(',', ';')  # Escape commas in notes
-            ]
-            output_lines.append(','.join(f'"{field}"' for field in row))
-
-        return "\n".join(output_lines)
-
-    def _format_tsv(self, contacts: List[Contact], award_name: str) -> str:
-        """Format report as Tab-Separated Values"""
-        output_lines: List[str] = []
+            row = self._report_fields(contact)
+            row[-1] = row[-1].replace(',', ';')  # Escape commas in notes
+            yield ','.join(f'"{field}"' for field in row)
 
+    def _tsv_lines(self, contacts: Iterable[ContactRecord]) -> Iterator[str]:
+        """Tab-Separated Values report lines"""
         # Header row
-        output_lines.append('\t'.join(self.REPORT_COLUMNS))
+        yield '\t'.join(self.REPORT_COLUMNS)
 
         # Data rows
         for contact in contacts:
-            row: List[str] = [
-                str(contact.qso_date) if contact.qso_date is not None else '',
-                str(contact.callsign) if contact.callsign is not None else '',
-                str(contact.skcc_number) if contact.skcc_number is not None else '',
-                str(contact.band) if contact.band is not None else '',
-                str(contact.mode) if contact.mode is not None else '',
-                str(contact.time_on) if contact.time_on is not None else '',
-                str(contact.rst_sent) if contact.rst_sent is not None else '',
-                str(contact.rst_rcvd) if contact.rst_rcvd is not None else '',
-                (str(contact.notes) if contact.notes is not None else '').replace('\t', ' ')  # Replace tabs with spaces
-            ]
-            output_lines.append('\t'.join(row))
-
-        return "\n".join(output_lines)
+            row = self._report_fields(contact)
+            row[-1] = row[-1].replace('\t', ' ')  # Replace tabs with spaces
+            yield '\t'.join(row)
 
-    def _format_html(
+    def _report_fields(self, contact: ContactRecord) -> List[str]:
+        """Report column values of a contact (NULL as empty string)"""
+        return [
+            str(contact.qso_date) if contact.qso_date is not None else '',
+            str(contact.callsign) if contact.callsign is not None else '',
+            str(contact.skcc_number) if contact.skcc_number is not None else '',
+            str(contact.band) if contact.band is not None else '',
+            str(contact.mode) if contact.mode is not None else '',
+            str(contact.time_on) if contact.time_on is not None else '',
+            str(contact.rst_sent) if contact.rst_sent is not None else '',
+            str(contact.rst_rcvd) if contact.rst_rcvd is not None else '',
+            str(contact.notes) if contact.notes is not None else '',
+        ]
+
+    def _html_lines(
         self,
-        contacts: List[Contact],
+        contacts: Iterable[ContactRecord],
         award_name: str,
-        include_summary: bool = True
-    ) -> str:
-        """Format report as HTML"""
-        lines: List[str] = []
-
-        lines.append("<!DOCTYPE html>")
-        lines.append("<html>")
-        lines.append("<head>")
-        lines.append(f"<title>SKCC {award_name} Award Report - {self.my_callsign}</title>")
-        lines.append("<style>")
-        lines.append("""
+        summary: Optional[ReportSummary] = None
+    ) -> Iterator[str]:
+        """HTML report lines (summary section only if a summary is given)"""
+        yield "<!DOCTYPE html>"
+        yield "<html>"
+        yield "<head>"
+        yield f"<title>SKCC {award_name} Award Report - {self.my_callsign}</title>"
+        yield "<style>"
+        yield """
             body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
             .header { background-color: #1E88E5; color: white; padding: 20px; border-radius: 5px; }
             .header h1 { margin: 0; }
@@ -564,74 +742,70 @@ class AwardReportGenerator:
             td { padding: 8px; border-bottom: 1px solid #ddd; }
             tr:hover { background-color: #f5f5f5; }
             .footer { text-align: center; margin-top: 20px; color: #666; font-size: 12px; }
-        """)
-        lines.append("</style>")
-        lines.append("</head>")
-        lines.append("<body>")
+        """
+        yield "</style>"
+        yield "</head>"
+        yield "<body>"
 
         # Header
-        lines.append("<div class='header'>")
-        lines.append(f"<h1>SKCC {award_name} Award Application Report</h1>")
-        lines.append("</div>")
+        yield "<div class='header'>"
+        yield f"<h1>SKCC {award_name} Award Application Report</h1>"
+        yield "</div>"
 
         # Operator Information
-        lines.append("<div class='operator-info'>")
-        lines.append("<h2>Operator Information</h2>")
-        lines.append(f"<p><strong>Call Sign:</strong> {self.my_callsign}</p>")
-        lines.append(f"<p><strong>SKCC Number:</strong> {self.my_skcc}</p>")
-        lines.append(f"<p><strong>Report Generated:</strong> {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}</p>")
-        lines.append("</div>")
+        yield "<div class='operator-info'>"
+        yield "<h2>Operator Information</h2>"
+        yield f"<p><strong>Call Sign:</strong> {self.my_callsign}</p>"
+        yield f"<p><strong>SKCC Number:</strong> {self.my_skcc}</p>"
+        yield f"<p><strong>Report Generated:</strong> {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}</p>"
+        yield "</div>"
 
         # Summary
-        if include_summary:
-            unique_calls = len(set(c.callsign for c in contacts))
-            unique_skcc = len(set(c.skcc_number for c in contacts if c.skcc_number is not None))
-            date_range = self._get_date_range(contacts)
-
-            lines.append("<div class='summary'>")
-            lines.append("<h2>Summary</h2>")
-            lines.append(f"<p><strong>Total QSOs:</strong> {len(contacts)}</p>")
-            lines.append(f"<p><strong>Unique Call Signs:</strong> {unique_calls}</p>")
-            lines.append(f"<p><strong>Unique SKCC Members:</strong> {unique_skcc}</p>")
+        if summary is not None:
+            date_range = summary.date_range
+
+            yield "<div class='summary'>"
+            yield "<h2>Summary</h2>"
+            yield f"<p><strong>Total QSOs:</strong> {summary.total}</p>"
+            yield f"<p><strong>Unique Call Signs:</strong> {len(summary.callsigns)}</p>"
+            yield f"<p><strong>Unique SKCC Members:</strong> {len(summary.skcc_numbers)}</p>"
             if date_range:
-                lines.append(f"<p><strong>Date Range:</strong> {date_range[0]} to {date_range[1]}</p>")
-            lines.append("</div>")
+                yield f"<p><strong>Date Range:</strong> {date_range[0]} to {date_range[1]}</p>"
+            yield "</div>"
 
         # Contact List
-        lines.append("<h2>Contact List</h2>")
-        lines.append("<table>")
-        lines.append("<thead>")
-        lines.append("<tr>")
+        yield "<h2>Contact List</h2>"
+        yield "<table>"
+        yield "<thead>"
+        yield "<tr>"
         for col in self.REPORT_COLUMNS:
-            lines.append(f"<th>{col}</th>")
-        lines.append("</tr>")
-        lines.append("</thead>")
-        lines.append("<tbody>")
+            yield f"<th>{col}</th>"
+        yield "</tr>"
+        yield "</thead>"
+        yield "<tbody>"
 
         for contact in contacts:
-            lines.append("<tr>")
-            lines.append(f"<td>{contact.qso_date or ''}</td>")
-            lines.append(f"<td>{contact.callsign or ''}</td>")
-            lines.append(f"<td>{contact.skcc_number or ''}</td>")
-            lines.append(f"<td>{contact.band or ''}</td>")
-            lines.append(f"<td>{contact.mode or ''}</td>")
-            lines.append(f"<td>{contact.time_on or ''}</td>")
-            lines.append(f"<td>{contact.rst_sent or ''}</td>")
-            lines.append(f"<td>{contact.rst_rcvd or ''}</td>")
-            lines.append(f"<td>{contact.notes or ''}</td>")
-            lines.append("</tr>")
-
-        lines.append("</tbody>")
-        lines.append("</table>")
-
-        lines.append("<div class='footer'>")
-        lines.append(f"<p>Generated by W4GNS Logger on {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}</p>")
-        lines.append("</div>")
-
-        lines.append("</body>")
-        lines.append("</html>")
-
-        return "\n".join(lines)
+            yield "<tr>"
+            yield f"<td>{contact.qso_date or ''}</td>"
+            yield f"<td>{contact.callsign or ''}</td>"
+            yield f"<td>{contact.skcc_number or ''}</td>"
+            yield f"<td>{contact.band or ''}</td>"
+            yield f"<td>{contact.mode or ''}</td>"
+            yield f"<td>{contact.time_on or ''}</td>"
+            yield f"<td>{contact.rst_sent or ''}</td>"
+            yield f"<td>{contact.rst_rcvd or ''}</td>"
+            yield f"<td>{contact.notes or ''}</td>"
+            yield "</tr>"
+
+        yield "</tbody>"
+        yield "</table>"
+
+        yield "<div class='footer'>"
+        yield f"<p>Generated by W4GNS Logger on {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}</p>"
+        yield "</div>"
+
+        yield "</body>"
+        yield "</html>"
 
     def _format_table_header(self) -> str:
         """Format table header row"""
@@ -661,15 +835,6 @@ class AwardReportGenerator:
             row_parts.append(str(val).ljust(width))
         return "".join(row_parts)
 
-    def _get_date_range(self, contacts: List[Contact]) -> Optional[Tuple[str, str]]:
-        """Get min and max dates from contacts"""
-        if not contacts:
-            return None
-        dates = [str(c.qso_date) for c in contacts if c.qso_date is not None]
-        if not dates:
-            return None
-        return (min(dates), max(dates))
-
     def export_report_to_file(
         self,
         report_text: str,
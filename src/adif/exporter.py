@@ -163,7 +163,6 @@ class ADIFExporter:
         my_callsign: Optional[str] = None
     ) -> None:
         """Export contacts to ADIF file in SKCCLogger format
-        Uses Rust acceleration when available for 30-50x speedup.
 
         Args:
             filename: Output file path
@@ -180,7 +179,6 @@ class ADIFExporter:
             raise ValueError("No contacts to export")
 
         try:
-            # Python implementation
             with open(filename, 'w', encoding='utf-8') as f:
                 # Write ADIF header with record count
                 header = self._build_header(my_skcc, len(contacts), my_callsign)
@@ -3,16 +3,128 @@ ADIF Parser Module
 
 Handles parsing of ADIF (ADI and ADX) format files.
 Implements ADIF 3.x specification compliance.
-Pure Python implementation for thread safety.
+
+ADI text is split into records by the 'parse_adi' acceleration kernel:
+parse_adi_content() is the pure Python reference, and a matching Rust
+implementation is used when it is installed (see src.utils.acceleration).
 """
 
 import logging
 import re
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import IO, List, Dict, Any, Iterator, Tuple, Union
+
+from src.utils.acceleration import PARSE_ADI
 
 logger = logging.getLogger(__name__)
 
+# ADIF field pattern: <FIELDNAME:length>value
+FIELD_PATTERN = re.compile(r"<([A-Z_0-9]+):(\d+)>([^<]*)")
+
+
+def parse_adi_content(content: str) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
+    """
+    Split ADI text into records and header (reference 'parse_adi' kernel)
+
+    Args:
+        content: ADI file content
+
+    Returns:
+        Tuple of (records, header) as field name -> raw value dicts
+    """
+    # Split header and records
+    if "<EOH>" in content:
+        header_str, records_str = content.split("<EOH>", 1)
+    else:
+        header_str = ""
+        records_str = content
+
+    header = {field_name: value for field_name, _, value in FIELD_PATTERN.findall(header_str)}
+
+    # Parse records (split by <EOR>)
+    records = []
+    for record_str in records_str.split("<EOR>"):
+        if record_str.strip():
+            record = {field_name: value for field_name, _, value in FIELD_PATTERN.findall(record_str)}
+            if record:
+                records.append(record)
+
+    return records, header
+
+
+# Tag names, which ADIF treats case-insensitively (LoTW and WSJT-X write lowercase)
+TAG_NAME_PATTERN = re.compile(r"<([A-Za-z_0-9]+)")
+EOH_PATTERN = re.compile(r"<eoh>", re.IGNORECASE)
+EOR_PATTERN = re.compile(r"<eor>", re.IGNORECASE)
+
+STREAM_CHUNK_SIZE = 1 << 16  # Characters read per chunk by iter_adi_records()
+
+
+def normalize_adi_tags(content: str) -> str:
+    """
+    Uppercase ADI tag names (values are left alone)
+
+    parse_adi_content() only recognizes uppercase tags.
+
+    Args:
+        content: ADI text
+
+    Returns:
+        ADI text with uppercase tag names
+    """
+    return TAG_NAME_PATTERN.sub(lambda match: f"<{match.group(1).upper()}", content)
+
+
+def iter_adi_records(
+    source: Union[str, Path, IO[str]],
+    chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[Dict[str, str]]:
+    """
+    Stream the records of an ADI file without reading it into memory
+
+    Tag names are matched case-insensitively; the header is skipped.
+
+    Args:
+        source: File path or text stream
+        chunk_size: Characters read at a time
+
+    Yields:
+        Records as uppercase field name -> raw value dicts
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "r", encoding="utf-8", errors="replace") as f:
+            yield from iter_adi_records(f, chunk_size)
+        return
+
+    buffer = ""
+    in_header = True
+    while True:
+        chunk = source.read(chunk_size)
+        buffer += chunk
+        if in_header:
+            eoh = EOH_PATTERN.search(buffer)
+            eor = EOR_PATTERN.search(buffer)
+            if eoh and (not eor or eoh.start() < eor.start()):
+                buffer = buffer[eoh.end():]
+                in_header = False
+            elif eor or not chunk:
+                in_header = False  # No header
+            else:
+                continue
+
+        # Keep the text after the last <EOR>: it may be a partial record
+        parts = EOR_PATTERN.split(buffer)
+        buffer = parts.pop() if chunk else ""
+        for record_str in parts:
+            record = {
+                field_name: value
+                for field_name, _, value in FIELD_PATTERN.findall(normalize_adi_tags(record_str))
+            }
+            if record:
+                yield record
+        if not chunk:
+            return
+
 
 class ADIFParser:
     """Parser for ADIF files (both ADI text and ADX XML formats)
@@ -21,9 +133,6 @@ class ADIFParser:
     Reference: https://adif.org/315/ADIF_315.htm
     """
 
-    # ADIF field pattern: <FIELDNAME:length>value
-    FIELD_PATTERN = re.compile(r"<([A-Z_0-9]+):(\d+)>([^<]*)")
-
     # Required fields per ADIF spec
     REQUIRED_FIELDS = {
         "CALL",           # Contacted station callsign
@@ -127,7 +236,7 @@ class ADIFParser:
     def _parse_adi(self, file_path: Path) -> Tuple[List[Dict], Dict[str, Any]]:
         """
         Parse ADI (text) format ADIF file
-        Uses Rust acceleration when available for 50-100x speedup.
+        Uses the fastest installed 'parse_adi' kernel backend.
 
         Args:
             file_path: Path to ADI file
@@ -143,26 +252,9 @@ class ADIFParser:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            # Split header and records
-            if "<EOH>" in content:
-                header_str, records_str = content.split("<EOH>", 1)
-            else:
-                header_str = ""
-                records_str = content
-
-            # Parse header
-            self._parse_header(header_str)
-
-            # Parse records (split by <EOR>)
-            record_strings = records_str.split("<EOR>")
-
-            for line_num, record_str in enumerate(record_strings, 1):
-                if record_str.strip():
-                    record = self._parse_record(record_str, line_num)
-                    if record:
-                        self.records.append(record)
+            self.records, self.header = PARSE_ADI(content)
 
-            logger.info(f"Parsed {len(self.records)} records from {file_path} (Python)")
+            logger.info(f"Parsed {len(self.records)} records from {file_path} ({PARSE_ADI.backend})")
             return self.records, self.header
 
         except Exception as e:
@@ -208,22 +300,6 @@ class ADIFParser:
             logger.error(f"Error parsing ADX file: {e}")
             raise
 
-    def _parse_header(self, header_str: str) -> None:
-        """Parse ADIF header"""
-        matches = self.FIELD_PATTERN.findall(header_str)
-        for field_name, length, value in matches:
-            self.header[field_name] = value
-
-    def _parse_record(self, record_str: str, line_num: int) -> Optional[Dict[str, Any]]:
-        """Parse single ADIF record"""
-        record = {}
-        matches = self.FIELD_PATTERN.findall(record_str)
-
-        for field_name, length, value in matches:
-            record[field_name] = value
-
-        return record if record else None
-
     def validate_records(self) -> List[Dict[str, Any]]:
         """
         Validate parsed records against ADIF 3.1.5 specification
@@ -405,3 +481,128 @@ class ADIFParser:
         # Grid pattern: 2 letters, 2 digits, optionally 4 more chars
         pattern = r"^[A-X]{2}[0-9]{2}([a-x]{2}[0-9]{2})?$"
         return bool(re.match(pattern, grid, re.IGNORECASE))
+
+
+# Map ADIF field names to database field names (reverse of exporter)
+ADIF_TO_DB = {
+    'CALL': 'callsign',
+    'QSO_DATE': 'qso_date',
+    'TIME_ON': 'time_on',
+    'TIME_OFF': 'time_off',
+    'BAND': 'band',
+    'FREQ': 'frequency',
+    'FREQ_RX': 'freq_rx',
+    'MODE': 'mode',
+    'RST_SENT': 'rst_sent',
+    'RST_RCVD': 'rst_rcvd',
+    'TX_PWR': 'tx_power',
+    'RX_PWR': 'rx_power',
+
+    'MY_GRIDSQUARE': 'my_gridsquare',
+    'GRIDSQUARE': 'gridsquare',
+    'MY_CITY': 'my_city',
+    'MY_COUNTRY': 'my_country',
+    'MY_STATE': 'my_state',
+    'NAME': 'name',
+    'QTH': 'qth',
+    'COUNTRY': 'country',
+
+    'DXCC': 'dxcc',
+    'CQZ': 'cqz',
+    'ITUZ': 'ituz',
+    'STATE': 'state',
+    'COUNTY': 'county',
+    'ARRL_SECT': 'arrl_sect',
+    'IOTA': 'iota',
+    'IOTA_ISLAND_ID': 'iota_island_id',
+    'SOTA_REF': 'sota_ref',
+    'POTA_REF': 'pota_ref',
+    'VUCC_GRIDS': 'vucc_grids',
+
+    'OPERATOR': 'operator',
+    'STATION_CALLSIGN': 'station_callsign',
+    'MY_RIG': 'my_rig',
+    'MY_RIG_MAKE': 'my_rig_make',
+    'MY_RIG_MODEL': 'my_rig_model',
+    'RIG_MAKE': 'rig_make',
+    'RIG_MODEL': 'rig_model',
+    'MY_ANTENNA': 'my_antenna',
+    'MY_ANTENNA_MAKE': 'my_antenna_make',
+    'MY_ANTENNA_MODEL': 'my_antenna_model',
+    'ANT_MAKE': 'antenna_make',
+    'ANT_MODEL': 'antenna_model',
+
+    'SKCC': 'skcc_number',
+    'KEY_TYPE': 'key_type',
+    'APP_SKCCLOGGER_KEYTYPE': 'key_type',  # Custom SKCC Logger field for key type
+
+    'PROPAGATION_MODE': 'propagation_mode',
+    'SAT_NAME': 'sat_name',
+    'SAT_MODE': 'sat_mode',
+    'A_INDEX': 'a_index',
+    'K_INDEX': 'k_index',
+    'SFI': 'sfi',
+    'ANTENNA_AZ': 'antenna_az',
+    'ANTENNA_EL': 'antenna_el',
+    'DISTANCE': 'distance',
+    'LATITUDE': 'latitude',
+    'LONGITUDE': 'longitude',
+
+    'QSL_RCVD': 'qsl_rcvd',
+    'QSL_SENT': 'qsl_sent',
+    'QSL_RCVD_DATE': 'qsl_rcvd_date',
+    'QSL_SENT_DATE': 'qsl_sent_date',
+    'QSL_VIA': 'qsl_via',
+    'LOTW_QSL_RCVD': 'lotw_qsl_rcvd',
+    'LOTW_QSL_SENT': 'lotw_qsl_sent',
+    'EQSL_QSL_RCVD': 'eqsl_qsl_rcvd',
+    'EQSL_QSL_SENT': 'eqsl_qsl_sent',
+    'CLUBLOG_QSO_UPLOAD_STATUS': 'clublog_status',
+
+    'NOTES': 'notes',
+    'COMMENT': 'comment',
+    'QSLMSG': 'qslmsg',
+
+    'CONTEST_ID': 'contest_id',
+    'CLASS': 'class_field',
+    'CHECK': 'check',
+}
+
+
+def map_adif_records(adif_records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Map ADIF field names to database field names
+
+    Args:
+        adif_records: List of records with ADIF field names (uppercase)
+
+    Returns:
+        List of records with database field names (lowercase)
+    """
+    mapped_records = []
+    for record in adif_records:
+        mapped = {}
+        for adif_key, value in record.items():
+            db_key = ADIF_TO_DB.get(adif_key)
+            if db_key:
+                mapped[db_key] = value
+            else:
+                # Include unmapped fields as-is (might be custom fields)
+                mapped[adif_key.lower()] = value
+
+        # Normalize key_type field: convert SKCC Logger abbreviations to standard names
+        if 'key_type' in mapped and mapped['key_type']:
+            key_type = mapped['key_type'].upper().strip()
+            # SKCC Logger uses: SK, BUG, SS
+            # Standard uses: STRAIGHT, BUG, SIDESWIPER
+            if key_type == 'SK':
+                mapped['key_type'] = 'STRAIGHT'
+            elif key_type == 'SS':
+                mapped['key_type'] = 'SIDESWIPER'
+            elif key_type == 'BUG':
+                mapped['key_type'] = 'BUG'  # Already correct
+            else:
+                mapped['key_type'] = key_type.upper()  # Keep other values as-is
+
+        mapped_records.append(mapped)
+
+    return mapped_records
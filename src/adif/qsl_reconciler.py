@@ -0,0 +1,275 @@
+"""
+QSL Confirmation Reconciliation
+
+Applies a confirmation report (LoTW lotwreport.adi, eQSL inbox download)
+to the log in bulk instead of one query per record:
+- The log is loaded once into an in-memory index keyed on
+  (callsign, band, mode group, date)
+- The report is streamed record by record (iter_adi_records)
+- Each confirmation matches the closest logged QSO within +/- time_window
+  minutes, looking at the neighbouring dates too, so clock offsets, QSOs
+  across midnight, band spelling ("40m" vs "40M", or only a frequency) and
+  submodes (USB vs SSB, FT8 vs DATA) still match
+- Flags and QSLRecord rows are written in one transaction
+  (DatabaseRepository.apply_qsl_confirmations)
+- Confirmations that match nothing are reported back
+"""
+
+import logging
+from datetime import date
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.adif.parser import iter_adi_records
+from src.utils.grid_calc import frequency_to_band
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIME_WINDOW_MINUTES = 30  # LoTW's own matching tolerance
+
+CONFIRMATION_TYPES = {'lotw': 'LOTW', 'eqsl': 'EQSL'}
+CONFIRMATION_SOURCES = {'LOTW': 'LoTW', 'EQSL': 'eQSL'}
+
+# Mode groups used by LoTW; every other mode is DATA
+PHONE_MODES = frozenset({
+    'PHONE', 'SSB', 'USB', 'LSB', 'AM', 'FM', 'DIGITALVOICE', 'DSTAR', 'C4FM', 'DMR', 'FREEDV',
+})
+IMAGE_MODES = frozenset({'IMAGE', 'SSTV', 'ATV', 'FAX'})
+
+# Report fields holding the date the confirmation was received
+RECEIVED_DATE_FIELDS = ('QSLRDATE', 'LOTW_QSLRDATE', 'EQSL_QSLRDATE')
+
+# (callsign, band, mode group, date ordinal)
+IndexKey = Tuple[str, str, str, int]
+
+
+def mode_group(mode: Optional[str]) -> str:
+    """
+    Group a mode the way LoTW matches it
+
+    Args:
+        mode: ADIF mode or submode (e.g. "USB", "FT8")
+
+    Returns:
+        'CW', 'PHONE', 'IMAGE' or 'DATA' ('' if no mode)
+    """
+    mode = (mode or '').strip().upper()
+    if not mode:
+        return ''
+    if mode == 'CW':
+        return 'CW'
+    if mode in PHONE_MODES:
+        return 'PHONE'
+    if mode in IMAGE_MODES:
+        return 'IMAGE'
+    return 'DATA'
+
+
+def normalize_band(band: Optional[str], frequency: Any = None) -> str:
+    """
+    Normalize a band name, deriving it from the frequency (MHz) when missing
+
+    Returns:
+        Uppercase band (e.g. "40M"), or '' if unknown
+    """
+    band = (band or '').strip().upper()
+    if band or frequency in (None, ''):
+        return band
+    try:
+        band = frequency_to_band(float(frequency))
+    except (TypeError, ValueError):
+        return ''
+    return '' if band == 'UNK' else band
+
+
+def qso_minute(qso_date: Optional[str], time_on: Optional[str]) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    Convert a QSO date and start time to (date ordinal, minute of the day)
+
+    Args:
+        qso_date: YYYYMMDD
+        time_on: HHMM, HHMMSS or HH:MM (minute is None if missing or unreadable)
+
+    Returns:
+        Tuple, or None if the date is unreadable
+    """
+    qso_date = (qso_date or '').strip()
+    try:
+        ordinal = date(int(qso_date[:4]), int(qso_date[4:6]), int(qso_date[6:8])).toordinal()
+    except ValueError:
+        return None
+    digits = (time_on or '').replace(':', '').strip()
+    if len(digits) >= 4 and digits[:4].isdigit():
+        return ordinal, int(digits[:2]) * 60 + int(digits[2:4])
+    return ordinal, None
+
+
+class LogIndex:
+    """Logged QSOs keyed on (callsign, band, mode group, date) for bulk matching"""
+
+    def __init__(self, records: Iterable[Any] = ()):
+        """
+        Initialize index
+
+        Args:
+            records: Contact records with id, callsign, band, mode, frequency,
+                qso_date and time_on
+        """
+        self._entries: Dict[IndexKey, List[Tuple[Optional[int], int]]] = {}
+        self.size = 0
+        for record in records:
+            self.add(record.id, record.callsign, record.band, record.mode, record.frequency,
+                     record.qso_date, record.time_on)
+
+    def add(
+        self,
+        contact_id: int,
+        callsign: Optional[str],
+        band: Optional[str],
+        mode: Optional[str],
+        frequency: Any,
+        qso_date: Optional[str],
+        time_on: Optional[str],
+    ) -> None:
+        """Index one logged QSO (QSOs without a callsign or date are skipped)"""
+        when = qso_minute(qso_date, time_on)
+        callsign = (callsign or '').strip().upper()
+        if when is None or not callsign:
+            return
+        key = (callsign, normalize_band(band, frequency), mode_group(mode), when[0])
+        self._entries.setdefault(key, []).append((when[1], contact_id))
+        self.size += 1
+
+    def match(
+        self,
+        callsign: Optional[str],
+        band: Optional[str],
+        mode: Optional[str],
+        frequency: Any,
+        qso_date: Optional[str],
+        time_on: Optional[str],
+        time_window: int = DEFAULT_TIME_WINDOW_MINUTES,
+    ) -> Optional[int]:
+        """
+        Find the logged QSO a confirmation refers to
+
+        Args:
+            callsign, band, mode, frequency, qso_date, time_on: Confirmation fields
+            time_window: Largest start time difference in minutes
+
+        Returns:
+            Contact id of the closest QSO within the window, or None
+        """
+        when = qso_minute(qso_date, time_on)
+        callsign = (callsign or '').strip().upper()
+        if when is None or not callsign:
+            return None
+        ordinal, minute = when
+        band = normalize_band(band, frequency)
+        group = mode_group(mode)
+
+        best: Optional[Tuple[float, int]] = None
+        # Neighbouring dates catch QSOs logged on the other side of midnight
+        days = (-1, 0, 1) if minute is not None else (0,)
+        for day in days:
+            for logged_minute, contact_id in self._entries.get((callsign, band, group, ordinal + day), ()):
+                if minute is None or logged_minute is None:
+                    distance = 0.0 if day == 0 else float('inf')
+                else:
+                    distance = abs(day * 1440 + logged_minute - minute)
+                if distance <= time_window and (best is None or distance < best[0]):
+                    best = (distance, contact_id)
+        return best[1] if best else None
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class QSLReconciler:
+    """Matches confirmation reports against the log and records the confirmations"""
+
+    def __init__(self, db: Any, time_window: int = DEFAULT_TIME_WINDOW_MINUTES):
+        """
+        Initialize reconciler
+
+        Args:
+            db: DatabaseRepository holding the log
+            time_window: Largest start time difference in minutes for a match
+        """
+        self.db = db
+        self.time_window = time_window
+
+    def build_index(self) -> LogIndex:
+        """Load the matching columns of every contact into a LogIndex"""
+        records = self.db.iter_contact_records(
+            columns=('id', 'callsign', 'band', 'mode', 'frequency', 'qso_date', 'time_on')
+        )
+        index = LogIndex(records)
+        logger.debug(f"Indexed {len(index)} logged QSOs for QSL matching")
+        return index
+
+    def reconcile(
+        self,
+        source: Union[str, Path, IO[str]],
+        confirmation_type: str = 'LOTW',
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Apply a confirmation report to the log
+
+        Args:
+            source: Report file path or text stream (ADI)
+            confirmation_type: 'LOTW' or 'EQSL'
+            dry_run: Match only, without writing to the database
+
+        Returns:
+            Dictionary with 'confirmations' (confirmed records in the report),
+            'matched', 'not_confirmed' (records with QSL_RCVD other than Y),
+            'flagged' and 'recorded' (see apply_qsl_confirmations) and
+            'unmatched' (the confirmation records that match no logged QSO)
+
+        Raises:
+            ValueError: If the confirmation type is unknown
+        """
+        confirmation_type = CONFIRMATION_TYPES.get(confirmation_type.lower(), confirmation_type.upper())
+        if confirmation_type not in CONFIRMATION_SOURCES:
+            raise ValueError(f"Unknown confirmation type: {confirmation_type}")
+
+        index = self.build_index()
+        matches: List[Tuple[int, Optional[str]]] = []
+        unmatched: List[Dict[str, str]] = []
+        confirmations = not_confirmed = 0
+
+        for record in iter_adi_records(source):
+            record = {key: value.strip() for key, value in record.items()}
+            if record.get('QSL_RCVD', 'Y').upper() != 'Y':
+                not_confirmed += 1
+                continue
+            confirmations += 1
+            contact_id = index.match(
+                record.get('CALL'), record.get('BAND'), record.get('MODE'), record.get('FREQ'),
+                record.get('QSO_DATE'), record.get('TIME_ON'), self.time_window,
+            )
+            if contact_id is None:
+                unmatched.append(record)
+                continue
+            received = next((record[f][:8] for f in RECEIVED_DATE_FIELDS if record.get(f)), None)
+            matches.append((contact_id, received))
+
+        applied = {'flagged': 0, 'recorded': 0}
+        if matches and not dry_run:
+            applied = self.db.apply_qsl_confirmations(
+                confirmation_type, matches, CONFIRMATION_SOURCES[confirmation_type]
+            )
+
+        logger.info(
+            f"{confirmation_type} reconciliation: {len(matches)} of {confirmations} confirmations matched, "
+            f"{len(unmatched)} unmatched"
+        )
+        return {
+            'confirmations': confirmations,
+            'matched': len(matches),
+            'not_confirmed': not_confirmed,
+            **applied,
+            'unmatched': unmatched,
+        }
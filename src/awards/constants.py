@@ -58,6 +58,22 @@ SENATOR_ENDORSEMENTS: List[Tuple[int, str]] = [
     (2000, "Senator x10"),
 ]
 
+# Rag Chew Award Endorsement Levels (accumulated minutes)
+RAG_CHEW_ENDORSEMENTS: List[Tuple[int, str]] = [
+    (300, "Rag Chew"),
+    (600, "Rag Chew x2"),
+    (900, "Rag Chew x3"),
+    (1200, "Rag Chew x4"),
+    (1500, "Rag Chew x5"),
+    (1800, "Rag Chew x6"),
+    (2100, "Rag Chew x7"),
+    (2400, "Rag Chew x8"),
+    (2700, "Rag Chew x9"),
+    (3000, "Rag Chew x10"),
+    (4500, "Rag Chew x15"),
+    (6000, "Rag Chew x20"),
+]
+
 # Award Effective Dates (YYYYMMDD format)
 TRIBUNE_EFFECTIVE_DATE = "20070301"  # March 1, 2007
 SENATOR_EFFECTIVE_DATE = "20130801"  # August 1, 2013
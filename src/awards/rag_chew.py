@@ -24,7 +24,7 @@ Rules:
 """
 
 import logging
-from typing import Dict, List, Any, Set, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 
@@ -35,6 +35,33 @@ from src.awards.base import AwardProgram
 logger = logging.getLogger(__name__)
 
 
+def qso_duration_minutes(time_on: str, time_off: str) -> Optional[int]:
+    """
+    Calculate QSO duration in minutes from time_on and time_off (HHMM format)
+
+    Args:
+        time_on: Start time in HHMM format (e.g., "1430")
+        time_off: End time in HHMM format (e.g., "1500")
+
+    Returns:
+        Duration in minutes, or None if calculation fails
+    """
+    try:
+        if not time_on or not time_off:
+            return None
+
+        on_total = int(time_on[:2]) * 60 + int(time_on[2:4])
+        off_total = int(time_off[:2]) * 60 + int(time_off[2:4])
+
+        if off_total >= on_total:
+            return off_total - on_total
+        # Wrapped to next day (e.g., 2300 to 0030)
+        return (1440 - on_total) + off_total
+    except (ValueError, IndexError):
+        logger.debug(f"Failed to calculate duration from {time_on} to {time_off}")
+        return None
+
+
 class RagChewAward(AwardProgram):
     """SKCC Rag Chew Award - Extended CW Conversations"""
 
@@ -128,7 +155,8 @@ class RagChewAward(AwardProgram):
         Tracks single-band endorsement progress separately.
 
         Args:
-            contacts: List of contact records (should be sorted by date and time)
+            contacts: List of contact records (duration in minutes, or time_off
+                to derive it from)
 
         Returns:
             {
@@ -140,49 +168,18 @@ class RagChewAward(AwardProgram):
                 'current_minutes': int,      # Total qualified minutes
                 'total_contacts': int,       # Number of qualifying contacts
                 'band_progress': dict,       # Single-band progress by band
-                'back_to_back_rejected': int # Contacts rejected due to back-to-back rule
+                'back_to_back_rejected': int, # Contacts rejected due to back-to-back rule
+                'milestones': list           # Milestone per level reached (QSO and date)
             }
         """
-        # Sort contacts by date and time for back-to-back checking
-        sorted_contacts = sorted(
-            contacts,
-            key=lambda c: (c.get('qso_date', ''), c.get('qso_time', ''))
-        )
-
-        total_minutes: float = 0.0
-        back_to_back_rejected = 0
-        last_contacted_member = None
-        qualified_contacts = []
-        band_minutes: Dict[str, float] = {}
-
-        for contact in sorted_contacts:
-            if self.validate(contact):
-                skcc_num = contact.get('skcc_number', '').strip()
-                duration_minutes = float(contact.get('duration', 0))
-                band = contact.get('band', 'UNKNOWN').upper()
-
-                if skcc_num:
-                    # Extract base SKCC number using utility function
-                    base_number = extract_base_skcc_number(skcc_num)
-
-                    # CRITICAL RULE: Back-to-back Prevention
-                    # Different member must intervene between contacts with same member
-                    if base_number == last_contacted_member:
-                        logger.debug(
-                            f"Back-to-back contact with {base_number} rejected for Rag Chew"
-                        )
-                        back_to_back_rejected += 1
-                        continue  # Skip this contact
-
-                    # This contact qualifies
-                    total_minutes += duration_minutes
-                    qualified_contacts.append(contact)
-                    last_contacted_member = base_number
-
-                    # Track band-specific minutes
-                    if band not in band_minutes:
-                        band_minutes[band] = 0
-                    band_minutes[band] += float(duration_minutes)
+        # Same state machine as the award timeline replay (sorts only if needed)
+        from src.awards.timeline import RagChewTrack, in_replay_order
+
+        track = RagChewTrack(self)
+        for contact in in_replay_order(contacts):
+            track.feed(contact)
+        total_minutes = track.minutes
+        band_minutes = track.band_minutes
 
         # Determine level based on total minutes
         level_name, required_minutes = self._get_endorsement_level(int(total_minutes))
@@ -204,9 +201,10 @@ class RagChewAward(AwardProgram):
             'progress_pct': min(100.0, (float(total_minutes) / self.base_duration) * 100),
             'level': level_name,
             'current_minutes': int(total_minutes),
-            'total_contacts': len(qualified_contacts),
+            'total_contacts': len(track.credited),
             'band_progress': band_progress,
-            'back_to_back_rejected': back_to_back_rejected,
+            'back_to_back_rejected': track.back_to_back_rejected,
+            'milestones': track.milestones,
             'bands_worked': len(band_minutes),
             'band_breakdown': band_minutes
         }
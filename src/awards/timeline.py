@@ -0,0 +1,373 @@
+"""
+SKCC Award Timeline Replay
+
+Replays the log once in (qso_date, time_on) order and advances the
+Centurion, Tribune, Senator and Rag Chew state machines together:
+- Each award credits a QSO only when its own rules hold at that point of
+  the timeline (Tribune after the Centurion date, Senator after Tribune x8,
+  Rag Chew without back-to-back contacts)
+- Every endorsement threshold crossed (Cx2...Cx10, Tx1...Tx8, Sx1, Rag Chew
+  levels) is recorded with the exact QSO and date that crossed it
+- A prerequisite date reached during the replay replaces guesses such as the
+  earliest CW QSO; same-day QSOs logged before the crossing still count,
+  since the SKCC rules compare dates only
+
+One O(n) scan serves the progress widgets and the application generators.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from src.awards.centurion import CenturionAward
+from src.awards.constants import (
+    CENTURION_ENDORSEMENTS,
+    RAG_CHEW_ENDORSEMENTS,
+    SENATOR_EFFECTIVE_DATE,
+    SENATOR_ENDORSEMENTS,
+    SPECIAL_EVENT_CALLS,
+    TRIBUNE_EFFECTIVE_DATE,
+    TRIBUNE_ENDORSEMENTS,
+    TRIBUNE_SPECIAL_EVENT_CUTOFF,
+    VALID_KEY_TYPES,
+)
+from src.awards.rag_chew import RagChewAward, qso_duration_minutes
+from src.utils.skcc_number import extract_base_skcc_number
+
+logger = logging.getLogger(__name__)
+
+# Endorsement steps past the last published level
+CENTURION_STEP = 500
+TRIBUNE_STEP = 250
+SENATOR_STEP = 200
+RAG_CHEW_STEP = 1500
+
+TRIBUNE_X8_THRESHOLD = 400
+
+
+class Milestone(NamedTuple):
+    """The QSO at which an endorsement threshold was crossed"""
+
+    award: str
+    level: str
+    threshold: int
+    qso_date: str
+    time_on: str
+    callsign: str
+    contact_id: Optional[int]
+
+
+def replay_key(contact: Dict[str, Any]) -> Tuple[str, str]:
+    """Sort key of a contact dict in the replay: (qso_date, time_on)"""
+    return (contact.get('qso_date') or '', contact.get('qso_time') or contact.get('time_on') or '')
+
+
+def in_replay_order(contacts: Sequence[Dict[str, Any]]) -> Sequence[Dict[str, Any]]:
+    """
+    Contacts in replay order, sorting only when they aren't already
+
+    Args:
+        contacts: Contact dicts (typically already ordered by the database index)
+
+    Returns:
+        The same sequence if ordered, otherwise a sorted copy
+    """
+    keys = [replay_key(c) for c in contacts]
+    if all(a <= b for a, b in zip(keys, keys[1:])):
+        return contacts
+    return [c for _, c in sorted(zip(keys, contacts), key=lambda pair: pair[0])]
+
+
+class EndorsementTrack:
+    """Credited count of one award and the milestones reached so far"""
+
+    def __init__(self, award: str, endorsements: List[Tuple[int, str]], step: int):
+        """
+        Initialize track
+
+        Args:
+            award: Award name used in milestones
+            endorsements: Published (threshold, level name) pairs in ascending order
+            step: Threshold increment after the last published level
+        """
+        self.award = award
+        self.count = 0
+        self.credited: List[Dict[str, Any]] = []  # Contacts that added to the count, in order
+        self.milestones: List[Milestone] = []
+        self._endorsements = endorsements
+        self._step = step
+        self._next = 0
+
+    @property
+    def level(self) -> str:
+        """Highest level reached ("Not Yet" before the first)"""
+        return self.milestones[-1].level if self.milestones else "Not Yet"
+
+    def next_level(self) -> Tuple[int, str]:
+        """Threshold and name of the next level"""
+        if self._next < len(self._endorsements):
+            return self._endorsements[self._next]
+        base_threshold, base_name = self._endorsements[0]
+        threshold = self._endorsements[-1][0] + self._step * (self._next - len(self._endorsements) + 1)
+        return threshold, f"{base_name} x{threshold // base_threshold}"
+
+    def credit(self, contact: Dict[str, Any], amount: int = 1) -> None:
+        """
+        Add a contact's credit and record any thresholds it crosses
+
+        Args:
+            contact: Credited contact dict
+            amount: Credit added (1 per member, minutes for Rag Chew)
+        """
+        self.count += amount
+        self.credited.append(contact)
+        threshold, level = self.next_level()
+        while self.count >= threshold:
+            self.milestones.append(Milestone(
+                self.award, level, threshold, contact.get('qso_date') or '',
+                contact.get('qso_time') or contact.get('time_on') or '',
+                contact.get('callsign') or '', contact.get('id'),
+            ))
+            self._next += 1
+            threshold, level = self.next_level()
+
+    def milestone(self, level: str) -> Optional[Milestone]:
+        """Milestone of a level by name (None if not reached)"""
+        for milestone in self.milestones:
+            if milestone.level == level:
+                return milestone
+        return None
+
+    def date_of(self, level: str) -> Optional[str]:
+        """QSO date on which a level was reached (None if not reached)"""
+        milestone = self.milestone(level)
+        return milestone.qso_date if milestone else None
+
+
+class MemberTrack(EndorsementTrack):
+    """Endorsement track counting each SKCC member once"""
+
+    def __init__(self, award: str, endorsements: List[Tuple[int, str]], step: int):
+        super().__init__(award, endorsements, step)
+        self.members: Set[str] = set()
+
+    def credit_member(self, base_number: str, contact: Dict[str, Any]) -> bool:
+        """
+        Credit a member's first qualifying contact
+
+        Returns:
+            True if the member was new
+        """
+        if base_number in self.members:
+            return False
+        self.members.add(base_number)
+        self.credit(contact)
+        return True
+
+
+class RagChewTrack(EndorsementTrack):
+    """Accumulated Rag Chew minutes with the back-to-back rule"""
+
+    def __init__(self, award: Optional[RagChewAward] = None):
+        super().__init__("Rag Chew", RAG_CHEW_ENDORSEMENTS, RAG_CHEW_STEP)
+        self.rules = award or RagChewAward(None)
+        self.minutes = 0.0
+        self.band_minutes: Dict[str, float] = {}
+        self.back_to_back_rejected = 0
+        self._last_member: Optional[str] = None
+
+    def feed(self, contact: Dict[str, Any]) -> None:
+        """Apply one contact (in replay order)"""
+        if contact.get('duration') is None and contact.get('time_off'):
+            time_on = contact.get('qso_time') or contact.get('time_on')
+            contact = dict(contact, duration=qso_duration_minutes(time_on, contact['time_off']))
+        if contact.get('key_type') is None or contact.get('mode') is None:
+            contact = dict(contact, key_type=contact.get('key_type') or '', mode=contact.get('mode') or '')
+        if not self.rules.validate(contact):
+            return
+        skcc_number = contact.get('skcc_number', '').strip()
+        if not skcc_number:
+            return
+        base_number = extract_base_skcc_number(skcc_number)
+
+        # Back-to-back prevention: a different member must intervene
+        if base_number == self._last_member:
+            logger.debug(f"Back-to-back contact with {base_number} rejected for Rag Chew")
+            self.back_to_back_rejected += 1
+            return
+        self._last_member = base_number
+
+        duration = float(contact['duration'])
+        band = contact.get('band', 'UNKNOWN').upper()
+        self.band_minutes[band] = self.band_minutes.get(band, 0) + duration
+        self.minutes += duration
+        self.credit(contact, int(self.minutes) - self.count)
+
+
+class AwardTimeline:
+    """Single-pass replay of the SKCC member awards"""
+
+    def __init__(
+        self,
+        centurion_numbers: Iterable[str] = (),
+        tribune_numbers: Iterable[str] = (),
+        senator_numbers: Iterable[str] = (),
+        centurion_dates: Optional[Dict[str, str]] = None,
+        user_centurion_date: Optional[str] = None,
+    ):
+        """
+        Initialize replay
+
+        Args:
+            centurion_numbers: SKCC numbers on the Centurion list
+            tribune_numbers: SKCC numbers on the Tribune list
+            senator_numbers: SKCC numbers on the Senator list
+            centurion_dates: Centurion date (YYYYMMDD) per SKCC number
+            user_centurion_date: Operator's official Centurion date; None to use
+                the date the replay reaches 100 members
+        """
+        tribune_numbers = set(tribune_numbers)
+        senator_numbers = set(senator_numbers)
+        self._tribune_eligible = set(centurion_numbers) | tribune_numbers | senator_numbers
+        self._senator_eligible = tribune_numbers | senator_numbers
+        self._centurion_dates = centurion_dates or {}
+        self._centurion_rules = CenturionAward(None)
+
+        self.centurion = MemberTrack("Centurion", CENTURION_ENDORSEMENTS, CENTURION_STEP)
+        self.tribune = MemberTrack("Tribune", TRIBUNE_ENDORSEMENTS, TRIBUNE_STEP)
+        self.senator = MemberTrack("Senator", SENATOR_ENDORSEMENTS, SENATOR_STEP)
+        self.rag_chew = RagChewTrack()
+
+        self.user_centurion_date = user_centurion_date or None
+        self.centurion_date_official = self.user_centurion_date is not None
+        self.tribune_x8_date: Optional[str] = None
+        self.contacts_replayed = 0
+
+        self._last_key: Tuple[str, str] = ('', '')
+        # Candidates of the current day waiting for a prerequisite reached later that day
+        self._day = ''
+        self._pending_tribune: List[Tuple[str, Dict[str, Any]]] = []
+        self._pending_senator: List[Tuple[str, Dict[str, Any]]] = []
+
+    @classmethod
+    def replay(cls, contacts: Iterable[Dict[str, Any]], **kwargs) -> "AwardTimeline":
+        """
+        Build a timeline from ordered contacts
+
+        Args:
+            contacts: Contact dicts in (qso_date, time_on) order
+            **kwargs: Member lists and dates (see __init__)
+
+        Returns:
+            The replayed timeline
+        """
+        timeline = cls(**kwargs)
+        for contact in contacts:
+            timeline.feed(contact)
+        return timeline
+
+    def feed(self, contact: Dict[str, Any]) -> None:
+        """
+        Advance every award by one contact
+
+        Args:
+            contact: Contact dict (callsign, qso_date, qso_time or time_on, time_off,
+                band, mode, key_type, skcc_number, optional id and duration)
+
+        Raises:
+            ValueError: If contacts arrive out of (qso_date, time_on) order
+        """
+        key = replay_key(contact)
+        if key < self._last_key:
+            raise ValueError(f"Contact {contact.get('callsign')} at {key} replayed out of order")
+        self._last_key = key
+        self.contacts_replayed += 1
+
+        qso_date = key[0]
+        if qso_date != self._day:
+            self._day = qso_date
+            self._pending_tribune.clear()
+            self._pending_senator.clear()
+
+        self.rag_chew.feed(contact)
+
+        base_number = extract_base_skcc_number(contact.get('skcc_number') or '')
+        if not base_number:
+            return
+
+        if self._centurion_rules.validate(contact):
+            if self.centurion.credit_member(base_number, contact) and self.user_centurion_date is None:
+                self._check_centurion_reached()
+
+        if self._tribune_qualifies(contact, base_number):
+            if self.user_centurion_date is None:
+                self._pending_tribune.append((base_number, contact))
+            elif qso_date >= self.user_centurion_date:
+                self._credit_tribune(base_number, contact)
+
+        if self._senator_qualifies(contact, base_number):
+            if self.tribune_x8_date is None:
+                self._pending_senator.append((base_number, contact))
+            else:
+                self.senator.credit_member(base_number, contact)
+
+    def milestones(self) -> List[Milestone]:
+        """All milestones of all awards in timeline order"""
+        tracks = (self.centurion, self.tribune, self.senator, self.rag_chew)
+        return sorted(
+            (m for track in tracks for m in track.milestones), key=lambda m: (m.qso_date, m.time_on)
+        )
+
+    def _check_centurion_reached(self) -> None:
+        """Take the operator's Centurion date from the replay once 100 members are reached"""
+        if not self.centurion.milestones:
+            return
+        self.user_centurion_date = self.centurion.milestones[0].qso_date
+        logger.debug(f"Centurion reached in replay on {self.user_centurion_date}")
+        pending, self._pending_tribune = self._pending_tribune, []
+        for base_number, contact in pending:
+            self._credit_tribune(base_number, contact)
+
+    def _credit_tribune(self, base_number: str, contact: Dict[str, Any]) -> None:
+        """Credit a Tribune member, unlocking Senator at Tribune x8"""
+        if not self.tribune.credit_member(base_number, contact):
+            return
+        if self.tribune_x8_date is None and self.tribune.count >= TRIBUNE_X8_THRESHOLD:
+            self.tribune_x8_date = contact.get('qso_date')
+            logger.debug(f"Tribune x8 reached in replay on {self.tribune_x8_date}")
+            pending, self._pending_senator = self._pending_senator, []
+            for senator_number, senator_contact in pending:
+                self.senator.credit_member(senator_number, senator_contact)
+
+    def _common_rules(self, contact: Dict[str, Any]) -> bool:
+        """CW with a mechanical (or unrecorded) key"""
+        if (contact.get('mode') or '').upper() != 'CW':
+            return False
+        key_type = (contact.get('key_type') or '').upper()
+        return not key_type or key_type in VALID_KEY_TYPES
+
+    @staticmethod
+    def _base_call(contact: Dict[str, Any]) -> str:
+        """Callsign without portable suffixes"""
+        return (contact.get('callsign') or '').upper().strip().split('/')[0]
+
+    def _tribune_qualifies(self, contact: Dict[str, Any], base_number: str) -> bool:
+        """Tribune rules apart from the operator's Centurion date"""
+        qso_date = contact.get('qso_date') or ''
+        if qso_date < TRIBUNE_EFFECTIVE_DATE or not self._common_rules(contact):
+            return False
+        if qso_date >= TRIBUNE_SPECIAL_EVENT_CUTOFF and self._base_call(contact) in SPECIAL_EVENT_CALLS:
+            return False
+        if base_number not in self._tribune_eligible:
+            return False
+        # The contacted station must have been a Centurion on the QSO date
+        member_date = self._centurion_dates.get(base_number)
+        return not (member_date and qso_date < member_date)
+
+    def _senator_qualifies(self, contact: Dict[str, Any], base_number: str) -> bool:
+        """Senator rules apart from the operator's Tribune x8 date"""
+        qso_date = contact.get('qso_date') or ''
+        if qso_date < SENATOR_EFFECTIVE_DATE or not self._common_rules(contact):
+            return False
+        if self._base_call(contact) in SPECIAL_EVENT_CALLS:
+            return False
+        return base_number in self._senator_eligible
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+W4GNS SKCC Logger - Headless Command-Line Interface
+
+Runs logbook maintenance without the GUI:
+- import: Import an ADIF file
+- export: Export the log to an ADIF file
+- awards: Award progress summary, or stream one award report to a file
+- qsl: Apply a LoTW or eQSL confirmation report
+- backup: Checkpoint and back up the database
+- vacuum: Compact the database and refresh planner statistics
+- backfill: Calculate missing contact distances
+- bench: Time acceleration kernels and common repository operations
+
+Qt is never imported, so commands start quickly and work on machines
+without a display. Every command accepts --json for machine-readable output.
+
+Usage:
+    w4gns [--db PATH] [--json] [-v] <command> [options]
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Award names accepted by AwardReportGenerator, in summary order
+AWARD_NAMES = (
+    'Centurion', 'Tribune', 'Senator', 'WAS', 'WAC', 'DXCC',
+    'CanadianMaple', 'RagChew', 'PFX', 'TripleKey', 'SKCCDx',
+)
+
+
+def _open_database(args: argparse.Namespace):
+    """Open the repository at --db, or the configured database location"""
+    from src.config.settings import get_config_manager
+    from src.database.repository import DatabaseRepository
+
+    db_path = args.db or get_config_manager().get('database.location')
+    if not db_path:
+        raise ValueError("No database location configured; pass --db")
+    return DatabaseRepository(str(Path(db_path).expanduser()))
+
+
+def _operator() -> Dict[str, Optional[str]]:
+    """Operator callsign and SKCC number from the configuration"""
+    from src.config.settings import get_config_manager
+
+    config = get_config_manager()
+    return {
+        'callsign': config.get('general.operator_callsign', 'MYCALL'),
+        'skcc': config.get('adif.my_skcc_number', '') or None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Commands
+# ---------------------------------------------------------------------------
+
+def cmd_import(args: argparse.Namespace) -> Dict[str, Any]:
+    """Import an ADIF file"""
+    from src.adif.parser import ADIFParser, map_adif_records
+
+    records, _header = ADIFParser().parse_file(args.file)
+    db = _open_database(args)
+    result = db.import_contacts_from_adif(map_adif_records(records), args.strategy)
+    result['file'] = args.file
+    return result
+
+
+def cmd_export(args: argparse.Namespace) -> Dict[str, Any]:
+    """Export the log (optionally from a date onwards) to an ADIF file"""
+    from src.adif.exporter import ADIFExporter
+    from src.database.models import Contact
+    from src.database.read_model import ALL_COLUMNS
+
+    db = _open_database(args)
+    criteria = [Contact.qso_date >= args.since] if args.since else []
+    contacts = db.get_contact_records(
+        *criteria, columns=ALL_COLUMNS, order_by=(Contact.qso_date, Contact.time_on)
+    )
+    operator = _operator()
+    ADIFExporter().export_to_file(
+        args.file, contacts, my_skcc=operator['skcc'], my_callsign=operator['callsign']
+    )
+    return {'file': args.file, 'exported': len(contacts)}
+
+
+def cmd_awards(args: argparse.Namespace) -> Dict[str, Any]:
+    """Summarize award progress, or stream one award report with --report"""
+    from src.adif.award_report_generator import AwardReportGenerator
+
+    db = _open_database(args)
+    operator = _operator()
+    generator = AwardReportGenerator(db, operator['callsign'], operator['skcc'] or '')
+
+    if args.report:
+        if not args.output:
+            raise ValueError("--report needs --output")
+        count = generator.write_report(
+            args.report, args.output, args.format,
+            achievement_date=args.since, compress=args.gzip,
+        )
+        return {'award': args.report, 'file': args.output, 'contacts': count}
+
+    records = db.get_contact_records()
+    session = db.get_session()
+    awards = []
+    try:
+        for name in AWARD_NAMES:
+            award_class = generator.get_award_class(name)
+            if award_class is None:
+                continue
+            # DXCC doesn't take a session parameter
+            award = award_class() if name == 'DXCC' else award_class(session)
+            progress = award.calculate_progress(records)
+            awards.append({
+                'award': name,
+                'name': award.get_name(),
+                'current': progress.get('current', len(progress.get('provinces_contacted') or ())),
+                'required': progress.get('required'),
+                'achieved': bool(progress.get('achieved', progress.get('current_level') not in (None, 'Not Yet'))),
+                'level': progress.get('level') or progress.get('endorsement') or progress.get('current_level'),
+                'progress_pct': progress.get('progress_pct'),
+            })
+    finally:
+        session.close()
+    return {'contacts': len(records), 'awards': awards}
+
+
+def cmd_qsl(args: argparse.Namespace) -> Dict[str, Any]:
+    """Match a confirmation report against the log and record the confirmations"""
+    from src.adif.qsl_reconciler import QSLReconciler
+
+    db = _open_database(args)
+    result = QSLReconciler(db, args.window).reconcile(args.file, args.type, dry_run=args.dry_run)
+    result['file'] = args.file
+    return result
+
+
+def cmd_backup(args: argparse.Namespace) -> Dict[str, Any]:
+    """Checkpoint the write-ahead log and back up the database file
+
+    Without --destination, a database given by --db is backed up to
+    backups/<file stem>/ next to it, so each logbook keeps and rotates its
+    own backups. The configured database uses BackupManager's default.
+    """
+    from src.backup.backup_manager import BackupManager
+
+    db = _open_database(args)
+    db.checkpoint()
+    if args.destination:
+        destination = Path(args.destination).expanduser()
+    elif args.db:
+        db_file = Path(db.db_path)
+        destination = db_file.parent / "backups" / db_file.stem
+    else:
+        destination = None
+    result = BackupManager().create_database_backup(Path(db.db_path), destination, args.keep)
+    if not result.get('success'):
+        raise RuntimeError(result.get('message', 'Backup failed'))
+    return result
+
+
+def cmd_vacuum(args: argparse.Namespace) -> Dict[str, Any]:
+    """Compact the database"""
+    db = _open_database(args)
+    result = db.vacuum()
+    result['reclaimed'] = result['size_before'] - result['size_after']
+    return result
+
+
+def cmd_backfill(args: argparse.Namespace) -> Dict[str, Any]:
+    """Calculate distances for contacts with a grid square but no distance"""
+    from src.config.settings import get_config_manager
+
+    home_grid = args.home_grid or get_config_manager().get('general.home_grid', '')
+    if not home_grid:
+        raise ValueError("No home grid configured; pass --home-grid")
+    db = _open_database(args)
+    result = db.backfill_contact_distances(home_grid)
+    result['home_grid'] = home_grid
+    return result
+
+
+def _best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Best-of-repeat seconds for one call"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def cmd_bench(args: argparse.Namespace) -> Dict[str, Any]:
+    """Time the acceleration kernels and, with a database, repository reads"""
+    from src.utils.acceleration import timing_report
+
+    kernel_timings = [timing._asdict() for timing in timing_report(args.repeat)]
+    operations = []
+    if not args.kernels_only:
+        db = _open_database(args)
+        contacts = db.get_contact_count()
+
+        def replay():
+            db.award_cache.invalidate_all_award_caches()
+            db.replay_award_timeline()
+
+        for name, func in (
+            ('contact_records', db.get_contact_records),
+            ('award_timeline', replay),
+        ):
+            operations.append({'operation': name, 'seconds': _best_of(func, args.repeat)})
+    else:
+        contacts = None
+    return {'contacts': contacts, 'kernels': kernel_timings, 'operations': operations}
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def _format_text(command: str, result: Dict[str, Any]) -> str:
+    """Human-readable output of a command result"""
+    if command == 'awards' and 'awards' in result:
+        lines = [f"{'Award':<24}{'Current':>9}{'Required':>10}{'Progress':>10}  Level"]
+        for a in result['awards']:
+            pct = f"{a['progress_pct']:.1f}%" if isinstance(a['progress_pct'], (int, float)) else "-"
+            lines.append(
+                f"{a['name']:<24}{str(a['current'] if a['current'] is not None else '-'):>9}"
+                f"{str(a['required'] if a['required'] is not None else '-'):>10}{pct:>10}"
+                f"  {a['level'] or ('Achieved' if a['achieved'] else '-')}"
+            )
+        lines.append(f"\n{result['contacts']} contacts")
+        return "\n".join(lines)
+
+    if command == 'qsl':
+        lines = [
+            f"{result['matched']} of {result['confirmations']} confirmations matched "
+            f"({result['recorded']} new, {result['not_confirmed']} unconfirmed records skipped)"
+        ]
+        if result['unmatched']:
+            lines.append(f"\nUnmatched ({len(result['unmatched'])}):")
+            for r in result['unmatched']:
+                lines.append(f"  {r.get('CALL', ''):<12}{r.get('QSO_DATE', ''):<10}{r.get('TIME_ON', ''):<8}"
+                             f"{r.get('BAND', ''):<6}{r.get('MODE', '')}")
+        return "\n".join(lines)
+
+    if command == 'bench':
+        from src.utils.acceleration import KernelTiming, format_timing_report
+        lines = [format_timing_report([KernelTiming(**t) for t in result['kernels']])]
+        if result['operations']:
+            lines.append(f"\n{'Operation':<28}{'Time (ms)':>12}   ({result['contacts']} contacts)")
+            for op in result['operations']:
+                lines.append(f"{op['operation']:<28}{op['seconds'] * 1000:>12.2f}")
+        return "\n".join(lines)
+
+    return "\n".join(
+        f"{key}: {value}" for key, value in result.items() if not isinstance(value, (list, dict))
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser"""
+    parser = argparse.ArgumentParser(prog='w4gns', description="W4GNS SKCC Logger command-line tools")
+    parser.add_argument('--db', help="Database file (default: configured database.location)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Log progress to stderr")
+    commands = parser.add_subparsers(dest='command', required=True, metavar='command')
+
+    p = commands.add_parser('import', help="Import an ADIF file")
+    p.add_argument('file', help="ADIF (.adi) file")
+    p.add_argument('--strategy', choices=('skip', 'update', 'append'), default='skip',
+                   help="Duplicate handling (default: skip)")
+    p.set_defaults(handler=cmd_import)
+
+    p = commands.add_parser('export', help="Export the log to an ADIF file")
+    p.add_argument('file', help="Output .adi file")
+    p.add_argument('--since', metavar='YYYYMMDD', help="Only contacts on or after this date")
+    p.set_defaults(handler=cmd_export)
+
+    p = commands.add_parser('awards', help="Award progress summary or report")
+    p.add_argument('--report', metavar='AWARD', choices=AWARD_NAMES, help="Write this award's report")
+    p.add_argument('--output', metavar='FILE', help="Report file")
+    p.add_argument('--format', choices=('text', 'csv', 'tsv', 'html'), default='text')
+    p.add_argument('--gzip', action='store_true', help="Compress the report")
+    p.add_argument('--since', metavar='YYYYMMDD', help="Only contacts on or after this date")
+    p.set_defaults(handler=cmd_awards)
+
+    p = commands.add_parser('qsl', help="Apply a LoTW or eQSL confirmation report")
+    p.add_argument('file', help="Confirmation report (.adi), e.g. lotwreport.adi")
+    p.add_argument('--type', choices=('lotw', 'eqsl'), default='lotw', help="Report source (default: lotw)")
+    p.add_argument('--window', type=int, default=30, help="Time difference allowed in minutes (default: 30)")
+    p.add_argument('--dry-run', action='store_true', help="Match without updating the log")
+    p.set_defaults(handler=cmd_qsl)
+
+    p = commands.add_parser('backup', help="Back up the database")
+    p.add_argument('--destination', metavar='DIR', help="Backup directory (default: backups/<name>/ beside --db, "
+                   "else the configured backup destination or ~/.w4gns_logger/Logs)")
+    p.add_argument('--keep', type=int, default=5, help="Backups to keep (default: 5)")
+    p.set_defaults(handler=cmd_backup)
+
+    p = commands.add_parser('vacuum', help="Compact the database")
+    p.set_defaults(handler=cmd_vacuum)
+
+    p = commands.add_parser('backfill', help="Calculate missing contact distances")
+    p.add_argument('--home-grid', help="Home grid square (default: configured general.home_grid)")
+    p.set_defaults(handler=cmd_backfill)
+
+    p = commands.add_parser('bench', help="Time kernels and repository operations")
+    p.add_argument('--repeat', type=int, default=3, help="Runs per measurement (best is reported)")
+    p.add_argument('--kernels-only', action='store_true', help="Skip the database timings")
+    p.set_defaults(handler=cmd_bench)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run one command
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code (0 on success, 1 on error)
+    """
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(levelname)s - %(name)s - %(message)s',
+        stream=sys.stderr,
+    )
+
+    try:
+        result = args.handler(args)
+    except Exception as e:
+        logger.debug(f"{args.command} failed", exc_info=True)
+        if args.json:
+            print(json.dumps({'command': args.command, 'error': str(e)}))
+        else:
+            print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps({'command': args.command, **result}, default=str))
+    else:
+        print(_format_text(args.command, result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
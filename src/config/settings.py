@@ -41,6 +41,12 @@ class ConfigManager:
             "enabled": True,
             "auto_connect": False,
             "heartbeat_interval": 60,  # seconds
+            "host": "",  # DX cluster node read alongside RBN (empty = RBN only)
+            "port": 7300,
+            "dedup_window_seconds": 120,  # Repeated call+frequency+reporter spots within this window are dropped
+            "archive_enabled": True,  # Keep spot history in spot_archive.db (separate from contacts.db)
+            "archive_retention_days": 90,
+            "worker_process": False,  # Run spot feeds in a separate process (a crashed feed can't take down the logger)
         },
         "qrz": {
             "enabled": False,
@@ -49,6 +55,26 @@ class ConfigManager:
             "api_key": "",  # QRZ.com API Key (for logbook uploads)
             "auto_upload": False,  # Auto-upload contacts to QRZ logbook
             "auto_fetch": False,  # Auto-fetch callsign info from QRZ
+            "cache_ttl_hours": 720,  # Keep looked-up callsigns for 30 days
+            "negative_cache_hours": 24,  # Remember "not found" callsigns for a day
+            "prefetch_spots": False,  # Look up spotted callsigns in the background
+            "upload_min_interval": 0.5,  # Seconds between QRZ logbook API calls
+        },
+        "udp_ingest": {
+            "enabled": False,  # Log QSOs broadcast by WSJT-X / N1MM Logger+ (src.integrations.udp_ingest)
+            "host": "127.0.0.1",  # Interface to listen on ("0.0.0.0" for other machines on the LAN)
+            "wsjtx_port": 2237,  # WSJT-X "UDP Server" port (0 = off)
+            "n1mm_port": 12060,  # N1MM Logger+ contact broadcast port (0 = off)
+        },
+        "network": {
+            "offline": False,  # Never touch the network; fetchers serve cached data (src.utils.http_client)
+            "max_connections_per_host": 4,  # Concurrent requests (kept-alive connections) per server
+            "min_request_interval": 0.0,  # Seconds between requests to one server
+            "host_limits": {},  # Per-host overrides, e.g. {"xmldata.qrz.com": {"max_connections": 1}}
+        },
+        "scheduler": {
+            "max_concurrent_jobs": 2,  # Background jobs (downloads, backups) running at once
+            "idle_seconds": 30,  # User inactivity before deferred jobs (roster, member lists) start
         },
         "awards": {
             "enabled": True,
@@ -60,6 +86,7 @@ class ConfigManager:
             "auto_sync_adif": False,  # Auto-sync new contacts from main ADIF file on startup
             "spots_enabled": False,  # Enable SKCC member spot monitoring
             "auto_start_spots": False,  # Auto-start monitoring on launch
+            "skimmer_path": "",  # SKCC Skimmer directory to run as an extra spot feed (empty = off)
             # SKCC Skimmer-style goals and targets configuration
             "goals": [],  # Personal awards pursuing (e.g., ["Centurion", "Tribune", "Senator", "WAS-C"])
             "targets": [],  # Awards user wants to help others earn
@@ -74,6 +101,9 @@ class ConfigManager:
             "giro_station_override": "",  # Leave empty for auto-select nearest, or set to station code (e.g., "WP937")
             "giro_cache_minutes": 15,  # Cache GIRO data for this many minutes
         },
+        "performance": {
+            "acceleration_backend": "auto",  # "auto", "rust", "numpy" or "python" (see src.utils.acceleration)
+        },
         "ui": {
             "theme": "light",
             "font_size": 10,
@@ -499,7 +499,8 @@ class ContactRepository(BaseRepository):
         Calculate and populate distance field for all contacts missing it.
 
         Processes contacts that have a grid square but no distance calculated.
-        Uses the Haversine formula to calculate great-circle distance.
+        Only (id, gridsquare) is loaded, distances are computed in one vectorized
+        pass (batch_distances acceleration kernel) and written back with a single bulk update.
 
         Args:
             home_grid: Your home Maidenhead grid square
@@ -507,56 +508,43 @@ class ContactRepository(BaseRepository):
         Returns:
             Dict with 'updated', 'skipped', and 'errors' counts
         """
-        from src.services.voacap_muf_fetcher import VOACAPMUFFetcher
+        from src.utils.grid_calc import batch_calculate_distances
 
         session = self.get_session()
         try:
-            # Get all contacts with grid squares but no distance
-            contacts_to_update = session.query(Contact).filter(
+            # Get all contacts with grid squares but no distance (projected, no ORM hydration)
+            rows = session.query(Contact.id, Contact.gridsquare).filter(
                 Contact.gridsquare.isnot(None),
                 Contact.gridsquare != "",
                 Contact.distance.is_(None)
             ).all()
 
-            updated = 0
-            skipped = 0
-            errors = 0
+            logger.info(f"Found {len(rows)} contacts to calculate distances for")
 
-            logger.info(f"Found {len(contacts_to_update)} contacts to calculate distances for")
+            # Validate grid squares (at least 4 characters)
+            candidates = [(row.id, row.gridsquare.strip()) for row in rows]
+            candidates = [(contact_id, grid) for contact_id, grid in candidates if len(grid) >= 4]
+            skipped = len(rows) - len(candidates)
 
-            for contact in contacts_to_update:
-                try:
-                    contact_grid = contact.gridsquare.strip()
-
-                    # Validate grid square (at least 4 characters)
-                    if not contact_grid or len(contact_grid) < 4:
-                        skipped += 1
-                        continue
-
-                    # Calculate distance
-                    distance_km = VOACAPMUFFetcher._grid_distance(home_grid, contact_grid)
+            distances = batch_calculate_distances(home_grid, [grid for _, grid in candidates])
 
-                    # Update contact
-                    contact.distance = distance_km
-                    updated += 1
+            updates = [
+                {'id': contact_id, 'distance': distance_km}
+                for (contact_id, _), distance_km in zip(candidates, distances)
+                if distance_km is not None
+            ]
+            errors = len(candidates) - len(updates)
+            updated = len(updates)
 
-                    if updated % 100 == 0:
-                        logger.info(f"Processed {updated} contacts...")
-                        session.commit()  # Commit in batches
-
-                except Exception as e:
-                    logger.warning(f"Error calculating distance for {contact.callsign} ({contact.gridsquare}): {e}")
-                    errors += 1
-                    continue
-
-            # Final commit
+            if updates:
+                session.bulk_update_mappings(Contact, updates)
             session.commit()
 
             result = {
                 'updated': updated,
                 'skipped': skipped,
                 'errors': errors,
-                'total': len(contacts_to_update)
+                'total': len(rows)
             }
 
             logger.info(f"Distance backfill complete: {updated} updated, {skipped} skipped, {errors} errors")
@@ -568,18 +556,3 @@ class ContactRepository(BaseRepository):
             raise
         finally:
             session.close()
-
-    def _contact_to_dict(self, contact: Contact) -> dict:
-        """Convert Contact ORM object to dictionary for award calculations"""
-        return {
-            'callsign': contact.callsign,
-            'qso_date': contact.qso_date,
-            'time_on': contact.time_on,
-            'band': contact.band,
-            'mode': contact.mode,
-            'country': contact.country,
-            'state': contact.state,
-            'skcc_number': contact.skcc_number,
-            'tx_power': contact.tx_power,
-            'rx_power': contact.rx_power,
-        }
@@ -143,6 +143,7 @@ class Contact(Base):
         Index("idx_band_mode_country", "band", "mode", "country"),
         Index("idx_callsign_band_mode", "callsign", "band", "mode"),
         Index("idx_qso_date_country", "qso_date", "country"),
+        Index("idx_qso_date_time_on", "qso_date", "time_on"),  # Award timeline replay order
         Index("idx_state_country_dxcc", "state", "country", "dxcc"),
         # SKCC award indexes
         Index("idx_skcc_number", "skcc_number"),
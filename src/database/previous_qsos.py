@@ -0,0 +1,187 @@
+"""
+Previous QSO Lookup
+
+Read path behind the Previous QSOs panel of the logging form:
+- Queries run on a dedicated read-only SQLite connection (WAL lets them
+  proceed while the logger writes) and return lightweight projected rows
+  instead of ORM objects
+- Recent results are cached per callsign until the contacts change
+- A sorted in-memory index of worked callsigns answers prefix queries
+  instantly while the operator is still typing
+"""
+
+import bisect
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 128  # Callsigns whose previous QSOs are kept
+DEFAULT_MATCH_LIMIT = 10  # Callsigns returned for a prefix
+
+
+class PreviousQSO(NamedTuple):
+    """Projected contact row shown in the Previous QSOs table"""
+
+    id: int
+    callsign: str
+    qso_date: Optional[str]
+    time_on: Optional[str]
+    band: Optional[str]
+    mode: Optional[str]
+    frequency: Optional[float]
+    rst_sent: Optional[str]
+    rst_rcvd: Optional[str]
+    skcc_number: Optional[str]
+    state: Optional[str]
+    qth: Optional[str]
+
+
+_SELECT_QSOS = (
+    f"SELECT {', '.join(PreviousQSO._fields)} FROM contacts WHERE callsign = ? "
+    "ORDER BY qso_date DESC, time_on DESC"
+)
+
+
+class PreviousQSOLookup:
+    """Cached previous-QSO queries and a sorted callsign index (thread-safe)"""
+
+    def __init__(self, db_path: str, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize lookup
+
+        Args:
+            db_path: Path to the contacts database
+            cache_size: Number of callsigns whose results are cached
+        """
+        self.db_path = db_path
+        self.cache_size = cache_size
+        self.stats = {'queries': 0, 'cache_hits': 0}
+        self._lock = threading.Lock()  # Guards the cache (held only briefly)
+        self._conn_lock = threading.Lock()  # Serializes use of the read connection
+        self._conn: Optional[sqlite3.Connection] = None
+        self._generation = 0  # Bumped on invalidation: older query results are not cached
+        self._cache: "OrderedDict[str, List[PreviousQSO]]" = OrderedDict()
+        self._callsigns: Optional[List[str]] = None  # Sorted, loaded on demand
+
+    def cached(self, callsign: str) -> Optional[List[PreviousQSO]]:
+        """
+        Get cached previous QSOs without touching the database
+
+        Args:
+            callsign: Callsign (upper case)
+
+        Returns:
+            Rows, most recent first, or None if not cached
+        """
+        with self._lock:
+            rows = self._cache.get(callsign)
+            if rows is not None:
+                self._cache.move_to_end(callsign)
+                self.stats['cache_hits'] += 1
+            return rows
+
+    def lookup(self, callsign: str) -> List[PreviousQSO]:
+        """
+        Get previous QSOs with a callsign (cached)
+
+        Args:
+            callsign: Callsign (upper case)
+
+        Returns:
+            Rows, most recent first
+        """
+        rows = self.cached(callsign)
+        if rows is not None:
+            return rows
+        generation = self._generation
+        with self._conn_lock:
+            rows = [PreviousQSO(*r) for r in self._connection().execute(_SELECT_QSOS, (callsign,))]
+        with self._lock:
+            self.stats['queries'] += 1
+            if generation == self._generation:
+                self._cache[callsign] = rows
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return rows
+
+    def matches(self, prefix: str, limit: int = DEFAULT_MATCH_LIMIT) -> List[str]:
+        """
+        Get worked callsigns starting with a prefix from the in-memory index
+
+        Never queries the database: returns [] until load_index() has run.
+
+        Args:
+            prefix: Partial callsign (upper case)
+            limit: Maximum number of callsigns returned
+
+        Returns:
+            Matching callsigns in sorted order
+        """
+        callsigns = self._callsigns
+        if not prefix or callsigns is None:
+            return []
+        start = bisect.bisect_left(callsigns, prefix)
+        end = bisect.bisect_left(callsigns, prefix + "\uffff", start)
+        return callsigns[start:min(end, start + limit)]
+
+    def index_loaded(self) -> bool:
+        """Check if the callsign index is available"""
+        return self._callsigns is not None
+
+    def load_index(self) -> int:
+        """
+        Load the sorted index of worked callsigns
+
+        Returns:
+            Number of distinct callsigns
+        """
+        generation = self._generation
+        with self._conn_lock:
+            rows = self._connection().execute(
+                "SELECT DISTINCT UPPER(callsign) FROM contacts WHERE callsign IS NOT NULL"
+            )
+            callsigns = sorted(r[0] for r in rows)
+        with self._lock:
+            if generation == self._generation:
+                self._callsigns = callsigns
+        logger.debug(f"Callsign index loaded with {len(callsigns)} callsigns")
+        return len(callsigns)
+
+    def invalidate(self, callsign: Optional[str] = None) -> None:
+        """
+        Discard cached results after contacts changed
+
+        Args:
+            callsign: Callsign of a newly added contact, which is merged into the
+                index; None means any change, so the index must be reloaded
+        """
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+            if callsign is None:
+                self._callsigns = None
+            elif self._callsigns is not None:
+                callsign = callsign.upper()
+                i = bisect.bisect_left(self._callsigns, callsign)
+                if i == len(self._callsigns) or self._callsigns[i] != callsign:
+                    # Copy-on-write: readers may hold the old list
+                    self._callsigns = self._callsigns[:i] + [callsign] + self._callsigns[i:]
+
+    def close(self) -> None:
+        """Close the read connection"""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the read-only connection on first use (caller holds the connection lock)"""
+        if self._conn is None:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False, timeout=10.0)
+        return self._conn
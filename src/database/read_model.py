@@ -0,0 +1,189 @@
+"""
+Contact Read Model
+
+Award, list and export paths read contacts through compact records instead
+of ORM objects:
+- A projected Core SELECT fetches only the columns a path needs, with no
+  identity map, change tracking or per-row instrumentation
+- Each column tuple gets its own record class with __slots__, so a record
+  costs about as much as a tuple of its values
+- Records are read-only mappings as well as attribute objects, so the award
+  classes (contact.get('skcc_number')) and the ADIF exporter
+  (getattr(contact, 'band')) consume them unchanged
+"""
+
+import logging
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Sequence, Tuple, Type
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .models import Contact
+
+logger = logging.getLogger(__name__)
+
+# Columns read by the award calculations and application generators
+AWARD_COLUMNS: Tuple[str, ...] = (
+    'id', 'callsign', 'qso_date', 'time_on', 'time_off', 'band', 'mode', 'frequency',
+    'rst_sent', 'rst_rcvd', 'tx_power', 'rx_power', 'country', 'dxcc', 'state',
+    'skcc_number', 'key_type', 'distance', 'notes',
+)
+
+# Columns replayed by the award timeline
+TIMELINE_COLUMNS: Tuple[str, ...] = (
+    'id', 'callsign', 'qso_date', 'time_on', 'time_off', 'band', 'mode', 'key_type', 'skcc_number',
+)
+
+# Every contact column (ADIF export and backups)
+ALL_COLUMNS: Tuple[str, ...] = tuple(c.name for c in Contact.__table__.columns)
+
+# Alternative keys the award code uses for a column
+KEY_ALIASES: Dict[str, str] = {
+    'qso_time': 'time_on',
+}
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class ContactRecord(Mapping):
+    """Read-only contact row (base of the per-projection record classes)"""
+
+    __slots__ = ()
+    _columns: Tuple[str, ...] = ()
+    _column_set: frozenset = frozenset()
+
+    def __getitem__(self, key: str) -> Any:
+        name = KEY_ALIASES.get(key, key)
+        if name not in self._column_set:
+            raise KeyError(key)
+        return getattr(self, name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __contains__(self, key: object) -> bool:
+        return KEY_ALIASES.get(key, key) in self._column_set
+
+    def __getattr__(self, name: str) -> Any:
+        # Contact columns outside the projection read as NULL
+        if name in ALL_COLUMNS:
+            return None
+        raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a column value
+
+        Unlike dict.get, NULL columns also return the default, matching the
+        normalized dicts the award classes were written against.
+
+        Args:
+            key: Column name (or alias such as 'qso_time')
+            default: Value for missing or NULL columns
+
+        Returns:
+            Column value or default
+        """
+        # Award validation calls this for every contact: avoid __getitem__ and KeyError
+        name = KEY_ALIASES.get(key, key)
+        if name not in self._column_set:
+            return default
+        value = getattr(self, name)
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the projected columns"""
+        return {name: getattr(self, name) for name in self._columns}
+
+    def __repr__(self) -> str:
+        return f"<ContactRecord(callsign={self.callsign}, date={self.qso_date}, band={self.band})>"
+
+
+_record_types: Dict[Tuple[str, ...], Type[ContactRecord]] = {}
+
+
+def record_type(columns: Sequence[str]) -> Type[ContactRecord]:
+    """
+    Get the record class holding a column projection (created once per tuple)
+
+    Args:
+        columns: Contact column names
+
+    Returns:
+        ContactRecord subclass with one slot per column
+
+    Raises:
+        ValueError: If a name is not a contact column
+    """
+    columns = tuple(columns)
+    cls = _record_types.get(columns)
+    if cls is None:
+        unknown = [name for name in columns if name not in ALL_COLUMNS]
+        if unknown:
+            raise ValueError(f"Not contact columns: {', '.join(unknown)}")
+        cls = type("ContactRecord", (ContactRecord,), {
+            '__slots__': columns, '_columns': columns, '_column_set': frozenset(columns),
+        })
+        _record_types[columns] = cls
+    return cls
+
+
+def make_record(columns: Sequence[str], values: Iterable[Any]) -> ContactRecord:
+    """
+    Build a single record
+
+    Args:
+        columns: Contact column names
+        values: Values in column order
+
+    Returns:
+        Record of the projection
+    """
+    return next(iter_records(record_type(columns), [values]))
+
+
+def iter_records(cls: Type[ContactRecord], rows: Iterable[Iterable[Any]]) -> Iterator[ContactRecord]:
+    """Fill records of a projection class from value rows"""
+    setters = [getattr(cls, name).__set__ for name in cls._columns]
+    new = object.__new__
+    for row in rows:
+        record = new(cls)
+        for setter, value in zip(setters, row):
+            setter(record, value)
+        yield record
+
+
+def select_contact_records(
+    session: Session,
+    *criteria,
+    columns: Sequence[str] = AWARD_COLUMNS,
+    order_by: Sequence[Any] = (),
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[ContactRecord]:
+    """
+    Stream contact records from a projected SELECT
+
+    Args:
+        session: Database session (must stay open while iterating)
+        *criteria: SQLAlchemy filter expressions on Contact columns
+        columns: Contact columns to load
+        order_by: Ordering expressions
+        batch_size: Rows fetched from the cursor at a time
+
+    Returns:
+        Iterator of records
+    """
+    cls = record_type(columns)
+    table = Contact.__table__
+    stmt = select(*(table.c[name] for name in cls._columns))
+    if criteria:
+        stmt = stmt.where(*criteria)
+    if order_by:
+        stmt = stmt.order_by(*order_by)
+    result = session.execute(stmt.execution_options(yield_per=batch_size))
+    return iter_records(cls, result)
+
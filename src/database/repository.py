@@ -6,19 +6,66 @@ Provides abstraction for database operations.
 
 import logging
 import re
-from typing import List, Optional, Dict, Any
-from sqlalchemy import create_engine, func, pool, text
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import bindparam, create_engine, func, pool, select, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from .models import Base, Contact, QSLRecord, AwardProgress, ClusterSpot, CenturionMember, TribuneeMember, SenatorMember
+from .read_model import AWARD_COLUMNS, TIMELINE_COLUMNS, ContactRecord, select_contact_records
 from .skcc_membership import SKCCMembershipManager
 from src.utils.cache import AwardProgressCache
-from src.ui.signals import get_app_signals
 from src.utils.skcc_number import extract_base_skcc_number
 
 logger = logging.getLogger(__name__)
 
+# Contact column flagged when a confirmation of each type is received
+QSL_FLAG_COLUMNS = {'LOTW': 'lotw_qsl_rcvd', 'EQSL': 'eqsl_qsl_rcvd', 'QSL': 'qsl_rcvd'}
+
+# (callsign, qso_date, time_on, band) - the fields the ADIF import matches duplicates on
+ContactKey = Tuple[str, str, str, str]
+
+
+def contact_key(
+    callsign: Optional[str], qso_date: Optional[str], time_on: Optional[str], band: Optional[str]
+) -> ContactKey:
+    """
+    Build the duplicate-detection key of a contact
+
+    Args:
+        callsign: Contact callsign
+        qso_date: QSO date (YYYYMMDD)
+        time_on: Start time (HHMM; HHMMSS is truncated like the ADIF import does)
+        band: Band (e.g. "40M")
+
+    Returns:
+        Normalized key tuple
+    """
+    return (
+        (callsign or "").strip().upper(),
+        (qso_date or "").strip(),
+        (time_on or "").strip()[:4],
+        (band or "").strip().upper(),
+    )
+
+
+def default_signals() -> Any:
+    """
+    Get the application signals when running inside the Qt application
+
+    Headless callers (CLI, cron jobs, scripts) never load PyQt6, so the
+    repository works without a QApplication and simply emits nothing.
+
+    Returns:
+        AppSignals instance, or None when Qt has not been loaded
+    """
+    if 'PyQt6.QtCore' not in sys.modules:
+        return None
+    from src.ui.signals import get_app_signals
+    return get_app_signals()
+
 
 class DatabaseRepository:
     """Repository for database operations"""
@@ -67,8 +114,8 @@ class DatabaseRepository:
             # Initialize award progress cache with 30-second TTL
             self.award_cache = AwardProgressCache(ttl_seconds=30)
 
-            # Get global signals instance
-            self.signals = get_app_signals()
+            # Get global signals instance (None when running headless)
+            self.signals = default_signals()
             
             # Cache for C/T/S member lookups (loaded on-demand, cached for performance)
             self._member_cache: Dict[str, Dict[str, bool]] = {}
@@ -121,6 +168,10 @@ class DatabaseRepository:
                         logger.error(f"Failed to add column '{column_name}': {alter_error}", exc_info=True)
                         session.rollback()
 
+            # Create indexes added to the model after the table was created
+            for index in Contact.__table__.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+
             logger.info("Schema migration completed successfully")
         except Exception as e:
             logger.error(f"Error during schema migration: {e}", exc_info=True)
@@ -128,6 +179,60 @@ class DatabaseRepository:
         finally:
             session.close()
 
+    def _executemany(self, statement: str, params: List[Dict[str, Any]]) -> None:
+        """
+        Execute one parameterized statement for many rows in a single transaction.
+
+        The engine runs the driver in autocommit mode, so ORM bulk operations
+        commit (and fsync) once per row. This wraps a DBAPI executemany in an
+        explicit BEGIN/COMMIT instead.
+
+        Args:
+            statement: SQL statement with named (:name) parameters
+            params: One parameter dict per row
+        """
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                conn.exec_driver_sql(statement, params)
+                conn.exec_driver_sql("COMMIT")
+            except Exception:
+                conn.exec_driver_sql("ROLLBACK")
+                raise
+
+    # ==================== Maintenance ====================
+
+    def checkpoint(self) -> None:
+        """
+        Fold the write-ahead log into the database file
+
+        Afterwards the .db file alone holds every committed change, so it can
+        be copied as a backup.
+        """
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def vacuum(self) -> Dict[str, int]:
+        """
+        Compact the database file and refresh the query planner statistics
+
+        Returns:
+            Dict with 'size_before' and 'size_after' in bytes
+        """
+        path = Path(self.db_path)
+        self.checkpoint()
+        size_before = path.stat().st_size
+
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("VACUUM")
+            conn.exec_driver_sql("ANALYZE")
+            conn.exec_driver_sql("PRAGMA optimize")
+        self.checkpoint()
+
+        size_after = path.stat().st_size
+        logger.info(f"Database vacuumed: {size_before} -> {size_after} bytes")
+        return {'size_before': size_before, 'size_after': size_after}
+
     # ==================== Contact Operations ====================
 
     def add_contact(self, contact: Contact) -> Contact:
@@ -146,11 +251,12 @@ class DatabaseRepository:
 
             # Invalidate caches and emit batched signal (OPTIMIZED: single signal emission)
             self.award_cache.invalidate_all_award_caches()
-            self.signals.emit_contact_change('added', {
-                'callsign': contact.callsign,
-                'band': contact.band,
-                'mode': contact.mode
-            })
+            if self.signals:
+                self.signals.emit_contact_change('added', {
+                    'callsign': contact.callsign,
+                    'band': contact.band,
+                    'mode': contact.mode
+                })
 
             return contact
         except ValueError as e:
@@ -188,6 +294,46 @@ class DatabaseRepository:
         finally:
             session.close()
 
+    def iter_contact_records(
+        self,
+        *criteria,
+        columns: Sequence[str] = AWARD_COLUMNS,
+        order_by: Sequence[Any] = (),
+    ) -> Iterator[ContactRecord]:
+        """Stream read-only contact records (projected, no ORM objects)
+
+        Args:
+            *criteria: Filter expressions on Contact columns
+            columns: Contact columns to load (award columns by default)
+            order_by: Ordering expressions
+
+        Returns:
+            Iterator of records; the session closes when it is exhausted
+        """
+        session = self.get_session()
+        try:
+            yield from select_contact_records(session, *criteria, columns=columns, order_by=order_by)
+        finally:
+            session.close()
+
+    def get_contact_records(
+        self,
+        *criteria,
+        columns: Sequence[str] = AWARD_COLUMNS,
+        order_by: Sequence[Any] = (),
+    ) -> List[ContactRecord]:
+        """Get read-only contact records for award, list and export paths
+
+        Args:
+            *criteria: Filter expressions on Contact columns
+            columns: Contact columns to load (award columns by default)
+            order_by: Ordering expressions
+
+        Returns:
+            List of records
+        """
+        return list(self.iter_contact_records(*criteria, columns=columns, order_by=order_by))
+
     def search_contacts(self, **filters) -> List[Contact]:
         """Search contacts by multiple criteria"""
         session = self.get_session()
@@ -227,10 +373,11 @@ class DatabaseRepository:
 
                 # Invalidate caches and emit batched signal (OPTIMIZED: single signal emission)
                 self.award_cache.invalidate_all_award_caches()
-                self.signals.emit_contact_change('modified', {
-                    'contact_id': contact_id,
-                    'callsign': contact.callsign
-                })
+                if self.signals:
+                    self.signals.emit_contact_change('modified', {
+                        'contact_id': contact_id,
+                        'callsign': contact.callsign
+                    })
 
             return contact
         except ValueError as e:
@@ -258,10 +405,11 @@ class DatabaseRepository:
 
                 # Invalidate caches and emit batched signal (OPTIMIZED: single signal emission)
                 self.award_cache.invalidate_all_award_caches()
-                self.signals.emit_contact_change('deleted', {
-                    'contact_id': contact_id,
-                    'callsign': callsign
-                })
+                if self.signals:
+                    self.signals.emit_contact_change('deleted', {
+                        'contact_id': contact_id,
+                        'callsign': callsign
+                    })
 
                 return True
             return False
@@ -584,13 +732,13 @@ class DatabaseRepository:
         Returns:
             Dict with eligibility info for all SKCC awards
         """
-        session = self.get_session()
         try:
             # Get ALL user contacts (not filtered by SKCC number - that was wrong!)
-            contacts = session.query(Contact).filter(
+            contacts = self.get_contact_records(
                 Contact.skcc_number.isnot(None),
-                Contact.skcc_number != ''
-            ).all()
+                Contact.skcc_number != '',
+                columns=('skcc_number', 'key_type', 'state', 'country', 'dxcc'),
+            )
 
             total_contacts = len(contacts)
 
@@ -701,8 +849,9 @@ class DatabaseRepository:
                     },
                 },
             }
-        finally:
-            session.close()
+        except SQLAlchemyError as e:
+            logger.error(f"Error analyzing SKCC award eligibility: {e}")
+            raise
 
     def get_skcc_member_summary(self, skcc_number: str) -> Dict[str, Any]:
         """Get quick summary of SKCC member for contact window
@@ -803,14 +952,14 @@ class DatabaseRepository:
             "2M": 0.5,
         }
 
-        session = self.get_session()
         try:
             # Get all QRP contacts grouped by band (one per band only)
-            qrp_contacts = session.query(Contact).filter(
+            qrp_contacts = self.get_contact_records(
                 Contact.tx_power.isnot(None),
                 Contact.tx_power <= 5.0,
-                Contact.mode == "CW"
-            ).all()
+                Contact.mode == "CW",
+                columns=('band',),
+            )
 
             # Track one contact per band only
             band_contacts = {}
@@ -833,8 +982,9 @@ class DatabaseRepository:
                 "qrp_contacts_count": len(qrp_contacts),
                 "unique_bands": len(band_contacts),
             }
-        finally:
-            session.close()
+        except SQLAlchemyError as e:
+            logger.error(f"Error counting QRP points by band: {e}")
+            raise
 
     def analyze_qrp_award_progress(self) -> Dict[str, Any]:
         """Complete QRP x1 and x2 award analysis
@@ -945,41 +1095,41 @@ class DatabaseRepository:
         Returns:
             List of qualifying contacts with MPW calculation
         """
+        from src.utils.geodesy import KM_TO_MILES
+
         session = self.get_session()
         try:
-            qrp_contacts = session.query(Contact).filter(
+            # Projected query with the MPW threshold evaluated in SQL:
+            # (distance_km * KM_TO_MILES) / tx_power >= 1000  <=>  distance_km * KM_TO_MILES >= 1000 * tx_power
+            rows = session.query(
+                Contact.id, Contact.callsign, Contact.qso_date, Contact.time_on,
+                Contact.band, Contact.distance, Contact.tx_power, Contact.skcc_number
+            ).filter(
                 Contact.tx_power.isnot(None),
+                Contact.tx_power > 0,
                 Contact.tx_power <= 5.0,
                 Contact.distance.isnot(None),
                 Contact.distance > 0,
-                Contact.mode == "CW"
+                Contact.mode == "CW",
+                Contact.distance * KM_TO_MILES >= Contact.tx_power * 1000.0
             ).all()
 
             mpw_qualifications = []
-            for contact in qrp_contacts:
+            for row in rows:
                 # Convert distance from km to miles
-                distance_km = contact.distance
-                distance_miles = distance_km * 0.621371  # km to miles conversion
-                mpw = contact.calculate_mpw(distance_miles)
-
-                if contact.qualifies_for_mpw(distance_miles):
-                    # Get SKCC number - try multiple fields
-                    skcc_number = None
-                    if contact.skcc_number:
-                        skcc_number = contact.skcc_number
-                    
-                    mpw_qualifications.append({
-                        "contact_id": contact.id,
-                        "callsign": contact.callsign,
-                        "date": contact.qso_date,
-                        "time": contact.time_on,
-                        "band": contact.band,
-                        "distance_miles": distance_miles,
-                        "tx_power": contact.tx_power,
-                        "mpw": mpw,
-                        "qualified": True,
-                        "skcc_number": skcc_number,
-                    })
+                distance_miles = row.distance * KM_TO_MILES
+                mpw_qualifications.append({
+                    "contact_id": row.id,
+                    "callsign": row.callsign,
+                    "date": row.qso_date,
+                    "time": row.time_on,
+                    "band": row.band,
+                    "distance_miles": distance_miles,
+                    "tx_power": row.tx_power,
+                    "mpw": distance_miles / row.tx_power,
+                    "qualified": True,
+                    "skcc_number": row.skcc_number or None,
+                })
 
             return mpw_qualifications
         finally:
@@ -988,71 +1138,60 @@ class DatabaseRepository:
     def backfill_contact_distances(self, home_grid: str) -> Dict[str, int]:
         """
         Calculate and populate distance field for all contacts missing it.
-        
+
         Processes contacts that have a grid square but no distance calculated.
-        Uses the Haversine formula to calculate great-circle distance.
-        
+        Only (id, gridsquare) is loaded, distances are computed in one vectorized
+        pass (batch_distances acceleration kernel) and written back with a single bulk update.
+
         Args:
             home_grid: Your home Maidenhead grid square
-            
+
         Returns:
             Dict with 'updated', 'skipped', and 'errors' counts
         """
-        from src.services.voacap_muf_fetcher import VOACAPMUFFetcher
-        
+        from src.utils.grid_calc import batch_calculate_distances
+
         session = self.get_session()
         try:
-            # Get all contacts with grid squares but no distance
-            contacts_to_update = session.query(Contact).filter(
+            # Get all contacts with grid squares but no distance (projected, no ORM hydration)
+            rows = session.query(Contact.id, Contact.gridsquare).filter(
                 Contact.gridsquare.isnot(None),
                 Contact.gridsquare != "",
                 Contact.distance.is_(None)
             ).all()
-            
-            updated = 0
-            skipped = 0
-            errors = 0
-            
-            logger.info(f"Found {len(contacts_to_update)} contacts to calculate distances for")
-            
-            for contact in contacts_to_update:
-                try:
-                    contact_grid = contact.gridsquare.strip()
-                    
-                    # Validate grid square (at least 4 characters)
-                    if not contact_grid or len(contact_grid) < 4:
-                        skipped += 1
-                        continue
-                    
-                    # Calculate distance
-                    distance_km = VOACAPMUFFetcher._grid_distance(home_grid, contact_grid)
-                    
-                    # Update contact
-                    contact.distance = distance_km
-                    updated += 1
-                    
-                    if updated % 100 == 0:
-                        logger.info(f"Processed {updated} contacts...")
-                        session.commit()  # Commit in batches
-                        
-                except Exception as e:
-                    logger.warning(f"Error calculating distance for {contact.callsign} ({contact.gridsquare}): {e}")
-                    errors += 1
-                    continue
-            
-            # Final commit
-            session.commit()
-            
+
+            logger.info(f"Found {len(rows)} contacts to calculate distances for")
+
+            # Validate grid squares (at least 4 characters)
+            candidates = [(row.id, row.gridsquare.strip()) for row in rows]
+            candidates = [(contact_id, grid) for contact_id, grid in candidates if len(grid) >= 4]
+            skipped = len(rows) - len(candidates)
+
+            distances = batch_calculate_distances(home_grid, [grid for _, grid in candidates])
+
+            updates = [
+                {'id': contact_id, 'distance': distance_km}
+                for (contact_id, _), distance_km in zip(candidates, distances)
+                if distance_km is not None
+            ]
+            errors = len(candidates) - len(updates)
+            updated = len(updates)
+
+            if updates:
+                self._executemany(
+                    "UPDATE contacts SET distance = :distance WHERE id = :id", updates
+                )
+
             result = {
                 'updated': updated,
                 'skipped': skipped,
                 'errors': errors,
-                'total': len(contacts_to_update)
+                'total': len(rows)
             }
-            
+
             logger.info(f"Distance backfill complete: {updated} updated, {skipped} skipped, {errors} errors")
             return result
-            
+
         except Exception as e:
             logger.error(f"Error during distance backfill: {e}", exc_info=True)
             session.rollback()
@@ -1189,6 +1328,98 @@ class DatabaseRepository:
 
         return cleaned
 
+    @staticmethod
+    def _new_contact(cleaned_data: Dict[str, Any]) -> Contact:
+        """Build a validated Contact from a cleaned record
+
+        Raises:
+            ValueError: If the contact breaks the SKCC constraints
+        """
+        contact = Contact()
+        for key, value in cleaned_data.items():
+            if hasattr(contact, key) and value is not None:
+                setattr(contact, key, value)
+
+        # Set defaults if not provided
+        if not contact.mode:
+            contact.mode = "CW"
+
+        # Validate SKCC constraints
+        contact.validate_skcc()
+        return contact
+
+    def get_contact_keys(self) -> Set[ContactKey]:
+        """Get the duplicate-detection key of every contact
+
+        Returns:
+            Set of contact_key() tuples, for in-memory dupe checks
+        """
+        session = self.get_session()
+        try:
+            rows = session.execute(
+                select(Contact.callsign, Contact.qso_date, Contact.time_on, Contact.band)
+            )
+            return {contact_key(*row) for row in rows}
+        finally:
+            session.close()
+
+    def add_contacts_batch(self, records: List[Dict[str, Any]], source: str = "") -> Dict[str, Any]:
+        """Insert new contacts in a single transaction
+
+        Unlike import_contacts_from_adif() there is no per-record duplicate
+        query: callers (e.g. the UDP ingest service) check contact_key()
+        against get_contact_keys() first. One 'bulk_import' signal is
+        emitted for the whole batch.
+
+        Args:
+            records: Contact dictionaries with database field names
+            source: Label for logs and the signal metadata
+
+        Returns:
+            Dictionary with 'imported', 'failed', 'errors' and the 'keys'
+            of the inserted contacts
+        """
+        stats: Dict[str, Any] = {"imported": 0, "failed": 0, "errors": [], "keys": []}
+        contacts = []
+        for record in records:
+            try:
+                contacts.append(self._new_contact(self._clean_adif_record(record)))
+            except ValueError as e:
+                stats["failed"] += 1
+                stats["errors"].append(f"{record.get('callsign', 'Unknown')}: {e}")
+        if not contacts:
+            return stats
+        keys = [contact_key(c.callsign, c.qso_date, c.time_on, c.band) for c in contacts]
+
+        session = self.get_session()
+        try:
+            # The driver autocommits, so open the transaction explicitly
+            session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+            session.add_all(contacts)
+            session.commit()
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Database error inserting {len(contacts)} contacts: {e}")
+            stats["failed"] += len(contacts)
+            stats["errors"].insert(0, f"Database error: {e}")
+            return stats
+        finally:
+            session.close()
+
+        stats["imported"] = len(contacts)
+        stats["keys"] = keys
+        logger.info(f"Inserted {len(contacts)} contacts{f' from {source}' if source else ''}")
+
+        self.award_cache.invalidate_all_award_caches()
+        if self.signals:
+            self.signals.emit_contact_change('bulk_import', {
+                'imported': len(contacts),
+                'updated': 0,
+                'total': len(contacts),
+                'source': source,
+            })
+        return stats
+
     def import_contacts_from_adif(
         self,
         adif_records: List[Dict[str, Any]],
@@ -1252,19 +1483,7 @@ class DatabaseRepository:
                         # "append" falls through to add new record
 
                     # Create new contact
-                    contact = Contact()
-                    for key, value in cleaned_data.items():
-                        if hasattr(contact, key) and value is not None:
-                            setattr(contact, key, value)
-
-                    # Set defaults if not provided
-                    if not contact.mode:
-                        contact.mode = "CW"
-
-                    # Validate SKCC constraints
-                    contact.validate_skcc()
-
-                    session.add(contact)
+                    session.add(self._new_contact(cleaned_data))
                     stats["imported"] += 1
 
                 except ValueError as e:
@@ -1292,11 +1511,12 @@ class DatabaseRepository:
 
             # Emit batched signal to refresh all widgets after successful import (OPTIMIZED)
             if stats['imported'] > 0 or stats['updated'] > 0:
-                self.signals.emit_contact_change('bulk_import', {
-                    'imported': stats['imported'],
-                    'updated': stats['updated'],
-                    'total': stats['imported'] + stats['updated']
-                })
+                if self.signals:
+                    self.signals.emit_contact_change('bulk_import', {
+                        'imported': stats['imported'],
+                        'updated': stats['updated'],
+                        'total': stats['imported'] + stats['updated']
+                    })
                 logger.info(f"Emitted batched signal for {stats['imported'] + stats['updated']} contacts")
 
         except SQLAlchemyError as e:
@@ -1308,6 +1528,75 @@ class DatabaseRepository:
 
         return stats
 
+    # ==================== QSL Confirmations ====================
+
+    def apply_qsl_confirmations(
+        self,
+        confirmation_type: str,
+        confirmations: Sequence[Tuple[int, Optional[str]]],
+        source: str = ""
+    ) -> Dict[str, int]:
+        """Record confirmations of matched contacts in one transaction
+
+        Sets the contact's received flag (lotw_qsl_rcvd, eqsl_qsl_rcvd or
+        qsl_rcvd) and adds a QSLRecord unless the contact already has one
+        of this type, so applying the same report twice changes nothing.
+
+        Args:
+            confirmation_type: 'LOTW', 'EQSL' or 'QSL'
+            confirmations: (contact_id, confirmed_date YYYYMMDD or None) pairs
+            source: confirmation_source of the new QSLRecords
+
+        Returns:
+            Dict with 'flagged' (contacts updated) and 'recorded' (QSLRecords added)
+
+        Raises:
+            ValueError: If the confirmation type is unknown
+        """
+        flag = QSL_FLAG_COLUMNS.get(confirmation_type)
+        if flag is None:
+            raise ValueError(f"Unknown confirmation type: {confirmation_type}")
+        latest: Dict[int, Optional[str]] = {}
+        for contact_id, confirmed_date in confirmations:
+            latest[contact_id] = confirmed_date or latest.get(contact_id)
+        if not latest:
+            return {'flagged': 0, 'recorded': 0}
+
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                recorded = set(conn.scalars(
+                    select(QSLRecord.contact_id).where(QSLRecord.confirmation_type == confirmation_type)
+                ))
+                conn.execute(
+                    Contact.__table__.update().where(Contact.id == bindparam('contact_id')).values({flag: 'Y'}),
+                    [{'contact_id': contact_id} for contact_id in latest],
+                )
+                new_records = [
+                    {'contact_id': contact_id, 'confirmation_type': confirmation_type,
+                     'confirmed_date': confirmed_date, 'confirmation_source': source or None}
+                    for contact_id, confirmed_date in latest.items() if contact_id not in recorded
+                ]
+                if new_records:
+                    conn.execute(QSLRecord.__table__.insert(), new_records)
+                conn.exec_driver_sql("COMMIT")
+            except Exception:
+                conn.exec_driver_sql("ROLLBACK")
+                raise
+
+        logger.info(
+            f"Applied {len(latest)} {confirmation_type} confirmations ({len(new_records)} new QSL records)"
+        )
+        self.award_cache.invalidate_all_award_caches()
+        if self.signals:
+            self.signals.emit_contact_change('bulk_import', {
+                'imported': 0,
+                'updated': len(latest),
+                'total': len(latest),
+                'source': source,
+            })
+        return {'flagged': len(latest), 'recorded': len(new_records)}
+
     # ==================== Cluster Spot Operations ====================
 
     def add_cluster_spot(self, spot_data: Dict[str, Any]) -> Optional[ClusterSpot]:
@@ -1401,6 +1690,67 @@ class DatabaseRepository:
         finally:
             session.close()
 
+    def replay_award_timeline(self):
+        """Replay the log once for the Centurion, Tribune, Senator and Rag Chew awards
+
+        Streams CW contacts with SKCC numbers in (qso_date, time_on) order from
+        the index and advances every award together, recording the exact QSO
+        at which each endorsement level was reached.
+
+        Returns:
+            AwardTimeline (cached until contacts change)
+        """
+        from src.awards.timeline import AwardTimeline
+
+        cached = self.award_cache.get_award_progress(AwardProgressCache.TIMELINE_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        self._load_member_sets()
+        session = self.get_session()
+        try:
+            centurion_dates = {}
+            for member in session.query(CenturionMember.skcc_number, CenturionMember.centurion_date):
+                base = extract_base_skcc_number(member.skcc_number)
+                if base and member.centurion_date:
+                    centurion_dates[base] = member.centurion_date
+
+            timeline = AwardTimeline(
+                centurion_numbers=self._centurion_set,
+                tribune_numbers=self._tribune_set,
+                senator_numbers=self._senator_set,
+                centurion_dates=centurion_dates,
+                user_centurion_date=self._official_centurion_date(session),
+            )
+
+            records = select_contact_records(
+                session,
+                Contact.mode == "CW",
+                Contact.skcc_number.isnot(None),
+                columns=TIMELINE_COLUMNS,
+                order_by=(Contact.qso_date, Contact.time_on),
+            )
+            for record in records:
+                timeline.feed(record)
+
+            logger.debug(f"Award timeline replayed {timeline.contacts_replayed} contacts")
+            self.award_cache.set_award_progress(AwardProgressCache.TIMELINE_CACHE_KEY, timeline)
+            return timeline
+        finally:
+            session.close()
+
+    def _official_centurion_date(self, session: Session) -> Optional[str]:
+        """Operator's Centurion date from the SKCC Centurion list, or the awards.centurion_date setting"""
+        from src.config.settings import get_config_manager
+
+        config_manager = get_config_manager()
+        user_callsign = config_manager.get("operator_callsign", "").upper()
+        if user_callsign:
+            entry = session.query(CenturionMember).filter(CenturionMember.callsign == user_callsign).first()
+            if entry and entry.centurion_date:
+                return entry.centurion_date
+        return config_manager.get('awards', {}).get('centurion_date', '') or None
+
     def analyze_centurion_award_progress(self) -> Dict[str, Any]:
         """Analyze Centurion award progress
 
@@ -1437,49 +1787,9 @@ class DatabaseRepository:
                 if user_centurion_entry and user_centurion_entry.centurion_date:
                     centurion_achievement_date = user_centurion_entry.centurion_date
 
-            # OPTIMIZED: Get only distinct SKCC numbers with their first occurrence
-            # This reduces dataset from 10,000+ contacts to ~500-1000 unique SKCC numbers
-            # Using subquery to get first contact for each SKCC number
-            from sqlalchemy.sql import func as sqlfunc
-
-            subq = session.query(
-                Contact.skcc_number,
-                sqlfunc.min(Contact.qso_date).label('first_date')
-            ).filter(
-                Contact.mode == "CW",
-                Contact.skcc_number.isnot(None),
-                Contact.key_type.in_(["STRAIGHT", "BUG", "SIDESWIPER"])
-            ).group_by(Contact.skcc_number).subquery()
-
-            # Join back to get contact details for first occurrence
-            centurion_contacts = session.query(
-                Contact.callsign, Contact.skcc_number, Contact.qso_date, Contact.band
-            ).join(
-                subq,
-                (Contact.skcc_number == subq.c.skcc_number) &
-                (Contact.qso_date == subq.c.first_date)
-            ).all()
-
-            # Collect unique SKCC members (base number without suffixes)
-            # Now processing only ~500-1000 rows instead of 10,000+
-            unique_members = set()
-            member_details = {}
-
-            for contact in centurion_contacts:
-                # Extract base SKCC number using utility function
-                base_number = extract_base_skcc_number(contact.skcc_number)
-
-                # Only add if it's a valid number
-                if base_number:
-                    unique_members.add(base_number)
-                    if base_number not in member_details:
-                        member_details[base_number] = {
-                            'callsign': contact.callsign,
-                            'date': contact.qso_date,
-                            'band': contact.band
-                        }
-
-            member_count = len(unique_members)
+            # Unique members credited by the award timeline replay
+            timeline = self.replay_award_timeline()
+            member_count = timeline.centurion.count
 
             # Calculate endorsement level
             if member_count < 100:
@@ -1529,7 +1839,9 @@ class DatabaseRepository:
                 'next_level': next_level,
                 'members_to_next': max(0, next_level - member_count),
                 'total_centurion_on_record': session.query(func.count(CenturionMember.id)).scalar() or 0,
-                'centurion_achievement_date': centurion_achievement_date  # Official Centurion achievement date from SKCC list
+                'centurion_achievement_date': centurion_achievement_date,  # Official Centurion achievement date from SKCC list
+                'centurion_replay_date': timeline.centurion.date_of("Centurion"),  # Date the log reached 100 members
+                'milestones': timeline.centurion.milestones
             }
             # Cache the result
             self.award_cache.set_centurion_progress(result)
@@ -1573,56 +1885,16 @@ class DatabaseRepository:
         try:
             from src.config.settings import get_config_manager
 
-            # Load member sets from cache (or query if not loaded)
-            self._load_member_sets()
-            tribune_member_set = self._tribune_set
-            senator_member_set = self._senator_set
-            centurion_member_set = self._centurion_set
-
-            # Optimized: Get only needed columns for centurion calculation
-            centurion_contacts = session.query(
-                Contact.skcc_number
-            ).filter(
-                Contact.mode == "CW",
-                Contact.skcc_number.isnot(None)
-            ).all()
-
-            unique_centurions = set()
-            for contact in centurion_contacts:
-                base_number = extract_base_skcc_number(contact.skcc_number)
-                if base_number:
-                    unique_centurions.add(base_number)
-
-            is_centurion = len(unique_centurions) >= 100
+            # Centurion and Tribune credits come from the award timeline replay, which
+            # uses the official Centurion date or else the date the log reached 100 members
+            timeline = self.replay_award_timeline()
+            is_centurion = timeline.centurion.count >= 100
+            centurion_achievement_date = timeline.user_centurion_date
 
             # Get user's callsign from config
             config_manager = get_config_manager()
             user_callsign = config_manager.get("operator_callsign", "").upper()
 
-            # Get the official Centurion achievement date (prerequisite for Tribune)
-            centurion_achievement_date = None
-            if user_callsign:
-                user_centurion_entry = session.query(CenturionMember).filter(
-                    CenturionMember.callsign == user_callsign
-                ).first()
-                if user_centurion_entry and user_centurion_entry.centurion_date:
-                    centurion_achievement_date = user_centurion_entry.centurion_date
-            
-            # If no Centurion date found in member list, check config or use earliest qualifying QSO
-            if not centurion_achievement_date:
-                # Try to get from config first
-                centurion_achievement_date = config_manager.get('awards', {}).get('centurion_date', '')
-                if not centurion_achievement_date:
-                    # Fall back to using earliest CW QSO date as a reasonable estimate
-                    # This allows the Tribune logic to work even if user not in official list yet
-                    earliest_qso = session.query(Contact).filter(
-                        Contact.mode == "CW",
-                        Contact.skcc_number.isnot(None)
-                    ).order_by(Contact.qso_date.asc()).first()
-                    if earliest_qso:
-                        centurion_achievement_date = earliest_qso.qso_date
-                        logger.info(f"Using earliest CW QSO date as Centurion date: {centurion_achievement_date}")
-
             # Get the official Tribune achievement date from the SKCC Tribune list
             # This is the authoritative date for endorsement calculations
             tribune_achievement_date = None
@@ -1633,66 +1905,8 @@ class DatabaseRepository:
                 if user_tribune_entry and user_tribune_entry.tribune_date:
                     tribune_achievement_date = user_tribune_entry.tribune_date
 
-            # Get all qualifying contacts (must check each one individually for date rules)
-            tribune_eligible_date = "20070301"  # March 1, 2007
-
-            all_tribune_contacts = session.query(Contact).filter(
-                Contact.mode == "CW",
-                Contact.skcc_number.isnot(None),
-                Contact.qso_date >= tribune_eligible_date
-            ).order_by(Contact.qso_date.asc()).all()
-
-            # Load Centurion dates for validation
-            # SKCC Rule: "the QSO date is compared with the applicant's and contact's
-            # Centurion dates. To count, the QSO date must be on or after both 
-            # participants' Centurion Award date."
-            centurion_dates = {}
-            for member in session.query(CenturionMember.skcc_number, CenturionMember.centurion_date).all():
-                if member.centurion_date:
-                    centurion_dates[member.skcc_number] = member.centurion_date
-
-            # Collect unique Centurion/Tribune/Senator members
-            # Process each contact individually to properly check date rules
-            unique_tribunes = set()
-
-            for contact in all_tribune_contacts:
-                # Extract base SKCC number using utility function
-                base_number = extract_base_skcc_number(contact.skcc_number)
-                if not base_number:
-                    continue
-
-                # Skip if already counted (only count each member once)
-                if base_number in unique_tribunes:
-                    continue
-
-                # SKCC Rule: Tribune counts Centurion, Tribune, or Senator members
-                is_valid_member = (
-                    base_number in centurion_member_set or
-                    base_number in tribune_member_set or
-                    base_number in senator_member_set
-                )
-
-                if not is_valid_member:
-                    continue
-
-                # SKCC Rule: Contact must be AFTER user's Centurion achievement date
-                # AND after the contacted station's Centurion achievement date
-                qso_date = contact.qso_date
-
-                # Check user's Centurion date
-                if centurion_achievement_date and qso_date < centurion_achievement_date:
-                    continue
-
-                # Check contacted station's Centurion date
-                contact_centurion_date = centurion_dates.get(base_number)
-                if contact_centurion_date and qso_date < contact_centurion_date:
-                    continue
-
-                # Both parties were Centurions at time of QSO - count this member
-                unique_tribunes.add(base_number)
-
             # Total unique Tribune members contacted (base award + endorsements)
-            tribune_count = len(unique_tribunes)
+            tribune_count = timeline.tribune.count
 
             # Calculate endorsement level based on total Tribune count
             if tribune_count < 50:
@@ -1751,9 +1965,11 @@ class DatabaseRepository:
                 'next_level': next_level,
                 'tribunes_to_next': tribunes_to_next,
                 'is_centurion': is_centurion,
-                'centurion_count': len(unique_centurions),
+                'centurion_count': timeline.centurion.count,
                 'total_tribune_on_record': session.query(func.count(TribuneeMember.id)).scalar() or 0,
-                'tribune_achievement_date': tribune_achievement_date  # Official Tribune achievement date from SKCC list
+                'tribune_achievement_date': tribune_achievement_date,  # Official Tribune achievement date from SKCC list
+                'centurion_achievement_date': centurion_achievement_date,  # Official, or reached in the replay
+                'milestones': timeline.tribune.milestones
             }
             # Cache the result
             self.award_cache.set_tribune_progress(result)
@@ -1784,7 +2000,7 @@ class DatabaseRepository:
         Requires user to be Tribune x8 first (400+ unique Tribune/Senator members).
         Endorsements available in 200-contact increments.
 
-        Uses the official Tribune x8 achievement date from SKCC list for endorsement calculations.
+        Uses the date the log reached Tribune x8 in the award timeline replay.
 
         Returns:
             Dict with Senator progress analysis
@@ -1797,111 +2013,13 @@ class DatabaseRepository:
 
         session = self.get_session()
         try:
-            from src.config.settings import get_config_manager
-
-            # Load member sets from cache (or query if not loaded)
-            self._load_member_sets()
-            tribune_member_set = self._tribune_set
-            senator_member_set = self._senator_set
-            centurion_member_set = self._centurion_set
-
-            # Get user's callsign from config
-            config_manager = get_config_manager()
-            user_callsign = config_manager.get("operator_callsign", "").upper()
-
-            # Get the official Centurion achievement date (prerequisite for Tribune x8)
-            centurion_achievement_date = None
-            if user_callsign:
-                user_centurion_entry = session.query(CenturionMember).filter(
-                    CenturionMember.callsign == user_callsign
-                ).first()
-                if user_centurion_entry and user_centurion_entry.centurion_date:
-                    centurion_achievement_date = user_centurion_entry.centurion_date
-
-            # OPTIMIZED: Get only unique SKCC numbers with first contact date
-            # This reduces dataset from 10,000+ contacts to ~500-1000 unique SKCC numbers
-            from sqlalchemy.sql import func as sqlfunc
-
-            tribune_contacts_unique = session.query(
-                Contact.skcc_number,
-                sqlfunc.min(Contact.qso_date).label('first_date')
-            ).filter(
-                Contact.mode == "CW",
-                Contact.skcc_number.isnot(None),
-                Contact.qso_date >= "20070301"  # After Tribune eligible date
-            ).group_by(Contact.skcc_number).all()
-
-            # Collect Tribune/Senator contacts and track when Tribune x8 (400) was achieved
-            # Now processing only unique SKCC numbers (~500-1000) instead of all contacts (10,000+)
-            tribune_contacts_list = []
-            for contact in tribune_contacts_unique:
-                # Extract base SKCC number using utility function
-                base_number = extract_base_skcc_number(contact.skcc_number)
-                if not base_number:
-                    continue
-
-                # Check if this is a Tribune/Senator member (using pre-loaded sets - no N+1)
-                if base_number in tribune_member_set or base_number in senator_member_set or base_number in centurion_member_set:
-                    # SKCC Rule: Tribune contacts must be AFTER Centurion achievement date
-                    if centurion_achievement_date:
-                        if contact.first_date >= centurion_achievement_date:
-                            tribune_contacts_list.append((base_number, contact.first_date))
-                    else:
-                        # No Centurion date available, count all contacts
-                        tribune_contacts_list.append((base_number, contact.first_date))
-
-            # Sort by date and find when Tribune x8 (400 unique members) was achieved
-            tribune_contacts_list.sort(key=lambda x: x[1])  # Sort by date
-            unique_tribunes = set()
-            tribune_x8_achievement_date = None
-            
-            for base_number, qso_date in tribune_contacts_list:
-                if base_number not in unique_tribunes:
-                    unique_tribunes.add(base_number)
-                    # Check if we just reached Tribune x8 (400 unique contacts)
-                    if len(unique_tribunes) == 400 and tribune_x8_achievement_date is None:
-                        tribune_x8_achievement_date = qso_date
-
-            is_tribune_x8 = len(unique_tribunes) >= 400
-
-            # OPTIMIZED: Get only unique SKCC numbers with first contact date
-            # This reduces dataset from 10,000+ contacts to ~500-1000 unique SKCC numbers
-            senator_eligible_date = "20130801"  # August 1, 2013
-
-            senator_contacts_unique = session.query(
-                Contact.skcc_number,
-                sqlfunc.min(Contact.qso_date).label('first_date')
-            ).filter(
-                Contact.mode == "CW",
-                Contact.skcc_number.isnot(None),
-                Contact.qso_date >= senator_eligible_date
-            ).group_by(Contact.skcc_number).all()
-
-            # Collect unique Tribune/Senator members contacted AFTER Tribune x8 date
-            # Now processing only unique SKCC numbers (~500-1000) instead of all contacts (10,000+)
-            unique_senators = set()
-
-            for contact in senator_contacts_unique:
-                # Extract base SKCC number using utility function
-                base_number = extract_base_skcc_number(contact.skcc_number)
-                if not base_number:
-                    continue
-
-                # Check if this is a Tribune/Senator member (using pre-loaded sets - no N+1)
-                if base_number in tribune_member_set or base_number in senator_member_set:
-                    # Only add if user has achieved Tribune x8 first
-                    if is_tribune_x8:
-                        # Count Senator contacts only AFTER Tribune x8 achievement date
-                        # Use official SKCC Tribune x8 date if available, otherwise use Senator eligible date
-                        if tribune_x8_achievement_date:
-                            # Use the official Tribune x8 achievement date from SKCC list
-                            if contact.first_date >= tribune_x8_achievement_date:
-                                unique_senators.add(base_number)
-                        else:
-                            # Fall back to Senator eligible date if no Tribune x8 date available
-                            if contact.first_date >= senator_eligible_date:
-                                unique_senators.add(base_number)
-                    # If not Tribune x8 yet, don't count any Senator contacts (prerequisite not met)
+            # Tribune x8 and Senator credits come from the award timeline replay: Senator
+            # counts only QSOs on or after the date the log reached Tribune x8
+            timeline = self.replay_award_timeline()
+            unique_tribunes = timeline.tribune.members
+            unique_senators = timeline.senator.members
+            is_tribune_x8 = timeline.tribune.count >= 400
+            tribune_x8_achievement_date = timeline.tribune_x8_date
 
             # For endorsement calculation, only count Tribune/Senator members contacted AFTER x8
             senator_count_for_endorsement = len(unique_senators)
@@ -1955,7 +2073,8 @@ class DatabaseRepository:
                 'is_tribune_x8': is_tribune_x8,
                 'tribune_x8_count': len(unique_tribunes),
                 'total_senator_on_record': session.query(func.count(SenatorMember.id)).scalar() or 0,
-                'tribune_x8_achievement_date': tribune_x8_achievement_date  # Official Tribune x8 achievement date from SKCC list
+                'tribune_x8_achievement_date': tribune_x8_achievement_date,  # Date the log reached Tribune x8
+                'milestones': timeline.senator.milestones
             }
             # Cache the result
             self.award_cache.set_senator_progress(result)
@@ -2046,18 +2165,15 @@ class DatabaseRepository:
         try:
             from src.awards.canadian_maple import CanadianMapleAward
 
-            session = self.get_session()
-            contacts = session.query(Contact).all()
-
-            # Convert to dictionaries for the award class
-            contact_dicts = [self._contact_to_dict(c) for c in contacts]
+            # Records read like the dicts the award class expects
+            contacts = self.get_contact_records()
 
-            # Calculate using award class
-            award = CanadianMapleAward(session)
-            progress = award.calculate_progress(contact_dicts)
-
-            session.close()
-            return progress
+            session = self.get_session()
+            try:
+                award = CanadianMapleAward(session)
+                return award.calculate_progress(contacts)
+            finally:
+                session.close()
 
         except Exception as e:
             logger.error(f"Error calculating Canadian Maple progress: {e}", exc_info=True)
@@ -2129,21 +2245,6 @@ class DatabaseRepository:
             session.close()
             return {}
 
-    def _contact_to_dict(self, contact: Contact) -> dict:
-        """Convert Contact ORM object to dictionary for award calculations"""
-        return {
-            'callsign': contact.callsign,
-            'qso_date': contact.qso_date,
-            'time_on': contact.time_on,
-            'band': contact.band,
-            'mode': contact.mode,
-            'country': contact.country,
-            'state': contact.state,
-            'skcc_number': contact.skcc_number,
-            'tx_power': contact.tx_power,
-            'rx_power': contact.rx_power,
-        }
-
     def check_skcc_member_status(self, skcc_number: str) -> Dict[str, bool]:
         """
         Check if an SKCC number is a Centurion, Tribune, or Senator member.
@@ -2229,3 +2330,47 @@ class DatabaseRepository:
         self._tribune_set.clear()
         self._senator_set.clear()
         logger.info("Member cache cleared, will reload on next access")
+
+    def apply_member_list_changes(self, changes: Any) -> None:
+        """
+        Patch the C/T/S member caches in place after an incremental list sync
+
+        Args:
+            changes: MemberListChanges from a Centurion/Tribune/Senator list sync
+        """
+        if changes is None or not changes.has_changes:
+            return
+
+        member_sets = {
+            'Centurion': self._centurion_set,
+            'Tribune': self._tribune_set,
+            'Senator': self._senator_set,
+        }
+        member_set = member_sets.get(changes.list_name)
+        if member_set is None:
+            self.refresh_member_cache()
+            return
+
+        # Updated rows keep their set membership, but their details (award
+        # dates, endorsements) feed award progress, so they invalidate too
+        affected = set()
+        for skcc_number in changes.inserted | changes.updated | changes.deleted:
+            base = extract_base_skcc_number(skcc_number)
+            if base:
+                affected.add(base)
+        if not affected:
+            return
+
+        # Sets that were never loaded will read the updated table on first use
+        if self._member_sets_loaded:
+            for skcc_number in changes.deleted:
+                member_set.discard(extract_base_skcc_number(skcc_number))
+            for skcc_number in changes.inserted:
+                base = extract_base_skcc_number(skcc_number)
+                if base:
+                    member_set.add(base)
+
+        for base in affected:
+            self._member_cache.pop(base, None)
+        self.award_cache.invalidate_all_award_caches()
+        logger.info(f"Member cache patched: {changes}")
@@ -5,14 +5,79 @@ Handles downloading, parsing, caching, and querying SKCC membership roster data.
 Implements local caching for fast lookups and minimal network traffic.
 """
 
+import csv
+import io
 import logging
 import sqlite3
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, List, Any
+from html.parser import HTMLParser
+from typing import Optional, Dict, List, Any, Iterable, Iterator, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Staging table filled during a roster download, then renamed over skcc_members
+STAGING_TABLE = "skcc_members_staging"
+
+# Rows per executemany while staging a roster
+ROSTER_CHUNK_SIZE = 2000
+
+# Bytes read from the roster download at a time
+ROSTER_READ_SIZE = 64 * 1024
+
+MEMBER_INSERT_COLUMNS = ('skcc_number', 'call_sign', 'member_name', 'join_date', 'current_suffix', 'current_score')
+
+
+def _member_params(member: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Insert parameters for one member dictionary"""
+    return (
+        member.get('skcc_number'),
+        member.get('call_sign'),
+        member.get('member_name'),
+        member.get('join_date'),
+        member.get('current_suffix'),
+        member.get('current_score', 0),
+    )
+
+
+class _RosterTableParser(HTMLParser):
+    """Incremental HTML table parser; completed rows accumulate in `rows`"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: List[List[str]] = []
+        self._td: Optional[List[str]] = None
+        self._th: Optional[List[str]] = None
+        self._cell: Optional[List[str]] = None
+        self._cell_tag = ""
+
+    def _close_cell(self) -> None:
+        if self._cell is not None:
+            target = self._td if self._cell_tag == 'td' else self._th
+            target.append(''.join(self._cell).strip())
+            self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'tr':
+            self._td, self._th, self._cell = [], [], None
+        elif tag in ('td', 'th') and self._td is not None:
+            self._close_cell()
+            self._cell = []
+            self._cell_tag = tag
+
+    def handle_endtag(self, tag):
+        if tag in ('td', 'th'):
+            self._close_cell()
+        elif tag == 'tr' and self._td is not None:
+            self._close_cell()
+            # Header-only rows are reported by their <th> cells
+            self.rows.append(self._td or self._th)
+            self._td = self._th = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
 
 class SKCCMembershipManager:
     """Manages SKCC membership data synchronization and caching"""
@@ -52,35 +117,8 @@ class SKCCMembershipManager:
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS skcc_members (
-                    id INTEGER PRIMARY KEY,
-                    skcc_number VARCHAR(20) UNIQUE NOT NULL,
-                    call_sign VARCHAR(12),
-                    member_name VARCHAR(100),
-                    join_date VARCHAR(10),
-                    current_suffix VARCHAR(3),
-                    current_score INTEGER,
-                    last_updated DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Create indexes for fast lookups
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_skcc_number
-                ON skcc_members(skcc_number)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_call_sign
-                ON skcc_members(call_sign)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_last_updated
-                ON skcc_members(last_updated)
-            """)
-
+            self._create_members_table(cursor, "skcc_members")
+            self._create_members_indexes(cursor)
             conn.commit()
             conn.close()
             logger.debug("SKCC members table ensured")
@@ -89,6 +127,39 @@ class SKCCMembershipManager:
             logger.error(f"Database error creating skcc_members table: {e}")
             raise
 
+    @staticmethod
+    def _create_members_table(cursor: sqlite3.Cursor, table: str) -> None:
+        """Create a members table (live or staging) if it doesn't exist"""
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id INTEGER PRIMARY KEY,
+                skcc_number VARCHAR(20) UNIQUE NOT NULL,
+                call_sign VARCHAR(12),
+                member_name VARCHAR(100),
+                join_date VARCHAR(10),
+                current_suffix VARCHAR(3),
+                current_score INTEGER,
+                last_updated DATETIME DEFAULT CURRENT_TIMESTAMP,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    @staticmethod
+    def _create_members_indexes(cursor: sqlite3.Cursor) -> None:
+        """Create lookup indexes on skcc_members"""
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_skcc_number
+            ON skcc_members(skcc_number)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_call_sign
+            ON skcc_members(call_sign)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_last_updated
+            ON skcc_members(last_updated)
+        """)
+
     def get_member(self, skcc_number: str) -> Optional[Dict[str, Any]]:
         """
         Get member information from cache
@@ -203,49 +274,107 @@ class SKCCMembershipManager:
         """
         Cache multiple members at once
 
+        All rows are written with one executemany in a single transaction.
+
         Args:
             members_list: List of member dictionaries
 
         Returns:
             Number of members successfully cached
         """
-        if not members_list:
+        params = [_member_params(m) for m in members_list or [] if m.get('skcc_number')]
+        if not params:
             return 0
 
-        successful = 0
         try:
             conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            for member in members_list:
-                try:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO skcc_members
-                        (skcc_number, call_sign, member_name, join_date,
-                         current_suffix, current_score, last_updated)
-                        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    """, (
-                        member.get('skcc_number'),
-                        member.get('call_sign'),
-                        member.get('member_name'),
-                        member.get('join_date'),
-                        member.get('current_suffix'),
-                        member.get('current_score', 0),
-                    ))
-                    successful += 1
-
-                except sqlite3.Error as e:
-                    logger.warning(f"Error caching member {member.get('skcc_number')}: {e}")
-                    continue
-
-            conn.commit()
+            with conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO skcc_members
+                    (skcc_number, call_sign, member_name, join_date,
+                     current_suffix, current_score, last_updated)
+                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, params)
             conn.close()
-            logger.info(f"Cached {successful}/{len(members_list)} members")
-            return successful
+            logger.info(f"Cached {len(params)}/{len(members_list)} members")
+            return len(params)
 
         except sqlite3.Error as e:
             logger.error(f"Database error in batch cache: {e}")
-            return successful
+            return 0
+
+    def replace_roster(self, members: Iterable[Dict[str, Any]]) -> int:
+        """
+        Replace the whole roster without ever exposing a partial table
+
+        Members are streamed into a staging table in chunks, which is then
+        renamed over skcc_members in one short transaction. Readers see the
+        old roster until the swap commits, and memory use does not grow with
+        the roster size.
+
+        Args:
+            members: Iterable (typically a generator) of member dictionaries
+
+        Returns:
+            Number of members in the new roster (0 if nothing was swapped in)
+
+        Raises:
+            sqlite3.Error: If staging or the swap fails (the live roster is untouched)
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+            self._create_members_table(cursor, STAGING_TABLE)
+
+            insert = f"""
+                INSERT OR REPLACE INTO {STAGING_TABLE}
+                ({', '.join(MEMBER_INSERT_COLUMNS)})
+                VALUES ({', '.join('?' * len(MEMBER_INSERT_COLUMNS))})
+            """
+            staged = 0
+            chunk: List[Tuple[Any, ...]] = []
+            for member in members:
+                if not member.get('skcc_number'):
+                    continue
+                chunk.append(_member_params(member))
+                if len(chunk) >= ROSTER_CHUNK_SIZE:
+                    staged += self._stage_chunk(cursor, insert, chunk)
+                    chunk = []
+            if chunk:
+                staged += self._stage_chunk(cursor, insert, chunk)
+
+            if staged == 0:
+                cursor.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+                return 0
+
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute("DROP TABLE skcc_members")
+                cursor.execute(f"ALTER TABLE {STAGING_TABLE} RENAME TO skcc_members")
+                self._create_members_indexes(cursor)
+                cursor.execute("COMMIT")
+            except sqlite3.Error:
+                cursor.execute("ROLLBACK")
+                raise
+
+            count = cursor.execute("SELECT COUNT(*) FROM skcc_members").fetchone()[0]
+            logger.info(f"Swapped in SKCC roster with {count} members")
+            return count
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _stage_chunk(cursor: sqlite3.Cursor, insert: str, chunk: List[Tuple[Any, ...]]) -> int:
+        """Write one chunk of staged members in its own short transaction"""
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.executemany(insert, chunk)
+            cursor.execute("COMMIT")
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK")
+            raise
+        return len(chunk)
 
     def get_last_update_time(self) -> Optional[datetime]:
         """
@@ -435,64 +564,69 @@ class SKCCMembershipManager:
             List of parsed member dictionaries
         """
         try:
-            import csv
-            from io import StringIO
-
-            members = []
-            reader = csv.DictReader(StringIO(csv_data))
-
-            if not reader.fieldnames:
-                logger.warning("CSV has no headers")
-                return []
-
-            logger.debug(f"CSV columns: {reader.fieldnames}")
-
-            for row_num, row in enumerate(reader, start=1):
-                try:
-                    # Handle various column name variations
-                    skcc_num = (
-                        row.get('SKCC#') or
-                        row.get('skcc_number') or
-                        row.get('SKCC Number') or
-                        row.get('Number') or
-                        ""
-                    ).strip()
-
-                    callsign = (
-                        row.get('Callsign') or
-                        row.get('Call Sign') or
-                        row.get('Call') or
-                        ""
-                    ).strip().upper()
-
-                    name = (
-                        row.get('Name') or
-                        row.get('Member Name') or
-                        ""
-                    ).strip()
-
-                    if skcc_num and callsign:
-                        member = {
-                            'skcc_number': skcc_num,
-                            'call_sign': callsign,
-                            'member_name': name,
-                            'join_date': row.get('JoinDate', row.get('Join Date', '')).strip(),
-                            'current_suffix': row.get('Level', row.get('Suffix', '')).strip(),
-                            'current_score': 0,
-                        }
-                        members.append(member)
-
-                except Exception as e:
-                    logger.debug(f"Error parsing CSV row {row_num}: {e}")
-                    continue
-
+            members = list(self.iter_roster_csv(io.StringIO(csv_data)))
             logger.info(f"Parsed {len(members)} members from CSV roster")
             return members
-
         except Exception as e:
             logger.error(f"Error parsing CSV roster: {e}")
             return []
 
+    def iter_roster_csv(self, lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Parse CSV roster data incrementally
+
+        Args:
+            lines: CSV lines (a text stream or any iterable of lines)
+
+        Yields:
+            Parsed member dictionaries
+        """
+        reader = csv.DictReader(lines)
+
+        if not reader.fieldnames:
+            logger.warning("CSV has no headers")
+            return
+
+        logger.debug(f"CSV columns: {reader.fieldnames}")
+
+        for row_num, row in enumerate(reader, start=1):
+            try:
+                # Handle various column name variations
+                skcc_num = (
+                    row.get('SKCC#') or
+                    row.get('skcc_number') or
+                    row.get('SKCC Number') or
+                    row.get('Number') or
+                    ""
+                ).strip()
+
+                callsign = (
+                    row.get('Callsign') or
+                    row.get('Call Sign') or
+                    row.get('Call') or
+                    ""
+                ).strip().upper()
+
+                name = (
+                    row.get('Name') or
+                    row.get('Member Name') or
+                    ""
+                ).strip()
+
+                if skcc_num and callsign:
+                    yield {
+                        'skcc_number': skcc_num,
+                        'call_sign': callsign,
+                        'member_name': name,
+                        'join_date': row.get('JoinDate', row.get('Join Date', '')).strip(),
+                        'current_suffix': row.get('Level', row.get('Suffix', '')).strip(),
+                        'current_score': 0,
+                    }
+
+            except Exception as e:
+                logger.debug(f"Error parsing CSV row {row_num}: {e}")
+                continue
+
     def parse_roster_html(self, html_data: str) -> List[Dict[str, Any]]:
         """
         Parse HTML roster data (for web scraping)
@@ -506,79 +640,135 @@ class SKCCMembershipManager:
             List of parsed member dictionaries
         """
         try:
-            import re
-            from html.parser import HTMLParser
-
-            members = []
-
-            # Simple regex-based table parser
-            # Look for table rows
-            rows = re.findall(r'<tr[^>]*>(.*?)</tr>', html_data, re.DOTALL | re.IGNORECASE)
-
-            if not rows:
-                logger.warning("No table rows found in HTML")
-                return []
-
-            logger.debug(f"Found {len(rows)} potential table rows")
-
-            for row_idx, row in enumerate(rows):
-                try:
-                    # Extract cells
-                    cells = re.findall(r'<td[^>]*>(.*?)</td>', row, re.DOTALL | re.IGNORECASE)
-                    if not cells:
-                        cells = re.findall(r'<th[^>]*>(.*?)</th>', row, re.DOTALL | re.IGNORECASE)
-
-                    if len(cells) < 2:
-                        continue
-
-                    # Clean cell data
-                    cells = [
-                        re.sub(r'<[^>]+>', '', cell).strip()
-                        for cell in cells
-                    ]
-
-                    # Try to identify columns by position
-                    # Common format: SKCC# | Callsign | Name | Date | Level | Score
-                    if len(cells) >= 2:
-                        skcc_num = cells[0].strip()
-                        callsign = cells[1].strip().upper()
-
-                        # Skip header rows
-                        if skcc_num.lower() in ['skcc', 'skcc#', 'number'] or not skcc_num or not skcc_num[0].isdigit():
-                            continue
-
-                        member = {
-                            'skcc_number': skcc_num,
-                            'call_sign': callsign,
-                            'member_name': cells[2].strip() if len(cells) > 2 else '',
-                            'join_date': cells[3].strip() if len(cells) > 3 else '',
-                            'current_suffix': cells[4].strip() if len(cells) > 4 else '',
-                            'current_score': 0,
-                        }
-                        members.append(member)
-
-                except Exception as e:
-                    logger.debug(f"Error parsing HTML row {row_idx}: {e}")
-                    continue
-
+            members = list(self.iter_roster_html([html_data]))
+            if not members:
+                logger.warning("No member rows found in HTML")
             logger.info(f"Parsed {len(members)} members from HTML roster")
             return members
-
         except Exception as e:
             logger.error(f"Error parsing HTML roster: {e}")
             return []
 
+    def iter_roster_html(self, chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Parse HTML roster tables incrementally
+
+        Rows are yielded as soon as their </tr> has been seen, so the page
+        never has to be held in memory.
+
+        Args:
+            chunks: HTML text in pieces of any size
+
+        Yields:
+            Parsed member dictionaries
+        """
+        parser = _RosterTableParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+            rows, parser.rows = parser.rows, []
+            for cells in rows:
+                member = self._member_from_cells(cells)
+                if member is not None:
+                    yield member
+        parser.close()
+        for cells in parser.rows:
+            member = self._member_from_cells(cells)
+            if member is not None:
+                yield member
+
+    @staticmethod
+    def _member_from_cells(cells: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Build a member from table cells
+
+        Common format: SKCC# | Callsign | Name | Date | Level | Score
+
+        Returns:
+            Member dictionary, or None for header and malformed rows
+        """
+        if len(cells) < 2:
+            return None
+
+        skcc_num = cells[0].strip()
+        # Skip header rows
+        if skcc_num.lower() in ['skcc', 'skcc#', 'number'] or not skcc_num or not skcc_num[0].isdigit():
+            return None
+
+        return {
+            'skcc_number': skcc_num,
+            'call_sign': cells[1].strip().upper(),
+            'member_name': cells[2].strip() if len(cells) > 2 else '',
+            'join_date': cells[3].strip() if len(cells) > 3 else '',
+            'current_suffix': cells[4].strip() if len(cells) > 4 else '',
+            'current_score': 0,
+        }
+
+    def iter_roster_stream(self, stream: Any, content_type: str = "") -> Iterator[Dict[str, Any]]:
+        """
+        Parse a roster download as it arrives
+
+        The format is guessed from the Content-Type and the first buffered
+        bytes: HTML pages go through the incremental table parser, anything
+        else through the CSV reader. The text read is kept until the first
+        member is parsed; if the guess yields no members at all (a
+        mislabelled or unknown Content-Type), it is parsed again in the
+        other format.
+
+        Args:
+            stream: Binary file-like object (e.g. an HTTP response)
+            content_type: Content-Type header of the response
+
+        Yields:
+            Parsed member dictionaries
+        """
+        buffered = io.BufferedReader(stream, ROSTER_READ_SIZE)
+        head = buffered.peek(ROSTER_READ_SIZE)[:ROSTER_READ_SIZE].lstrip().lower()
+        text = io.TextIOWrapper(buffered, encoding='utf-8', errors='replace', newline='')
+        as_html = 'html' in content_type.lower() or head.startswith(b'<') or b'<tr' in head
+
+        recorded: Optional[List[str]] = []
+
+        def record(pieces: Iterable[str]) -> Iterator[str]:
+            for piece in pieces:
+                if recorded is not None:
+                    recorded.append(piece)
+                yield piece
+
+        if as_html:
+            logger.debug("Streaming roster as HTML")
+            members = self.iter_roster_html(record(iter(lambda: text.read(ROSTER_READ_SIZE), '')))
+        else:
+            logger.debug("Streaming roster as CSV")
+            members = self.iter_roster_csv(record(text))
+
+        for member in members:
+            recorded = None  # Format confirmed; stop keeping the text
+            yield member
+        if recorded is None:
+            return
+
+        data = ''.join(recorded)
+        if as_html:
+            logger.debug("No members parsed as HTML, trying CSV")
+            yield from self.iter_roster_csv(io.StringIO(data, newline=''))
+        else:
+            logger.debug("No members parsed as CSV, trying HTML")
+            yield from self.iter_roster_html([data])
+
     def sync_membership_data(self, force_refresh: bool = False) -> bool:
         """
         Synchronize membership data with official SKCC roster
 
-        Checks if cache is stale, downloads fresh data if needed
+        Checks if cache is stale, downloads fresh data if needed. The download
+        is parsed while it streams into a staging table that replaces the live
+        roster atomically, so lookups keep working throughout.
 
         Args:
             force_refresh: If True, always download fresh data and skip cache check
 
         Returns:
             True if sync successful or cache still valid, False otherwise
+            (a failed download or parse keeps the existing roster)
         """
         try:
             # Check if we have any cached members
@@ -592,50 +782,34 @@ class SKCCMembershipManager:
             # Cache is empty or stale, try to download fresh data
             logger.info("Downloading fresh SKCC membership data from official source...")
 
-            import urllib.request
             import urllib.error
+            from src.utils.network import urlopen_with_retries
 
             # Try primary source
             try:
-                req = urllib.request.Request(
-                    self.PRIMARY_SOURCE,
-                    headers={
-                        'User-Agent': 'Mozilla/5.0 (W4GNS-Logger/1.0)',
-                        'Accept': 'text/csv, text/html, application/json'
-                    }
-                )
-                with urllib.request.urlopen(req, timeout=30) as response:
-                    response_text = response.read().decode('utf-8')
+                headers = {
+                    'User-Agent': 'Mozilla/5.0 (W4GNS-Logger/1.0)',
+                    'Accept': 'text/csv, text/html, application/json'
+                }
+                with urlopen_with_retries(self.PRIMARY_SOURCE, timeout=30, retries=1, headers=headers) as response:
                     content_type = response.headers.get('content-type', 'unknown')
+                    logger.debug(f"Content-Type: {content_type}")
+                    cached = self.replace_roster(self.iter_roster_stream(response, content_type))
 
-                logger.debug(f"Downloaded {len(response_text)} bytes from {self.PRIMARY_SOURCE}")
-                logger.debug(f"Content-Type: {content_type}")
-
-                # Try parsing as CSV first, then HTML
-                members = self.parse_roster_csv(response_text)
-
-                if not members:
-                    logger.debug("CSV parsing returned no members, trying HTML parser...")
-                    members = self.parse_roster_html(response_text)
-
-                if members:
-                    # Clear old data and cache new members
-                    logger.info(f"Clearing old cache and caching {len(members)} new members...")
-                    self.clear_cache()
-                    cached = self.cache_members_batch(members)
+                if cached:
                     logger.info(f"Successfully synced {cached} SKCC members from official source")
                     return True
                 else:
-                    logger.warning(f"Downloaded roster but failed to parse members. Response sample: {response_text[:200]}")
+                    logger.warning(f"Downloaded roster from {self.PRIMARY_SOURCE} but failed to parse members")
                     return False
 
             except urllib.error.URLError as e:
                 logger.warning(f"Error downloading from {self.PRIMARY_SOURCE}: {e}")
-                return self.get_member_count() > 0
+                return False
 
         except Exception as e:
             logger.error(f"Error syncing membership data: {e}", exc_info=True)
-            return self.get_member_count() > 0
+            return False
 
     def load_test_data(self) -> bool:
         """
@@ -661,8 +835,7 @@ class SKCCMembershipManager:
                 {'skcc_number': '10', 'call_sign': 'W6VWX', 'member_name': 'Test User 10'},
             ]
 
-            self.clear_cache()
-            cached = self.cache_members_batch(test_members)
+            cached = self.replace_roster(test_members)
             logger.warning(f"Loaded {cached} TEST SKCC members (for development only)")
             return True
 
@@ -3,4 +3,5 @@ Integration modules for external applications
 
 Supports:
 - SKCC Skimmer: RBN spot monitoring and award tracking
+- WSJT-X / N1MM Logger+: QSOs logged over UDP (udp_ingest)
 """
@@ -0,0 +1,473 @@
+"""
+UDP QSO Ingestion - WSJT-X and N1MM Logger+ broadcasts
+
+Logs QSOs that other station software broadcasts over UDP:
+- WSJT-X (and JTDX/MSHV) binary messages: QSOLogged (type 5) and LoggedADIF (type 12)
+- N1MM Logger+ XML <contactinfo> packets
+
+A receiver thread parses datagrams and queues the records. A writer thread
+drains the queue in batches (up to batch_size records, or whatever arrived
+within flush_interval of the first one) and inserts each batch in one
+transaction through DatabaseRepository.add_contacts_batch(), which emits a
+single 'bulk_import' signal per batch. Duplicates are dropped against an
+in-memory set of contact keys, so contest rates never cost a query per QSO
+(WSJT-X sends every QSO twice, as QSOLogged and as LoggedADIF).
+"""
+
+import logging
+import queue
+import selectors
+import socket
+import struct
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.adif.parser import map_adif_records, normalize_adi_tags, parse_adi_content
+from src.database.repository import ContactKey, contact_key
+from src.utils.grid_calc import frequency_to_band
+
+logger = logging.getLogger(__name__)
+
+WSJTX_PORT = 2237
+N1MM_PORT = 12060
+DEFAULT_HOST = "127.0.0.1"
+
+DEFAULT_BATCH_SIZE = 50  # Records inserted per transaction at most
+DEFAULT_FLUSH_SECONDS = 0.5  # Longest a queued record waits for its batch to fill
+QUEUE_LIMIT = 10000  # Records held while the database is busy; more are dropped
+DATAGRAM_LIMIT_BYTES = 65535
+POLL_SECONDS = 0.25  # How often the threads check for stop()
+
+WSJTX_MAGIC = 0xADBCCBDA
+WSJTX_QSO_LOGGED = 5
+WSJTX_LOGGED_ADIF = 12
+
+_JULIAN_DAY_OFFSET = 1721425  # Julian day number of date.fromordinal(0)
+
+
+def known_band(frequency_mhz: float) -> str:
+    """Band of a frequency, or "" outside the bands frequency_to_band() knows"""
+    band = frequency_to_band(frequency_mhz)
+    return "" if band == "UNK" else band
+
+
+class WSJTXReader:
+    """Reads the Qt QDataStream fields of a WSJT-X message"""
+
+    def __init__(self, data: bytes, offset: int = 0):
+        self.data = data
+        self.offset = offset
+
+    def _unpack(self, fmt: str) -> Any:
+        value = struct.unpack_from(fmt, self.data, self.offset)[0]
+        self.offset += struct.calcsize(fmt)
+        return value
+
+    def uint8(self) -> int:
+        return self._unpack(">B")
+
+    def int32(self) -> int:
+        return self._unpack(">i")
+
+    def uint32(self) -> int:
+        return self._unpack(">I")
+
+    def int64(self) -> int:
+        return self._unpack(">q")
+
+    def uint64(self) -> int:
+        return self._unpack(">Q")
+
+    def bytes(self) -> Optional[bytes]:
+        """QByteArray (length-prefixed, 0xFFFFFFFF = null)"""
+        length = self.uint32()
+        if length == 0xFFFFFFFF:
+            return None
+        if self.offset + length > len(self.data):
+            raise struct.error("string runs past end of datagram")
+        value = self.data[self.offset:self.offset + length]
+        self.offset += length
+        return value
+
+    def string(self) -> str:
+        """utf8 QString as WSJT-X serializes it"""
+        value = self.bytes()
+        return value.decode("utf-8", errors="replace") if value else ""
+
+    def datetime(self) -> Optional[datetime]:
+        """QDateTime: Julian day, milliseconds since midnight, time spec"""
+        julian_day = self.int64()
+        msecs = self.uint32()
+        spec = self.uint8()
+        offset_seconds = 0
+        if spec == 2:  # Qt::OffsetFromUTC
+            offset_seconds = self.int32()
+        elif spec == 3:  # Qt::TimeZone (IANA id; not expected from WSJT-X)
+            self.bytes()
+        if julian_day <= 0 or msecs == 0xFFFFFFFF:
+            return None
+        value = datetime.combine(date.fromordinal(julian_day - _JULIAN_DAY_OFFSET), datetime.min.time())
+        return value + timedelta(milliseconds=msecs) - timedelta(seconds=offset_seconds)
+
+
+def parse_wsjtx_datagram(data: bytes) -> List[Dict[str, str]]:
+    """
+    Parse a WSJT-X UDP message
+
+    Args:
+        data: Datagram payload
+
+    Returns:
+        ADIF-keyed records (empty for heartbeats, status and other messages)
+
+    Raises:
+        struct.error: If a QSO message is truncated
+    """
+    reader = WSJTXReader(data)
+    if reader.uint32() != WSJTX_MAGIC:
+        return []
+    reader.uint32()  # Schema
+    message_type = reader.uint32()
+    if message_type not in (WSJTX_QSO_LOGGED, WSJTX_LOGGED_ADIF):
+        return []
+    reader.string()  # Client id
+
+    if message_type == WSJTX_LOGGED_ADIF:
+        # WSJT-X writes lowercase tags
+        records, _header = parse_adi_content(normalize_adi_tags(reader.string()))
+        return records
+
+    time_off = reader.datetime()
+    record = {'CALL': reader.string(), 'GRIDSQUARE': reader.string()}
+    frequency_mhz = reader.uint64() / 1e6
+    record.update({
+        'MODE': reader.string(),
+        'RST_SENT': reader.string(),
+        'RST_RCVD': reader.string(),
+        'TX_PWR': reader.string(),
+        'COMMENT': reader.string(),
+        'NAME': reader.string(),
+    })
+    time_on = reader.datetime() or time_off
+    record.update({
+        'OPERATOR': reader.string(),
+        'STATION_CALLSIGN': reader.string(),
+        'MY_GRIDSQUARE': reader.string(),
+    })
+
+    if frequency_mhz:
+        record['FREQ'] = f"{frequency_mhz:.6f}"
+        record['BAND'] = known_band(frequency_mhz)
+    if time_on:
+        record['QSO_DATE'] = time_on.strftime("%Y%m%d")
+        record['TIME_ON'] = time_on.strftime("%H%M%S")
+    if time_off:
+        record['TIME_OFF'] = time_off.strftime("%H%M%S")
+    return [{key: value for key, value in record.items() if value}]
+
+
+def parse_n1mm_datagram(data: bytes) -> List[Dict[str, str]]:
+    """
+    Parse an N1MM Logger+ XML contact packet
+
+    Args:
+        data: Datagram payload
+
+    Returns:
+        ADIF-keyed records (empty for packets other than <contactinfo>)
+
+    Raises:
+        ET.ParseError: If the XML is malformed
+    """
+    root = ET.fromstring(data)
+    if root.tag.lower() != "contactinfo":
+        return []
+    fields = {child.tag.lower(): (child.text or "").strip() for child in root}
+
+    record = {
+        'CALL': fields.get('call', '').upper(),
+        'MODE': fields.get('mode', ''),
+        'RST_SENT': fields.get('snt', ''),
+        'RST_RCVD': fields.get('rcv', ''),
+        'GRIDSQUARE': fields.get('gridsquare', ''),
+        'NAME': fields.get('name', ''),
+        'COMMENT': fields.get('comment', ''),
+        'OPERATOR': fields.get('operator', ''),
+        'STATION_CALLSIGN': fields.get('mycall', ''),
+        'TX_PWR': fields.get('power', ''),
+        'CONTEST_ID': fields.get('contestname', ''),
+    }
+    # Frequencies are in tens of Hz
+    frequency = fields.get('txfreq') or fields.get('rxfreq')
+    if frequency and frequency.isdigit() and int(frequency):
+        frequency_mhz = int(frequency) / 100000.0
+        record['FREQ'] = f"{frequency_mhz:.5f}"
+        record['BAND'] = known_band(frequency_mhz)
+
+    timestamp = fields.get('timestamp', '')
+    try:
+        logged = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+        record['QSO_DATE'] = logged.strftime("%Y%m%d")
+        record['TIME_ON'] = logged.strftime("%H%M%S")
+    except ValueError:
+        logger.debug(f"N1MM packet with unreadable timestamp: {timestamp!r}")
+    return [{key: value for key, value in record.items() if value}]
+
+
+def parse_datagram(data: bytes) -> List[Dict[str, Any]]:
+    """
+    Parse a WSJT-X or N1MM datagram into contact records
+
+    Args:
+        data: Datagram payload
+
+    Returns:
+        Records with database field names (empty if the datagram logs no QSO)
+
+    Raises:
+        ValueError: If the datagram is a malformed QSO message
+    """
+    try:
+        if data[:4] == struct.pack(">I", WSJTX_MAGIC):
+            records = parse_wsjtx_datagram(data)
+        elif data.lstrip()[:1] == b"<":
+            records = parse_n1mm_datagram(data)
+        else:
+            return []
+    except (struct.error, ET.ParseError, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed QSO datagram: {e}") from e
+    return map_adif_records(records)
+
+
+class QSOIngestService:
+    """Listens for QSO broadcasts and logs them in batched transactions"""
+
+    def __init__(
+        self,
+        db: Any,
+        addresses: Iterable[Tuple[str, int]] = ((DEFAULT_HOST, WSJTX_PORT), (DEFAULT_HOST, N1MM_PORT)),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_SECONDS,
+        on_batch: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """
+        Initialize service
+
+        Args:
+            db: DatabaseRepository the QSOs are logged to
+            addresses: (host, port) pairs to listen on; either format is accepted on any port
+            batch_size: Most records per transaction
+            flush_interval: Seconds a batch waits for more records after its first
+            on_batch: Called on the writer thread with each batch's insert statistics
+        """
+        self.db = db
+        self.addresses = list(addresses)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.on_batch = on_batch
+        self.stats = {
+            'datagrams': 0, 'rejected': 0, 'dropped': 0,
+            'imported': 0, 'duplicates': 0, 'failed': 0, 'batches': 0,
+        }
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=QUEUE_LIMIT)
+        self._keys: Set[ContactKey] = set()
+        self._keys_stale = threading.Event()
+        self._sockets: List[socket.socket] = []
+        self._threads: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+
+    @property
+    def bound_addresses(self) -> List[Tuple[str, int]]:
+        """Addresses actually bound (resolves port 0)"""
+        return [sock.getsockname()[:2] for sock in self._sockets]
+
+    def is_running(self) -> bool:
+        """Check if the listener is running"""
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> bool:
+        """
+        Load the contact keys, bind the sockets and start the threads
+
+        Returns:
+            True if listening on every address
+        """
+        if self.is_running():
+            logger.warning("QSO ingest service already running")
+            return True
+        try:
+            for host, port in self.addresses:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind((host, port))
+                sock.setblocking(False)
+                self._sockets.append(sock)
+        except OSError as e:
+            logger.error(f"Failed to bind QSO listener: {e}")
+            self._close_sockets()
+            return False
+
+        self._keys = self.db.get_contact_keys()
+        self._keys_stale.clear()
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._receive_loop, name="QSOIngestReceiver", daemon=True),
+            threading.Thread(target=self._write_loop, name="QSOIngestWriter", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Listening for logged QSOs on {self.bound_addresses} ({len(self._keys)} known contacts)")
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop listening and write the records already queued"""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._close_sockets()
+        logger.info(f"QSO ingest service stopped: {self.stats}")
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every queued record has been written
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._queue.unfinished_tasks == 0:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def submit(self, data: bytes) -> int:
+        """
+        Parse one datagram and queue its records
+
+        Args:
+            data: Datagram payload
+
+        Returns:
+            Number of records queued
+        """
+        self.stats['datagrams'] += 1
+        try:
+            records = parse_datagram(data)
+        except ValueError as e:
+            self.stats['rejected'] += 1
+            logger.warning(f"Ignoring datagram: {e}")
+            return 0
+
+        queued = 0
+        for record in records:
+            if not record.get('callsign'):
+                continue
+            try:
+                self._queue.put_nowait(record)
+                queued += 1
+            except queue.Full:
+                self.stats['dropped'] += 1
+                logger.warning(f"QSO queue full, dropped {record.get('callsign')}")
+        return queued
+
+    def on_contacts_changed(self, change_type: str, metadata: dict) -> None:
+        """
+        Reload the contact keys before the next batch after an outside change
+
+        Connect to AppSignals.contacts_batch_changed. Contacts added by the
+        GUI or an ADIF import are missing from the keys, and deleted or
+        edited ones are still in them. The service's own inserts are
+        already in the keys and are ignored.
+
+        Args:
+            change_type: Type of change ('added', 'modified', 'deleted', 'bulk_import', 'bulk')
+            metadata: Change metadata; 'source' is "UDP" for the service's own batches
+        """
+        if metadata.get('source') != "UDP":
+            self._keys_stale.set()
+
+    def _receive_loop(self) -> None:
+        """Read datagrams from every socket until stopped"""
+        selector = selectors.DefaultSelector()
+        for sock in self._sockets:
+            selector.register(sock, selectors.EVENT_READ)
+        try:
+            while not self._stop_event.is_set():
+                for key, _events in selector.select(POLL_SECONDS):
+                    try:
+                        data, _sender = key.fileobj.recvfrom(DATAGRAM_LIMIT_BYTES)
+                    except OSError as e:
+                        logger.debug(f"UDP receive error: {e}")
+                        continue
+                    self.submit(data)
+        finally:
+            selector.close()
+
+    def _write_loop(self) -> None:
+        """Drain the queue in batches until stopped and empty"""
+        while True:
+            try:
+                first = self._queue.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                if self._stop_event.is_set():
+                    return
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=min(remaining, POLL_SECONDS)))
+                except queue.Empty:
+                    if self._stop_event.is_set():
+                        break
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to log {len(batch)} QSOs: {e}", exc_info=True)
+                self.stats['failed'] += len(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Drop duplicates and insert the rest in one transaction"""
+        if self._keys_stale.is_set():
+            self._keys_stale.clear()
+            self._keys = self.db.get_contact_keys()
+        new_records = []
+        batch_keys: Set[ContactKey] = set()
+        for record in batch:
+            key = contact_key(record.get('callsign'), record.get('qso_date'),
+                              record.get('time_on'), record.get('band'))
+            if key in self._keys or key in batch_keys:
+                self.stats['duplicates'] += 1
+                continue
+            batch_keys.add(key)
+            new_records.append(record)
+        if not new_records:
+            return
+
+        result = self.db.add_contacts_batch(new_records, source="UDP")
+        self._keys.update(result['keys'])
+        self.stats['imported'] += result['imported']
+        self.stats['failed'] += result['failed']
+        self.stats['batches'] += 1
+        for error in result['errors']:
+            logger.warning(f"QSO not logged: {error}")
+        if self.on_batch:
+            self.on_batch(result)
+
+    def _close_sockets(self) -> None:
+        for sock in self._sockets:
+            sock.close()
+        self._sockets = []
@@ -4,6 +4,8 @@ Provides API client for QRZ.com callsign lookups and logbook management.
 """
 
 from src.qrz.qrz_api import QRZAPIClient, QRZError, QRZAuthError, CallsignInfo
+from src.qrz.callsign_cache import CallsignCache
+from src.qrz.upload_queue import QRZUploadQueue
 from src.qrz.qrz_service import QRZService, get_qrz_service
 
 __all__ = [
@@ -11,6 +13,8 @@ __all__ = [
     "QRZError",
     "QRZAuthError",
     "CallsignInfo",
+    "CallsignCache",
+    "QRZUploadQueue",
     "QRZService",
     "get_qrz_service",
 ]
@@ -0,0 +1,203 @@
+"""
+Persistent QRZ Callsign Cache
+
+SQLite-backed cache of QRZ.com callsign lookups that survives restarts:
+- Found callsigns are kept for a configurable TTL
+- "Not found" results are cached too (shorter TTL) so misses are not re-queried
+- Expired rows are ignored on read and purged on demand
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
+
+from src.qrz.qrz_api import CallsignInfo
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 30 * 86400  # 30 days
+DEFAULT_NEGATIVE_TTL_SECONDS = 86400  # 24 hours
+
+_CALLSIGN_FIELDS = {f.name for f in fields(CallsignInfo)}
+
+
+class CallsignCache:
+    """SQLite cache of callsign lookups with positive and negative TTLs"""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path, None] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS
+    ):
+        """
+        Initialize callsign cache
+
+        Args:
+            db_path: SQLite database file (None for an in-memory cache)
+            ttl_seconds: How long found callsigns are served from the cache
+            negative_ttl_seconds: How long "not found" results are served from the cache
+        """
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._lock = threading.Lock()
+
+        if db_path is None:
+            self.db_path = ":memory:"
+        else:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self.db_path = str(db_path)
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS callsign_cache (
+                callsign TEXT PRIMARY KEY,
+                found INTEGER NOT NULL,
+                data TEXT,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+
+    @staticmethod
+    def _key(callsign: str) -> str:
+        """Normalize a callsign for use as a cache key"""
+        return callsign.strip().upper()
+
+    def get(self, callsign: str) -> Tuple[bool, Optional[CallsignInfo]]:
+        """
+        Look up a callsign in the cache
+
+        Args:
+            callsign: Callsign to look up
+
+        Returns:
+            (hit, info): hit is False when the callsign must be queried;
+            on a hit, info is None for a cached "not found" result
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT found, data, fetched_at FROM callsign_cache WHERE callsign = ?",
+                (self._key(callsign),)
+            ).fetchone()
+        if row is None:
+            return False, None
+
+        found, data, fetched_at = row
+        ttl = self.ttl_seconds if found else self.negative_ttl_seconds
+        if time.time() - fetched_at > ttl:
+            return False, None
+        if not found:
+            return True, None
+
+        try:
+            values = json.loads(data)
+            return True, CallsignInfo(**{k: v for k, v in values.items() if k in _CALLSIGN_FIELDS})
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Discarding unreadable cache entry for {callsign}: {e}")
+            return False, None
+
+    def contains(self, callsign: str) -> bool:
+        """Check whether a callsign has a fresh cache entry (found or not found)"""
+        return self.get(callsign)[0]
+
+    def fresh_callsigns(self, callsigns: Iterable[str]) -> Set[str]:
+        """
+        Find which callsigns have fresh cache entries, in one query
+
+        Args:
+            callsigns: Callsigns to check
+
+        Returns:
+            Set of normalized callsigns that would be served from the cache
+        """
+        keys = list({self._key(c) for c in callsigns if c and c.strip()})
+        if not keys:
+            return set()
+
+        now = time.time()
+        fresh = set()
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT callsign, found, fetched_at FROM callsign_cache WHERE callsign IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for callsign, found, fetched_at in rows:
+                    ttl = self.ttl_seconds if found else self.negative_ttl_seconds
+                    if now - fetched_at <= ttl:
+                        fresh.add(callsign)
+        return fresh
+
+    def put(self, callsign: str, info: Optional[CallsignInfo]) -> None:
+        """
+        Store a lookup result
+
+        Args:
+            callsign: Callsign that was looked up
+            info: Lookup result, or None to cache a "not found" result
+        """
+        data = json.dumps(asdict(info)) if info is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO callsign_cache (callsign, found, data, fetched_at) VALUES (?, ?, ?, ?)",
+                (self._key(callsign), 1 if info is not None else 0, data, time.time())
+            )
+
+    def invalidate(self, callsign: Optional[str] = None) -> None:
+        """
+        Remove cached entries
+
+        Args:
+            callsign: Specific callsign to remove, or None to remove all
+        """
+        with self._lock:
+            if callsign:
+                self._conn.execute("DELETE FROM callsign_cache WHERE callsign = ?", (self._key(callsign),))
+            else:
+                self._conn.execute("DELETE FROM callsign_cache")
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries
+
+        Returns:
+            Number of rows removed
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM callsign_cache WHERE (found = 1 AND fetched_at < ?) OR (found = 0 AND fetched_at < ?)",
+                (now - self.ttl_seconds, now - self.negative_ttl_seconds)
+            )
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """Get counts of cached found and not-found callsigns"""
+        with self._lock:
+            found, missing = self._conn.execute(
+                "SELECT COALESCE(SUM(found), 0), COALESCE(SUM(1 - found), 0) FROM callsign_cache"
+            ).fetchone()
+        return {'found': found, 'not_found': missing}
+
+    def __len__(self) -> int:
+        """Number of cached entries (including expired rows not yet purged)"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM callsign_cache").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -99,7 +99,8 @@ class QRZAPIClient:
 
     BASE_URL = "https://xmldata.qrz.com/xml/current/"
 
-    def __init__(self, username: str, password: str, api_key: Optional[str] = None, timeout: int = 10):
+    def __init__(self, username: str, password: str, api_key: Optional[str] = None, timeout: int = 10,
+                 cache=None):
         """
         Initialize QRZ API client
 
@@ -108,6 +109,7 @@ class QRZAPIClient:
             password: QRZ.com account password (for callsign lookups)
             api_key: QRZ.com API Key (for logbook uploads - optional)
             timeout: Request timeout in seconds
+            cache: CallsignCache for lookup results (defaults to an in-memory cache)
         """
         self.username = username
         self.password = password
@@ -115,8 +117,10 @@ class QRZAPIClient:
         self.timeout = timeout
         self.session_key: Optional[str] = None
         self.session_expires: Optional[float] = None
-        self.callsign_cache: Dict[str, CallsignInfo] = {}
-        self.cache_ttl = 86400  # 24 hours
+        if cache is None:
+            from src.qrz.callsign_cache import CallsignCache
+            cache = CallsignCache()
+        self.callsign_cache = cache
 
     def authenticate(self) -> bool:
         """
@@ -183,7 +187,7 @@ class QRZAPIClient:
 
         Args:
             callsign: The callsign to look up
-            use_cache: Whether to use cached results
+            use_cache: Whether to use cached results (including cached "not found")
 
         Returns:
             CallsignInfo object or None if not found
@@ -192,10 +196,11 @@ class QRZAPIClient:
             QRZError: If lookup fails
         """
         # Check cache
-        if use_cache and callsign.upper() in self.callsign_cache:
-            cached = self.callsign_cache[callsign.upper()]
-            logger.debug(f"Using cached callsign info for {callsign}")
-            return cached
+        if use_cache:
+            hit, cached = self.callsign_cache.get(callsign)
+            if hit:
+                logger.debug(f"Using cached callsign info for {callsign} (found={cached is not None})")
+                return cached
 
         try:
             # Note: QRZ.com callsign lookups require username/password directly,
@@ -219,18 +224,22 @@ class QRZAPIClient:
                 if error_elem is not None:
                     error_msg = error_elem.text or "Unknown error"
                     logger.warning(f"QRZ lookup error for {callsign}: {error_msg}")
+                    if error_msg.lower().startswith("not found"):
+                        # Cache the miss so it is not re-queried on every focus change
+                        self.callsign_cache.put(callsign, None)
                     return None
 
                 # Parse callsign data (handle namespaces)
                 callsign_elem = self._find_element(root, 'Callsign')
                 if callsign_elem is None:
                     logger.debug(f"No callsign data found for {callsign}")
+                    self.callsign_cache.put(callsign, None)
                     return None
 
                 info = self._parse_callsign_element(callsign_elem)
 
                 # Cache result
-                self.callsign_cache[callsign.upper()] = info
+                self.callsign_cache.put(callsign, info)
                 logger.info(f"Retrieved callsign info for {callsign}")
 
                 return info
@@ -337,6 +346,47 @@ class QRZAPIClient:
             return child.text.lower() in ('y', 'yes', '1', 'true')
         return False
 
+    @staticmethod
+    def build_adif_record(callsign: str, qso_date: str, time_on: str,
+                          freq: float, mode: str, rst_sent: str, rst_rcvd: str,
+                          tx_power: Optional[float] = None,
+                          notes: Optional[str] = None) -> str:
+        """
+        Build the single ADIF record sent to the QRZ logbook API
+
+        Args:
+            callsign: DX station callsign
+            qso_date: QSO date (YYYY-MM-DD)
+            time_on: QSO time (HH:MM:SS UTC)
+            freq: Frequency in MHz
+            mode: Operating mode (CW, SSB, etc.)
+            rst_sent: RST sent to station
+            rst_rcvd: RST received from station
+            tx_power: TX power in watts (optional)
+            notes: QSO notes (optional)
+
+        Returns:
+            ADIF record terminated with <EOR>
+        """
+        adif_str = (
+            f"<CALL:{len(callsign)}>{callsign.upper()} "
+            f"<QSO_DATE:8>{qso_date.replace('-', '')} "
+            f"<TIME_ON:6>{time_on.replace(':', '')} "
+            f"<FREQ:{len(str(freq))}>{freq} "
+            f"<MODE:{len(mode)}>{mode.upper()} "
+            f"<RST_SENT:{len(rst_sent)}>{rst_sent} "
+            f"<RST_RCVD:{len(rst_rcvd)}>{rst_rcvd}"
+        )
+
+        # Add optional fields to ADIF string
+        if tx_power is not None:
+            power_str = str(int(tx_power))
+            adif_str += f" <TX_PWR:{len(power_str)}>{power_str}"
+        if notes:
+            adif_str += f" <COMMENT:{len(notes)}>{notes}"
+
+        return adif_str + " <EOR>"
+
     def upload_qso(self, callsign: str, qso_date: str, time_on: str,
                    freq: float, mode: str, rst_sent: str, rst_rcvd: str,
                    tx_power: Optional[float] = None,
@@ -375,25 +425,11 @@ class QRZAPIClient:
             params = {
                 'KEY': self.api_key,  # API Key for logbook access
                 'ACTION': 'INSERT',   # Required: INSERT for new QSO
-                'ADIF': f"<CALL:{len(callsign)}>{callsign.upper()} "
-                        f"<QSO_DATE:8>{qso_date.replace('-', '')} "
-                        f"<TIME_ON:6>{time_on.replace(':', '')} "
-                        f"<FREQ:{len(str(freq))}>{freq} "
-                        f"<MODE:{len(mode)}>{mode.upper()} "
-                        f"<RST_SENT:{len(rst_sent)}>{rst_sent} "
-                        f"<RST_RCVD:{len(rst_rcvd)}>{rst_rcvd}"
+                'ADIF': self.build_adif_record(
+                    callsign, qso_date, time_on, freq, mode,
+                    rst_sent, rst_rcvd, tx_power, notes
+                )
             }
-            
-            # Add optional fields to ADIF string
-            adif_str = params['ADIF']
-            if tx_power is not None:
-                power_str = str(int(tx_power))
-                adif_str += f" <TX_PWR:{len(power_str)}>{power_str}"
-            if notes:
-                adif_str += f" <COMMENT:{len(notes)}>{notes}"
-            
-            adif_str += " <EOR>"
-            params['ADIF'] = adif_str
 
             params_encoded = urllib.parse.urlencode(params)
 
@@ -468,11 +504,10 @@ class QRZAPIClient:
         Args:
             callsign: Specific callsign to clear, or None to clear all
         """
+        self.callsign_cache.invalidate(callsign)
         if callsign:
-            self.callsign_cache.pop(callsign.upper(), None)
             logger.debug(f"Cleared cache for {callsign}")
         else:
-            self.callsign_cache.clear()
             logger.debug("Cleared all cached callsigns")
 
     def get_session_info(self) -> Dict[str, Any]:
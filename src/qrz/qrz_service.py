@@ -6,12 +6,21 @@ High-level interface for QRZ.com operations integrated with application settings
 
 import logging
 import threading
-from typing import Optional, Callable, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Callable, Any, Dict, Iterable
 from src.config.settings import get_config_manager
 from src.qrz.qrz_api import QRZAPIClient, QRZError, CallsignInfo
+from src.qrz.callsign_cache import CallsignCache
+from src.qrz.upload_queue import QRZUploadQueue
 
 logger = logging.getLogger(__name__)
 
+# Concurrent QRZ lookups (kept low to be polite to the XML API)
+LOOKUP_WORKERS = 2
+
+# Most lookups queued by spot prefetch at any time
+PREFETCH_MAX_PENDING = 20
+
 
 class QRZService:
     """Service for managing QRZ.com operations"""
@@ -23,10 +32,38 @@ class QRZService:
         self.authenticated = False
         self._lock = threading.Lock()
 
+        # Persistent lookup cache and in-flight lookups shared by concurrent callers
+        self.callsign_cache: Optional[CallsignCache] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Durable logbook upload queue (opened on first upload)
+        self.upload_queue: Optional[QRZUploadQueue] = None
+        self._upload_queue_lock = threading.Lock()
+
     def is_enabled(self) -> bool:
         """Check if QRZ integration is enabled"""
         return self.config_manager.get("qrz.enabled", False)
 
+    def get_callsign_cache(self) -> CallsignCache:
+        """
+        Get the persistent callsign cache, opening it on first use
+
+        Returns:
+            CallsignCache stored next to the configuration file
+        """
+        if self.callsign_cache is None:
+            ttl_hours = float(self.config_manager.get("qrz.cache_ttl_hours", 720))
+            negative_hours = float(self.config_manager.get("qrz.negative_cache_hours", 24))
+            db_path = self.config_manager.config_dir / "qrz_cache.db"
+            try:
+                self.callsign_cache = CallsignCache(db_path, ttl_hours * 3600, negative_hours * 3600)
+            except Exception as e:
+                logger.warning(f"Could not open QRZ cache at {db_path}, using memory only: {e}")
+                self.callsign_cache = CallsignCache(None, ttl_hours * 3600, negative_hours * 3600)
+        return self.callsign_cache
+
     def initialize(self) -> bool:
         """
         Initialize QRZ API client with credentials from config
@@ -48,7 +85,7 @@ class QRZService:
 
         try:
             # API key is optional - only needed for logbook uploads
-            self.api_client = QRZAPIClient(username, password, api_key)
+            self.api_client = QRZAPIClient(username, password, api_key, cache=self.get_callsign_cache())
             if api_key:
                 logger.info(f"QRZ client initialized with credentials and logbook API key: {api_key[:8]}...")
             else:
@@ -90,6 +127,11 @@ class QRZService:
         Returns:
             CallsignInfo or None if not found
         """
+        # Cached results (including "not found") need neither a session nor the API lock
+        hit, info = self.get_callsign_cache().get(callsign)
+        if hit:
+            return info
+
         if not self.authenticated:
             if not self.authenticate():
                 return None
@@ -101,20 +143,135 @@ class QRZService:
             logger.error(f"Callsign lookup failed: {e}")
             return None
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the lookup thread pool, creating it on first use"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=LOOKUP_WORKERS, thread_name_prefix="qrz-lookup")
+        return self._executor
+
+    def lookup_callsign_future(self, callsign: str) -> Future:
+        """
+        Start a background lookup, sharing any lookup already in flight for the callsign
+
+        Args:
+            callsign: The callsign to look up
+
+        Returns:
+            Future resolving to CallsignInfo or None
+        """
+        key = callsign.strip().upper()
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                logger.debug(f"Joining in-flight QRZ lookup for {key}")
+                return future
+            future = self._get_executor().submit(self.lookup_callsign, key)
+            self._inflight[key] = future
+
+        def _done(_future: Future) -> None:
+            with self._inflight_lock:
+                if self._inflight.get(key) is _future:
+                    del self._inflight[key]
+
+        future.add_done_callback(_done)
+        return future
+
     def lookup_callsign_async(self, callsign: str, callback: Callable[[Optional[CallsignInfo]], None]) -> None:
         """
         Look up a callsign asynchronously
 
+        Cached results are delivered immediately on the calling thread. Otherwise
+        the lookup runs on a worker thread, and simultaneous requests for the same
+        callsign share a single QRZ query.
+
         Args:
             callsign: The callsign to look up
-            callback: Function to call with result (runs in separate thread)
+            callback: Function to call with result
         """
-        def _lookup():
-            result = self.lookup_callsign(callsign)
+        hit, info = self.get_callsign_cache().get(callsign)
+        if hit:
+            callback(info)
+            return
+
+        def _deliver(future: Future) -> None:
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Callsign lookup failed for {callsign}: {e}")
+                result = None
             callback(result)
 
-        thread = threading.Thread(target=_lookup, daemon=True)
-        thread.start()
+        self.lookup_callsign_future(callsign).add_done_callback(_deliver)
+
+    def prefetch_callsigns(self, callsigns: Iterable[str], max_pending: int = PREFETCH_MAX_PENDING) -> int:
+        """
+        Queue background lookups for callsigns that are not cached yet
+
+        Used to warm the cache from the spot table so logging a spotted station
+        fills the form instantly.
+
+        Args:
+            callsigns: Callsigns to prefetch (duplicates and cached calls are skipped)
+            max_pending: Upper bound on lookups in flight after queuing
+
+        Returns:
+            Number of lookups queued
+        """
+        if not self.is_enabled():
+            return 0
+
+        candidates = []
+        for callsign in callsigns:
+            key = callsign.strip().upper() if callsign else ""
+            if key and key not in candidates:
+                candidates.append(key)
+        if not candidates:
+            return 0
+
+        fresh = self.get_callsign_cache().fresh_callsigns(candidates)
+        queued = 0
+        for key in candidates:
+            if key in fresh:
+                continue
+            with self._inflight_lock:
+                if key in self._inflight:
+                    continue
+                if len(self._inflight) >= max_pending:
+                    break
+            self.lookup_callsign_future(key)
+            queued += 1
+
+        if queued:
+            logger.debug(f"Queued {queued} QRZ prefetch lookups")
+        return queued
+
+    def shutdown(self) -> None:
+        """Cancel queued lookups, stop the lookup thread pool and the upload worker"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self.upload_queue is not None:
+            # Unsent uploads stay in the database and resume on next start
+            self.upload_queue.stop(timeout=1.0)
+
+    def get_upload_queue(self) -> QRZUploadQueue:
+        """
+        Get the logbook upload queue, opening it and starting its worker on first use
+
+        Returns:
+            QRZUploadQueue stored in the logbook database
+        """
+        with self._upload_queue_lock:
+            if self.upload_queue is None:
+                self.upload_queue = QRZUploadQueue(
+                    self.config_manager.get("database.location"),
+                    api_key=self.config_manager.get("qrz.api_key", ""),
+                    min_interval=float(self.config_manager.get("qrz.upload_min_interval", 0.5))
+                )
+            else:
+                self.upload_queue.set_api_key(self.config_manager.get("qrz.api_key", ""))
+            self.upload_queue.start()
+            return self.upload_queue
 
     def upload_qso(self, callsign: str, qso_date: str, time_on: str,
                    freq: float, mode: str, rst_sent: str, rst_rcvd: str,
@@ -170,10 +327,14 @@ class QRZService:
                         freq: float, mode: str, rst_sent: str, rst_rcvd: str,
                         tx_power: Optional[float] = None,
                         notes: Optional[str] = None,
-                        callback: Optional[Callable[[bool], None]] = None) -> None:
+                        callback: Optional[Callable[[bool], None]] = None,
+                        contact_id: Optional[int] = None) -> None:
         """
         Upload a QSO asynchronously
 
+        The QSO is added to the persistent upload queue and sent by its single
+        worker thread, so uploads survive restarts and network outages.
+
         Args:
             callsign: DX station callsign
             qso_date: QSO date (YYYY-MM-DD)
@@ -185,17 +346,46 @@ class QRZService:
             tx_power: TX power in watts
             notes: QSO notes
             callback: Function to call with result (bool)
+            contact_id: Logbook contact to mark uploaded on success
         """
-        def _upload():
-            result = self.upload_qso(
-                callsign, qso_date, time_on, freq, mode,
-                rst_sent, rst_rcvd, tx_power, notes
-            )
+        if not self.is_enabled():
+            logger.warning("QRZ upload skipped: QRZ integration disabled in settings")
             if callback:
-                callback(result)
+                callback(False)
+            return
+
+        if not self.config_manager.get("qrz.api_key", ""):
+            logger.error("Cannot upload QSO to QRZ logbook: API Key not configured")
+            if callback:
+                callback(False)
+            return
+
+        adif = QRZAPIClient.build_adif_record(
+            callsign, qso_date, time_on, freq, mode,
+            rst_sent, rst_rcvd, tx_power, notes
+        )
+        self.get_upload_queue().enqueue(adif, contact_id=contact_id, callback=callback)
+
+    def upload_pending_contacts(self, contact_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Queue logbook contacts that have not been uploaded to QRZ yet
+
+        Used after a bulk import: the whole batch is queued in one transaction
+        and drained in the background by the upload worker.
+
+        Args:
+            contact_ids: Contacts to consider (None for the whole log)
+
+        Returns:
+            Number of contacts queued
+        """
+        if not self.is_enabled():
+            return 0
+        return self.get_upload_queue().enqueue_contacts(contact_ids)
 
-        thread = threading.Thread(target=_upload, daemon=True)
-        thread.start()
+    def get_upload_stats(self) -> Dict[str, Any]:
+        """Get upload queue depth and throughput (see QRZUploadQueue.stats)"""
+        return self.get_upload_queue().stats()
 
     def get_status(self) -> dict:
         """Get QRZ service status"""
@@ -217,6 +407,8 @@ class QRZService:
         """Clear callsign cache"""
         if self.api_client:
             self.api_client.clear_cache(callsign)
+        elif self.callsign_cache is not None:
+            self.callsign_cache.invalidate(callsign)
 
 
 # Global service instance
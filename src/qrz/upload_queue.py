@@ -0,0 +1,601 @@
+"""
+QRZ Logbook Upload Queue
+
+Durable outbound queue for QRZ.com logbook uploads:
+- Pending records live in the logbook database, so nothing is lost on exit or crash
+- A single worker thread drains the queue over one keep-alive HTTP connection
+- Calls are spaced to a minimum interval; 429/503 responses and network
+  errors pause the whole queue with exponential backoff
+- Records rejected by QRZ are retried with per-record backoff, then marked failed
+- Successful uploads set contacts.qrz_uploaded / qrz_upload_date
+"""
+
+import http.client
+import logging
+import sqlite3
+import threading
+import time
+import urllib.parse
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from src.qrz.qrz_api import QRZAPIClient
+
+logger = logging.getLogger(__name__)
+
+LOGBOOK_API_URL = "https://logbook.qrz.com/api"
+USER_AGENT = "W4GNS-Logger/1.0"
+
+DEFAULT_BATCH_SIZE = 50  # Records claimed from the database per worker pass
+DEFAULT_MIN_INTERVAL = 0.5  # Seconds between logbook API calls
+DEFAULT_MAX_ATTEMPTS = 8  # Rejections before a record is marked failed
+DEFAULT_TIMEOUT = 30
+
+BACKOFF_BASE_SECONDS = 30.0
+BACKOFF_MAX_SECONDS = 3600.0
+IDLE_POLL_SECONDS = 60.0  # Longest the worker sleeps without being woken
+THROUGHPUT_WINDOW_SECONDS = 60.0
+
+STATUS_PENDING = "pending"
+STATUS_FAILED = "failed"
+
+# Connection errors that mean a kept-alive socket was closed by the server
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+def backoff_delay(failures: int) -> float:
+    """
+    Exponential backoff delay
+
+    Args:
+        failures: Consecutive failures so far (1 for the first)
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** max(0, failures - 1)))
+
+
+def adif_from_contact(
+    callsign: str,
+    qso_date: Optional[str],
+    time_on: Optional[str],
+    frequency: Optional[float],
+    mode: Optional[str],
+    rst_sent: Optional[str],
+    rst_rcvd: Optional[str],
+    tx_power: Optional[float] = None,
+    key_type: Optional[str] = None
+) -> Optional[str]:
+    """
+    Build a logbook ADIF record from stored contact fields
+
+    Args:
+        callsign: Contact callsign
+        qso_date: UTC date (YYYYMMDD)
+        time_on: UTC time (HHMM or HHMMSS)
+        frequency: Frequency in MHz (kHz and Hz values are converted)
+        mode: Operating mode
+        rst_sent: RST sent (defaults to 59)
+        rst_rcvd: RST received (defaults to 59)
+        tx_power: TX power in watts
+        key_type: Key type, sent as the QSO comment
+
+    Returns:
+        ADIF record, or None if the contact lacks the fields QRZ requires
+    """
+    if not callsign or not qso_date or not time_on or not frequency or not mode:
+        return None
+
+    freq_mhz = frequency
+    if freq_mhz > 30000:  # Hz
+        freq_mhz = freq_mhz / 1_000_000
+    elif freq_mhz > 300:  # kHz
+        freq_mhz = freq_mhz / 1000
+
+    digits = time_on.replace(":", "")
+    api_time_on = f"{digits[0:2]}:{digits[2:4]}:{digits[4:6] or '00'}"
+
+    return QRZAPIClient.build_adif_record(
+        callsign, qso_date, api_time_on, freq_mhz, mode,
+        rst_sent or "59", rst_rcvd or "59", tx_power,
+        f"Key Type: {key_type}" if key_type else None
+    )
+
+
+class QRZUploadQueue:
+    """Persistent QRZ logbook upload queue drained by a single worker thread"""
+
+    def __init__(
+        self,
+        db_path: str,
+        api_key: str = "",
+        api_url: str = LOGBOOK_API_URL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        timeout: int = DEFAULT_TIMEOUT
+    ):
+        """
+        Initialize upload queue
+
+        Args:
+            db_path: Logbook SQLite database (holds the queue and the contacts table)
+            api_key: QRZ logbook API key
+            api_url: Logbook API endpoint
+            batch_size: Records claimed from the database per worker pass
+            min_interval: Minimum seconds between API calls
+            max_attempts: Rejections before a record is marked failed
+            timeout: HTTP timeout in seconds
+        """
+        self.db_path = db_path
+        self.api_key = api_key
+        self.api_url = api_url
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=10.0)
+        self._db.execute("PRAGMA busy_timeout=10000")
+        self._ensure_table_exists()
+
+        # Worker state
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._http: Optional[http.client.HTTPConnection] = None
+        self._last_request = 0.0
+        self._paused_until = 0.0
+        self._network_failures = 0
+        self._callbacks: Dict[int, Callable[[bool], None]] = {}
+        self._callbacks_lock = threading.Lock()
+
+        # Statistics
+        self._completed: Deque[float] = deque()
+        self._uploaded_total = 0
+        self._requests_total = 0
+        self._last_error: Optional[str] = None
+
+    def _ensure_table_exists(self) -> None:
+        """Create the qrz_upload_queue table if it doesn't exist"""
+        with self._db_lock:
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS qrz_upload_queue (
+                    id INTEGER PRIMARY KEY,
+                    contact_id INTEGER UNIQUE,
+                    adif TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    last_error TEXT,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_qrz_upload_due ON qrz_upload_queue(status, next_attempt_at)"
+            )
+
+    def set_api_key(self, api_key: str) -> None:
+        """Update the logbook API key, resuming a queue paused by an auth failure"""
+        if api_key != self.api_key:
+            self.api_key = api_key
+            self._paused_until = 0.0
+            self._wake.set()
+
+    def enqueue(
+        self,
+        adif: str,
+        contact_id: Optional[int] = None,
+        callback: Optional[Callable[[bool], None]] = None
+    ) -> Optional[int]:
+        """
+        Queue one ADIF record for upload
+
+        Args:
+            adif: ADIF record terminated with <EOR>
+            contact_id: Contact row to mark uploaded on success (a contact is queued at most once)
+            callback: Called with True when uploaded, or False once the record is given up on
+
+        Returns:
+            Queue row id, or None if the contact was already queued
+        """
+        with self._db_lock:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO qrz_upload_queue (contact_id, adif, next_attempt_at, created_at) "
+                "VALUES (?, ?, 0, ?)",
+                (contact_id, adif, time.time())
+            )
+            row_id = cursor.lastrowid if cursor.rowcount else None
+
+        if row_id is not None and callback is not None:
+            with self._callbacks_lock:
+                self._callbacks[row_id] = callback
+        self._wake.set()
+        return row_id
+
+    def enqueue_contacts(self, contact_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Queue contacts that have not been uploaded yet, in one transaction
+
+        Args:
+            contact_ids: Contacts to consider (None for every contact in the log)
+
+        Returns:
+            Number of contacts queued
+        """
+        query = (
+            "SELECT id, callsign, qso_date, time_on, frequency, mode, rst_sent, rst_rcvd, tx_power, key_type "
+            "FROM contacts c WHERE COALESCE(c.qrz_uploaded, 0) = 0 "
+            "AND NOT EXISTS (SELECT 1 FROM qrz_upload_queue q WHERE q.contact_id = c.id)"
+        )
+        with self._db_lock:
+            if contact_ids is None:
+                rows = self._db.execute(query).fetchall()
+            else:
+                ids = list(dict.fromkeys(contact_ids))
+                rows = []
+                # Stay well below SQLite's bound-parameter limit
+                for start in range(0, len(ids), 500):
+                    chunk = ids[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows.extend(self._db.execute(f"{query} AND c.id IN ({placeholders})", chunk).fetchall())
+
+        now = time.time()
+        params = []
+        skipped = 0
+        for row in rows:
+            adif = adif_from_contact(*row[1:])
+            if adif is None:
+                skipped += 1
+                continue
+            params.append((row[0], adif, now))
+
+        if skipped:
+            logger.warning(f"Skipped {skipped} contacts missing date, time, frequency or mode for QRZ upload")
+        if not params:
+            return 0
+
+        with self._db_lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO qrz_upload_queue (contact_id, adif, next_attempt_at, created_at) "
+                    "VALUES (?, ?, 0, ?)",
+                    params
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+        logger.info(f"Queued {len(params)} contacts for QRZ logbook upload")
+        self._wake.set()
+        return len(params)
+
+    def retry_failed(self) -> int:
+        """
+        Return failed records to the queue with their attempt counts reset
+
+        Returns:
+            Number of records requeued
+        """
+        with self._db_lock:
+            cursor = self._db.execute(
+                "UPDATE qrz_upload_queue SET status = ?, attempts = 0, next_attempt_at = 0 WHERE status = ?",
+                (STATUS_PENDING, STATUS_FAILED)
+            )
+            count = cursor.rowcount
+        self._wake.set()
+        return count
+
+    def depth(self) -> int:
+        """Number of records waiting to be uploaded (including ones backing off)"""
+        with self._db_lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM qrz_upload_queue WHERE status = ?", (STATUS_PENDING,)
+            ).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue depth and throughput
+
+        Returns:
+            Dictionary with pending, retrying and failed counts, uploads in this
+            session, uploads per minute over the last minute, seconds until a
+            paused queue resumes, and the last error
+        """
+        with self._db_lock:
+            pending, retrying, failed = self._db.execute(
+                "SELECT COALESCE(SUM(status = ?), 0), COALESCE(SUM(status = ? AND attempts > 0), 0), "
+                "COALESCE(SUM(status = ?), 0) FROM qrz_upload_queue",
+                (STATUS_PENDING, STATUS_PENDING, STATUS_FAILED)
+            ).fetchone()
+
+        now = time.time()
+        self._trim_completed(now)
+        return {
+            'pending': pending,
+            'retrying': retrying,
+            'failed': failed,
+            'uploaded': self._uploaded_total,
+            'requests': self._requests_total,
+            'per_minute': len(self._completed) * 60.0 / THROUGHPUT_WINDOW_SECONDS,
+            'paused_for': max(0.0, self._paused_until - now),
+            'last_error': self._last_error,
+            'running': self.is_running(),
+        }
+
+    def _trim_completed(self, now: float) -> None:
+        """Drop completion times outside the throughput window"""
+        while self._completed and now - self._completed[0] > THROUGHPUT_WINDOW_SECONDS:
+            self._completed.popleft()
+
+    def start(self) -> None:
+        """Start the upload worker thread (no-op if already running)"""
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="qrz-upload", daemon=True)
+        self._thread.start()
+
+    def is_running(self) -> bool:
+        """Check whether the worker thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop the worker thread; unsent records stay queued for next time
+
+        Args:
+            timeout: Seconds to wait for an in-progress request to finish
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._close_http()
+
+    def close(self) -> None:
+        """Stop the worker and close the database connection"""
+        self.stop()
+        with self._db_lock:
+            self._db.close()
+
+    def _run(self) -> None:
+        """Worker loop: drain due records, then sleep until the next one is due"""
+        logger.debug("QRZ upload worker started")
+        while not self._stop.is_set():
+            try:
+                processed = self.process_due()
+            except Exception as e:
+                logger.error(f"QRZ upload worker error: {e}", exc_info=True)
+                processed = 0
+            if processed:
+                continue
+
+            self._wake.clear()
+            self._wake.wait(self._seconds_until_due())
+        self._close_http()
+        logger.debug("QRZ upload worker stopped")
+
+    def _seconds_until_due(self) -> float:
+        """Seconds until the next record can be sent, capped at IDLE_POLL_SECONDS"""
+        now = time.time()
+        if self._paused_until > now:
+            return min(IDLE_POLL_SECONDS, self._paused_until - now)
+        with self._db_lock:
+            next_due = self._db.execute(
+                "SELECT MIN(next_attempt_at) FROM qrz_upload_queue WHERE status = ?", (STATUS_PENDING,)
+            ).fetchone()[0]
+        if next_due is None:
+            return IDLE_POLL_SECONDS
+        return min(IDLE_POLL_SECONDS, max(0.0, next_due - now))
+
+    def process_due(self) -> int:
+        """
+        Upload one batch of due records
+
+        Results for the whole batch are written in a single transaction.
+
+        Returns:
+            Number of records that got a definitive answer from QRZ
+        """
+        if not self.api_key or time.time() < self._paused_until:
+            return 0
+
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT id, contact_id, adif, attempts FROM qrz_upload_queue "
+                "WHERE status = ? AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (STATUS_PENDING, time.time(), self.batch_size)
+            ).fetchall()
+        if not rows:
+            return 0
+
+        uploaded: List[Tuple[int, Optional[int]]] = []
+        rejected: List[Tuple[int, int, str]] = []
+        for row_id, contact_id, adif, attempts in rows:
+            if self._stop.is_set():
+                break
+            outcome = self._send(adif)
+            if outcome is None:
+                break  # Queue-wide pause; remaining records stay due
+            ok, reason = outcome
+            if ok:
+                uploaded.append((row_id, contact_id))
+            else:
+                rejected.append((row_id, attempts + 1, reason))
+
+        self._record_results(uploaded, rejected)
+        return len(uploaded) + len(rejected)
+
+    def _record_results(
+        self,
+        uploaded: List[Tuple[int, Optional[int]]],
+        rejected: List[Tuple[int, int, str]]
+    ) -> None:
+        """Persist a batch of results and notify callbacks"""
+        if not uploaded and not rejected:
+            return
+
+        now = time.time()
+        upload_date = datetime.now(timezone.utc).strftime("%Y%m%d")
+        given_up = []
+        retry_params = []
+        for row_id, attempts, reason in rejected:
+            if attempts >= self.max_attempts:
+                given_up.append(row_id)
+                retry_params.append((STATUS_FAILED, attempts, now, reason, row_id))
+            else:
+                retry_params.append((STATUS_PENDING, attempts, now + backoff_delay(attempts), reason, row_id))
+
+        with self._db_lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany("DELETE FROM qrz_upload_queue WHERE id = ?", [(row_id,) for row_id, _ in uploaded])
+                contact_ids = [(upload_date, contact_id) for _, contact_id in uploaded if contact_id is not None]
+                if contact_ids:
+                    self._db.executemany(
+                        "UPDATE contacts SET qrz_uploaded = 1, qrz_upload_date = ? WHERE id = ?", contact_ids
+                    )
+                self._db.executemany(
+                    "UPDATE qrz_upload_queue SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? "
+                    "WHERE id = ?",
+                    retry_params
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+        self._uploaded_total += len(uploaded)
+        self._completed.extend([now] * len(uploaded))
+        self._trim_completed(now)
+        if given_up:
+            logger.warning(f"Gave up on {len(given_up)} QRZ uploads after {self.max_attempts} attempts")
+
+        finished = [(row_id, True) for row_id, _ in uploaded] + [(row_id, False) for row_id in given_up]
+        with self._callbacks_lock:
+            callbacks = [(self._callbacks.pop(row_id, None), ok) for row_id, ok in finished]
+        for callback, ok in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(ok)
+            except Exception as e:
+                logger.error(f"QRZ upload callback error: {e}", exc_info=True)
+
+    def _pause(self, seconds: float, reason: str) -> None:
+        """Pause the whole queue"""
+        self._paused_until = time.time() + seconds
+        self._last_error = reason
+        logger.warning(f"QRZ uploads paused for {seconds:.0f}s: {reason}")
+
+    def _send(self, adif: str) -> Optional[Tuple[bool, str]]:
+        """
+        Send one record, honoring the rate limit
+
+        Returns:
+            (uploaded, reason) for a definitive answer, or None if the queue was paused
+        """
+        wait = self._last_request + self.min_interval - time.time()
+        if wait > 0 and self._stop.wait(wait):
+            return None
+        self._last_request = time.time()
+        self._requests_total += 1
+
+        try:
+            status, retry_after, body = self._post({'KEY': self.api_key, 'ACTION': 'INSERT', 'ADIF': adif})
+        except (OSError, http.client.HTTPException) as e:
+            self._close_http()
+            self._network_failures += 1
+            self._pause(backoff_delay(self._network_failures), f"Connection error: {e}")
+            return None
+
+        if status == 429 or status >= 500:
+            self._network_failures += 1
+            delay = backoff_delay(self._network_failures)
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            self._pause(delay, f"HTTP {status}")
+            return None
+        self._network_failures = 0
+
+        result = urllib.parse.parse_qs(body)
+        api_status = (result.get('RESULT') or result.get('STATUS') or [''])[0].upper()
+        reason = result.get('REASON', [''])[0]
+
+        if status == 200 and api_status in ('OK', 'REPLACE'):
+            return True, ""
+        if api_status == 'AUTH' or 'invalid api key' in reason.lower():
+            self._pause(BACKOFF_MAX_SECONDS, f"QRZ rejected the logbook API key: {reason or api_status}")
+            return None
+        if 'duplicate' in reason.lower():
+            # Already in the QRZ logbook (e.g. uploaded before a crash)
+            return True, ""
+
+        reason = reason or f"HTTP {status}: {body.strip()[:100]}"
+        self._last_error = reason
+        logger.warning(f"QRZ logbook rejected upload: {reason}")
+        return False, reason
+
+    def _post(self, fields: Dict[str, str]) -> Tuple[int, str, str]:
+        """
+        POST a form to the logbook API over the kept-alive connection
+
+        A connection the server closed while idle is reopened once.
+
+        Returns:
+            (HTTP status, Retry-After header, response body)
+        """
+        body = urllib.parse.urlencode(fields)
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'User-Agent': USER_AGENT,
+        }
+        path = urllib.parse.urlsplit(self.api_url).path or "/"
+
+        reused = self._http is not None
+        try:
+            response = self._request(path, body, headers)
+        except _STALE_CONNECTION_ERRORS:
+            self._close_http()
+            if not reused:
+                raise
+            response = self._request(path, body, headers)
+
+        data = response.read().decode('utf-8', errors='replace')
+        if response.will_close:
+            self._close_http()
+        return response.status, response.getheader('Retry-After', ''), data
+
+    def _request(self, path: str, body: str, headers: Dict[str, str]) -> http.client.HTTPResponse:
+        """Send a POST and wait for the response headers"""
+        conn = self._get_http()
+        conn.request("POST", path, body=body, headers=headers)
+        return conn.getresponse()
+
+    def _get_http(self) -> http.client.HTTPConnection:
+        """Get the kept-alive connection to the logbook API, opening it if needed"""
+        if self._http is None:
+            parts = urllib.parse.urlsplit(self.api_url)
+            if parts.scheme == "https":
+                self._http = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=self.timeout)
+            else:
+                self._http = http.client.HTTPConnection(parts.hostname, parts.port, timeout=self.timeout)
+        return self._http
+
+    def _close_http(self) -> None:
+        """Close the kept-alive connection"""
+        if self._http is not None:
+            try:
+                self._http.close()
+            except Exception:
+                pass
+            self._http = None
@@ -5,5 +5,29 @@ Fetches real-time CW spots from Telegraphy.de RBN API
 """
 
 from .rbn_fetcher import RBNFetcher, RBNSpot, RBNConnectionState
+from .spot_archive import SpotArchive
+from .spot_ring import SpotRingBuffer
+from .spot_stream import (
+    SpotStreamService,
+    SpotSource,
+    TelnetSpotSource,
+    RBNTelnetSource,
+    SkimmerProcessSource,
+    SpotDeduplicator,
+)
+from .spot_worker import SpotWorkerProcess
 
-__all__ = ["RBNFetcher", "RBNSpot", "RBNConnectionState"]
+__all__ = [
+    "RBNFetcher",
+    "RBNSpot",
+    "RBNConnectionState",
+    "SpotStreamService",
+    "SpotSource",
+    "TelnetSpotSource",
+    "RBNTelnetSource",
+    "SkimmerProcessSource",
+    "SpotDeduplicator",
+    "SpotArchive",
+    "SpotRingBuffer",
+    "SpotWorkerProcess",
+]
@@ -0,0 +1,281 @@
+"""
+Day-Partitioned Spot Archive
+
+Keeps months of RBN/cluster spot history outside contacts.db:
+- Spots are buffered and written in batches (one executemany per day)
+- Each UTC day is its own compact table (spots_YYYYMMDD), so retention drops
+  whole tables instead of running row DELETEs
+- Aggregate queries (who hears a station per band and hour, when a member is
+  usually on) only touch the partitions in the requested range
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from src.utils.grid_calc import frequency_to_band
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETENTION_DAYS = 90
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 30
+PARTITION_PREFIX = "spots_"
+
+
+def partition_name(day: datetime) -> str:
+    """Table name holding the spots of a UTC day"""
+    return f"{PARTITION_PREFIX}{day.strftime('%Y%m%d')}"
+
+
+class SpotArchive:
+    """Batched, day-partitioned SQLite store of received spots"""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path, None] = None,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ):
+        """
+        Initialize spot archive
+
+        Args:
+            db_path: SQLite database file (None for an in-memory archive)
+            retention_days: Days of history kept (older partitions are dropped)
+            batch_size: Buffered spots that trigger a write
+            flush_interval: Maximum seconds a spot stays buffered while spots keep arriving
+        """
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._buffer: List[Tuple] = []
+        self._buffer_started = 0.0
+
+        if db_path is None:
+            self.db_path = ":memory:"
+        else:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self.db_path = str(db_path)
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._partitions: Set[str] = self._existing_partitions()
+        self.enforce_retention()
+
+    def add(self, spot: Any) -> None:
+        """
+        Buffer a spot for the next batch write
+
+        Args:
+            spot: RBNSpot/SKCCSpot (callsign, frequency in MHz, mode, reporter,
+                strength, speed, timestamp, skcc_number)
+        """
+        timestamp = spot.timestamp or datetime.now(timezone.utc)
+        row = (
+            int(timestamp.timestamp()),
+            spot.callsign.upper(),
+            int(round(spot.frequency * 10000)),  # Tenths of a kHz
+            frequency_to_band(spot.frequency),
+            spot.mode or None,
+            spot.reporter or None,
+            spot.strength,
+            spot.speed,
+            spot.skcc_number,
+        )
+        with self._lock:
+            if not self._buffer:
+                self._buffer_started = time.monotonic()
+            self._buffer.append(row)
+            due = (len(self._buffer) >= self.batch_size
+                   or time.monotonic() - self._buffer_started >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write buffered spots, one executemany per day partition, in one transaction
+
+        Returns:
+            Number of spots written
+        """
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+
+            by_day: Dict[str, List[Tuple]] = {}
+            for row in rows:
+                day = datetime.fromtimestamp(row[0], timezone.utc)
+                by_day.setdefault(partition_name(day), []).append(row)
+
+            new_partition = False
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                for table, day_rows in by_day.items():
+                    if table not in self._partitions:
+                        self._create_partition(table)
+                        new_partition = True
+                    self._conn.executemany(
+                        f"INSERT INTO {table} (ts, callsign, freq, band, mode, reporter, snr, wpm, skcc_number) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        day_rows
+                    )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                self._partitions = self._existing_partitions()
+                logger.error(f"Failed to archive {len(rows)} spots: {e}")
+                return 0
+
+        logger.debug(f"Archived {len(rows)} spots in {len(by_day)} partition(s)")
+        if new_partition:
+            self.enforce_retention()
+        return len(rows)
+
+    def enforce_retention(self, now: Optional[datetime] = None) -> int:
+        """
+        Drop partitions older than the retention period
+
+        Args:
+            now: Current time (defaults to UTC now)
+
+        Returns:
+            Number of partitions dropped
+        """
+        oldest_kept = partition_name((now or datetime.now(timezone.utc)) - timedelta(days=self.retention_days - 1))
+        with self._lock:
+            expired = sorted(t for t in self._partitions if t < oldest_kept)
+            for table in expired:
+                self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+                self._partitions.discard(table)
+        if expired:
+            logger.info(f"Dropped {len(expired)} expired spot archive partition(s)")
+        return len(expired)
+
+    def partitions(self) -> List[str]:
+        """Stored partition names, oldest first"""
+        with self._lock:
+            return sorted(self._partitions)
+
+    def spot_count(self, days: int = 1, now: Optional[datetime] = None) -> int:
+        """Number of archived spots in the last `days` days"""
+        self.flush()
+        tables = self._tables_for(days, now)
+        if not tables:
+            return 0
+        query = " UNION ALL ".join(f"SELECT COUNT(*) AS n FROM {t}" for t in tables)
+        with self._lock:
+            return self._conn.execute(f"SELECT SUM(n) FROM ({query})").fetchone()[0] or 0
+
+    def skimmers_by_band_hour(
+        self, callsign: str, days: int = 30, now: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        How many distinct skimmers heard a station, per band and UTC hour of day
+
+        Args:
+            callsign: Spotted callsign (usually your own)
+            days: Number of days to look back
+            now: Current time (defaults to UTC now)
+
+        Returns:
+            List of dicts with band, hour, skimmers, spots and best_snr,
+            ordered by band and hour
+        """
+        rows = self._query_union(
+            "SELECT band, (ts / 3600) % 24 AS hour, reporter, snr FROM {table} WHERE callsign = ?",
+            (callsign.upper(),),
+            "SELECT band, hour, COUNT(DISTINCT reporter), COUNT(*), MAX(snr) FROM ({union}) "
+            "GROUP BY band, hour ORDER BY band, hour",
+            days, now
+        )
+        return [
+            {'band': band, 'hour': hour, 'skimmers': skimmers, 'spots': spots, 'best_snr': best_snr}
+            for band, hour, skimmers, spots, best_snr in rows
+        ]
+
+    def activity_hours(
+        self, callsign: str, days: int = 30, now: Optional[datetime] = None
+    ) -> Dict[int, int]:
+        """
+        When a station is usually on: number of days it was spotted in each UTC hour
+
+        Args:
+            callsign: Station to look up
+            days: Number of days to look back
+            now: Current time (defaults to UTC now)
+
+        Returns:
+            Dict of UTC hour (0-23) to days active in that hour (hours never heard are omitted)
+        """
+        rows = self._query_union(
+            "SELECT ts / 86400 AS day, (ts / 3600) % 24 AS hour FROM {table} WHERE callsign = ?",
+            (callsign.upper(),),
+            "SELECT hour, COUNT(DISTINCT day) FROM ({union}) GROUP BY hour ORDER BY hour",
+            days, now
+        )
+        return {hour: active_days for hour, active_days in rows}
+
+    def close(self) -> None:
+        """Write buffered spots and close the database"""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def _create_partition(self, table: str) -> None:
+        """Create one day's table (caller holds the lock and the transaction)"""
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                ts INTEGER NOT NULL,
+                callsign TEXT NOT NULL,
+                freq INTEGER NOT NULL,
+                band TEXT,
+                mode TEXT,
+                reporter TEXT,
+                snr INTEGER,
+                wpm INTEGER,
+                skcc_number TEXT
+            )
+            """
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_callsign ON {table} (callsign)")
+        self._partitions.add(table)
+
+    def _existing_partitions(self) -> Set[str]:
+        """Partition tables present in the database"""
+        return {
+            row[0] for row in self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ?",
+                (f"{PARTITION_PREFIX}%",)
+            )
+        }
+
+    def _tables_for(self, days: int, now: Optional[datetime]) -> List[str]:
+        """Existing partitions covering the last `days` days"""
+        now = now or datetime.now(timezone.utc)
+        wanted = {partition_name(now - timedelta(days=offset)) for offset in range(days)}
+        with self._lock:
+            return sorted(wanted & self._partitions)
+
+    def _query_union(
+        self, part_sql: str, part_params: Tuple, outer_sql: str, days: int, now: Optional[datetime]
+    ) -> List[Tuple]:
+        """Run outer_sql over the UNION ALL of part_sql applied to each partition in range"""
+        self.flush()
+        tables = self._tables_for(days, now)
+        if not tables:
+            return []
+        union = " UNION ALL ".join(part_sql.format(table=t) for t in tables)
+        with self._lock:
+            return self._conn.execute(outer_sql.format(union=union), part_params * len(tables)).fetchall()
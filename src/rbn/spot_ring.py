@@ -0,0 +1,188 @@
+"""
+Shared-Memory Spot Ring Buffer
+
+Carries spots from the spot worker process to the GUI without pickling:
+- Fixed-size records in a multiprocessing.shared_memory block, written by a
+  single producer and read by any number of consumers
+- The header holds a write sequence counter and the worker's connection state
+- Each slot carries the sequence number of the record it holds (0 while being
+  written), so a reader detects torn or overwritten records instead of
+  returning them
+- A reader that falls more than one buffer behind skips ahead and reports how
+  many spots it missed
+"""
+
+import logging
+import struct
+from datetime import datetime, timezone
+from multiprocessing import shared_memory
+from typing import Any, List, Optional, Tuple
+
+from src.rbn.rbn_fetcher import RBNConnectionState
+from src.skcc.skcc_skimmer_subprocess import SKCCSpot
+from src.utils.continents import CONTINENTS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 4096  # Spots held (about 20 minutes of a busy contest weekend)
+
+# Header: write sequence, capacity, connection state (padded to one cache line)
+HEADER = struct.Struct("<QIB")
+HEADER_SIZE = 64
+
+# Record: slot sequence, timestamp, frequency (MHz), SNR, WPM (0 = unknown),
+# is_skcc, continent index, callsign, reporter, mode, grid, SKCC number
+RECORD = struct.Struct("<QddhhBB16s16s8s8s12s6x")
+RECORD_SIZE = RECORD.size
+
+STATES = tuple(RBNConnectionState)
+
+
+def _encode(value: Optional[str]) -> bytes:
+    """Text field as ASCII bytes (struct truncates to the field size)"""
+    return (value or "").encode("ascii", "replace")
+
+
+def _decode(value: bytes) -> str:
+    """ASCII field with its NUL padding removed"""
+    return value.rstrip(b"\0").decode("ascii", "replace")
+
+
+class SpotRingBuffer:
+    """Single-producer ring of fixed-size spot records in shared memory"""
+
+    def __init__(self, name: Optional[str] = None, capacity: int = DEFAULT_CAPACITY, create: bool = False):
+        """
+        Create or attach to a ring buffer
+
+        Args:
+            name: Shared memory block name (None with create=True picks a unique name)
+            capacity: Number of records (only used when creating)
+            create: True in the owning process, False to attach to an existing ring
+        """
+        if create:
+            if capacity < 1:
+                raise ValueError("capacity must be at least 1")
+            self._shm = shared_memory.SharedMemory(
+                name=name, create=True, size=HEADER_SIZE + capacity * RECORD_SIZE
+            )
+            self._shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+            HEADER.pack_into(self._shm.buf, 0, 0, capacity, STATES.index(RBNConnectionState.DISCONNECTED))
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self.capacity = HEADER.unpack_from(self._shm.buf, 0)[1]
+        self._owner = create
+        self._write_seq = self.write_seq
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name (pass to the attaching process)"""
+        return self._shm.name
+
+    @property
+    def write_seq(self) -> int:
+        """Number of records ever published"""
+        return HEADER.unpack_from(self._shm.buf, 0)[0]
+
+    @property
+    def state(self) -> RBNConnectionState:
+        """Connection state last reported by the producer"""
+        return STATES[HEADER.unpack_from(self._shm.buf, 0)[2]]
+
+    def set_state(self, state: RBNConnectionState) -> None:
+        """Report the producer's connection state"""
+        struct.pack_into("<B", self._shm.buf, 12, STATES.index(state))
+
+    def publish(self, spot: Any) -> int:
+        """
+        Append a spot, overwriting the oldest record when full (producer only)
+
+        Args:
+            spot: SKCCSpot (or any object with the same attributes)
+
+        Returns:
+            Sequence number of the record (1-based)
+        """
+        seq = self._write_seq + 1
+        offset = HEADER_SIZE + ((seq - 1) % self.capacity) * RECORD_SIZE
+        buf = self._shm.buf
+        timestamp = spot.timestamp or datetime.now(timezone.utc)
+        continent = getattr(spot, "continent", None)
+
+        # Mark the slot as being written, fill it, then publish its sequence
+        struct.pack_into("<Q", buf, offset, 0)
+        RECORD.pack_into(
+            buf, offset,
+            0,
+            timestamp.timestamp(),
+            spot.frequency,
+            max(-32768, min(32767, spot.strength or 0)),
+            max(0, min(32767, spot.speed or 0)),
+            1 if getattr(spot, "is_skcc", bool(spot.skcc_number)) else 0,
+            CONTINENTS.index(continent) if continent in CONTINENTS else 0,
+            _encode(spot.callsign.upper()),
+            _encode(spot.reporter),
+            _encode(spot.mode),
+            _encode(spot.grid),
+            _encode(spot.skcc_number),
+        )
+        struct.pack_into("<Q", buf, offset, seq)
+        struct.pack_into("<Q", buf, 0, seq)
+        self._write_seq = seq
+        return seq
+
+    def read(self, since: int) -> Tuple[List[SKCCSpot], int, int]:
+        """
+        Read the records published after sequence `since`
+
+        Args:
+            since: Last sequence number already read (0 for everything available)
+
+        Returns:
+            (spots oldest first, new `since` value, number of spots missed)
+        """
+        buf = self._shm.buf
+        write_seq = HEADER.unpack_from(buf, 0)[0]
+        if write_seq < since:
+            # Producer restarted with a fresh counter
+            since = 0
+        missed = 0
+        if write_seq - since > self.capacity:
+            missed = write_seq - since - self.capacity
+            since = write_seq - self.capacity
+
+        spots = []
+        for seq in range(since + 1, write_seq + 1):
+            offset = HEADER_SIZE + ((seq - 1) % self.capacity) * RECORD_SIZE
+            record = RECORD.unpack_from(buf, offset)
+            # Overwritten or mid-write while unpacking: the slot sequence changed
+            if record[0] != seq or struct.unpack_from("<Q", buf, offset)[0] != seq:
+                missed += 1
+                continue
+            (_, ts, frequency, strength, speed, is_skcc, continent,
+             callsign, reporter, mode, grid, skcc_number) = record
+            spots.append(SKCCSpot(
+                callsign=_decode(callsign),
+                frequency=frequency,
+                mode=_decode(mode),
+                grid=_decode(grid) or None,
+                reporter=_decode(reporter),
+                strength=strength,
+                speed=speed or None,
+                timestamp=datetime.fromtimestamp(ts, timezone.utc),
+                is_skcc=bool(is_skcc),
+                skcc_number=_decode(skcc_number) or None,
+                continent=CONTINENTS[continent] if continent else None,
+            ))
+        if missed:
+            logger.debug(f"Spot ring reader missed {missed} spots")
+        return spots, write_seq, missed
+
+    def close(self) -> None:
+        """Detach from the shared memory block"""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory block (owner only, after close)"""
+        if self._owner:
+            self._shm.unlink()
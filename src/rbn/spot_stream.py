@@ -0,0 +1,544 @@
+"""
+Spot Stream Service - asyncio ingestion of several spot feeds
+
+Runs every spot source (RBN telnet, a DX cluster node, the SKCC Skimmer
+subprocess) as a task on one event loop in a single background thread:
+- Each source reads bytes with StreamReader.readline, so bursts cost
+  linear time regardless of how the data is chunked
+- Sources reconnect independently with backoff
+- Spots from all sources share one dedup window keyed on (callsign, frequency,
+  reporter), so a report relayed by two feeds counts once while reports from
+  different skimmers are kept
+- Delivered spots can be recorded in a SpotArchive
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.rbn.rbn_fetcher import RBNConnectionState, RBNSpot
+from src.rbn.spot_archive import SpotArchive
+from src.skcc.skcc_skimmer_subprocess import DIAGNOSTIC_LINE_COUNT, SKCCSpot, parse_spot_line
+from src.utils.grid_calc import determine_mode, parse_rbn_spot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEDUP_WINDOW_SECONDS = 120  # Same call, frequency and reporter within this window is one spot
+DEFAULT_DEDUP_RESOLUTION_KHZ = 1.0  # Frequencies are rounded to this before comparing
+LOGIN_TIMEOUT_SECONDS = 10
+LINE_LIMIT_BYTES = 8192  # Longer lines are discarded
+RETRY_DELAY_SECONDS = 5
+MAX_RETRY_DELAY_SECONDS = 30
+
+
+def spot_from_cluster_line(line: str) -> Optional[RBNSpot]:
+    """
+    Convert a "DX de" cluster/RBN line into a spot
+
+    Args:
+        line: Stripped line from a telnet feed
+
+    Returns:
+        RBNSpot with the frequency in MHz, or None if the line is not a spot
+    """
+    if not line.startswith("DX de "):
+        return None
+    fields = parse_rbn_spot(line)
+    if not fields:
+        return None
+
+    freq_mhz = round(fields['frequency'] / 1000.0, 4)
+    return RBNSpot(
+        callsign=fields['callsign'].upper(),
+        frequency=freq_mhz,
+        mode=determine_mode(freq_mhz, fields['mode']),
+        reporter=fields['reporter'],
+        strength=fields['snr'],
+        speed=fields['wpm'],
+    )
+
+
+def spot_from_skimmer(spot: SKCCSpot) -> RBNSpot:
+    """Convert a parsed SKCC Skimmer spot into the common spot type"""
+    return RBNSpot(
+        callsign=spot.callsign,
+        frequency=spot.frequency,
+        mode=spot.mode,
+        grid=spot.grid,
+        reporter=spot.reporter,
+        strength=spot.strength,
+        speed=spot.speed,
+        timestamp=spot.timestamp,
+        skcc_number=spot.skcc_number,
+    )
+
+
+class SpotDeduplicator:
+    """Drops repeats of the same callsign, frequency and reporter within a time window"""
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_DEDUP_WINDOW_SECONDS,
+        resolution_khz: float = DEFAULT_DEDUP_RESOLUTION_KHZ,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize deduplicator
+
+        Args:
+            window_seconds: How long a spot suppresses its repeats
+            resolution_khz: Frequency rounding used for the key
+            clock: Monotonic time source
+        """
+        self.window_seconds = window_seconds
+        self.resolution_khz = resolution_khz
+        self._clock = clock
+        # Insertion order is time order, so expired keys are always at the front
+        self._seen: Dict[Tuple[str, int, str], float] = {}
+
+    def is_new(self, callsign: str, frequency_mhz: float, reporter: str = "") -> bool:
+        """
+        Record a spot and report whether it is outside the dedup window
+
+        Args:
+            callsign: Spotted callsign
+            frequency_mhz: Spot frequency in MHz
+            reporter: Spotting station (skimmer)
+
+        Returns:
+            True if the spot should be delivered
+        """
+        now = self._clock()
+        cutoff = now - self.window_seconds
+        seen = self._seen
+        while seen:
+            oldest = next(iter(seen))
+            if seen[oldest] > cutoff:
+                break
+            del seen[oldest]
+
+        key = (callsign.upper(), round(frequency_mhz * 1000.0 / self.resolution_khz), reporter)
+        if key in seen:
+            return False
+        seen[key] = now
+        return True
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+class SpotSource(ABC):
+    """Base class for a line-oriented spot feed run by SpotStreamService"""
+
+    max_retries = 10
+    retry_delay = RETRY_DELAY_SECONDS
+
+    def __init__(self, name: str):
+        """
+        Initialize source
+
+        Args:
+            name: Label used in logs and statistics
+        """
+        self.name = name
+        self.state = RBNConnectionState.DISCONNECTED
+        self.line_count = 0
+        self.spot_count = 0
+
+    @abstractmethod
+    async def connect(self) -> asyncio.StreamReader:
+        """Open the feed and return the reader delivering its lines"""
+
+    async def close(self) -> None:
+        """Release the connection or process (called after every session)"""
+
+    @abstractmethod
+    def parse(self, line: str) -> Optional[RBNSpot]:
+        """Convert one stripped line into a spot, or None"""
+
+    async def run(self, service: "SpotStreamService") -> None:
+        """Connect, read and reconnect until cancelled or out of retries"""
+        retries = 0
+        while retries < self.max_retries:
+            service._set_source_state(self, RBNConnectionState.CONNECTING)
+            try:
+                reader = await self.connect()
+                logger.info(f"{self.name} connected")
+                service._set_source_state(self, RBNConnectionState.RUNNING)
+                retries = 0
+                await self._read_lines(reader, service)
+                logger.info(f"{self.name} closed the stream")
+            except asyncio.CancelledError:
+                raise
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                logger.error(f"{self.name} connection error: {type(e).__name__}: {e}")
+            finally:
+                await self.close()
+
+            retries += 1
+            if retries < self.max_retries:
+                logger.info(f"{self.name} reconnecting (retry {retries}/{self.max_retries})")
+                await asyncio.sleep(min(self.retry_delay * retries, MAX_RETRY_DELAY_SECONDS))
+
+        logger.error(f"{self.name}: max retries reached")
+        service._set_source_state(self, RBNConnectionState.ERROR)
+
+    async def _read_lines(self, reader: asyncio.StreamReader, service: "SpotStreamService") -> None:
+        """Parse lines until end of stream"""
+        while True:
+            try:
+                raw = await reader.readline()
+            except ValueError:
+                # Line longer than the reader limit; the reader has already discarded it
+                logger.debug(f"{self.name}: discarded overlong line")
+                continue
+            if not raw:
+                return
+
+            line = raw.decode("utf-8", errors="ignore").strip()
+            if not line:
+                continue
+            self.line_count += 1
+            spot = self.parse(line)
+            if spot is not None:
+                self.spot_count += 1
+                service.publish(spot)
+
+
+class TelnetSpotSource(SpotSource):
+    """DX cluster node (or RBN) telnet feed of "DX de" lines"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        callsign: str = "",
+        login_commands: Iterable[str] = (),
+        name: Optional[str] = None,
+    ):
+        """
+        Initialize telnet source
+
+        Args:
+            host: Cluster host name
+            port: Cluster telnet port
+            callsign: Callsign sent at the login prompt
+            login_commands: Commands sent after logging in
+            name: Label for logs (defaults to host:port)
+        """
+        super().__init__(name or f"{host}:{port}")
+        self.host = host
+        self.port = port
+        self.callsign = callsign
+        self.login_commands = list(login_commands)
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self) -> asyncio.StreamReader:
+        """Connect and log in"""
+        logger.info(f"Connecting to {self.host}:{self.port}")
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, limit=LINE_LIMIT_BYTES),
+            timeout=LOGIN_TIMEOUT_SECONDS,
+        )
+        self._writer = writer
+
+        # The login prompt has no line ending, so wait for any data before answering
+        try:
+            banner = await asyncio.wait_for(reader.read(4096), timeout=LOGIN_TIMEOUT_SECONDS)
+            logger.debug(f"{self.name} banner: {banner!r}")
+        except asyncio.TimeoutError:
+            logger.debug(f"{self.name}: no login prompt received (timeout)")
+
+        # Replies to the commands arrive as ordinary lines and are skipped by parse()
+        commands = [self.callsign or "W4GNS"] + self.login_commands
+        writer.write("".join(f"{command}\n" for command in commands).encode("utf-8"))
+        await writer.drain()
+        return reader
+
+    async def close(self) -> None:
+        """Close the connection"""
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    def parse(self, line: str) -> Optional[RBNSpot]:
+        """Parse a "DX de" line"""
+        spot = spot_from_cluster_line(line)
+        if spot is None:
+            logger.debug(f"[{self.name}] Non-spot line: {line}")
+        return spot
+
+
+class RBNTelnetSource(TelnetSpotSource):
+    """Telegraphy.de RBN telnet stream (all CW spots)"""
+
+    HOST = "rbn.telegraphy.de"
+    PORT = 7000
+
+    def __init__(self, callsign: str = "", host: str = HOST, port: int = PORT):
+        """
+        Initialize RBN source
+
+        Args:
+            callsign: Callsign sent at the login prompt
+            host: RBN telnet host
+            port: RBN telnet port
+        """
+        # set/raw: all spots, not just club-filtered; set/nodupes: less traffic
+        super().__init__(host, port, callsign, ["set/raw", "set/nodupes"], name="RBN")
+
+
+class SkimmerProcessSource(SpotSource):
+    """K7MJG's SKCC Skimmer run as a child process"""
+
+    max_retries = 3
+
+    def __init__(self, skimmer_path: Path):
+        """
+        Initialize skimmer source
+
+        Args:
+            skimmer_path: SKCC Skimmer directory (containing skcc_skimmer.py)
+        """
+        super().__init__("SKCC Skimmer")
+        self.skimmer_path = Path(skimmer_path)
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._recent_lines: deque = deque(maxlen=DIAGNOSTIC_LINE_COUNT)
+
+    async def connect(self) -> asyncio.StreamReader:
+        """Start SKCC Skimmer with stdout and stderr merged into one pipe"""
+        skimmer_script = self.skimmer_path / "skcc_skimmer.py"
+        if not skimmer_script.exists():
+            raise FileNotFoundError(f"SKCC Skimmer not found at: {skimmer_script}")
+
+        # Prefer the run script, which sets up SKCC Skimmer's virtual environment
+        run_script = self.skimmer_path / "run"
+        if run_script.is_file():
+            args = ["bash", str(run_script)]
+        else:
+            args = ["python3", str(skimmer_script)]
+
+        logger.info(f"Starting SKCC Skimmer from: {self.skimmer_path}")
+        self._process = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=str(self.skimmer_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=LINE_LIMIT_BYTES,
+            # Own process group, so children of the run script are stopped with it
+            start_new_session=os.name == "posix",
+        )
+        return self._process.stdout
+
+    async def close(self) -> None:
+        """Stop the process if it is still running"""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.returncode is None:
+            try:
+                self._signal(process, signal.SIGTERM)
+                await asyncio.wait_for(process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                logger.warning("SKCC Skimmer did not terminate gracefully, killing...")
+                self._signal(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+                await process.wait()
+            except ProcessLookupError:
+                pass
+        elif process.returncode != 0:
+            logger.warning(f"SKCC Skimmer exited with code {process.returncode}, last lines:")
+            for line in list(self._recent_lines)[-3:]:
+                logger.warning(f"  {line}")
+
+    @staticmethod
+    def _signal(process: asyncio.subprocess.Process, sig: int) -> None:
+        """Signal the process group on POSIX, the process elsewhere"""
+        if os.name == "posix":
+            os.killpg(process.pid, sig)
+        else:
+            process.send_signal(sig)
+
+    def parse(self, line: str) -> Optional[RBNSpot]:
+        """Parse an SKCC Skimmer console line"""
+        self._recent_lines.append(line)
+        spot = parse_spot_line(line)
+        return spot_from_skimmer(spot) if spot else None
+
+    def recent_output(self) -> List[str]:
+        """Most recent console lines (oldest first), for diagnostics"""
+        return list(self._recent_lines)
+
+
+class SpotStreamService:
+    """Runs spot sources on one asyncio loop and delivers deduplicated spots"""
+
+    def __init__(
+        self,
+        sources: Iterable[SpotSource] = (),
+        dedup_window_seconds: float = DEFAULT_DEDUP_WINDOW_SECONDS,
+        archive: Optional[SpotArchive] = None,
+    ):
+        """
+        Initialize service
+
+        Args:
+            sources: Spot sources to run
+            dedup_window_seconds: Window for dropping repeated spots across sources
+            archive: Archive recording every delivered spot (written on the service thread)
+        """
+        self.sources: List[SpotSource] = list(sources)
+        self.archive = archive
+        self.dedup = SpotDeduplicator(dedup_window_seconds)
+        self.state = RBNConnectionState.DISCONNECTED
+        self.spot_count = 0
+        self.duplicate_count = 0
+        self.on_spot: Optional[Callable[[RBNSpot], None]] = None
+        self.on_state_change: Optional[Callable[[RBNConnectionState], None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+
+    def set_callbacks(
+        self,
+        on_spot: Optional[Callable[[RBNSpot], None]] = None,
+        on_state_change: Optional[Callable[[RBNConnectionState], None]] = None,
+    ) -> None:
+        """Set callbacks for events (both run on the service thread)"""
+        self.on_spot = on_spot
+        self.on_state_change = on_state_change
+
+    def add_source(self, source: SpotSource) -> None:
+        """Add a source (before start)"""
+        if self.is_running():
+            raise RuntimeError("Sources must be added before the service starts")
+        self.sources.append(source)
+
+    def start(self) -> bool:
+        """
+        Start all sources on a background event loop
+
+        Returns:
+            True if started (or already running), False if there are no sources
+        """
+        if self.is_running():
+            logger.warning("Spot stream already running")
+            return True
+        if not self.sources:
+            logger.error("Spot stream has no sources")
+            return False
+
+        self._stopping = False
+        self._set_state(RBNConnectionState.CONNECTING)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="SpotStream", daemon=True)
+        self._thread.start()
+        logger.info(f"Spot stream started with {len(self.sources)} source(s)")
+        return True
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Cancel all sources and wait for the loop thread to finish"""
+        self._stopping = True
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._cancel_tasks)
+            except RuntimeError:
+                pass  # Loop already closed
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        if self.archive is not None:
+            self.archive.flush()
+        self._set_state(RBNConnectionState.STOPPED)
+
+    def is_running(self) -> bool:
+        """Check if the loop thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def stats(self) -> Dict[str, object]:
+        """Delivered and suppressed spot counts, overall and per source"""
+        return {
+            'state': self.state.value,
+            'spots': self.spot_count,
+            'duplicates': self.duplicate_count,
+            'sources': {
+                s.name: {'state': s.state.value, 'lines': s.line_count, 'spots': s.spot_count}
+                for s in self.sources
+            },
+        }
+
+    def publish(self, spot: RBNSpot) -> None:
+        """Deliver a spot unless it repeats one seen within the dedup window"""
+        if not self.dedup.is_new(spot.callsign, spot.frequency, spot.reporter):
+            self.duplicate_count += 1
+            return
+        self.spot_count += 1
+        if self.archive is not None:
+            self.archive.add(spot)
+        if self.on_spot:
+            try:
+                self.on_spot(spot)
+            except Exception as e:
+                logger.error(f"Error in spot callback for {spot.callsign}: {e}", exc_info=True)
+
+    def _run_loop(self) -> None:
+        """Thread body: run all source tasks to completion"""
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._run_sources())
+        except Exception as e:
+            logger.error(f"Spot stream loop error: {e}", exc_info=True)
+        finally:
+            loop.close()
+
+    async def _run_sources(self) -> None:
+        """Run every source concurrently"""
+        self._tasks = [asyncio.ensure_future(source.run(self)) for source in self.sources]
+        if self._stopping:
+            self._cancel_tasks()
+        results = await asyncio.gather(*self._tasks, return_exceptions=True)
+        for source, result in zip(self.sources, results):
+            if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
+                logger.error(f"{source.name} failed: {type(result).__name__}: {result}")
+                source.state = RBNConnectionState.ERROR
+        if not self._stopping:
+            self._set_state(RBNConnectionState.ERROR)
+
+    def _cancel_tasks(self) -> None:
+        """Cancel source tasks (runs on the loop thread)"""
+        for task in self._tasks:
+            task.cancel()
+
+    def _set_source_state(self, source: SpotSource, state: RBNConnectionState) -> None:
+        """Record a source state and derive the overall state from all sources"""
+        source.state = state
+        if self._stopping:
+            return
+        states = {s.state for s in self.sources}
+        if RBNConnectionState.RUNNING in states:
+            self._set_state(RBNConnectionState.RUNNING)
+        elif states & {RBNConnectionState.CONNECTING, RBNConnectionState.DISCONNECTED}:
+            self._set_state(RBNConnectionState.CONNECTING)
+        else:
+            self._set_state(RBNConnectionState.ERROR)
+
+    def _set_state(self, state: RBNConnectionState) -> None:
+        """Update overall state and call callback"""
+        if self.state != state:
+            self.state = state
+            if self.on_state_change:
+                self.on_state_change(state)
+            logger.info(f"Spot stream state: {state.value}")
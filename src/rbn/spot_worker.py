@@ -0,0 +1,273 @@
+"""
+Out-of-Process Spot Worker
+
+Runs spot ingestion (RBN, DX cluster, SKCC Skimmer) and enrichment in a
+separate process, so a crashed or wedged feed can't take down the logger:
+- The worker looks up SKCC numbers and continents and writes each spot into
+  a SpotRingBuffer shared with the GUI
+- The GUI polls the ring on a timer; nothing is pickled per spot
+- A worker that dies is restarted with backoff, attaching to the same ring
+"""
+
+import logging
+import multiprocessing
+import time
+from typing import Any, Dict, List, Optional
+
+from src.rbn.rbn_fetcher import RBNConnectionState, RBNFetcher
+from src.rbn.spot_ring import DEFAULT_CAPACITY, SpotRingBuffer
+from src.skcc.skcc_skimmer_subprocess import SKCCSpot
+from src.utils.continents import continent_from_callsign
+
+logger = logging.getLogger(__name__)
+
+ROSTER_REFRESH_SECONDS = 1800
+ARCHIVE_FLUSH_SECONDS = 30
+STOP_TIMEOUT_SECONDS = 5
+RESTART_DELAY_SECONDS = 2
+MAX_RESTART_DELAY_SECONDS = 60
+STABLE_RUN_SECONDS = 300  # A worker alive this long resets the restart backoff
+
+
+class SpotEnricher:
+    """Adds SKCC membership and continent to raw spots"""
+
+    def __init__(self, roster_db_path: Optional[str] = None):
+        """
+        Initialize enricher
+
+        Args:
+            roster_db_path: contacts.db holding the SKCC roster (None = no membership lookup)
+        """
+        self.roster_db_path = roster_db_path
+        self.roster: Dict[str, str] = {}
+        self.roster_loaded = 0.0
+
+    def refresh_roster(self) -> None:
+        """Reload the SKCC roster from the database"""
+        if not self.roster_db_path:
+            return
+        from src.database.skcc_membership import SKCCMembershipManager
+
+        self.roster = SKCCMembershipManager(self.roster_db_path).get_roster_dict()
+        self.roster_loaded = time.monotonic()
+        logger.debug(f"Spot worker loaded {len(self.roster)} SKCC members")
+
+    def enrich(self, spot: Any) -> SKCCSpot:
+        """
+        Convert an RBNSpot/SKCCSpot into an SKCCSpot with membership and continent
+
+        Args:
+            spot: Spot from the stream (frequency in MHz)
+
+        Returns:
+            SKCCSpot ready for the ring buffer
+        """
+        callsign = spot.callsign.upper()
+        skcc_number = spot.skcc_number or self.roster.get(callsign)
+        return SKCCSpot(
+            callsign=callsign,
+            frequency=spot.frequency,
+            mode=spot.mode,
+            grid=spot.grid,
+            reporter=spot.reporter,
+            strength=spot.strength,
+            speed=spot.speed,
+            timestamp=spot.timestamp,
+            is_skcc=bool(skcc_number),
+            skcc_number=str(skcc_number) if skcc_number else None,
+            continent=continent_from_callsign(callsign),
+        )
+
+
+def run_spot_worker(ring_name: str, options: Dict[str, Any], stop_event) -> None:
+    """
+    Worker process entry point: ingest spots into the ring until stop_event is set
+
+    Args:
+        ring_name: Shared memory name of the SpotRingBuffer
+        options: Feed settings (callsign, rbn_host/rbn_port overriding the RBN node,
+            cluster_host, cluster_port, skimmer_path, dedup_window_seconds,
+            roster_db_path, archive_path, archive_retention_days)
+        stop_event: multiprocessing.Event set by the GUI to stop the worker
+    """
+    ring = SpotRingBuffer(ring_name)
+    archive = None
+    fetcher = None
+    try:
+        enricher = SpotEnricher(options.get("roster_db_path"))
+        enricher.refresh_roster()
+
+        if options.get("archive_path"):
+            from src.rbn.spot_archive import SpotArchive
+
+            archive = SpotArchive(
+                options["archive_path"], retention_days=options.get("archive_retention_days", 90)
+            )
+
+        fetcher = RBNFetcher(
+            cluster_host=options.get("cluster_host") or None,
+            cluster_port=options.get("cluster_port", 7300),
+            skimmer_path=options.get("skimmer_path") or None,
+            dedup_window_seconds=options.get("dedup_window_seconds", 120),
+            archive=archive,
+        )
+        if options.get("rbn_host"):
+            fetcher.HOST, fetcher.PORT = options["rbn_host"], options.get("rbn_port", fetcher.PORT)
+        fetcher.my_callsign = options.get("callsign") or None
+        fetcher.set_callbacks(
+            on_spot=lambda spot: ring.publish(enricher.enrich(spot)),
+            on_state_change=ring.set_state,
+        )
+        if not fetcher.start():
+            ring.set_state(RBNConnectionState.ERROR)
+            return
+
+        last_flush = time.monotonic()
+        while not stop_event.wait(1.0):
+            now = time.monotonic()
+            if now - enricher.roster_loaded >= ROSTER_REFRESH_SECONDS:
+                enricher.refresh_roster()
+            if archive is not None and now - last_flush >= ARCHIVE_FLUSH_SECONDS:
+                archive.flush()
+                last_flush = now
+    finally:
+        if fetcher is not None:
+            fetcher.stop()
+        if archive is not None:
+            archive.close()
+        ring.close()
+
+
+class SpotWorkerProcess:
+    """Owns the spot worker process and its ring buffer (used from the GUI thread)"""
+
+    def __init__(self, options: Dict[str, Any], capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize worker handle
+
+        Args:
+            options: Feed settings passed to run_spot_worker
+            capacity: Ring buffer size in spots
+        """
+        self.options = options
+        self.capacity = capacity
+        self.restarts = 0
+        self.missed = 0
+        self._ctx = multiprocessing.get_context("spawn")
+        self._ring: Optional[SpotRingBuffer] = None
+        self._process = None
+        self._stop_event = None
+        self._next_seq = 0
+        self._started_at = 0.0
+        self._restart_at: Optional[float] = None
+
+    def start(self) -> bool:
+        """Create the ring and start the worker process"""
+        if self.is_running():
+            logger.warning("Spot worker already running")
+            return True
+        try:
+            self._ring = SpotRingBuffer(capacity=self.capacity, create=True)
+            self._next_seq = 0
+            self._spawn()
+            logger.info(f"Spot worker started (pid {self._process.pid})")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to start spot worker: {e}")
+            self._release_ring()
+            return False
+
+    def poll(self) -> List[SKCCSpot]:
+        """
+        Read spots published since the last poll, restarting a dead worker when due
+
+        Returns:
+            New spots, oldest first
+        """
+        if self._ring is None:
+            return []
+        spots, self._next_seq, missed = self._ring.read(self._next_seq)
+        if missed:
+            self.missed += missed
+            logger.warning(f"Spot worker ring overflowed, {missed} spots missed")
+        self._check_worker()
+        return spots
+
+    @property
+    def state(self) -> RBNConnectionState:
+        """Connection state reported by the worker (ERROR while it is down)"""
+        if self._ring is None:
+            return RBNConnectionState.STOPPED
+        if not self._process.is_alive():
+            return RBNConnectionState.ERROR
+        return self._ring.state
+
+    def is_running(self) -> bool:
+        """Check if the worker is active (including while waiting to be restarted)"""
+        return self._ring is not None
+
+    def stop(self) -> None:
+        """Stop the worker process and free the ring"""
+        if self._ring is None:
+            return
+        logger.info("Stopping spot worker...")
+        self._stop_event.set()
+        self._process.join(STOP_TIMEOUT_SECONDS)
+        if self._process.is_alive():
+            logger.warning("Spot worker did not stop, terminating it")
+            self._process.terminate()
+            self._process.join(STOP_TIMEOUT_SECONDS)
+        self._release_ring()
+
+    def stats(self) -> dict:
+        """Spot and restart counts ({} when stopped)"""
+        if self._ring is None:
+            return {}
+        return {
+            'spots': self._ring.write_seq,
+            'missed': self.missed,
+            'restarts': self.restarts,
+            'pid': self._process.pid,
+        }
+
+    def _spawn(self) -> None:
+        """Start a worker process attached to the ring"""
+        # A fresh event each time: one a killed worker was waiting on can't be set anymore
+        self._stop_event = self._ctx.Event()
+        self._process = self._ctx.Process(
+            target=run_spot_worker,
+            args=(self._ring.name, self.options, self._stop_event),
+            name="SpotWorker",
+            daemon=True,
+        )
+        self._process.start()
+        self._started_at = time.monotonic()
+        self._restart_at = None
+
+    def _check_worker(self) -> None:
+        """Schedule and perform the restart of a worker that exited unexpectedly"""
+        if self._process.is_alive():
+            return
+        now = time.monotonic()
+        if self._restart_at is None:
+            if now - self._started_at >= STABLE_RUN_SECONDS:
+                self.restarts = 0
+            delay = min(RESTART_DELAY_SECONDS * 2 ** self.restarts, MAX_RESTART_DELAY_SECONDS)
+            self._restart_at = now + delay
+            logger.warning(
+                f"Spot worker exited (code {self._process.exitcode}), restarting in {delay}s"
+            )
+        elif now >= self._restart_at:
+            self.restarts += 1
+            self._spawn()
+            logger.info(f"Spot worker restarted (pid {self._process.pid})")
+
+    def _release_ring(self) -> None:
+        """Close and free the shared memory block"""
+        if self._ring is not None:
+            self._ring.close()
+            self._ring.unlink()
+            self._ring = None
+        self._process = None
+        self._stop_event = None
@@ -7,7 +7,7 @@ The list is fetched from: https://www.skccgroup.com/centurionlist.txt
 
 import logging
 import csv
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from io import StringIO
 from typing import List, Dict, Optional
 from urllib.error import URLError
@@ -16,6 +16,7 @@ from src.utils.network import urlopen_with_retries as urlopen
 from sqlalchemy.orm import Session
 
 from src.database.models import CenturionMember
+from src.services.member_list_sync import MemberListChanges, MemberListSource, MemberListSync
 
 logger = logging.getLogger(__name__)
 
@@ -117,11 +118,26 @@ class CenturionFetcher:
             logger.error(f"Unexpected error parsing Centurion list: {e}", exc_info=True)
             return []
 
+    @staticmethod
+    def list_sync() -> MemberListSync:
+        """Incremental sync engine for the Centurion list"""
+        return MemberListSync(MemberListSource(
+            name="Centurion",
+            url=CENTURION_LIST_URL,
+            table="centurion_members",
+            date_column="centurion_date",
+            parse=CenturionFetcher.parse_centurion_list,
+            max_age_hours=CENTURION_LIST_CACHE_HOURS
+        ))
+
     @staticmethod
     def update_database(db: Session, members: List[Dict[str, str]]) -> bool:
         """
         Update the database with parsed Centurion members
 
+        Only members that were added, changed or removed since the stored list
+        are written, in a single transaction.
+
         Args:
             db: SQLAlchemy database session
             members: List of parsed member dictionaries
@@ -130,40 +146,13 @@ class CenturionFetcher:
             True if update successful, False otherwise
         """
         try:
-            # Clear old list
-            old_count = db.query(CenturionMember).count()
-            db.query(CenturionMember).delete()
-            db.commit()
-            logger.info(f"Cleared {old_count} old Centurion members from database")
-
-            # Insert new members
-            now = datetime.now(timezone.utc)
-            for member_data in members:
-                member = CenturionMember(
-                    rank=member_data['rank'],
-                    callsign=member_data['callsign'],
-                    skcc_number=member_data['skcc_number'],
-                    name=member_data['name'],
-                    city=member_data['city'],
-                    state=member_data['state'],
-                    country='',  # Will be determined from SKCC data
-                    centurion_date=member_data['centurion_date'],
-                    endorsements=member_data['endorsements'],
-                    last_list_update=now
-                )
-                db.add(member)
-
-            db.commit()
-            logger.info(f"Updated database with {len(members)} Centurion members")
+            CenturionFetcher.list_sync().apply(db, members)
             return True
-
         except (ValueError, KeyError, AttributeError) as e:
             logger.error(f"Invalid member data when updating Centurion database: {e}", exc_info=True)
-            db.rollback()
             return False
         except Exception as e:
             logger.error(f"Unexpected error updating Centurion database: {e}", exc_info=True)
-            db.rollback()
             return False
 
     @staticmethod
@@ -172,81 +161,42 @@ class CenturionFetcher:
         Check if Centurion list needs updating
 
         Returns:
-            True if list hasn't been updated in the last 24 hours
+            True if list hasn't been checked in the last CENTURION_LIST_CACHE_HOURS hours
         """
         try:
-            latest_member = db.query(CenturionMember).order_by(
-                CenturionMember.last_list_update.desc()
-            ).first()
-
-            if not latest_member:
-                logger.info("No Centurion members in database, update needed")
-                return True
-
-            last_update = latest_member.last_list_update
-            # Ensure timezone-aware arithmetic
-            if last_update.tzinfo is None:
-                last_update = last_update.replace(tzinfo=timezone.utc)
-            age = datetime.now(timezone.utc) - last_update
-            should_update = age > timedelta(hours=CENTURION_LIST_CACHE_HOURS)
-
-            if should_update:
-                logger.info(f"Centurion list is {age.total_seconds() / 3600:.1f} hours old, update needed")
-            else:
-                hours_remaining = (timedelta(hours=CENTURION_LIST_CACHE_HOURS) - age).total_seconds() / 3600
-                logger.info(f"Centurion list is current (update in {hours_remaining:.1f} hours)")
-
-            return should_update
-
-        except TypeError as e:
-            logger.error(f"Error checking Centurion list age - invalid date format: {e}", exc_info=True)
-            return True  # Try to update on error
+            return CenturionFetcher.list_sync().should_update(db)
         except Exception as e:
             logger.error(f"Unexpected error checking Centurion list age: {e}", exc_info=True)
             return True  # Try to update on error
 
     @staticmethod
-    def refresh_centurion_list(db: Session, force: bool = False) -> bool:
+    def sync_centurion_list(db: Session, force: bool = False) -> Optional[MemberListChanges]:
         """
-        Refresh the Centurion list from SKCC if needed
+        Refresh the Centurion list from SKCC if needed, applying only changes
 
         Args:
             db: SQLAlchemy database session
-            force: If True, refresh regardless of age
+            force: If True, download now regardless of age
 
         Returns:
-            True if list was updated successfully, False otherwise
+            Summary of added/updated/removed SKCC numbers (for patching member
+            caches), or None if the refresh failed
         """
-        try:
-            if not force and not CenturionFetcher.should_update(db):
-                logger.debug("Centurion list is current, skipping update")
-                return True
-
-            logger.info("Starting Centurion list refresh")
-            raw_content = CenturionFetcher.fetch_centurion_list()
+        return CenturionFetcher.list_sync().sync(db, force=force)
 
-            if not raw_content:
-                logger.error("Failed to fetch Centurion list, update aborted")
-                return False
-
-            members = CenturionFetcher.parse_centurion_list(raw_content)
-
-            if not members:
-                logger.error("Failed to parse Centurion list, update aborted")
-                return False
-
-            success = CenturionFetcher.update_database(db, members)
-
-            if success:
-                logger.info("Centurion list refresh completed successfully")
-            else:
-                logger.error("Failed to update Centurion database")
+    @staticmethod
+    def refresh_centurion_list(db: Session, force: bool = False) -> bool:
+        """
+        Refresh the Centurion list from SKCC if needed
 
-            return success
+        Args:
+            db: SQLAlchemy database session
+            force: If True, refresh regardless of age
 
-        except Exception as e:
-            logger.error(f"Unexpected error during Centurion list refresh: {e}", exc_info=True)
-            return False
+        Returns:
+            True if list was updated successfully or already current, False otherwise
+        """
+        return CenturionFetcher.sync_centurion_list(db, force=force) is not None
 
     @staticmethod
     def is_centurion_member(db: Session, skcc_number: str) -> bool:
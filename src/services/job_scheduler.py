@@ -0,0 +1,369 @@
+"""
+Background Job Scheduler
+
+One place for the application's periodic work (roster and member list
+downloads, space weather refresh, database backups):
+- Jobs are named; adding a job with an existing name replaces it
+- Intervals get random jitter, so jobs registered together drift apart
+- A failing job is retried with exponential backoff instead of its interval
+- At most max_concurrent jobs run at once; when more are due, higher
+  priority jobs start first
+- Deferrable jobs only start once the user has been idle for idle_seconds
+  (measured from startup, and from the last notify_activity() call), so
+  first paint and the first QSO never compete with several downloads
+
+Jobs run on pool threads: a job that updates widgets must hand its result
+to the GUI thread with a Qt signal.
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 50
+PRIORITY_HIGH = 100
+
+DEFAULT_MAX_CONCURRENT = 2
+DEFAULT_IDLE_SECONDS = 30.0
+DEFAULT_JITTER = 0.1  # Fraction of the interval added or subtracted at random
+DEFAULT_BACKOFF_BASE = 60.0
+DEFAULT_BACKOFF_MAX = 3600.0
+MAX_WAIT_SECONDS = 60.0  # Longest the dispatcher sleeps without being woken
+
+
+def backoff_delay(failures: int, base: float, maximum: float) -> float:
+    """
+    Exponential backoff delay
+
+    Args:
+        failures: Consecutive failures so far (1 for the first)
+        base: Delay after the first failure
+        maximum: Upper bound
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return min(maximum, base * (2 ** max(0, failures - 1)))
+
+
+class Job:
+    """A named unit of periodic or one-shot background work"""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval: Optional[float] = None,
+        priority: int = PRIORITY_NORMAL,
+        jitter: float = DEFAULT_JITTER,
+        defer_until_idle: bool = True,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ):
+        """
+        Initialize job
+
+        Args:
+            name: Unique job name
+            func: Work to run; raising an exception counts as a failure
+            interval: Seconds between runs (None = run once, retrying until it succeeds)
+            priority: Higher values start first when several jobs are due
+            jitter: Random fraction (+/-) applied to the interval and the initial delay
+            defer_until_idle: Only start while the user is idle
+            backoff_base: Retry delay after the first consecutive failure
+            backoff_max: Longest retry delay
+        """
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.priority = priority
+        self.jitter = jitter
+        self.defer_until_idle = defer_until_idle
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.next_run = 0.0
+        self.forced = False  # run_now() was called: start regardless of idle state
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.last_duration: Optional[float] = None
+
+    def status(self, now: float) -> Dict[str, Any]:
+        """Job state for display and logs"""
+        return {
+            'name': self.name,
+            'priority': self.priority,
+            'interval': self.interval,
+            'running': self.running,
+            'due_in': max(0.0, self.next_run - now),
+            'runs': self.runs,
+            'failures': self.failures,
+            'last_error': self.last_error,
+            'last_duration': self.last_duration,
+        }
+
+
+class JobScheduler:
+    """Runs named background jobs on a small thread pool"""
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            max_concurrent: Most jobs running at the same time
+            idle_seconds: User inactivity required before deferrable jobs start
+            clock: Monotonic time source
+            rng: Random source for jitter
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._jobs: Dict[str, Job] = {}
+        self._running = 0
+        self._last_activity = clock()  # Startup counts as activity
+        self._condition = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def add_job(self, name: str, func: Callable[[], Any], delay: float = 0.0, **options: Any) -> Job:
+        """
+        Register a job, replacing any job with the same name
+
+        Args:
+            name: Unique job name
+            func: Work to run
+            delay: Seconds before the first run (jittered like the interval)
+            **options: Job options (interval, priority, jitter, defer_until_idle,
+                backoff_base, backoff_max)
+
+        Returns:
+            The new job
+        """
+        job = Job(name, func, **options)
+        with self._condition:
+            job.next_run = self._clock() + self._jittered(delay, job.jitter)
+            self._jobs[name] = job
+            self._condition.notify_all()
+        logger.debug(f"Scheduled job {name} (interval={job.interval}, priority={job.priority})")
+        return job
+
+    def remove_job(self, name: str) -> bool:
+        """
+        Unregister a job (a run in progress finishes but is not rescheduled)
+
+        Returns:
+            True if the job existed
+        """
+        with self._condition:
+            return self._jobs.pop(name, None) is not None
+
+    def run_now(self, name: str) -> bool:
+        """
+        Make a job due immediately, even while the user is active
+
+        Returns:
+            True if the job exists
+        """
+        with self._condition:
+            job = self._jobs.get(name)
+            if job is None:
+                return False
+            job.next_run = self._clock()
+            job.forced = True
+            self._condition.notify_all()
+            return True
+
+    def get_job(self, name: str) -> Optional[Job]:
+        """Get a registered job by name"""
+        return self._jobs.get(name)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """State of every job, next due first"""
+        with self._condition:
+            now = self._clock()
+            return [job.status(now) for job in sorted(self._jobs.values(), key=lambda j: j.next_run)]
+
+    # ------------------------------------------------------------------
+    # Idle tracking
+    # ------------------------------------------------------------------
+
+    def notify_activity(self) -> None:
+        """Record user activity; deferrable jobs wait until idle_seconds have passed"""
+        self._last_activity = self._clock()
+
+    def is_idle(self, now: Optional[float] = None) -> bool:
+        """Check whether the user has been inactive for idle_seconds"""
+        return (self._clock() if now is None else now) - self._last_activity >= self.idle_seconds
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the dispatcher thread"""
+        if self.is_running():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._dispatch_loop, name="JobScheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop dispatching; running jobs finish in the background, queued ones are dropped"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def is_running(self) -> bool:
+        """Check if the dispatcher thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def run_pending(self) -> List[str]:
+        """
+        Start the due jobs the concurrency limit allows
+
+        Returns:
+            Names of the jobs started
+        """
+        with self._condition:
+            return self._start_due(self._clock())
+
+    def _start_due(self, now: float) -> List[str]:
+        """Start due jobs by priority (caller holds the lock)"""
+        slots = self.max_concurrent - self._running
+        if slots <= 0 or self._stopping:
+            return []
+        idle = self.is_idle(now)
+        due = [
+            job for job in self._jobs.values()
+            if not job.running and job.next_run <= now and (idle or job.forced or not job.defer_until_idle)
+        ]
+        due.sort(key=lambda job: (-job.priority, job.next_run))
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="job")
+        started = []
+        for job in due[:slots]:
+            job.running = True
+            job.forced = False
+            self._running += 1
+            self._executor.submit(self._run, job)
+            started.append(job.name)
+        return started
+
+    def _next_wakeup(self, now: float) -> float:
+        """Seconds until a waiting job could start (caller holds the lock)"""
+        idle_at = self._last_activity + self.idle_seconds
+        wakeup = now + MAX_WAIT_SECONDS
+        for job in self._jobs.values():
+            if job.running:
+                continue
+            due = job.next_run
+            if job.defer_until_idle and not job.forced:
+                due = max(due, idle_at)
+            wakeup = min(wakeup, due)
+        return max(0.0, wakeup - now)
+
+    def _dispatch_loop(self) -> None:
+        """Start jobs as they become due until stopped"""
+        with self._condition:
+            while not self._stopping:
+                now = self._clock()
+                self._start_due(now)
+                timeout = self._next_wakeup(now) if self._running < self.max_concurrent else MAX_WAIT_SECONDS
+                # Sleep at least a moment so a job that is due but deferred doesn't spin
+                self._condition.wait(max(timeout, 0.01))
+
+    def _run(self, job: Job) -> None:
+        """Run one job on a pool thread and reschedule it"""
+        started = self._clock()
+        error: Optional[Exception] = None
+        try:
+            job.func()
+        except Exception as e:
+            error = e
+            logger.warning(f"Job {job.name} failed: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+
+        with self._condition:
+            now = self._clock()
+            job.running = False
+            job.runs += 1
+            job.last_duration = now - started
+            self._running -= 1
+            if error is None:
+                job.failures = 0
+                job.last_error = None
+                if job.interval is None and self._jobs.get(job.name) is job:
+                    del self._jobs[job.name]  # One-shot job done
+                else:
+                    job.next_run = now + self._jittered(job.interval or 0.0, job.jitter)
+            else:
+                job.failures += 1
+                job.last_error = str(error)
+                job.next_run = now + backoff_delay(job.failures, job.backoff_base, job.backoff_max)
+                logger.info(f"Job {job.name} retries in {job.next_run - now:.0f}s (failure {job.failures})")
+            self._condition.notify_all()
+
+    def _jittered(self, seconds: float, jitter: float) -> float:
+        """Apply +/- jitter (a fraction) to a delay"""
+        if seconds <= 0 or jitter <= 0:
+            return max(0.0, seconds)
+        return seconds * (1.0 + self._rng.uniform(-jitter, jitter))
+
+
+# Global scheduler instance
+_job_scheduler: Optional[JobScheduler] = None
+
+
+def get_job_scheduler() -> JobScheduler:
+    """
+    Get the global job scheduler, creating and starting it on first use
+
+    Returns:
+        JobScheduler configured from the scheduler settings
+    """
+    global _job_scheduler
+    if _job_scheduler is None:
+        from src.config.settings import get_config_manager
+
+        config = get_config_manager()
+        _job_scheduler = JobScheduler(
+            max_concurrent=int(config.get("scheduler.max_concurrent_jobs", DEFAULT_MAX_CONCURRENT)),
+            idle_seconds=float(config.get("scheduler.idle_seconds", DEFAULT_IDLE_SECONDS)),
+        )
+        _job_scheduler.start()
+    return _job_scheduler
+
+
+def shutdown_job_scheduler() -> None:
+    """Stop the global job scheduler if it was created"""
+    global _job_scheduler
+    if _job_scheduler is not None:
+        _job_scheduler.stop()
+        _job_scheduler = None
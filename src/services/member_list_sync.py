@@ -0,0 +1,356 @@
+"""
+SKCC Member List Sync Engine
+
+Shared incremental synchronization for the Centurion, Tribune and Senator lists:
+- Conditional download (ETag/Last-Modified), plus a content hash for servers
+  that ignore the validators
+- The parsed list is diffed against the stored rows by SKCC number
+- Only inserts, updates and deletes are written, as executemany statements in
+  one transaction, so concurrent readers never see a half-empty table
+- A change summary lets in-memory member caches be patched in place
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.error import HTTPError, URLError
+
+from sqlalchemy.orm import Session
+
+from src.utils.network import urlopen_with_retries as urlopen
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_HOURS = 24  # Check each list at most once a day
+
+
+@dataclass(frozen=True)
+class MemberListSource:
+    """Where a member list comes from and where it is stored"""
+    name: str  # Centurion, Tribune, Senator
+    url: str
+    table: str  # Database table holding the list
+    date_column: str  # Column (and parsed dict key) with the award date
+    parse: Callable[[str], List[Dict[str, Any]]]
+    max_age_hours: float = DEFAULT_MAX_AGE_HOURS
+
+    @property
+    def compared_columns(self) -> Tuple[str, ...]:
+        """Columns compared to decide whether a stored member changed"""
+        return ('rank', 'callsign', 'name', 'city', 'state', self.date_column, 'endorsements')
+
+
+@dataclass
+class MemberListChanges:
+    """Summary of one list sync, keyed by SKCC number"""
+    list_name: str
+    inserted: Set[str] = field(default_factory=set)
+    updated: Set[str] = field(default_factory=set)
+    deleted: Set[str] = field(default_factory=set)
+    unchanged: int = 0
+    not_modified: bool = False  # The download was skipped (304 or identical content)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any member was added, changed or removed"""
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def __str__(self) -> str:
+        if self.not_modified:
+            return f"{self.list_name} list not modified"
+        return (f"{self.list_name} list: {len(self.inserted)} added, {len(self.updated)} updated, "
+                f"{len(self.deleted)} removed, {self.unchanged} unchanged")
+
+
+def _normalize(value: Any) -> Any:
+    """Treat NULL and empty strings alike when comparing stored and parsed values"""
+    return "" if value is None else value
+
+
+class MemberListSync:
+    """Incremental download-and-apply for one SKCC member list"""
+
+    def __init__(self, source: MemberListSource, timeout: int = 10):
+        """
+        Initialize list sync
+
+        Args:
+            source: List definition
+            timeout: Download timeout in seconds
+        """
+        self.source = source
+        self.timeout = timeout
+
+    @property
+    def state_key(self) -> str:
+        """Configuration table key holding validators and the last check time"""
+        return f"member_list_sync.{self.source.table}"
+
+    def load_state(self, session: Session) -> Dict[str, Any]:
+        """
+        Load the stored sync state
+
+        Returns:
+            Dict with etag, last_modified, sha256, count and checked_at (ISO UTC), or {}
+        """
+        conn = session.connection()
+        row = conn.exec_driver_sql(
+            "SELECT value FROM configuration WHERE key = ?", (self.state_key,)
+        ).fetchone()
+        if row is None or not row[0]:
+            return {}
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            logger.warning(f"Ignoring unreadable {self.source.name} list sync state")
+            return {}
+
+    def should_update(self, session: Session) -> bool:
+        """
+        Check whether the list is due for a (conditional) download
+
+        Returns:
+            True if the list has not been checked within max_age_hours
+        """
+        checked_at = self.load_state(session).get('checked_at')
+        if not checked_at:
+            logger.info(f"{self.source.name} list has never been synced, update needed")
+            return True
+
+        try:
+            age = datetime.now(timezone.utc) - datetime.fromisoformat(checked_at)
+        except (TypeError, ValueError):
+            return True
+
+        max_age = timedelta(hours=self.source.max_age_hours)
+        if age > max_age:
+            logger.info(f"{self.source.name} list is {age.total_seconds() / 3600:.1f} hours old, update needed")
+            return True
+
+        hours_remaining = (max_age - age).total_seconds() / 3600
+        logger.info(f"{self.source.name} list is current (update in {hours_remaining:.1f} hours)")
+        return False
+
+    def fetch(self, state: Dict[str, Any], conditional: bool = True) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Download the list, revalidating with stored validators
+
+        Args:
+            state: Stored sync state
+            conditional: Send If-None-Match/If-Modified-Since
+
+        Returns:
+            (body, validators); body is None when the server answered 304 Not Modified
+
+        Raises:
+            URLError: If the download fails
+        """
+        headers = {}
+        if conditional and state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if conditional and state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+
+        logger.info(f"Fetching {self.source.name} list from {self.source.url}")
+        try:
+            with urlopen(self.source.url, timeout=self.timeout, retries=3, backoff=0.5, headers=headers) as response:
+                body = response.read().decode('utf-8')
+                validators = {
+                    'etag': response.headers.get('ETag') or '',
+                    'last_modified': response.headers.get('Last-Modified') or '',
+                }
+        except HTTPError as e:
+            if e.code == 304:
+                logger.info(f"{self.source.name} list not modified since last download")
+                return None, {}
+            raise
+
+        logger.info(f"Successfully fetched {self.source.name} list ({len(body)} bytes)")
+        return body, validators
+
+    def _stored_count(self, session: Session) -> int:
+        """Number of rows currently stored for the list"""
+        return session.connection().exec_driver_sql(f"SELECT COUNT(*) FROM {self.source.table}").scalar()
+
+    def sync(self, session: Session, force: bool = False) -> Optional[MemberListChanges]:
+        """
+        Download the list if due and apply only what changed
+
+        Args:
+            session: SQLAlchemy database session
+            force: Check now regardless of age and download unconditionally
+
+        Returns:
+            Change summary (empty if nothing was due), or None if the sync failed
+        """
+        try:
+            if not force and not self.should_update(session):
+                return MemberListChanges(self.source.name, not_modified=True)
+
+            state = self.load_state(session)
+            # Only trust validators while the table still holds what they describe
+            conditional = not force and state.get('count') == self._stored_count(session)
+            session.commit()  # Release the read transaction before writing
+
+            body, validators = self.fetch(state, conditional=conditional)
+            if body is None:
+                self._save_state(session, dict(state, checked_at=self._now()))
+                return MemberListChanges(self.source.name, not_modified=True)
+
+            digest = hashlib.sha256(body.encode('utf-8')).hexdigest()
+            new_state = dict(validators, sha256=digest)
+            if conditional and digest == state.get('sha256'):
+                logger.info(f"{self.source.name} list content unchanged")
+                new_state.update(count=state.get('count'), checked_at=self._now())
+                self._save_state(session, new_state)
+                return MemberListChanges(self.source.name, not_modified=True)
+
+            members = self.source.parse(body)
+            if not members:
+                logger.error(f"Failed to parse {self.source.name} list, update aborted")
+                return None
+
+            return self.apply(session, members, new_state)
+
+        except URLError as e:
+            logger.error(f"Failed to fetch {self.source.name} list: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error during {self.source.name} list sync: {e}", exc_info=True)
+            return None
+
+    def apply(
+        self,
+        session: Session,
+        members: List[Dict[str, Any]],
+        state: Optional[Dict[str, Any]] = None
+    ) -> MemberListChanges:
+        """
+        Diff parsed members against the stored list and write only the differences
+
+        Deletes, updates, inserts and the sync state are written in one transaction.
+
+        Args:
+            session: SQLAlchemy database session (its engine is used for the write)
+            members: Parsed member dictionaries
+            state: Sync state to store with the changes (validators and hash)
+
+        Returns:
+            Change summary
+
+        Raises:
+            SQLAlchemyError/sqlite3.Error: If the write fails (nothing is applied)
+        """
+        columns = self.source.compared_columns
+        table = self.source.table
+
+        parsed: Dict[str, Dict[str, Any]] = {}
+        duplicates = 0
+        for member in members:
+            skcc_number = member['skcc_number']
+            if skcc_number in parsed:
+                duplicates += 1
+                continue
+            parsed[skcc_number] = member
+        if duplicates:
+            logger.warning(f"Ignored {duplicates} duplicate SKCC numbers in the {self.source.name} list")
+
+        changes = MemberListChanges(self.source.name)
+        now = self._db_timestamp()
+        session.commit()  # Make sure the session holds no open transaction
+
+        with session.get_bind().connect() as conn:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                stored = {
+                    row[0]: tuple(_normalize(v) for v in row[1:])
+                    for row in conn.exec_driver_sql(
+                        f"SELECT skcc_number, {', '.join(columns)} FROM {table}"
+                    ).fetchall()
+                }
+
+                inserts: List[Dict[str, Any]] = []
+                updates: List[Dict[str, Any]] = []
+                renamed: List[Dict[str, Any]] = []
+                for skcc_number, member in parsed.items():
+                    values = tuple(_normalize(member.get(c)) for c in columns)
+                    params = dict(zip(columns, values), skcc_number=skcc_number, now=now)
+                    current = stored.get(skcc_number)
+                    if current is None:
+                        inserts.append(params)
+                        changes.inserted.add(skcc_number)
+                    elif current != values:
+                        updates.append(params)
+                        changes.updated.add(skcc_number)
+                        if current[columns.index('callsign')] != params['callsign']:
+                            renamed.append({'skcc_number': skcc_number})
+                    else:
+                        changes.unchanged += 1
+                changes.deleted = set(stored) - set(parsed)
+
+                if changes.deleted:
+                    conn.exec_driver_sql(
+                        f"DELETE FROM {table} WHERE skcc_number = :skcc_number",
+                        [{'skcc_number': n} for n in changes.deleted]
+                    )
+                if renamed:
+                    # Free callsigns first so swaps between members don't trip the unique index
+                    conn.exec_driver_sql(
+                        f"UPDATE {table} SET callsign = '#' || skcc_number WHERE skcc_number = :skcc_number",
+                        renamed
+                    )
+                if updates:
+                    assignments = ", ".join(f"{c} = :{c}" for c in columns)
+                    conn.exec_driver_sql(
+                        f"UPDATE {table} SET {assignments}, last_list_update = :now WHERE skcc_number = :skcc_number",
+                        updates
+                    )
+                if inserts:
+                    conn.exec_driver_sql(
+                        f"INSERT INTO {table} (skcc_number, {', '.join(columns)}, country, last_list_update) "
+                        f"VALUES (:skcc_number, {', '.join(':' + c for c in columns)}, '', :now)",
+                        inserts
+                    )
+
+                new_state = dict(state or {}, count=len(parsed), checked_at=self._now())
+                self._write_state(conn, new_state)
+                conn.exec_driver_sql("COMMIT")
+            except Exception:
+                conn.exec_driver_sql("ROLLBACK")
+                raise
+
+        logger.info(str(changes))
+        return changes
+
+    @staticmethod
+    def _now() -> str:
+        """Current UTC time as an ISO string"""
+        return datetime.now(timezone.utc).isoformat()
+
+    @staticmethod
+    def _db_timestamp() -> str:
+        """Current UTC time in the format SQLAlchemy uses for SQLite DateTime columns"""
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')
+
+    def _save_state(self, session: Session, state: Dict[str, Any]) -> None:
+        """Store sync state in its own short transaction"""
+        session.commit()
+        with session.get_bind().connect() as conn:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                self._write_state(conn, state)
+                conn.exec_driver_sql("COMMIT")
+            except Exception:
+                conn.exec_driver_sql("ROLLBACK")
+                raise
+
+    def _write_state(self, conn: Any, state: Dict[str, Any]) -> None:
+        """Upsert the sync state row (caller manages the transaction)"""
+        conn.exec_driver_sql(
+            "INSERT INTO configuration (key, value, value_type, updated_at) VALUES (?, ?, 'json', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+            (self.state_key, json.dumps(state), self._db_timestamp())
+        )
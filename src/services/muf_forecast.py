@@ -0,0 +1,556 @@
+"""
+MUF Forecast Table - Precomputed 24-Hour Band Predictions
+
+Builds a full-day table of empirical MUF predictions (24 UTC hours x HF band x
+target region) in one pass whenever SFI or K-index change, and persists it to
+disk so it survives restarts. "Now" and "next N hours" queries are then plain
+lookups instead of repeated solar zenith / day-night factor calculations.
+
+The empirical model only depends on the UTC hour, so an hourly table gives the
+same values as calling VOACAPMUFFetcher.calculate_empirical_muf directly.
+
+NumPy is optional. When it is not installed the table is built with a Python
+loop over the same formulas.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.services.voacap_muf_fetcher import HF_BANDS, MUFPrediction, MUFSource, VOACAPMUFFetcher
+from src.utils import geodesy
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+# Region name used for predictions at the home station itself
+LOCAL_REGION = "Local"
+
+# Representative grid for each DX target region. The path MUF is evaluated at
+# the great-circle midpoint between the home grid and this grid.
+TARGET_REGIONS = {
+    "North America": "EN61",
+    "South America": "GG66",
+    "Europe": "JN58",
+    "Africa": "KG43",
+    "Asia": "PM95",
+    "Oceania": "QF56",
+}
+
+# Bump when the table layout or model changes so stale files are rebuilt
+FORECAST_FORMAT_VERSION = 1
+
+# Tables older than this many days are removed from the disk cache
+FORECAST_RETENTION_DAYS = 2
+
+HOURS_PER_DAY = 24
+
+
+class MUFForecastTable:
+    """Precomputed MUF values for one grid, SFI, K-index and UTC date"""
+
+    def __init__(
+        self,
+        home_grid: str,
+        sfi: int,
+        k_index: int,
+        day: date,
+        bands: List[str],
+        regions: List[str],
+        muf: List[List[List[float]]],
+        zenith: List[List[float]],
+    ):
+        """
+        Initialize forecast table
+
+        Args:
+            home_grid: Home station grid square
+            sfi: Solar Flux Index used for the table
+            k_index: K-Index used for the table
+            day: UTC date covered by the table
+            bands: Band names (table column order)
+            regions: Region names (table row order)
+            muf: MUF values indexed [hour][region][band] in MHz
+            zenith: Solar zenith angle at each region's control point, indexed [hour][region]
+        """
+        self.home_grid = home_grid
+        self.sfi = sfi
+        self.k_index = k_index
+        self.day = day
+        self.bands = bands
+        self.regions = regions
+        self.muf = muf
+        self.zenith = zenith
+        self._region_index = {name: i for i, name in enumerate(regions)}
+
+    def _region(self, region: str) -> int:
+        """Resolve a region name to its table index"""
+        try:
+            return self._region_index[region]
+        except KeyError:
+            raise ValueError(f"Unknown forecast region: {region}") from None
+
+    def get_muf(self, hour: int, band: str, region: str = LOCAL_REGION) -> float:
+        """
+        Look up the MUF for one band
+
+        Args:
+            hour: UTC hour (0-23)
+            band: Band name (e.g., "20m")
+            region: Target region name
+
+        Returns:
+            MUF in MHz
+        """
+        return self.muf[hour][self._region(region)][self.bands.index(band)]
+
+    def get_zenith(self, hour: int, region: str = LOCAL_REGION) -> float:
+        """
+        Look up the solar zenith angle at a region's control point
+
+        Args:
+            hour: UTC hour (0-23)
+            region: Target region name
+
+        Returns:
+            Solar zenith angle in degrees
+        """
+        return self.zenith[hour][self._region(region)]
+
+    def get_predictions(self, hour: int, region: str = LOCAL_REGION) -> Dict[str, MUFPrediction]:
+        """
+        Build band predictions for one hour from the table
+
+        Args:
+            hour: UTC hour (0-23)
+            region: Target region name
+
+        Returns:
+            Dictionary of band name -> MUFPrediction
+        """
+        row = self.muf[hour][self._region(region)]
+        return {
+            band: MUFPrediction(
+                band_name=band,
+                frequency_range=HF_BANDS[band],
+                muf_value=value,
+                confidence=0.75,
+                source=MUFSource.EMPIRICAL
+            )
+            for band, value in zip(self.bands, row)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize table for the disk cache"""
+        return {
+            "version": FORECAST_FORMAT_VERSION,
+            "home_grid": self.home_grid,
+            "sfi": self.sfi,
+            "k_index": self.k_index,
+            "date": self.day.isoformat(),
+            "bands": self.bands,
+            "regions": self.regions,
+            "muf": self.muf,
+            "zenith": self.zenith,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["MUFForecastTable"]:
+        """
+        Deserialize a table from the disk cache
+
+        Args:
+            data: Dictionary produced by to_dict()
+
+        Returns:
+            Forecast table, or None if the data is from an incompatible version
+        """
+        if data.get("version") != FORECAST_FORMAT_VERSION:
+            return None
+        if data.get("bands") != list(HF_BANDS) or data.get("regions") != [LOCAL_REGION, *TARGET_REGIONS]:
+            return None
+        return cls(
+            home_grid=data["home_grid"],
+            sfi=data["sfi"],
+            k_index=data["k_index"],
+            day=date.fromisoformat(data["date"]),
+            bands=data["bands"],
+            regions=data["regions"],
+            muf=data["muf"],
+            zenith=data["zenith"],
+        )
+
+
+class MUFForecastEngine:
+    """Build, cache and query 24-hour MUF forecast tables"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        fetcher: Optional[VOACAPMUFFetcher] = None,
+        use_numpy: Optional[bool] = None
+    ):
+        """
+        Initialize forecast engine
+
+        Args:
+            cache_dir: Directory for persisted tables. Defaults to ~/.w4gns_logger/cache/muf_forecast
+            fetcher: MUF fetcher providing the empirical model (created if not given)
+            use_numpy: Force NumPy on/off (default: use NumPy when installed)
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".w4gns_logger" / "cache" / "muf_forecast"
+        self.cache_dir = Path(cache_dir)
+        self.fetcher = fetcher if fetcher is not None else VOACAPMUFFetcher()
+
+        if use_numpy is None:
+            use_numpy = HAS_NUMPY
+        elif use_numpy and not HAS_NUMPY:
+            logger.debug("NumPy requested for MUF forecast but not installed, using Python")
+            use_numpy = False
+        self.use_numpy = use_numpy
+
+        # (grid, SFI, K, date) -> table; guarded because the widget refreshes from a worker thread
+        self._tables: Dict[Tuple[str, int, int, date], MUFForecastTable] = {}
+        self._lock = threading.Lock()
+
+    # ==================== Table Access ====================
+
+    def get_table(
+        self,
+        sfi: int,
+        k_index: int,
+        home_grid: str,
+        day: Optional[date] = None
+    ) -> MUFForecastTable:
+        """
+        Get the forecast table for a grid, SFI, K-index and UTC date
+
+        Checks memory, then the disk cache, and only builds a new table when
+        neither has one.
+
+        Args:
+            sfi: Solar Flux Index
+            k_index: K-Index
+            home_grid: Home station grid square
+            day: UTC date (defaults to today)
+
+        Returns:
+            Forecast table
+        """
+        if day is None:
+            day = datetime.now(timezone.utc).date()
+        key = (home_grid, int(sfi), int(k_index), day)
+
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                return table
+
+            table = self._load_table(*key)
+            if table is None:
+                table = self.build_table(*key)
+                self._save_table(table)
+            self._tables[key] = table
+            return table
+
+    def get_predictions(
+        self,
+        sfi: int,
+        k_index: int,
+        home_grid: str,
+        utc_time: Optional[datetime] = None,
+        region: str = LOCAL_REGION
+    ) -> Dict[str, MUFPrediction]:
+        """
+        Band predictions for a moment in time (defaults to now)
+
+        Args:
+            sfi: Solar Flux Index
+            k_index: K-Index
+            home_grid: Home station grid square
+            utc_time: UTC time (defaults to now)
+            region: Target region name
+
+        Returns:
+            Dictionary of band name -> MUFPrediction
+        """
+        utc_time = self._as_utc(utc_time)
+        table = self.get_table(sfi, k_index, home_grid, utc_time.date())
+        return table.get_predictions(utc_time.hour, region)
+
+    def get_timeline(
+        self,
+        sfi: int,
+        k_index: int,
+        home_grid: str,
+        hours: int = 6,
+        utc_time: Optional[datetime] = None,
+        region: str = LOCAL_REGION
+    ) -> List[Tuple[datetime, Dict[str, MUFPrediction]]]:
+        """
+        Band predictions for the current hour and the following hours
+
+        Crossing midnight UTC reads from the next day's table.
+
+        Args:
+            sfi: Solar Flux Index
+            k_index: K-Index
+            home_grid: Home station grid square
+            hours: Number of hours after the current one to include
+            utc_time: Start time (defaults to now)
+            region: Target region name
+
+        Returns:
+            List of (UTC hour start, predictions) tuples, current hour first
+        """
+        start = self._as_utc(utc_time).replace(minute=0, second=0, microsecond=0)
+        timeline = []
+        for offset in range(hours + 1):
+            slot = start + timedelta(hours=offset)
+            table = self.get_table(sfi, k_index, home_grid, slot.date())
+            timeline.append((slot, table.get_predictions(slot.hour, region)))
+        return timeline
+
+    def load_latest(self, home_grid: str, day: Optional[date] = None) -> Optional[MUFForecastTable]:
+        """
+        Load the most recently written table for a grid and date from disk
+
+        Lets the UI show a forecast at startup before space weather is fetched.
+
+        Args:
+            home_grid: Home station grid square
+            day: UTC date (defaults to today)
+
+        Returns:
+            Forecast table, or None if nothing is cached
+        """
+        if day is None:
+            day = datetime.now(timezone.utc).date()
+        pattern = f"{self._safe_grid(home_grid)}_*_{day.isoformat()}.json"
+        try:
+            candidates = sorted(
+                self.cache_dir.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True
+            )
+        except OSError as e:
+            logger.debug(f"Could not scan MUF forecast cache: {e}")
+            return None
+
+        for path in candidates:
+            table = self._read_file(path)
+            if table is not None and table.home_grid == home_grid:
+                return table
+        return None
+
+    def clear_memory_cache(self) -> None:
+        """Drop tables held in memory (disk cache is kept)"""
+        with self._lock:
+            self._tables.clear()
+
+    # ==================== Table Construction ====================
+
+    def build_table(self, home_grid: str, sfi: int, k_index: int, day: date) -> MUFForecastTable:
+        """
+        Compute a full 24-hour x band x region table
+
+        Args:
+            home_grid: Home station grid square
+            sfi: Solar Flux Index
+            k_index: K-Index
+            day: UTC date
+
+        Returns:
+            Forecast table
+        """
+        bands = list(HF_BANDS)
+        regions = [LOCAL_REGION, *TARGET_REGIONS]
+        points = self._control_points(home_grid)
+        freqs = [(low + high) / 2.0 for low, high in HF_BANDS.values()]
+
+        if self.use_numpy:
+            muf, zenith = self._build_numpy(sfi, k_index, day, points, freqs)
+        else:
+            muf, zenith = self._build_python(sfi, k_index, day, points, freqs)
+
+        logger.debug(
+            f"Built MUF forecast for {home_grid} on {day} (SFI={sfi}, K={k_index}): "
+            f"{HOURS_PER_DAY}h x {len(bands)} bands x {len(regions)} regions"
+        )
+        return MUFForecastTable(home_grid, sfi, k_index, day, bands, regions, muf, zenith)
+
+    def _control_points(self, home_grid: str) -> List[Tuple[float, float]]:
+        """
+        Ionospheric control point (latitude, longitude) for each region
+
+        The local point uses the same coordinates as VOACAPMUFFetcher so table
+        lookups match its direct calculations.
+        """
+        home_lat = self.fetcher._grid_to_latitude(home_grid)
+        home_lon = self.fetcher._grid_to_longitude(home_grid)
+        home_point = geodesy.grid_to_latlon(home_grid) or (home_lat, home_lon)
+
+        points = [(home_lat, home_lon)]
+        for region_grid in TARGET_REGIONS.values():
+            target = geodesy.grid_to_latlon(region_grid)
+            points.append(geodesy.midpoint(home_point[0], home_point[1], target[0], target[1]))
+        return points
+
+    def _build_python(
+        self,
+        sfi: int,
+        k_index: int,
+        day: date,
+        points: List[Tuple[float, float]],
+        freqs: List[float]
+    ) -> Tuple[List[List[List[float]]], List[List[float]]]:
+        """Build the table with the fetcher's scalar formulas"""
+        muf = []
+        zenith = []
+        for hour in range(HOURS_PER_DAY):
+            utc_time = datetime(day.year, day.month, day.day, hour, tzinfo=timezone.utc)
+            muf.append([
+                [
+                    self.fetcher.calculate_empirical_muf(
+                        sfi, k_index, lat, freq, longitude=lon, utc_time=utc_time
+                    )
+                    for freq in freqs
+                ]
+                for lat, lon in points
+            ])
+            zenith.append([
+                self.fetcher._get_solar_zenith_angle(lat, lon, utc_time) for lat, lon in points
+            ])
+        return muf, zenith
+
+    def _build_numpy(
+        self,
+        sfi: int,
+        k_index: int,
+        day: date,
+        points: List[Tuple[float, float]],
+        freqs: List[float]
+    ) -> Tuple[List[List[List[float]]], List[List[float]]]:
+        """
+        Build the table in one vectorized pass
+
+        Mirrors VOACAPMUFFetcher.calculate_empirical_muf, _get_solar_zenith_angle
+        and _get_day_night_factor over arrays shaped (hour, region, band).
+        """
+        lats = np.array([p[0] for p in points], dtype=np.float64)
+        lons = np.array([p[1] for p in points], dtype=np.float64)
+        freq = np.array(freqs, dtype=np.float64)[None, None, :]
+        hours = np.arange(HOURS_PER_DAY, dtype=np.float64)[:, None]
+
+        # Solar zenith angle, shape (hour, region)
+        day_of_year = day.timetuple().tm_yday
+        declination = 23.44 * math.sin(math.radians(360.0 * (day_of_year - 81.0) / 365.25))
+        dec_rad = math.radians(declination)
+        local_hour = (hours + lons[None, :] / 15.0) % 24.0
+        ha_rad = np.radians(15.0 * (local_hour - 12.0))
+        lat_rad = np.radians(lats)[None, :]
+        cos_zenith = np.sin(lat_rad) * math.sin(dec_rad) + np.cos(lat_rad) * math.cos(dec_rad) * np.cos(ha_rad)
+        zenith = np.degrees(np.arccos(np.clip(cos_zenith, -1.0, 1.0)))
+
+        # Day/night absorption factor, shape (hour, region, band)
+        z = zenith[:, :, None]
+        day_factor = (0.7 + (z / 90.0) * 0.3) * np.maximum(0.9, 1.0 + (freq - 14.0) / 50.0)
+        twilight_factor = 1.3 + (110.0 - z) * 0.01
+        night_factor = (0.8 + ((180.0 - z) / 70.0) * 0.4) * (
+            0.9 + np.minimum(1.0, 1.0 - (14.0 - freq) / 30.0) * 0.1
+        )
+        time_factor = np.where(z < 90.0, day_factor, np.where(z < 110.0, twilight_factor, night_factor))
+
+        # Static factors
+        base_muf = 9.0 + (sfi - 70) * 0.185
+        k_factor = self.fetcher._get_k_factor(k_index)
+        latitude_factor = np.array(
+            [self.fetcher._get_latitude_factor(lat, k_index) for lat in lats.tolist()], dtype=np.float64
+        )[None, :, None]
+        freq_factor = np.maximum(0.92, 1.0 - (freq - 3.5) / 200.0)
+
+        muf = base_muf * k_factor * latitude_factor * freq_factor * time_factor
+        muf = np.clip(muf + 0.12, 2.0, 49.9)
+
+        # Python rounding keeps values identical to the scalar model
+        muf_list = [[[round(v, 1) for v in row] for row in hour] for hour in muf.tolist()]
+        return muf_list, zenith.tolist()
+
+    # ==================== Disk Cache ====================
+
+    @staticmethod
+    def _safe_grid(home_grid: str) -> str:
+        """Grid square reduced to characters that are safe in a file name"""
+        return "".join(c for c in home_grid if c.isalnum()).upper() or "UNKNOWN"
+
+    def _table_path(self, home_grid: str, sfi: int, k_index: int, day: date) -> Path:
+        """Disk cache path for a table key"""
+        return self.cache_dir / f"{self._safe_grid(home_grid)}_{sfi}_{k_index}_{day.isoformat()}.json"
+
+    def _read_file(self, path: Path) -> Optional[MUFForecastTable]:
+        """Read a cached table file, ignoring unreadable or outdated files"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return MUFForecastTable.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable MUF forecast cache file {path}: {e}")
+            return None
+
+    def _load_table(self, home_grid: str, sfi: int, k_index: int, day: date) -> Optional[MUFForecastTable]:
+        """Load a table from the disk cache"""
+        table = self._read_file(self._table_path(home_grid, sfi, k_index, day))
+        if table is not None and table.home_grid != home_grid:
+            return None
+        if table is not None:
+            logger.debug(f"Loaded MUF forecast for {home_grid} on {day} from disk cache")
+        return table
+
+    def _save_table(self, table: MUFForecastTable) -> None:
+        """Write a table to the disk cache and prune old tables"""
+        path = self._table_path(table.home_grid, table.sfi, table.k_index, table.day)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(table.to_dict(), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write MUF forecast cache: {e}")
+            return
+
+        self._prune(table.day)
+
+    def _prune(self, today: date) -> None:
+        """Remove cached tables older than the retention window"""
+        cutoff = today - timedelta(days=FORECAST_RETENTION_DAYS)
+        try:
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    file_day = date.fromisoformat(path.stem.rsplit('_', 1)[-1])
+                except ValueError:
+                    continue
+                if file_day < cutoff:
+                    path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not prune MUF forecast cache: {e}")
+
+    @staticmethod
+    def _as_utc(utc_time: Optional[datetime]) -> datetime:
+        """Normalize a time to timezone-aware UTC (defaults to now)"""
+        if utc_time is None:
+            return datetime.now(timezone.utc)
+        if utc_time.tzinfo is None:
+            return utc_time.replace(tzinfo=timezone.utc)
+        return utc_time.astimezone(timezone.utc)
@@ -7,7 +7,7 @@ The list is fetched from: https://www.skccgroup.com/senator.txt
 
 import logging
 import csv
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from io import StringIO
 from typing import List, Dict, Optional
 from urllib.error import URLError
@@ -16,6 +16,7 @@ from src.utils.network import urlopen_with_retries as urlopen
 from sqlalchemy.orm import Session
 
 from src.database.models import SenatorMember
+from src.services.member_list_sync import MemberListChanges, MemberListSource, MemberListSync
 
 logger = logging.getLogger(__name__)
 
@@ -121,11 +122,26 @@ class SenatorFetcher:
             logger.error(f"Unexpected error parsing Senator list: {e}", exc_info=True)
             return []
 
+    @staticmethod
+    def list_sync() -> MemberListSync:
+        """Incremental sync engine for the Senator list"""
+        return MemberListSync(MemberListSource(
+            name="Senator",
+            url=SENATOR_LIST_URL,
+            table="senator_members",
+            date_column="senator_date",
+            parse=SenatorFetcher.parse_senator_list,
+            max_age_hours=SENATOR_LIST_CACHE_HOURS
+        ))
+
     @staticmethod
     def update_database(db: Session, members: List[Dict[str, str]]) -> bool:
         """
         Update the database with parsed Senator members
 
+        Only members that were added, changed or removed since the stored list
+        are written, in a single transaction.
+
         Args:
             db: SQLAlchemy database session
             members: List of parsed member dictionaries
@@ -134,90 +150,57 @@ class SenatorFetcher:
             True if update successful, False otherwise
         """
         try:
-            # Clear old list
-            old_count = db.query(SenatorMember).count()
-            db.query(SenatorMember).delete()
-            db.commit()
-            logger.info(f"Cleared {old_count} old Senator members from database")
-
-            # Insert new members
-            now = datetime.now(timezone.utc)
-            for member_data in members:
-                member = SenatorMember(
-                    rank=member_data['rank'],
-                    callsign=member_data['callsign'],
-                    skcc_number=member_data['skcc_number'],
-                    name=member_data['name'],
-                    city=member_data['city'],
-                    state=member_data['state'],
-                    country='',  # Will be determined from SKCC data
-                    senator_date=member_data['senator_date'],
-                    endorsements=member_data['endorsements'],
-                    last_list_update=now
-                )
-                db.add(member)
-
-            db.commit()
-            logger.info(f"Updated database with {len(members)} Senator members")
+            SenatorFetcher.list_sync().apply(db, members)
             return True
-
         except (ValueError, KeyError, AttributeError) as e:
             logger.error(f"Invalid member data when updating Senator database: {e}", exc_info=True)
-            db.rollback()
             return False
         except Exception as e:
             logger.error(f"Unexpected error updating Senator database: {e}", exc_info=True)
-            db.rollback()
             return False
 
     @staticmethod
-    def refresh_senator_list(db: Session, force: bool = False) -> bool:
+    def should_update(db: Session) -> bool:
+        """
+        Check if Senator list needs updating
+
+        Returns:
+            True if list hasn't been checked in the last SENATOR_LIST_CACHE_HOURS hours
+        """
+        try:
+            return SenatorFetcher.list_sync().should_update(db)
+        except Exception as e:
+            logger.error(f"Unexpected error checking Senator list age: {e}", exc_info=True)
+            return True  # Try to update on error
+
+    @staticmethod
+    def sync_senator_list(db: Session, force: bool = False) -> Optional[MemberListChanges]:
         """
-        Refresh Senator list if needed (24-hour cache)
+        Refresh the Senator list from SKCC if needed, applying only changes
 
         Args:
             db: SQLAlchemy database session
-            force: Force refresh even if cache is fresh
+            force: If True, download now regardless of age
 
         Returns:
-            True if list was refreshed or already current, False if error
+            Summary of added/updated/removed SKCC numbers (for patching member
+            caches), or None if the refresh failed
         """
-        try:
-            # Check if we need to refresh (every 24 hours)
-            last_update = db.query(SenatorMember).first()
-            if last_update and not force:
-                last_update_time = last_update.last_list_update
-                if last_update_time:
-                    if last_update_time.tzinfo is None:
-                        last_update_time = last_update_time.replace(tzinfo=timezone.utc)
-                    hours_since = (datetime.now(timezone.utc) - last_update_time).total_seconds() / 3600
-                    if hours_since < SENATOR_LIST_CACHE_HOURS:
-                        logger.debug(f"Senator list cache is fresh ({hours_since:.1f} hours old)")
-                        return True
-
-            # Fetch new list
-            raw_content = SenatorFetcher.fetch_senator_list()
-            if not raw_content:
-                logger.warning("Failed to fetch Senator list from SKCC")
-                return False
+        return SenatorFetcher.list_sync().sync(db, force=force)
 
-            # Parse and update
-            members = SenatorFetcher.parse_senator_list(raw_content)
-            if not members:
-                logger.warning("No Senator members parsed from list")
-                return False
+    @staticmethod
+    def refresh_senator_list(db: Session, force: bool = False) -> bool:
+        """
+        Refresh the Senator list from SKCC if needed
 
-            success = SenatorFetcher.update_database(db, members)
-            if success:
-                logger.info(f"Senator list refreshed: {len(members)} members")
-            return success
+        Args:
+            db: SQLAlchemy database session
+            force: If True, refresh regardless of age
 
-        except TypeError as e:
-            logger.error(f"Error refreshing Senator list - invalid date format: {e}", exc_info=True)
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error refreshing Senator list: {e}", exc_info=True)
-            return False
+        Returns:
+            True if list was updated successfully or already current, False otherwise
+        """
+        return SenatorFetcher.sync_senator_list(db, force=force) is not None
 
     @staticmethod
     def is_senator_member(db: Session, skcc_number: str) -> bool:
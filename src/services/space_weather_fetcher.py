@@ -2,15 +2,22 @@
 Space Weather Data Fetcher
 
 Retrieves current space weather conditions from NOAA SWPC for HF propagation assessment.
+
+Responses are kept in an on-disk HTTP cache with per-endpoint freshness and
+ETag/If-Modified-Since revalidation, and a full refresh fetches all endpoints
+concurrently. The last known data survives restarts and network outages.
 """
 
 import logging
-import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone, timedelta
 import json
 
+from src.utils.http_cache import HTTPDiskCache
+
 logger = logging.getLogger(__name__)
 
 # NOAA SWPC URLs (Official NOAA Space Weather Prediction Center)
@@ -33,19 +40,117 @@ GIRO_STATIONS_API = "https://prop.kc2g.com/api/stations.json"
 # Default timeout for HTTP requests
 HTTP_TIMEOUT = 10
 
+# How long a cached response is used before revalidating, in seconds
+# (roughly how often each source publishes new data). Other URLs use the
+# server's Cache-Control/Expires lifetime, or revalidate on every fetch without one.
+ENDPOINT_MAX_AGE = {
+    NOAA_SCALES: 900,
+    NOAA_KP_FORECAST: 900,
+    NOAA_F107_FLUX: 3 * 3600,
+    NOAA_SUNSPOTS: 24 * 3600,
+    NOAA_SUNSPOT_AREA: 24 * 3600,
+    HAMQSL_SOLAR_DATA: 3600,
+    HAMQSL_SOLAR_XML: 3600,
+    GIRO_STATIONS_API: 600,
+}
+
+
+def _refresh_endpoints() -> List[str]:
+    """Endpoints fetched together on a full refresh (HamQSL JSON is only a fallback)"""
+    return [NOAA_SCALES, NOAA_KP_FORECAST, NOAA_F107_FLUX, NOAA_SUNSPOTS, HAMQSL_SOLAR_XML]
+
 
 class SpaceWeatherFetcher:
     """Fetcher for NOAA space weather data"""
 
-    def __init__(self):
-        """Initialize the space weather fetcher"""
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        http_cache: Optional[HTTPDiskCache] = None,
+        offline: bool = False
+    ):
+        """
+        Initialize the space weather fetcher
+
+        Args:
+            cache_dir: Directory for cached responses. Defaults to ~/.w4gns_logger/cache/space_weather
+            http_cache: Existing response cache to share (overrides cache_dir)
+            offline: Serve only cached responses, never touching the network
+        """
         self.user_agent = 'W4GNS-Logger/1.0 (ham radio logging application)'
+        if http_cache is None:
+            if cache_dir is None:
+                cache_dir = Path.home() / ".w4gns_logger" / "cache" / "space_weather"
+            http_cache = HTTPDiskCache(cache_dir, self.user_agent, timeout=HTTP_TIMEOUT)
+        self.http_cache = http_cache
+        self.offline = offline
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _fetch_text(self, url: str, timeout: int = HTTP_TIMEOUT) -> str:
+        """Fetch a response body through the disk cache"""
+        return self.http_cache.fetch(url, ENDPOINT_MAX_AGE.get(url), timeout=timeout, offline=self.offline)
 
     def _fetch_json(self, url: str, timeout: int = HTTP_TIMEOUT) -> Any:
-        """Helper method to fetch JSON data from a URL using urllib"""
-        req = urllib.request.Request(url, headers={'User-Agent': self.user_agent})
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            return json.loads(response.read().decode('utf-8'))
+        """Helper method to fetch JSON data from a URL (cached, revalidated when stale)"""
+        return json.loads(self._fetch_text(url, timeout))
+
+    def prefetch(self, urls: Optional[List[str]] = None) -> None:
+        """
+        Fetch several endpoints concurrently to warm the cache
+
+        A refresh then costs the slowest request rather than the sum of all of
+        them; the getters below read the warmed cache.
+
+        Args:
+            urls: Endpoints to fetch (defaults to everything a full refresh needs)
+        """
+        if self.offline:
+            return
+        if urls is None:
+            urls = _refresh_endpoints()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="space-weather")
+
+        def warm(url: str) -> None:
+            try:
+                self._fetch_text(url)
+            except (urllib.error.URLError, OSError) as e:
+                logger.debug(f"Prefetch failed for {url}: {e}")
+
+        list(self._executor.map(warm, urls))
+
+    def get_all_conditions(self) -> Dict[str, Any]:
+        """
+        Get current conditions and solar data in one concurrent refresh
+
+        Returns:
+            Combined dict of get_current_conditions() and get_solar_data()
+        """
+        self.prefetch()
+        conditions = self.get_current_conditions()
+        solar = self.get_solar_data()
+        return {**(conditions or {}), **(solar or {})}
+
+    def get_last_known_conditions(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent cached conditions without touching the network
+
+        Returns:
+            Combined conditions dict built from cached responses, or None if
+            nothing has been cached yet
+        """
+        if self.http_cache.get_cached(NOAA_SCALES) is None:
+            return None
+        snapshot = SpaceWeatherFetcher(http_cache=self.http_cache, offline=True)
+        conditions = snapshot.get_current_conditions()
+        solar = snapshot.get_solar_data()
+        return {**(conditions or {}), **(solar or {})}
+
+    def close(self) -> None:
+        """Shut down the request thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     def get_current_conditions(self) -> Dict[str, Any]:
         """
@@ -276,9 +381,7 @@ class SpaceWeatherFetcher:
             # Get current sunspot count from HamQSL XML
             try:
                 logger.debug("Fetching sunspot data from HamQSL XML...")
-                req = urllib.request.Request(HAMQSL_SOLAR_XML, headers={'User-Agent': self.user_agent})
-                with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT) as response:
-                    response_text = response.read().decode('utf-8')
+                response_text = self._fetch_text(HAMQSL_SOLAR_XML)
 
                 # Parse XML response - structure is <solar><solardata><sunspots>
                 root = ET.fromstring(response_text)
@@ -7,7 +7,7 @@ The list is fetched from: https://www.skccgroup.com/tribunelist.txt
 
 import logging
 import csv
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from io import StringIO
 from typing import List, Dict, Optional
 from urllib.error import URLError
@@ -16,6 +16,7 @@ from src.utils.network import urlopen_with_retries as urlopen
 from sqlalchemy.orm import Session
 
 from src.database.models import TribuneeMember
+from src.services.member_list_sync import MemberListChanges, MemberListSource, MemberListSync
 
 logger = logging.getLogger(__name__)
 
@@ -120,11 +121,26 @@ class TribuneFetcher:
             logger.error(f"Unexpected error parsing Tribune list: {e}", exc_info=True)
             return []
 
+    @staticmethod
+    def list_sync() -> MemberListSync:
+        """Incremental sync engine for the Tribune list"""
+        return MemberListSync(MemberListSource(
+            name="Tribune",
+            url=TRIBUNE_LIST_URL,
+            table="tribune_members",
+            date_column="tribune_date",
+            parse=TribuneFetcher.parse_tribune_list,
+            max_age_hours=TRIBUNE_LIST_CACHE_HOURS
+        ))
+
     @staticmethod
     def update_database(db: Session, members: List[Dict[str, str]]) -> bool:
         """
         Update the database with parsed Tribune members
 
+        Only members that were added, changed or removed since the stored list
+        are written, in a single transaction.
+
         Args:
             db: SQLAlchemy database session
             members: List of parsed member dictionaries
@@ -133,42 +149,13 @@ class TribuneFetcher:
             True if update successful, False otherwise
         """
         try:
-            # Clear old list
-            old_count = db.query(TribuneeMember).count()
-            db.query(TribuneeMember).delete()
-            db.commit()
-            logger.info(f"Cleared {old_count} old Tribune members from database")
-
-            # Insert new members
-            now = datetime.now(timezone.utc)
-            for member_data in members:
-                member = TribuneeMember(
-                    rank=member_data['rank'],
-                    callsign=member_data['callsign'],
-                    skcc_number=member_data['skcc_number'],
-                    name=member_data['name'],
-                    city=member_data['city'],
-                    state=member_data['state'],
-                    country='',  # Will be determined from SKCC data
-                    tribune_date=member_data['tribune_date'],
-                    endorsements=member_data['endorsements'],
-                    last_list_update=now
-                )
-                db.add(member)
-
-            db.commit()
-            logger.info(f"Updated database with {len(members)} Tribune members")
+            TribuneFetcher.list_sync().apply(db, members)
             return True
-
         except (ValueError, KeyError, AttributeError) as e:
-            # Validation error in member data
             logger.error(f"Invalid member data when updating Tribune database: {e}", exc_info=True)
-            db.rollback()
             return False
         except Exception as e:
-            # Database or other errors
             logger.error(f"Unexpected error updating Tribune database: {e}", exc_info=True)
-            db.rollback()
             return False
 
     @staticmethod
@@ -177,82 +164,42 @@ class TribuneFetcher:
         Check if Tribune list needs updating
 
         Returns:
-            True if list hasn't been updated in the last 24 hours
+            True if list hasn't been checked in the last TRIBUNE_LIST_CACHE_HOURS hours
         """
         try:
-            latest_member = db.query(TribuneeMember).order_by(
-                TribuneeMember.last_list_update.desc()
-            ).first()
-
-            if not latest_member:
-                logger.info("No Tribune members in database, update needed")
-                return True
-
-            last_update = latest_member.last_list_update
-            # Ensure last_update is timezone-aware for comparison
-            if last_update.tzinfo is None:
-                last_update = last_update.replace(tzinfo=timezone.utc)
-            age = datetime.now(timezone.utc) - last_update
-            should_update = age > timedelta(hours=TRIBUNE_LIST_CACHE_HOURS)
-
-            if should_update:
-                logger.info(f"Tribune list is {age.total_seconds() / 3600:.1f} hours old, update needed")
-            else:
-                hours_remaining = (timedelta(hours=TRIBUNE_LIST_CACHE_HOURS) - age).total_seconds() / 3600
-                logger.info(f"Tribune list is current (update in {hours_remaining:.1f} hours)")
-
-            return should_update
-
-        except TypeError as e:
-            # Type error in datetime comparison
-            logger.error(f"Error checking Tribune list age - invalid date format: {e}", exc_info=True)
-            return True  # Try to update on error
+            return TribuneFetcher.list_sync().should_update(db)
         except Exception as e:
             logger.error(f"Unexpected error checking Tribune list age: {e}", exc_info=True)
             return True  # Try to update on error
 
     @staticmethod
-    def refresh_tribune_list(db: Session, force: bool = False) -> bool:
+    def sync_tribune_list(db: Session, force: bool = False) -> Optional[MemberListChanges]:
         """
-        Refresh the Tribune list from SKCC if needed
+        Refresh the Tribune list from SKCC if needed, applying only changes
 
         Args:
             db: SQLAlchemy database session
-            force: If True, refresh regardless of age
+            force: If True, download now regardless of age
 
         Returns:
-            True if list was updated successfully, False otherwise
+            Summary of added/updated/removed SKCC numbers (for patching member
+            caches), or None if the refresh failed
         """
-        try:
-            if not force and not TribuneFetcher.should_update(db):
-                logger.debug("Tribune list is current, skipping update")
-                return True
-
-            logger.info("Starting Tribune list refresh")
-            raw_content = TribuneFetcher.fetch_tribune_list()
+        return TribuneFetcher.list_sync().sync(db, force=force)
 
-            if not raw_content:
-                logger.error("Failed to fetch Tribune list, update aborted")
-                return False
-
-            members = TribuneFetcher.parse_tribune_list(raw_content)
-
-            if not members:
-                logger.error("Failed to parse Tribune list, update aborted")
-                return False
-
-            success = TribuneFetcher.update_database(db, members)
-
-            if success:
-                logger.info("Tribune list refresh completed successfully")
-            else:
-                logger.error("Failed to update Tribune database")
+    @staticmethod
+    def refresh_tribune_list(db: Session, force: bool = False) -> bool:
+        """
+        Refresh the Tribune list from SKCC if needed
 
-            return success
+        Args:
+            db: SQLAlchemy database session
+            force: If True, refresh regardless of age
 
-        except Exception as e:
-            logger.error(f"Unexpected error during Tribune list refresh: {e}", exc_info=True)
-            return False
+        Returns:
+            True if list was updated successfully or already current, False otherwise
+        """
+        return TribuneFetcher.sync_tribune_list(db, force=force) is not None
 
     @staticmethod
     def is_tribune_member(db: Session, skcc_number: str) -> bool:
@@ -14,12 +14,14 @@ import urllib.request
 import urllib.error
 import math
 from datetime import datetime, timezone, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 import hashlib
 import json
 
 from src.services.space_weather_fetcher import SpaceWeatherFetcher
+from src.utils import geodesy
 
 logger = logging.getLogger(__name__)
 
@@ -84,8 +86,14 @@ class VOACAPMUFFetcher:
     # 24-hour cache TTL for band predictions (86400 seconds)
     PREDICTION_CACHE_TTL_SECONDS = 86400
 
-    def __init__(self):
-        """Initialize VOACAP MUF fetcher with GIRO real-time data support and prediction caching"""
+    def __init__(self, forecast_cache_dir: Optional[Path] = None):
+        """
+        Initialize VOACAP MUF fetcher with GIRO real-time data support and prediction caching
+
+        Args:
+            forecast_cache_dir: Directory for persisted 24-hour forecast tables
+                (defaults to ~/.w4gns_logger/cache/muf_forecast)
+        """
         self.user_agent = 'W4GNS-Logger/1.0 (ham radio logging application)'
         self.last_update = None
         # Cache key -> (predictions dict, timestamp) for O(1) prediction lookups
@@ -96,6 +104,23 @@ class VOACAPMUFFetcher:
         self.giro_data = None
         self.giro_data_time = None
 
+        # Lazy-initialize 24-hour forecast tables (empirical predictions become lookups)
+        self.forecast_cache_dir = forecast_cache_dir
+        self.forecast_engine = None
+
+    def get_forecast_engine(self):
+        """
+        Get the 24-hour MUF forecast engine, creating it on first use
+
+        Returns:
+            MUFForecastEngine sharing this fetcher's empirical model
+        """
+        if self.forecast_engine is None:
+            # Imported here: muf_forecast builds on this module
+            from src.services.muf_forecast import MUFForecastEngine
+            self.forecast_engine = MUFForecastEngine(cache_dir=self.forecast_cache_dir, fetcher=self)
+        return self.forecast_engine
+
     def _generate_prediction_cache_key(
         self,
         sfi: int,
@@ -264,6 +289,73 @@ class VOACAPMUFFetcher:
             logger.debug(f"Error calculating day/night factor: {e}")
             return 1.0
 
+    @staticmethod
+    def _get_k_factor(k_index: int) -> float:
+        """
+        Get geomagnetic disturbance correction for the MUF
+
+        Args:
+            k_index: Geomagnetic K-Index (0-9)
+
+        Returns:
+            MUF multiplier (1.05 when quiet, decreasing with disturbance)
+        """
+        # K=0-3: Normal conditions, slight boost
+        # K=4-6: Degraded, slight reduction
+        # K=7-9: Very poor, significant reduction
+        if k_index <= 3:
+            return 1.05  # Slight improvement
+        elif k_index <= 6:
+            return 1.0 - (k_index - 3) * 0.05  # 5% reduction per step
+        else:
+            return 0.80 - (k_index - 7) * 0.08  # More aggressive reduction
+
+    @staticmethod
+    def _get_latitude_factor(latitude: float, k_index: int) -> float:
+        """
+        Get ionospheric latitude-zone correction for the MUF
+
+        This is crucial for accuracy across different regions of the globe.
+
+        Args:
+            latitude: Latitude of the ionospheric control point in degrees
+            k_index: Geomagnetic K-Index (high latitudes degrade faster in storms)
+
+        Returns:
+            MUF multiplier
+        """
+        abs_lat = abs(latitude)
+
+        if abs_lat < 10:
+            # EQUATORIAL REGION (0-10°): Lower MUF, Spread-F effects, less reliable
+            # More absorption, different ionospheric layer heights
+            latitude_factor = 0.85 - (5 - abs_lat) * 0.02
+        elif abs_lat < 20:
+            # LOW EQUATORIAL (10-20°): Transitioning to better propagation
+            latitude_factor = 0.88 + (abs_lat - 10) * 0.008
+        elif abs_lat < 35:
+            # LOW MID-LATITUDE (20-35°): Good propagation
+            latitude_factor = 0.94 + (abs_lat - 20) * 0.005
+        elif abs_lat < 55:
+            # MID-LATITUDE (35-55°): OPTIMAL - most stable, best for DX
+            # This is the reference region for standard propagation models
+            latitude_factor = 1.0 + (abs_lat - 35) * 0.002
+        elif abs_lat < 70:
+            # HIGH LATITUDE (55-70°): Auroral effects, more variable
+            # Stronger K-index dependence, lower average MUF during storms
+            latitude_factor = 1.02 - (abs_lat - 55) * 0.012
+            # Apply additional K-index penalty at high latitudes
+            if k_index > 5:
+                latitude_factor *= (1.0 - (k_index - 5) * 0.08)
+        else:
+            # POLAR REGION (>70°): Extreme auroral effects, unreliable
+            # Special aurora-dependent behavior
+            latitude_factor = 0.70
+            if k_index >= 6:
+                latitude_factor *= 0.70  # Severe degradation during storms
+
+        return latitude_factor
+
     def get_giro_muf(self, latitude: float, longitude: float, frequency_mhz: float = 14.0) -> Optional[float]:
         """
         Get real-time MUF from GIRO ionosondes (MOST ACCURATE).
@@ -398,47 +490,10 @@ class VOACAPMUFFetcher:
             base_muf = 9.0 + (sfi - 70) * 0.185
 
             # K-Index correction (negative effects from geomagnetic disturbance)
-            # K=0-3: Normal conditions, slight boost
-            # K=4-6: Degraded, slight reduction
-            # K=7-9: Very poor, significant reduction
-            if k_index <= 3:
-                k_factor = 1.05  # Slight improvement
-            elif k_index <= 6:
-                k_factor = 1.0 - (k_index - 3) * 0.05  # 5% reduction per step
-            else:
-                k_factor = 0.80 - (k_index - 7) * 0.08  # More aggressive reduction
+            k_factor = self._get_k_factor(k_index)
 
             # Latitude correction - accounts for ionospheric characteristics by latitude zone
-            # This is crucial for accuracy across different regions of the globe
-            abs_lat = abs(latitude)
-
-            if abs_lat < 10:
-                # EQUATORIAL REGION (0-10°): Lower MUF, Spread-F effects, less reliable
-                # More absorption, different ionospheric layer heights
-                latitude_factor = 0.85 - (5 - abs_lat) * 0.02
-            elif abs_lat < 20:
-                # LOW EQUATORIAL (10-20°): Transitioning to better propagation
-                latitude_factor = 0.88 + (abs_lat - 10) * 0.008
-            elif abs_lat < 35:
-                # LOW MID-LATITUDE (20-35°): Good propagation
-                latitude_factor = 0.94 + (abs_lat - 20) * 0.005
-            elif abs_lat < 55:
-                # MID-LATITUDE (35-55°): OPTIMAL - most stable, best for DX
-                # This is the reference region for standard propagation models
-                latitude_factor = 1.0 + (abs_lat - 35) * 0.002
-            elif abs_lat < 70:
-                # HIGH LATITUDE (55-70°): Auroral effects, more variable
-                # Stronger K-index dependence, lower average MUF during storms
-                latitude_factor = 1.02 - (abs_lat - 55) * 0.012
-                # Apply additional K-index penalty at high latitudes
-                if k_index > 5:
-                    latitude_factor *= (1.0 - (k_index - 5) * 0.08)
-            else:
-                # POLAR REGION (>70°): Extreme auroral effects, unreliable
-                # Special aurora-dependent behavior
-                latitude_factor = 0.70
-                if k_index >= 6:
-                    latitude_factor *= 0.70  # Severe degradation during storms
+            latitude_factor = self._get_latitude_factor(latitude, k_index)
 
             # Frequency-dependent attenuation factor
             # Updated: Less aggressive reduction for higher frequencies
@@ -485,7 +540,8 @@ class VOACAPMUFFetcher:
         Results cached for 24 hours for O(1) lookup performance.
 
         Uses real-time GIRO ionospheric measurements when available (MOST ACCURATE),
-        falls back to empirical SFI+K-index formula if GIRO unavailable.
+        falls back to empirical SFI+K-index formula if GIRO unavailable. Empirical
+        predictions for the home grid are read from the 24-hour forecast table.
 
         Args:
             sfi: Solar Flux Index (70-300)
@@ -500,6 +556,9 @@ class VOACAPMUFFetcher:
             Dictionary of band name -> MUFPrediction
         """
         try:
+            # Forecast tables cover the home grid location with the time factor applied
+            use_forecast = include_time_factor and latitude is None and longitude is None
+
             # Derive latitude/longitude from grid square if not provided
             if latitude is None:
                 latitude = self._grid_to_latitude(home_grid)
@@ -520,6 +579,13 @@ class VOACAPMUFFetcher:
             if giro_muf is not None:
                 muf_source = MUFSource.GIRO
                 logger.info(f"Using GIRO-measured base MUF: {giro_muf:.1f} MHz")
+            elif use_forecast:
+                # Hourly table lookup; not stored in the 24-hour cache so it follows the clock
+                predictions = self.get_forecast_engine().get_predictions(
+                    sfi, k_index, home_grid, utc_time=utc_time
+                )
+                logger.debug(f"MUF predictions from forecast table (SFI={sfi}, K={k_index})")
+                return predictions
 
             for band_name, (min_freq, max_freq) in HF_BANDS.items():
                 # Use center frequency for calculation
@@ -691,8 +757,9 @@ class VOACAPMUFFetcher:
             local_time = datetime.now().astimezone()  # Timezone-aware local time
             utc_time = local_time.astimezone(timezone.utc)  # Convert to UTC
 
-            # Get solar zenith angle for time period identification
-            zenith_angle = self._get_solar_zenith_angle(latitude, longitude, utc_time)
+            # Get solar zenith angle for time period identification (precomputed per hour)
+            table = self.get_forecast_engine().get_table(sfi, k_index, home_grid, utc_time.date())
+            zenith_angle = table.get_zenith(utc_time.hour)
 
             # Determine time period
             if zenith_angle < 90.0:
@@ -925,7 +992,7 @@ class VOACAPMUFFetcher:
         """
         Calculate approximate distance between two grid squares
 
-        Uses simplified great-circle distance formula
+        Uses the memoized great-circle calculation in src.utils.geodesy
 
         Args:
             grid1: Source Maidenhead grid square
@@ -934,22 +1001,15 @@ class VOACAPMUFFetcher:
         Returns:
             Distance in kilometers
         """
-        import math
-
-        lat1 = math.radians(cls._grid_to_latitude(grid1))
-        lon1 = math.radians(cls._grid_to_longitude(grid1))
-        lat2 = math.radians(cls._grid_to_latitude(grid2))
-        lon2 = math.radians(cls._grid_to_longitude(grid2))
-
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-
-        a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-        c = 2 * math.asin(math.sqrt(a))
-        r = 6371  # Earth radius in km
+        distance = geodesy.grid_distance_km(grid1, grid2)
+        if distance is not None:
+            return distance
 
-        return c * r
+        # Malformed grid: fall back to the coarse field-level estimate
+        return geodesy.haversine_km(
+            cls._grid_to_latitude(grid1), cls._grid_to_longitude(grid1),
+            cls._grid_to_latitude(grid2), cls._grid_to_longitude(grid2)
+        )
 
     @classmethod
     def _grid_bearing(cls, grid1: str, grid2: str) -> float:
@@ -963,23 +1023,15 @@ class VOACAPMUFFetcher:
         Returns:
             Bearing in degrees (0-360)
         """
-        import math
-
-        lat1 = math.radians(cls._grid_to_latitude(grid1))
-        lon1 = math.radians(cls._grid_to_longitude(grid1))
-        lat2 = math.radians(cls._grid_to_latitude(grid2))
-        lon2 = math.radians(cls._grid_to_longitude(grid2))
-
-        dlon = lon2 - lon1
-
-        x = math.sin(dlon) * math.cos(lat2)
-        y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
-
-        bearing = math.atan2(x, y)
-        bearing = math.degrees(bearing)
-        bearing = (bearing + 360) % 360
-
-        return bearing
+        bearing = geodesy.grid_bearing(grid1, grid2)
+        if bearing is not None:
+            return bearing
+
+        # Malformed grid: fall back to the coarse field-level estimate
+        return geodesy.initial_bearing(
+            cls._grid_to_latitude(grid1), cls._grid_to_longitude(grid1),
+            cls._grid_to_latitude(grid2), cls._grid_to_longitude(grid2)
+        )
 
     def get_color_for_muf(self, prediction: MUFPrediction) -> str:
         """
@@ -6,10 +6,14 @@ SKCC Skimmer analyzes user's ADIF file and goals/targets to provide
 relevant spot recommendations.
 """
 
-from .skcc_skimmer_subprocess import SkccSkimmerSubprocess, SkimmerConnectionState, SKCCSpot
+from .skcc_skimmer_subprocess import SkccSkimmerSubprocess, SkimmerConnectionState, SKCCSpot, parse_spot_line
+from .spot_aggregator import SpotAggregator, SpotCluster
 
 __all__ = [
     "SkccSkimmerSubprocess",
     "SkimmerConnectionState",
     "SKCCSpot",
+    "parse_spot_line",
+    "SpotAggregator",
+    "SpotCluster",
 ]
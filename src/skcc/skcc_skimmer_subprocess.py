@@ -10,6 +10,7 @@ import logging
 import subprocess
 import threading
 import re
+from collections import deque
 from pathlib import Path
 from typing import Optional, Callable, List
 from datetime import datetime, timezone
@@ -18,6 +19,31 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+DIAGNOSTIC_LINE_COUNT = 50  # Recent console lines kept for troubleshooting
+
+# Status/info messages that share the spot line's time prefix
+NON_SPOT_KEYWORDS = (
+    "connected", "running", "retrieving", "reading", "processing", "found", "finding",
+    "goals", "targets", "bands", "progress", "qualifies", "requires", "award", "rosters",
+    "centurion", "tribune", "senator", "page", "sked", "rrn", "version", "cfg",
+)
+
+# Classifies a console line and extracts its fields in one match.
+# Formats:
+# - RBN: "HH:MM:SS ± CALLSIGN (SKCC#) on FREQUENCY MHz MODE"
+# - Sked: "HHMM[Z] CALLSIGN (SKCC#) TEXT"
+# Each optional field sits in its own lookahead, so fields may appear in any order.
+SPOT_LINE_PATTERN = re.compile(
+    r"^(?!(?i:.*(?:" + "|".join(NON_SPOT_KEYWORDS) + r")))"
+    r"(?:\d{1,2}:\d{2}:\d{2}|\d{3,4}Z?)"
+    r"(?=(?:.*?\((?P<skcc>\d+[A-Z]*)\))?)"
+    r"(?=(?:.*?(?P<freq>\d+[.,]?\d*)\s*(?P<unit>kHz|MHz))?)"
+    r"(?=(?:.*?\b(?P<mode>(?i:CW|SSB|LSB|USB|FM|RTTY|FT8|FT4))\b)?)"
+    r"(?=(?:.*?(?P<strength>\d+)\s*dB)?)"
+    r"(?=(?:.*?(?P<speed>\d+)\s*WPM)?)"
+    r".*?\s(?P<callsign>[A-Z0-9]{2,})\s"
+)
+
 
 @dataclass
 class SKCCSpot:
@@ -33,6 +59,49 @@ class SKCCSpot:
     timestamp: datetime
     is_skcc: bool = True
     skcc_number: Optional[str] = None
+    continent: Optional[str] = None  # Filled in by the spot worker (None = derive from callsign)
+
+
+def parse_spot_line(line: str) -> Optional[SKCCSpot]:
+    """
+    Parse one SKCC Skimmer console line into a spot
+
+    Args:
+        line: Console line with surrounding whitespace removed
+
+    Returns:
+        SKCCSpot, or None if the line is not a spot (status message, or neither
+        frequency nor SKCC number)
+    """
+    match = SPOT_LINE_PATTERN.match(line)
+    if not match:
+        return None
+
+    freq, skcc_number = match.group("freq", "skcc")
+    if freq:
+        freq_mhz = float(freq.replace(",", "."))
+        if match.group("unit") == "kHz":
+            freq_mhz = freq_mhz / 1000
+    elif skcc_number:
+        freq_mhz = 0.0  # Sked entries have no frequency
+    else:
+        return None
+
+    mode = (match.group("mode") or "CW").upper()
+    strength = match.group("strength")
+    speed = match.group("speed")
+    return SKCCSpot(
+        callsign=match.group("callsign"),
+        frequency=freq_mhz,
+        mode=mode,
+        grid=None,
+        reporter="SKCC_Skimmer",
+        strength=int(strength) if strength else 0,
+        speed=int(speed) if speed and mode == "CW" else None,
+        timestamp=datetime.now(timezone.utc),
+        is_skcc=True,
+        skcc_number=skcc_number,
+    )
 
 
 class SkimmerConnectionState(Enum):
@@ -68,9 +137,10 @@ class SkccSkimmerSubprocess:
         self.state = SkimmerConnectionState.DISCONNECTED
         self._reader_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._recent_lines: deque = deque(maxlen=DIAGNOSTIC_LINE_COUNT)
 
-        # Callbacks
-        self.on_spot: Optional[Callable[[str], None]] = None
+        # Callbacks (on_spot runs on the reader thread)
+        self.on_spot: Optional[Callable[[SKCCSpot], None]] = None
         self.on_state_change: Optional[Callable[[SkimmerConnectionState], None]] = None
 
     @staticmethod
@@ -118,7 +188,7 @@ class SkccSkimmerSubprocess:
 
     def set_callbacks(
         self,
-        on_spot: Optional[Callable[[str], None]] = None,
+        on_spot: Optional[Callable[[SKCCSpot], None]] = None,
         on_state_change: Optional[Callable[[SkimmerConnectionState], None]] = None,
     ) -> None:
         """Set callbacks for events"""
@@ -307,31 +377,39 @@ class SkccSkimmerSubprocess:
         logger.info("SKCC Skimmer subprocess stopped")
 
     def _read_output(self) -> None:
-        """Read SKCC Skimmer's console output in background thread"""
+        """
+        Read SKCC Skimmer's console output in background thread
+
+        Only the last DIAGNOSTIC_LINE_COUNT lines are kept, so memory stays flat
+        over long sessions. Spot lines are parsed here and passed to on_spot as
+        SKCCSpot objects.
+        """
         if not self.process or not self.process.stdout:
             return
 
+        line_count = 0
+        spot_count = 0
+        recent_lines = self._recent_lines
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            line_count = 0
-            spot_count = 0
-            all_lines = []
             for line in iter(self.process.stdout.readline, ""):
                 if self._stop_event.is_set():
                     break
 
-                if not line.strip():
+                line = line.strip()
+                if not line:
                     continue
 
                 line_count += 1
-                all_lines.append(line.strip())
-                logger.info(f"[SKCC LINE {line_count}] {line.strip()}")
+                recent_lines.append(line)
+                if debug:
+                    logger.debug(f"[SKCC LINE {line_count}] {line}")
 
-                # Check if this is a spot line
-                if self._is_spot_line(line):
+                spot = parse_spot_line(line)
+                if spot is not None:
                     spot_count += 1
-                    logger.info(f"[SPOT #{spot_count}] {line.strip()}")
                     if self.on_spot:
-                        self.on_spot(line.strip())
+                        self.on_spot(spot)
 
         except Exception as e:
             logger.error(f"Error reading SKCC Skimmer output: {e}")
@@ -339,15 +417,19 @@ class SkccSkimmerSubprocess:
         finally:
             logger.info(f"[SKCC SUMMARY] Received {line_count} lines, {spot_count} spots detected")
             if line_count > 0 and spot_count == 0:
-                logger.warning(f"[DEBUG] Sample lines (first 3):")
-                for i, line in enumerate(all_lines[:3], 1):
-                    logger.warning(f"  Line {i}: {line}")
+                logger.warning("No spots recognized, last lines received:")
+                for line in list(recent_lines)[-3:]:
+                    logger.warning(f"  {line}")
             if self.process and self.process.poll() is None:
                 try:
                     self.process.wait(timeout=2)
                 except subprocess.TimeoutExpired:
                     self.process.kill()
 
+    def recent_output(self) -> List[str]:
+        """Most recent console lines (oldest first), for diagnostics"""
+        return list(self._recent_lines)
+
     @staticmethod
     def _is_spot_line(line: str) -> bool:
         """
@@ -357,50 +439,7 @@ class SkccSkimmerSubprocess:
         - RBN: "HH:MM:SS ± CALLSIGN (SKCC#) on FREQUENCY MHz MODE"
         - Sked: "HHMM[Z] CALLSIGN (SKCC#) TEXT"
         """
-        if not line or len(line) < 6:
-            return False
-
-        # Time can be HH:MM:SS or HHMM format
-        time_pattern = r"^\d{1,2}:\d{2}:\d{2}|^\d{3,4}Z?"
-        if not re.match(time_pattern, line):
-            return False
-
-        # Must have a callsign (2+ alphanumeric)
-        if not re.search(r"\s([A-Z0-9]{2,})\s", line):
-            return False
-
-        # Skip non-spot lines (status/info messages)
-        non_spot_keywords = [
-            "connected",
-            "running",
-            "retrieving",
-            "reading",
-            "processing",
-            "found",
-            "finding",
-            "goals",
-            "targets",
-            "bands",
-            "progress",
-            "qualifies",
-            "requires",
-            "award",
-            "rosters",
-            "centurion",
-            "tribune",
-            "senator",
-            "page",
-            "sked",
-            "rrn",
-            "version",
-            "cfg",
-        ]
-        line_lower = line.lower()
-        for keyword in non_spot_keywords:
-            if keyword in line_lower:
-                return False
-
-        return True
+        return SPOT_LINE_PATTERN.match(line) is not None
 
     def _set_state(self, state: SkimmerConnectionState) -> None:
         """Update connection state and call callback"""
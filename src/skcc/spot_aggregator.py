@@ -0,0 +1,221 @@
+"""
+Spot Consensus Aggregator
+
+Merges reports of the same signal from many skimmers into one cluster:
+- Reports match a cluster by callsign and frequency (within a tolerance)
+- Each cluster keeps the latest report per reporter inside a sliding window,
+  and derives reporter count, best/median SNR, WPM and first/last-seen time
+- Clusters are updated in place, so the spots table shows one row per signal
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from statistics import median
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOLERANCE_KHZ = 0.5
+DEFAULT_WINDOW_SECONDS = 600  # A signal not reported for this long is dropped
+DEFAULT_MAX_CLUSTERS = 200
+
+
+class SpotReport:
+    """One reporter's latest observation of a signal"""
+
+    __slots__ = ("frequency", "strength", "speed", "timestamp")
+
+    def __init__(self, frequency: float, strength: int, speed: Optional[int], timestamp: datetime):
+        self.frequency = frequency
+        self.strength = strength
+        self.speed = speed
+        self.timestamp = timestamp
+
+
+class SpotCluster:
+    """
+    One active signal heard by one or more reporters
+
+    Exposes the same attributes as SKCCSpot (callsign, frequency, mode, grid,
+    reporter, strength, speed, timestamp, is_skcc, skcc_number, continent), so it can be
+    displayed and filtered like a single spot. strength is the best SNR,
+    reporter the reporter that heard it best and timestamp the last report.
+    """
+
+    def __init__(self, spot: Any):
+        """
+        Start a cluster from its first report
+
+        Args:
+            spot: SKCCSpot (or any object with the same attributes)
+        """
+        self.callsign = spot.callsign.upper()
+        self.mode = spot.mode
+        self.grid = spot.grid
+        self.is_skcc = getattr(spot, "is_skcc", bool(spot.skcc_number))
+        self.skcc_number = spot.skcc_number
+        self.continent = getattr(spot, "continent", None)
+        self.first_seen = spot.timestamp
+        self.reports: Dict[str, SpotReport] = {}
+        self.frequency = spot.frequency
+        self.reporter = spot.reporter
+        self.strength = spot.strength
+        self.median_strength: float = spot.strength
+        self.speed = spot.speed
+        self.timestamp = spot.timestamp
+        self.add(spot)
+
+    @property
+    def last_seen(self) -> datetime:
+        """Time of the most recent report"""
+        return self.timestamp
+
+    @property
+    def reporter_count(self) -> int:
+        """Number of distinct reporters in the window"""
+        return len(self.reports)
+
+    def add(self, spot: Any) -> None:
+        """Record a report (replacing the reporter's previous one) and refresh the summary"""
+        self.reports[spot.reporter] = SpotReport(spot.frequency, spot.strength, spot.speed, spot.timestamp)
+        if spot.timestamp > self.timestamp:
+            self.timestamp = spot.timestamp
+        if spot.skcc_number and not self.skcc_number:
+            self.skcc_number = spot.skcc_number
+            self.is_skcc = True
+        if spot.grid and not self.grid:
+            self.grid = spot.grid
+        self._summarize()
+
+    def prune(self, cutoff: datetime) -> bool:
+        """
+        Drop reports older than cutoff
+
+        Returns:
+            True if any reports remain
+        """
+        stale = [reporter for reporter, report in self.reports.items() if report.timestamp < cutoff]
+        for reporter in stale:
+            del self.reports[reporter]
+        if stale and self.reports:
+            self._summarize()
+        return bool(self.reports)
+
+    def _summarize(self) -> None:
+        """Recompute the displayed values from the current reports"""
+        reports = self.reports
+        best_reporter, best = max(reports.items(), key=lambda item: item[1].strength)
+        self.reporter = best_reporter
+        self.strength = best.strength
+        self.median_strength = median(r.strength for r in reports.values())
+        self.frequency = round(median(r.frequency for r in reports.values()), 4)
+        speeds = [r.speed for r in reports.values() if r.speed]
+        self.speed = round(median(speeds)) if speeds else None
+
+    def __repr__(self) -> str:
+        return (f"SpotCluster({self.callsign} {self.frequency:.3f} heard by {self.reporter_count}, "
+                f"best {self.strength} dB)")
+
+
+class SpotAggregator:
+    """Clusters spot reports by callsign and frequency within a sliding window"""
+
+    def __init__(
+        self,
+        tolerance_khz: float = DEFAULT_TOLERANCE_KHZ,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_clusters: int = DEFAULT_MAX_CLUSTERS,
+    ):
+        """
+        Initialize aggregator
+
+        Args:
+            tolerance_khz: Maximum distance from a cluster's frequency to join it
+            window_seconds: How long reports (and clusters without reports) are kept
+            max_clusters: Oldest clusters are dropped beyond this many
+        """
+        # Epsilon keeps the boundary inclusive (RBN reports in 0.1 kHz steps)
+        self.tolerance_mhz = tolerance_khz / 1000.0 + 1e-9
+        self.window = timedelta(seconds=window_seconds)
+        self.max_clusters = max_clusters
+        self._by_callsign: Dict[str, List[SpotCluster]] = {}
+        self._count = 0
+
+    def add(self, spot: Any) -> Tuple[SpotCluster, bool]:
+        """
+        Merge a report into its cluster, creating one if needed
+
+        Args:
+            spot: SKCCSpot (or any object with the same attributes)
+
+        Returns:
+            (cluster, created)
+        """
+        callsign = spot.callsign.upper()
+        clusters = self._by_callsign.setdefault(callsign, [])
+        cutoff = spot.timestamp - self.window
+
+        match = None
+        for cluster in clusters:
+            if (cluster.timestamp >= cutoff
+                    and abs(cluster.frequency - spot.frequency) <= self.tolerance_mhz):
+                match = cluster
+                break
+
+        if match is not None:
+            match.prune(cutoff)
+            match.add(spot)
+            return match, False
+
+        cluster = SpotCluster(spot)
+        clusters.append(cluster)
+        self._count += 1
+        if self._count > self.max_clusters:
+            self._drop_oldest(self._count - self.max_clusters)
+        return cluster, True
+
+    def expire(self, now: Optional[datetime] = None) -> int:
+        """
+        Drop stale reports and clusters that no longer have any
+
+        Args:
+            now: Current time (defaults to UTC now)
+
+        Returns:
+            Number of clusters removed
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - self.window
+        removed = 0
+        for callsign in list(self._by_callsign):
+            clusters = self._by_callsign[callsign]
+            kept = [c for c in clusters if c.prune(cutoff)]
+            removed += len(clusters) - len(kept)
+            if kept:
+                self._by_callsign[callsign] = kept
+            else:
+                del self._by_callsign[callsign]
+        self._count -= removed
+        return removed
+
+    def clusters(self) -> List[SpotCluster]:
+        """Active clusters, most recently heard first"""
+        result = [c for clusters in self._by_callsign.values() for c in clusters]
+        result.sort(key=lambda c: c.timestamp, reverse=True)
+        return result
+
+    def clear(self) -> None:
+        """Forget all clusters"""
+        self._by_callsign.clear()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _drop_oldest(self, count: int) -> None:
+        """Remove the least recently heard clusters"""
+        for cluster in sorted(self.clusters(), key=lambda c: c.timestamp)[:count]:
+            clusters = self._by_callsign[cluster.callsign]
+            clusters.remove(cluster)
+            if not clusters:
+                del self._by_callsign[cluster.callsign]
+            self._count -= 1
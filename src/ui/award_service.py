@@ -0,0 +1,223 @@
+"""
+Shared award computation service.
+
+Award widgets submit jobs here instead of computing on the GUI thread or
+starting their own QThreads:
+- Jobs run on one bounded thread pool, so award tabs never block input and
+  the pool size caps CPU use on small machines
+- Contacts are loaded once per data generation (bumped on every contact
+  change) and shared by all jobs of that generation
+- A job is identified by award id and generation: a duplicate of an
+  in-flight job is dropped, a newer job cancels the older one, and the
+  latest result per award is cached until the data changes
+- Results come back to the GUI thread through the result_ready signal
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from src.ui.signals import get_app_signals
+
+logger = logging.getLogger(__name__)
+
+# Leave a core for the GUI thread, and keep small machines (Raspberry Pi) responsive
+DEFAULT_MAX_WORKERS = max(1, min(3, (os.cpu_count() or 2) - 1))
+
+AwardCompute = Callable[[List[Mapping[str, Any]]], Any]
+
+
+class AwardJob:
+    """A submitted award computation"""
+
+    __slots__ = ("award_id", "generation", "compute", "future")
+
+    def __init__(self, award_id: str, generation: int, compute: AwardCompute):
+        self.award_id = award_id
+        self.generation = generation
+        self.compute = compute
+        self.future: Optional[Future] = None
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        """Identity used for deduplication"""
+        return (self.award_id, self.generation)
+
+    def __repr__(self) -> str:
+        return f"AwardJob({self.award_id}, generation {self.generation})"
+
+
+class AwardComputeService(QObject):
+    """Runs award calculations on a shared thread pool"""
+
+    result_ready = pyqtSignal(str, object)  # (award_id, result)
+    job_failed = pyqtSignal(str, str)  # (award_id, error message)
+
+    # Internal: worker threads hand results to the GUI thread
+    _job_finished = pyqtSignal(object, object, object)  # (job, result, error)
+
+    def __init__(self, db, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialize service
+
+        Args:
+            db: DatabaseRepository the contacts are loaded from
+            max_workers: Pool size (concurrent award calculations)
+        """
+        super().__init__()
+        self.db = db
+        self.generation = 0
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="AwardCompute")
+        self._jobs: Dict[str, AwardJob] = {}  # In-flight job per award
+        self._results: Dict[str, Tuple[int, Any]] = {}  # Latest (generation, result) per award
+        self._snapshot_lock = threading.Lock()
+        self._snapshot: Optional[Tuple[int, List[Mapping[str, Any]]]] = None
+        self.stats = {'submitted': 0, 'computed': 0, 'deduplicated': 0, 'cached': 0, 'cancelled': 0}
+
+        self._job_finished.connect(self._on_job_finished)
+        get_app_signals().contacts_batch_changed.connect(self._on_contacts_changed)
+
+    def submit(self, award_id: str, compute: AwardCompute) -> AwardJob:
+        """
+        Compute an award for the current data generation
+
+        The result is delivered through result_ready (asynchronously, even
+        when it comes from the cache).
+
+        Args:
+            award_id: Award identifier (e.g. 'was')
+            compute: Function taking the contact records and returning the result;
+                runs on a pool thread, so it must not touch widgets
+
+        Returns:
+            The job computing (or already holding) the result
+        """
+        self.stats['submitted'] += 1
+        job = AwardJob(award_id, self.generation, compute)
+
+        cached = self._results.get(award_id)
+        if cached is not None and cached[0] == job.generation:
+            self.stats['cached'] += 1
+            QTimer.singleShot(0, lambda: self._deliver(job, cached[1]))
+            return job
+
+        running = self._jobs.get(award_id)
+        if running is not None:
+            if running.key == job.key:
+                self.stats['deduplicated'] += 1
+                return running
+            self._cancel(running)
+
+        self._jobs[award_id] = job
+        job.future = self._executor.submit(self._run_job, job)
+        return job
+
+    def invalidate(self) -> None:
+        """Start a new data generation (cancels queued jobs of the old one)"""
+        self.generation += 1
+        self._results.clear()
+        for job in list(self._jobs.values()):
+            self._cancel(job)
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and stop the pool"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._jobs.clear()
+
+    def contacts(self, generation: int) -> List[Mapping[str, Any]]:
+        """
+        Contact records of a data generation, loaded once and shared (pool threads)
+
+        Args:
+            generation: Generation the caller computes for
+
+        Returns:
+            Contact records (read-only mappings)
+        """
+        with self._snapshot_lock:
+            if self._snapshot is not None and self._snapshot[0] >= generation:
+                return self._snapshot[1]
+
+            from src.database.models import Contact
+
+            # Projected read-only records in timeline order, so award replays need not sort
+            contacts = self.db.get_contact_records(order_by=(Contact.qso_date, Contact.time_on))
+            self._snapshot = (generation, contacts)
+            logger.debug(f"Award service loaded {len(contacts)} contacts for generation {generation}")
+            return contacts
+
+    def _run_job(self, job: AwardJob) -> None:
+        """Compute a job (pool thread)"""
+        if job.generation != self.generation:
+            self._job_finished.emit(job, None, None)
+            return
+        try:
+            result = job.compute(self.contacts(job.generation))
+            self._job_finished.emit(job, result, None)
+        except Exception as e:
+            logger.error(f"Error computing {job.award_id} award: {e}", exc_info=True)
+            self._job_finished.emit(job, None, e)
+
+    def _on_job_finished(self, job: AwardJob, result: Any, error: Optional[Exception]) -> None:
+        """Deliver a finished job unless a newer one replaced it (GUI thread)"""
+        if self._jobs.get(job.award_id) is job:
+            del self._jobs[job.award_id]
+        if job.generation != self.generation:
+            logger.debug(f"Dropping superseded {job!r}")
+            return
+        if error is not None:
+            self.job_failed.emit(job.award_id, str(error))
+            return
+        self.stats['computed'] += 1
+        self._results[job.award_id] = (job.generation, result)
+        self._deliver(job, result)
+
+    def _deliver(self, job: AwardJob, result: Any) -> None:
+        """Emit a result"""
+        self.result_ready.emit(job.award_id, result)
+
+    def _cancel(self, job: AwardJob) -> None:
+        """Cancel a job that hasn't started (a running one is dropped when it finishes)"""
+        if job.future is not None and job.future.cancel():
+            self.stats['cancelled'] += 1
+        if self._jobs.get(job.award_id) is job:
+            del self._jobs[job.award_id]
+
+    def _on_contacts_changed(self, change_type: str, metadata: dict) -> None:
+        """Contacts changed: results and snapshots of the old generation are stale"""
+        self.invalidate()
+
+
+# Global service instance
+_award_service = None
+
+
+def get_award_service(db=None) -> AwardComputeService:
+    """
+    Get the global award computation service.
+
+    Args:
+        db: DatabaseRepository (required on the first call)
+
+    Returns:
+        AwardComputeService: The global service instance
+    """
+    global _award_service
+    if _award_service is None:
+        if db is None:
+            raise ValueError("db is required to create the award service")
+        _award_service = AwardComputeService(db)
+    return _award_service
+
+
+def shutdown_award_service() -> None:
+    """Stop the global award service if it was created"""
+    global _award_service
+    if _award_service is not None:
+        _award_service.shutdown()
+        _award_service = None
@@ -15,11 +15,11 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QProgressBar, QTableWidget,
     QTableWidgetItem, QPushButton
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor
 
 from src.database.repository import DatabaseRepository
-from src.ui.signals import get_app_signals
+from src.ui.refresh_scheduler import get_refresh_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -45,14 +45,9 @@ class CanadianMapleProgressWidget(QWidget):
         self.db = db
 
         self._init_ui()
-        self.refresh()
-
-        # Connect to signals for auto-refresh
-        signals = get_app_signals()
-        signals.contacts_changed.connect(self.refresh)
-        signals.contact_added.connect(self.refresh)
-        signals.contact_modified.connect(self.refresh)
-        signals.contact_deleted.connect(self.refresh)
+
+        # Refresh on contact changes while visible (loads on first show)
+        get_refresh_scheduler().register(self)
 
     def _init_ui(self) -> None:
         """Initialize UI components"""
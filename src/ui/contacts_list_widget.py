@@ -15,7 +15,7 @@ from PyQt6.QtGui import QFont, QColor
 
 from src.database.repository import DatabaseRepository
 from src.database.models import Contact
-from src.ui.signals import get_app_signals
+from src.ui.refresh_scheduler import get_refresh_scheduler
 from src.ui.contact_edit_dialog import ContactEditDialog
 from src.ui.dropdown_data import DropdownData
 
@@ -45,24 +45,15 @@ class ContactsListWidget(QWidget):
         # View mode state
         self.view_mode = "all"  # "all" or "last_10"
 
-        # Visibility-aware refresh state
-        self._needs_refresh = False
-        self._has_initial_data = False
-
         # Debounce timer for search input (prevents database query on every keystroke)
         self._search_timer = QTimer()
         self._search_timer.setSingleShot(True)
         self._search_timer.timeout.connect(self.refresh)
 
         self._init_ui()
-        self.refresh()
 
-        # Connect to signals - but refresh intelligently based on visibility
-        signals = get_app_signals()
-        signals.contacts_changed.connect(self._on_data_changed)
-        signals.contact_added.connect(self._on_data_changed)
-        signals.contact_modified.connect(self._on_data_changed)
-        signals.contact_deleted.connect(self._on_data_changed)
+        # Refresh on contact changes while visible (loads on first show)
+        get_refresh_scheduler().register(self)
 
     def _init_ui(self) -> None:
         """Initialize UI components"""
@@ -178,36 +169,6 @@ class ContactsListWidget(QWidget):
         group.setLayout(layout)
         return group
 
-    def _on_data_changed(self) -> None:
-        """Handle data change signal - refresh if visible, mark for refresh if hidden"""
-        try:
-            if self.isVisible():
-                # Widget is visible, refresh immediately to show fresh data
-                self.refresh()
-            else:
-                # Widget is hidden, just mark that refresh is needed
-                self._needs_refresh = True
-                logger.debug("ContactsListWidget: Data changed while hidden, marked for refresh")
-        except Exception as e:
-            logger.error(f"Error handling data change: {e}", exc_info=True)
-
-    def showEvent(self, event) -> None:
-        """Handle widget becoming visible - refresh if needed"""
-        try:
-            super().showEvent(event)
-
-            # If data changed while hidden, refresh now to show fresh data
-            if self._needs_refresh:
-                logger.info("ContactsListWidget: Refreshing on show (data changed while hidden)")
-                self.refresh()
-                self._needs_refresh = False
-            elif not self._has_initial_data:
-                # First time showing, ensure we have data
-                logger.info("ContactsListWidget: Loading initial data on first show")
-                self.refresh()
-        except Exception as e:
-            logger.error(f"Error in showEvent: {e}", exc_info=True)
-
     def _on_search_changed(self) -> None:
         """Handle search input changes with debouncing (300ms)"""
         # Stop existing timer if running
@@ -218,7 +179,6 @@ class ContactsListWidget(QWidget):
     def refresh(self) -> None:
         """Refresh the contacts table"""
         try:
-            self._has_initial_data = True
             # Reset to first page on refresh
             self.current_offset = 0
             logger.debug(f"=== REFRESH START === view_mode={self.view_mode}")
@@ -68,6 +68,36 @@ class ApplicationGeneratorWorkerThread(QThread):
             self.finished.emit(False, f"Application generation failed: {str(e)}", "")
 
 
+class AllApplicationsWorkerThread(QThread):
+    """Worker thread generating every award application into a folder"""
+
+    finished = pyqtSignal(bool, str, str)  # Success, message, summary text
+
+    def __init__(self, generator: AwardApplicationGenerator, app_format: str, output_dir: str):
+        super().__init__()
+        self.generator = generator
+        self.app_format = app_format
+        self.output_dir = output_dir
+
+    def run(self):
+        """Generate all applications from one pass over the log"""
+        try:
+            results = self.generator.generate_all_applications(
+                format=self.app_format,
+                output_dir=self.output_dir
+            )
+            failed = [key for key, text in results.items() if text.startswith("Error generating application")]
+            summary = "\n".join(
+                f"{key}_application: {'FAILED' if key in failed else 'written'}" for key in results
+            )
+            message = f"{len(results) - len(failed)} of {len(results)} applications written to {self.output_dir}"
+            self.finished.emit(True, message, summary)
+
+        except Exception as e:
+            logger.error(f"Batch application generation error: {e}", exc_info=True)
+            self.finished.emit(False, f"Application generation failed: {str(e)}", "")
+
+
 class AwardApplicationDialog(QDialog):
     """Dialog for generating award applications"""
 
@@ -161,6 +191,11 @@ class AwardApplicationDialog(QDialog):
         generate_btn.clicked.connect(self._generate_application)
         button_layout.addWidget(generate_btn)
 
+        generate_all_btn = QPushButton("Generate All...")
+        generate_all_btn.setToolTip("Write every award application to a folder in one pass")
+        generate_all_btn.clicked.connect(self._generate_all_applications)
+        button_layout.addWidget(generate_all_btn)
+
         export_btn = QPushButton("Export Application")
         export_btn.clicked.connect(self._export_application)
         self.export_btn = export_btn
@@ -296,6 +331,49 @@ class AwardApplicationDialog(QDialog):
         self.worker.finished.connect(self._on_application_generated)
         self.worker.start()
 
+    def _generate_all_applications(self) -> None:
+        """Generate every award application into a chosen folder"""
+        if not self.generator:
+            QMessageBox.warning(self, "Error", "Application generator not initialized")
+            return
+
+        from pathlib import Path
+        project_root = Path(__file__).parent.parent.parent.parent
+        award_apps_dir = project_root / "award_applications"
+        award_apps_dir.mkdir(parents=True, exist_ok=True)
+
+        output_dir = QFileDialog.getExistingDirectory(
+            self,
+            "Folder for Award Applications",
+            str(award_apps_dir)
+        )
+        if not output_dir:
+            return
+
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Busy indicator
+        self.status_label.setText("Generating all applications...")
+
+        self.batch_worker = AllApplicationsWorkerThread(
+            self.generator,
+            self._get_application_format(),
+            output_dir
+        )
+        self.batch_worker.finished.connect(self._on_all_applications_generated)
+        self.batch_worker.start()
+
+    def _on_all_applications_generated(self, success: bool, message: str, summary: str) -> None:
+        """Handle batch generation completion"""
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+
+        if success:
+            self.status_label.setText(message)
+            self.preview_text.setText(summary)
+        else:
+            QMessageBox.critical(self, "Error", message)
+            self.status_label.setText(f"Error: {message}")
+
     def _on_application_generated(self, success: bool, message: str, app_text: str) -> None:
         """Handle application generation completion"""
         self.progress_bar.setVisible(False)
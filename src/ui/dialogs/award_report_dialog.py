@@ -51,17 +51,17 @@ class ReportGeneratorWorkerThread(QThread):
         """Run the report generation process"""
         try:
             self.status.emit("Generating report...")
-            self.progress.emit(25)
+            self.progress.emit(0)
 
             # Use universal report generation
             report_text = self.generator.generate_report(
                 award_name=self.award_type,
                 format=self.report_format,
                 include_summary=self.include_summary,
-                achievement_date=self.achievement_date
+                achievement_date=self.achievement_date,
+                progress=self._on_progress
             )
 
-            self.progress.emit(75)
             self.status.emit("Report generated successfully")
             self.progress.emit(100)
 
@@ -71,6 +71,52 @@ class ReportGeneratorWorkerThread(QThread):
             logger.error(f"Report generation error: {e}", exc_info=True)
             self.finished.emit(False, f"Report generation failed: {str(e)}", "")
 
+    def _on_progress(self, done: int, total: int) -> None:
+        """Forward validation progress as a percentage"""
+        if total:
+            self.progress.emit(int(done * 100 / total))
+
+
+class ReportExportWorkerThread(ReportGeneratorWorkerThread):
+    """Worker thread streaming an award report straight to a file"""
+
+    def __init__(
+        self,
+        generator: AwardReportGenerator,
+        award_type: str,
+        report_format: str,
+        file_path: str,
+        include_summary: bool = True,
+        achievement_date: Optional[str] = None,
+        compress: bool = False
+    ):
+        super().__init__(generator, award_type, report_format, include_summary, achievement_date)
+        self.file_path = file_path
+        self.compress = compress
+
+    def run(self):
+        """Write the report without building it in memory"""
+        try:
+            self.status.emit("Exporting report...")
+            self.progress.emit(0)
+
+            count = self.generator.write_report(
+                self.award_type,
+                self.file_path,
+                format=self.report_format,
+                include_summary=self.include_summary,
+                achievement_date=self.achievement_date,
+                compress=self.compress,
+                progress=self._on_progress
+            )
+
+            self.progress.emit(100)
+            self.finished.emit(True, f"Exported {count} contacts to:\n{self.file_path}", "")
+
+        except Exception as e:
+            logger.error(f"Report export error: {e}", exc_info=True)
+            self.finished.emit(False, f"Report export failed: {str(e)}", "")
+
 
 class AwardReportDialog(QDialog):
     """Dialog for generating and exporting award reports"""
@@ -148,7 +194,6 @@ class AwardReportDialog(QDialog):
         export_btn = QPushButton("Export Report")
         export_btn.clicked.connect(self._export_report)
         self.export_btn = export_btn
-        self.export_btn.setEnabled(False)
         button_layout.addWidget(export_btn)
 
         copy_btn = QPushButton("Copy to Clipboard")
@@ -248,6 +293,10 @@ class AwardReportDialog(QDialog):
         self.summary_checkbox.setChecked(True)
         layout.addWidget(self.summary_checkbox)
 
+        self.compress_checkbox = QCheckBox("Compress Exported File (gzip)")
+        self.compress_checkbox.setChecked(False)
+        layout.addWidget(self.compress_checkbox)
+
         layout.addStretch()
         group.setLayout(layout)
         return group
@@ -386,7 +435,6 @@ class AwardReportDialog(QDialog):
         if success:
             self.report_text = report_text
             self.status_label.setText(message)
-            self.export_btn.setEnabled(True)
             self.copy_btn.setEnabled(True)
 
             # Show preview (first 1000 characters)
@@ -400,11 +448,14 @@ class AwardReportDialog(QDialog):
             self.status_label.setText(f"Error: {message}")
 
     def _export_report(self) -> None:
-        """Export report to file"""
-        if not self.report_text:
-            QMessageBox.warning(self, "No Report", "Please generate a report first")
+        """Export report to file (streamed from the database in a worker thread)"""
+        if not self.generator:
+            QMessageBox.warning(self, "Error", "Report generator not initialized")
             return
 
+        # Get selected award from combo box
+        self.selected_award = self.award_combo.currentText()
+
         # Determine file extension based on format
         format_map = {
             'text': 'txt',
@@ -413,6 +464,9 @@ class AwardReportDialog(QDialog):
             'html': 'html'
         }
         extension = format_map.get(self._get_report_format(), 'txt')
+        compress = self.compress_checkbox.isChecked()
+        if compress:
+            extension += '.gz'
 
         # Create suggested filename
         award_name = self.selected_award.lower()
@@ -420,7 +474,6 @@ class AwardReportDialog(QDialog):
         suggested_name = f"{award_name}_report_{timestamp}.{extension}"
 
         # Default to award_applications folder in project root
-        from pathlib import Path
         project_root = Path(__file__).parent.parent.parent.parent
         award_apps_dir = project_root / "award_applications"
         award_apps_dir.mkdir(parents=True, exist_ok=True)
@@ -436,18 +489,39 @@ class AwardReportDialog(QDialog):
         if not file_path:
             return
 
-        # Export
-        if self.generator.export_report_to_file(self.report_text, file_path, self._get_report_format()):
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Report exported to:\n{file_path}"
-            )
+        # Show progress
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.export_btn.setEnabled(False)
+
+        self.export_worker = ReportExportWorkerThread(
+            self.generator,
+            self.selected_award,
+            self._get_report_format(),
+            file_path,
+            self.summary_checkbox.isChecked(),
+            self._get_achievement_date() if hasattr(self, 'achievement_date_edit') else None,
+            compress
+        )
+        self.export_worker.progress.connect(self.progress_bar.setValue)
+        self.export_worker.status.connect(self.status_label.setText)
+        self.export_worker.finished.connect(self._on_report_exported)
+        self.export_worker.start()
+
+    def _on_report_exported(self, success: bool, message: str, _report_text: str) -> None:
+        """Handle report export completion"""
+        self.progress_bar.setVisible(False)
+        self.export_btn.setEnabled(True)
+
+        if success:
+            self.status_label.setText("Report exported")
+            QMessageBox.information(self, "Success", message)
         else:
+            self.status_label.setText(f"Error: {message}")
             QMessageBox.critical(
                 self,
                 "Export Failed",
-                "Failed to export report. Check logs for details."
+                f"{message}\n\nCheck logs for details."
             )
 
     def _copy_to_clipboard(self) -> None:
@@ -16,6 +16,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QDate, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 
+from src.database.models import Contact
+from src.database.read_model import ALL_COLUMNS
 from src.database.repository import DatabaseRepository
 from src.adif.exporter import ADIFExporter
 
@@ -86,42 +88,37 @@ class ExportWorkerThread(QThread):
         """Get contacts based on filter criteria
 
         Returns:
-            List of Contact objects
+            List of read-only contact records with every column
         """
-        contacts = self.db.get_all_contacts(limit=10000)
-
-        # Apply filters
-        filtered = contacts
+        criteria = []
 
         # Filter by date range
         if self.filters.get('date_from'):
-            date_from = self.filters['date_from']
-            filtered = [c for c in filtered if c.qso_date >= date_from]
+            criteria.append(Contact.qso_date >= self.filters['date_from'])
 
         if self.filters.get('date_to'):
-            date_to = self.filters['date_to']
-            filtered = [c for c in filtered if c.qso_date <= date_to]
+            criteria.append(Contact.qso_date <= self.filters['date_to'])
 
         # Filter by band
         if self.filters.get('band'):
-            band = self.filters['band']
-            filtered = [c for c in filtered if c.band == band]
+            criteria.append(Contact.band == self.filters['band'])
 
         # Filter by mode
         if self.filters.get('mode'):
-            mode = self.filters['mode']
-            filtered = [c for c in filtered if c.mode == mode]
+            criteria.append(Contact.mode == self.filters['mode'])
 
         # Filter by country
         if self.filters.get('country'):
-            country = self.filters['country']
-            filtered = [c for c in filtered if c.country and country.lower() in c.country.lower()]
+            criteria.append(Contact.country.ilike(f"%{self.filters['country']}%"))
 
         # Filter by SKCC only
         if self.filters.get('skcc_only'):
-            filtered = [c for c in filtered if c.skcc_number]
+            criteria.append(Contact.skcc_number.isnot(None))
+            criteria.append(Contact.skcc_number != '')
 
-        return filtered
+        return self.db.get_contact_records(
+            *criteria, columns=ALL_COLUMNS, order_by=(Contact.qso_date, Contact.time_on)
+        )
 
 
 class ExportDialog(QDialog):
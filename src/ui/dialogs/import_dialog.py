@@ -17,7 +17,8 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 
 from src.database.repository import DatabaseRepository
-from src.adif.parser import ADIFParser
+from src.adif.parser import ADIFParser, map_adif_records
+from src.config.settings import get_config_manager
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +76,7 @@ class ImportWorkerThread(QThread):
             # Convert ADIF records to contact format
             # The parser returns records as dictionaries with ADIF field names
             # We need to map them back to database field names
-            records = self._map_adif_records(records)
+            records = map_adif_records(records)
 
             self.progress.emit(50)
             self.status.emit(f"Cleaning {len(records)} records...")
@@ -117,129 +118,6 @@ class ImportWorkerThread(QThread):
         finally:
             session.close()
 
-    def _map_adif_records(self, adif_records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Map ADIF field names to database field names
-
-        Args:
-            adif_records: List of records with ADIF field names (uppercase)
-
-        Returns:
-            List of records with database field names (lowercase)
-        """
-        # Map ADIF field names to database field names (reverse of exporter)
-        adif_to_db = {
-            'CALL': 'callsign',
-            'QSO_DATE': 'qso_date',
-            'TIME_ON': 'time_on',
-            'TIME_OFF': 'time_off',
-            'BAND': 'band',
-            'FREQ': 'frequency',
-            'FREQ_RX': 'freq_rx',
-            'MODE': 'mode',
-            'RST_SENT': 'rst_sent',
-            'RST_RCVD': 'rst_rcvd',
-            'TX_PWR': 'tx_power',
-            'RX_PWR': 'rx_power',
-
-            'MY_GRIDSQUARE': 'my_gridsquare',
-            'GRIDSQUARE': 'gridsquare',
-            'MY_CITY': 'my_city',
-            'MY_COUNTRY': 'my_country',
-            'MY_STATE': 'my_state',
-            'NAME': 'name',
-            'QTH': 'qth',
-            'COUNTRY': 'country',
-
-            'DXCC': 'dxcc',
-            'CQZ': 'cqz',
-            'ITUZ': 'ituz',
-            'STATE': 'state',
-            'COUNTY': 'county',
-            'ARRL_SECT': 'arrl_sect',
-            'IOTA': 'iota',
-            'IOTA_ISLAND_ID': 'iota_island_id',
-            'SOTA_REF': 'sota_ref',
-            'POTA_REF': 'pota_ref',
-            'VUCC_GRIDS': 'vucc_grids',
-
-            'OPERATOR': 'operator',
-            'STATION_CALLSIGN': 'station_callsign',
-            'MY_RIG': 'my_rig',
-            'MY_RIG_MAKE': 'my_rig_make',
-            'MY_RIG_MODEL': 'my_rig_model',
-            'RIG_MAKE': 'rig_make',
-            'RIG_MODEL': 'rig_model',
-            'MY_ANTENNA': 'my_antenna',
-            'MY_ANTENNA_MAKE': 'my_antenna_make',
-            'MY_ANTENNA_MODEL': 'my_antenna_model',
-            'ANT_MAKE': 'antenna_make',
-            'ANT_MODEL': 'antenna_model',
-
-            'SKCC': 'skcc_number',
-            'KEY_TYPE': 'key_type',
-            'APP_SKCCLOGGER_KEYTYPE': 'key_type',  # Custom SKCC Logger field for key type
-
-            'PROPAGATION_MODE': 'propagation_mode',
-            'SAT_NAME': 'sat_name',
-            'SAT_MODE': 'sat_mode',
-            'A_INDEX': 'a_index',
-            'K_INDEX': 'k_index',
-            'SFI': 'sfi',
-            'ANTENNA_AZ': 'antenna_az',
-            'ANTENNA_EL': 'antenna_el',
-            'DISTANCE': 'distance',
-            'LATITUDE': 'latitude',
-            'LONGITUDE': 'longitude',
-
-            'QSL_RCVD': 'qsl_rcvd',
-            'QSL_SENT': 'qsl_sent',
-            'QSL_RCVD_DATE': 'qsl_rcvd_date',
-            'QSL_SENT_DATE': 'qsl_sent_date',
-            'QSL_VIA': 'qsl_via',
-            'LOTW_QSL_RCVD': 'lotw_qsl_rcvd',
-            'LOTW_QSL_SENT': 'lotw_qsl_sent',
-            'EQSL_QSL_RCVD': 'eqsl_qsl_rcvd',
-            'EQSL_QSL_SENT': 'eqsl_qsl_sent',
-            'CLUBLOG_QSO_UPLOAD_STATUS': 'clublog_status',
-
-            'NOTES': 'notes',
-            'COMMENT': 'comment',
-            'QSLMSG': 'qslmsg',
-
-            'CONTEST_ID': 'contest_id',
-            'CLASS': 'class_field',
-            'CHECK': 'check',
-        }
-
-        mapped_records = []
-        for record in adif_records:
-            mapped = {}
-            for adif_key, value in record.items():
-                db_key = adif_to_db.get(adif_key)
-                if db_key:
-                    mapped[db_key] = value
-                else:
-                    # Include unmapped fields as-is (might be custom fields)
-                    mapped[adif_key.lower()] = value
-
-            # Normalize key_type field: convert SKCC Logger abbreviations to standard names
-            if 'key_type' in mapped and mapped['key_type']:
-                key_type = mapped['key_type'].upper().strip()
-                # SKCC Logger uses: SK, BUG, SS
-                # Standard uses: STRAIGHT, BUG, SIDESWIPER
-                if key_type == 'SK':
-                    mapped['key_type'] = 'STRAIGHT'
-                elif key_type == 'SS':
-                    mapped['key_type'] = 'SIDESWIPER'
-                elif key_type == 'BUG':
-                    mapped['key_type'] = 'BUG'  # Already correct
-                else:
-                    mapped['key_type'] = key_type.upper()  # Keep other values as-is
-
-            mapped_records.append(mapped)
-
-        return mapped_records
-
 
 class ImportDialog(QDialog):
     """Dialog for importing ADIF files"""
@@ -308,6 +186,11 @@ class ImportDialog(QDialog):
         self.clear_db_checkbox = QCheckBox("Clear all existing contacts before importing")
         strategy_layout.addWidget(self.clear_db_checkbox)
 
+        # Queue not-yet-uploaded contacts for the QRZ logbook once the import finishes
+        self.qrz_upload_checkbox = QCheckBox("Upload contacts not yet on QRZ.com logbook in the background")
+        self.qrz_upload_checkbox.setEnabled(bool(get_config_manager().get("qrz.enabled", False)))
+        strategy_layout.addWidget(self.qrz_upload_checkbox)
+
         main_layout.addLayout(strategy_layout)
 
         # Progress section
@@ -438,6 +321,15 @@ class ImportDialog(QDialog):
             if len(stats['errors']) > 10:
                 results.append(f"  ... and {len(stats['errors']) - 10} more errors")
 
+        if self.qrz_upload_checkbox.isChecked():
+            try:
+                from src.qrz import get_qrz_service
+                queued = get_qrz_service().upload_pending_contacts()
+                results.append(f"\nQueued for QRZ upload: {queued}")
+            except Exception as e:
+                logger.error(f"Failed to queue QRZ uploads: {e}", exc_info=True)
+                results.append(f"\nQRZ upload could not be queued: {e}")
+
         self.results_text.setText('\n'.join(results))
 
         # Show summary message
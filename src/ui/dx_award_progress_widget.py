@@ -14,12 +14,13 @@ from typing import Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QProgressBar, QTabWidget, QPushButton
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor
 
 from src.database.repository import DatabaseRepository
 from src.awards.skcc_dx import DXQAward, DXCAward
-from src.ui.signals import get_app_signals
+from src.ui.award_service import get_award_service
+from src.ui.refresh_scheduler import get_refresh_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -41,15 +42,15 @@ class DXAwardProgressWidget(QWidget):
         super().__init__(parent)
         self.db = db
 
+        # Award calculations run on the shared pool; results arrive via signal
+        self._award_service = get_award_service(db)
+        self._award_service.result_ready.connect(self._on_award_result)
+        self._award_service.job_failed.connect(self._on_award_failed)
+
         self._init_ui()
-        self.refresh()
 
-        # Connect to signals for auto-refresh
-        signals = get_app_signals()
-        signals.contacts_changed.connect(self.refresh)
-        signals.contact_added.connect(self.refresh)
-        signals.contact_modified.connect(self.refresh)
-        signals.contact_deleted.connect(self.refresh)
+        # Refresh on contact changes while visible (loads on first show)
+        get_refresh_scheduler().register(self)
 
     def _init_ui(self) -> None:
         """Initialize UI components"""
@@ -228,24 +229,23 @@ class DXAwardProgressWidget(QWidget):
         return widget
 
     def refresh(self) -> None:
-        """Refresh award progress from database"""
-        try:
-            session = self.db.get_session()
-
-            # Get all contacts
-            from src.database.models import Contact
-            contacts = session.query(Contact).all()
-            logger.info(f"DX Award: Fetched {len(contacts)} total contacts from database")
-            contact_dicts = [self._contact_to_dict(c) for c in contacts]
-            logger.debug(f"DX Award: Converted {len(contact_dicts)} contacts to dict format")
+        """Refresh award progress (calculated on the award service pool)"""
+        self._award_service.submit("skcc_dx", self._calculate_progress)
 
-            # Keep session open - award class may need it
-            # session.close()  # REMOVED: Session closed too early
-
-            # Calculate DXQ progress
-            dxq_award = DXQAward(session)
-            dxq_progress = dxq_award.calculate_progress(contact_dicts)
+    @staticmethod
+    def _calculate_progress(contacts: list) -> dict:
+        """Calculate DXQ and DXC progress (award service pool thread)"""
+        return {
+            'dxq': DXQAward(None).calculate_progress(contacts),
+            'dxc': DXCAward(None).calculate_progress(contacts),
+        }
 
+    def _on_award_result(self, award_id: str, progress: dict) -> None:
+        """Update the display with finished DXQ/DXC calculations"""
+        if award_id != "skcc_dx":
+            return
+        try:
+            dxq_progress = progress['dxq']
             dxq_current = dxq_progress['current']
             self.dxq_progress.setMaximum(50)
             self.dxq_progress.setValue(dxq_current)
@@ -264,9 +264,7 @@ class DXAwardProgressWidget(QWidget):
                         label.setText(label.text().replace("☑", "☐"))
                         label.setStyleSheet("color: #666666;")
 
-            # Calculate DXC progress
-            dxc_award = DXCAward(session)
-            dxc_progress = dxc_award.calculate_progress(contact_dicts)
+            dxc_progress = progress['dxc']
 
             dxc_current = dxc_progress['current']
             self.dxc_progress.setMaximum(50)
@@ -291,6 +289,12 @@ class DXAwardProgressWidget(QWidget):
             self.dxq_status.setText(f"Error: {str(e)}")
             self.dxc_status.setText(f"Error: {str(e)}")
 
+    def _on_award_failed(self, award_id: str, message: str) -> None:
+        """Show failed DXQ/DXC calculations"""
+        if award_id == "skcc_dx":
+            self.dxq_status.setText(f"Error: {message}")
+            self.dxc_status.setText(f"Error: {message}")
+
     def _create_actions_section(self) -> QGroupBox:
         """Create actions section with report and application generation buttons"""
         group = QGroupBox("Actions")
@@ -333,17 +337,3 @@ class DXAwardProgressWidget(QWidget):
             logger.error(f"Error opening award application dialog: {e}", exc_info=True)
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Failed to open application dialog: {str(e)}")
-
-    def _contact_to_dict(self, contact) -> dict:
-        """Convert Contact ORM object to dictionary"""
-        return {
-            'callsign': contact.callsign,
-            'mode': contact.mode,
-            'band': contact.band,
-            'qso_date': contact.qso_date,
-            'qso_time': contact.time_on,
-            'skcc_number': contact.skcc_number,
-            'key_type': contact.key_type,
-            'dxcc': contact.dxcc,
-            'distance': contact.distance,
-        }
@@ -896,7 +896,8 @@ class LoggingForm(QWidget):
                             rst_rcvd=contact.rst_rcvd or "59",
                             tx_power=contact.tx_power,
                             notes=f"Key Type: {contact.key_type}" if contact.key_type else None,
-                            callback=on_qrz_upload_complete
+                            callback=on_qrz_upload_complete,
+                            contact_id=contact.id
                         )
                         logger.debug(f"Queued QSO for upload to QRZ: {contact.callsign}")
                 except Exception as e:
@@ -1205,8 +1206,9 @@ class LoggingForm(QWidget):
         Handle callsign input changes
 
         When callsign is entered and remains stable for 5 seconds,
-        record the QSO start time. Updates previous QSOs widget with
-        debounce (500ms after typing stops) for better performance.
+        record the QSO start time. Shows worked callsigns matching the
+        input immediately, and updates previous QSOs widget with debounce
+        (500ms after typing stops) for better performance.
 
         Args:
             text: Current callsign input text
@@ -1222,6 +1224,9 @@ class LoggingForm(QWidget):
                 self.callsign_stable_timer.start(5000)  # 5 seconds for QSO timing
                 self.callsign_debounce_timer.start(500)  # 500ms for previous QSOs lookup
                 logger.debug(f"Callsign changed to '{text}', debounce timer started")
+                # Prefix matches come from an in-memory index, so show them while typing
+                if hasattr(self, 'previous_qsos_widget'):
+                    self.previous_qsos_widget.show_matches(text)
             else:
                 # Callsign cleared
                 logger.debug("Callsign cleared, QSO start time reset")
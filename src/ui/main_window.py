@@ -11,13 +11,16 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
     QMenuBar, QToolBar, QStatusBar, QMessageBox, QProgressDialog, QApplication
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal
 from PyQt6.QtGui import QAction, QIcon
 
+from src.database.models import Contact
+from src.database.read_model import ALL_COLUMNS
 from src.database.repository import DatabaseRepository
 from src.config.settings import get_config_manager
 from src.ui.theme_manager import ThemeManager
 from src.backup.backup_manager import BackupManager
+from src.services.job_scheduler import PRIORITY_LOW, PRIORITY_NORMAL, get_job_scheduler, shutdown_job_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -91,8 +94,14 @@ class MainWindow(QMainWindow):
         # Connect status signal for thread-safe updates
         self.status_message.connect(self._update_status_bar)
 
-        # Defer roster sync to after window is shown (non-blocking)
-        QTimer.singleShot(1000, self._start_background_roster_sync)
+        # Roster sync and periodic backups wait until the user is idle
+        self._start_background_roster_sync()
+        self._schedule_database_backup()
+        QApplication.instance().installEventFilter(self)
+
+        # Log QSOs broadcast by WSJT-X / N1MM Logger+
+        self.qso_ingest = None
+        self._start_qso_ingest()
 
         logger.info("Main window initialized")
 
@@ -521,16 +530,42 @@ class MainWindow(QMainWindow):
         if self.status_label:
             self.status_label.showMessage(message)
 
+    def _start_qso_ingest(self) -> None:
+        """Start the UDP QSO listener if enabled in the udp_ingest settings"""
+        if not self.db or not self.config_manager.get("udp_ingest.enabled", False):
+            return
+        from src.integrations.udp_ingest import QSOIngestService
+
+        host = self.config_manager.get("udp_ingest.host", "127.0.0.1")
+        ports = [
+            self.config_manager.get("udp_ingest.wsjtx_port", 2237),
+            self.config_manager.get("udp_ingest.n1mm_port", 12060),
+        ]
+        service = QSOIngestService(
+            self.db,
+            [(host, int(port)) for port in ports if port],
+            on_batch=lambda result: self.status_message.emit(f"Logged {result['imported']} QSOs from UDP"),
+        )
+        if service.start():
+            self.qso_ingest = service
+            if self.db.signals:
+                self.db.signals.contacts_batch_changed.connect(service.on_contacts_changed)
+
+    def eventFilter(self, obj, event) -> bool:
+        """Report keyboard and mouse input to the job scheduler (postpones deferred jobs)"""
+        if event.type() in (QEvent.Type.KeyPress, QEvent.Type.MouseButtonPress, QEvent.Type.Wheel):
+            get_job_scheduler().notify_activity()
+        return super().eventFilter(obj, event)
+
     def _start_background_roster_sync(self, force_refresh: bool = True) -> None:
-        """Start SKCC roster sync in background thread (non-blocking)
+        """Queue an SKCC roster sync on the job scheduler (runs once the user is idle)
 
         Args:
             force_refresh: If True, download fresh data on startup (default). Set False to use cache if available.
         """
-        import threading
-
         def sync_roster():
-            """Background thread function to sync SKCC roster"""
+            """Job function to sync SKCC roster (raises on failure so the scheduler retries)"""
+            success = False
             try:
                 # Use signal for thread-safe status update
                 self.status_message.emit("Syncing SKCC roster... (background)")
@@ -561,9 +596,35 @@ class MainWindow(QMainWindow):
                 # Use signal for thread-safe status update
                 self.status_message.emit(f"✗ Roster sync error: {str(e)}")
 
-        # Start roster sync in daemon thread (won't block main thread)
-        roster_thread = threading.Thread(target=sync_roster, daemon=True)
-        roster_thread.start()
+            if not success:
+                raise RuntimeError("SKCC roster sync failed")
+
+        get_job_scheduler().add_job("skcc_roster", sync_roster, priority=PRIORITY_NORMAL)
+
+    def _schedule_database_backup(self) -> None:
+        """Back up the database every database.backup_interval hours if database.backup_enabled"""
+        if not self.db or not self.config_manager.get("database.backup_enabled", True):
+            return
+        interval = float(self.config_manager.get("database.backup_interval", 24)) * 3600
+        if interval <= 0:
+            return
+
+        def backup_database():
+            """Job function to write a timestamped database backup"""
+            self.db.checkpoint()
+            result = BackupManager().create_database_backup(
+                database_path=Path(self.db.db_path),
+                backup_location=None,  # Uses configured backup destination or ~/.w4gns_logger/Logs
+                max_backups=5
+            )
+            if not result["success"]:
+                raise RuntimeError(result["message"])
+            logger.info(f"Periodic database backup created: {result['message']}")
+
+        get_job_scheduler().add_job(
+            "database_backup", backup_database, delay=interval, interval=interval,
+            priority=PRIORITY_LOW, backoff_base=300.0,
+        )
 
     def _show_help(self) -> None:
         """Show help contents"""
@@ -745,6 +806,26 @@ class MainWindow(QMainWindow):
                         if widget:
                             widget.close()
 
+                    # Stop the UDP QSO listener (queued QSOs are written first)
+                    if self.qso_ingest:
+                        self.qso_ingest.stop()
+
+                    # Cancel queued QRZ lookups so they do not delay exit
+                    from src.qrz import get_qrz_service
+                    get_qrz_service().shutdown()
+
+                    # Cancel queued award calculations
+                    from src.ui.award_service import shutdown_award_service
+                    shutdown_award_service()
+
+                    # Stop background jobs (a download in progress is abandoned)
+                    QApplication.instance().removeEventFilter(self)
+                    shutdown_job_scheduler()
+
+                    # Close kept-alive HTTP connections
+                    from src.utils.http_client import shutdown_http_client
+                    shutdown_http_client()
+
                     # Give widgets time to close their threads
                     QApplication.processEvents()
 
@@ -778,8 +859,10 @@ class MainWindow(QMainWindow):
                 try:
                     logger.info("Exporting contacts on shutdown...")
                     if hasattr(self, 'db') and self.db:
-                        # Get all contacts from database
-                        all_contacts = self.db.get_all_contacts()
+                        # Get all contacts from database (read-only records with every column)
+                        all_contacts = self.db.get_contact_records(
+                            columns=ALL_COLUMNS, order_by=(Contact.qso_date, Contact.time_on)
+                        )
                         if all_contacts and len(all_contacts) > 0:
                             backup_manager = BackupManager()
                             my_skcc = self.config_manager.get("adif.my_skcc_number", "")
@@ -13,12 +13,13 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QProgressBar, QTableWidget,
     QTableWidgetItem, QHeaderView, QPushButton
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor
 
 from src.database.repository import DatabaseRepository
 from src.awards.pfx import PFXAward
-from src.ui.signals import get_app_signals
+from src.ui.award_service import get_award_service
+from src.ui.refresh_scheduler import get_refresh_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -40,15 +41,15 @@ class PFXProgressWidget(QWidget):
         super().__init__(parent)
         self.db = db
 
+        # Award calculations run on the shared pool; results arrive via signal
+        self._award_service = get_award_service(db)
+        self._award_service.result_ready.connect(self._on_award_result)
+        self._award_service.job_failed.connect(self._on_award_failed)
+
         self._init_ui()
-        self.refresh()
 
-        # Connect to signals for auto-refresh
-        signals = get_app_signals()
-        signals.contacts_changed.connect(self.refresh)
-        signals.contact_added.connect(self.refresh)
-        signals.contact_modified.connect(self.refresh)
-        signals.contact_deleted.connect(self.refresh)
+        # Refresh on contact changes while visible (loads on first show)
+        get_refresh_scheduler().register(self)
 
     def _init_ui(self) -> None:
         """Initialize UI components"""
@@ -224,24 +225,16 @@ class PFXProgressWidget(QWidget):
         return group
 
     def refresh(self) -> None:
-        """Refresh award progress from database"""
-        try:
-            session = self.db.get_session()
-
-            # Get all contacts
-            from src.database.models import Contact
-            contacts = session.query(Contact).all()
-            logger.info(f"PFX Award: Fetched {len(contacts)} total contacts from database")
-            contact_dicts = [self._contact_to_dict(c) for c in contacts]
-            logger.debug(f"PFX Award: Converted {len(contact_dicts)} contacts to dict format")
-
-            # Keep session open - award class may need it
-            # session.close()  # REMOVED: Session closed too early
-
-            # Calculate PFX progress
-            pfx_award = PFXAward(session)
-            progress = pfx_award.calculate_progress(contact_dicts)
+        """Refresh award progress (calculated on the award service pool)"""
+        self._award_service.submit(
+            "pfx", lambda contacts: PFXAward(None).calculate_progress(contacts)
+        )
 
+    def _on_award_result(self, award_id: str, progress: dict) -> None:
+        """Update the display with a finished PFX calculation"""
+        if award_id != "pfx":
+            return
+        try:
             current_points = progress['current']
             required = progress['required']
             level = progress['level']
@@ -325,6 +318,11 @@ class PFXProgressWidget(QWidget):
             points_item.setForeground(QColor(PFX_COLOR))
             self.prefix_table.setItem(row, 2, points_item)
 
+    def _on_award_failed(self, award_id: str, message: str) -> None:
+        """Show a failed PFX calculation"""
+        if award_id == "pfx":
+            self.status_label.setText(f"Error: {message}")
+
     def _create_actions_section(self) -> QGroupBox:
         """Create actions section with report and application generation buttons"""
         group = QGroupBox("Actions")
@@ -367,15 +365,3 @@ class PFXProgressWidget(QWidget):
             logger.error(f"Error opening award application dialog: {e}", exc_info=True)
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Failed to open application dialog: {str(e)}")
-
-    def _contact_to_dict(self, contact) -> dict:
-        """Convert Contact ORM object to dictionary"""
-        return {
-            'callsign': contact.callsign,
-            'mode': contact.mode,
-            'band': contact.band,
-            'qso_date': contact.qso_date,
-            'qso_time': contact.time_on,
-            'skcc_number': contact.skcc_number,
-            'key_type': contact.key_type,
-        }
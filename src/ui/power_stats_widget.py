@@ -11,11 +11,11 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QTableWidget,
     QTableWidgetItem
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor
 
 from src.database.repository import DatabaseRepository
-from src.ui.signals import get_app_signals
+from src.ui.refresh_scheduler import get_refresh_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -34,31 +34,10 @@ class PowerStatsWidget(QWidget):
         super().__init__(parent)
         self.db = db
 
-        # Visibility-aware refresh state
-        self._needs_refresh = False
-        self._has_initial_data = False
-
         self._init_ui()
-        # Defer initial refresh to avoid blocking GUI initialization
-        QTimer.singleShot(300, self._initial_refresh)
-
-        # Connect to signals - but refresh intelligently based on visibility
-        signals = get_app_signals()
-        signals.contacts_changed.connect(self._on_data_changed)
-        signals.contact_added.connect(self._on_data_changed)
-        signals.contact_modified.connect(self._on_data_changed)
-        signals.contact_deleted.connect(self._on_data_changed)
-
-    def _initial_refresh(self) -> None:
-        """Initial refresh - only if widget is visible"""
-        try:
-            if self.isVisible():
-                self.refresh()
-            else:
-                # Widget not visible yet, mark for refresh when shown
-                self._needs_refresh = True
-        except Exception as e:
-            logger.error(f"Error in initial refresh: {e}", exc_info=True)
+
+        # Refresh on contact changes while visible (loads on first show)
+        get_refresh_scheduler().register(self)
 
     def _init_ui(self) -> None:
         """Initialize UI components"""
@@ -196,40 +175,9 @@ class PowerStatsWidget(QWidget):
         group.setLayout(layout)
         return group
 
-    def _on_data_changed(self) -> None:
-        """Handle data change signal - refresh if visible, mark for refresh if hidden"""
-        try:
-            if self.isVisible():
-                # Widget is visible, refresh immediately to show fresh data
-                self.refresh()
-            else:
-                # Widget is hidden, just mark that refresh is needed
-                self._needs_refresh = True
-                logger.debug("PowerStatsWidget: Data changed while hidden, marked for refresh")
-        except Exception as e:
-            logger.error(f"Error handling data change: {e}", exc_info=True)
-
-    def showEvent(self, event) -> None:
-        """Handle widget becoming visible - refresh if needed"""
-        try:
-            super().showEvent(event)
-
-            # If data changed while hidden, refresh now to show fresh data
-            if self._needs_refresh:
-                logger.info("PowerStatsWidget: Refreshing on show (data changed while hidden)")
-                self.refresh()
-                self._needs_refresh = False
-            elif not self._has_initial_data:
-                # First time showing, ensure we have data
-                logger.info("PowerStatsWidget: Loading initial data on first show")
-                self.refresh()
-        except Exception as e:
-            logger.error(f"Error in showEvent: {e}", exc_info=True)
-
     def refresh(self) -> None:
         """Refresh all power statistics displays"""
         try:
-            self._has_initial_data = True
             # Get power statistics
             stats = self.db.get_power_statistics()
 
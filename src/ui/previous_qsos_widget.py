@@ -1,7 +1,9 @@
 """
 Previous QSOs Display Widget
 
-Shows a list of previous QSO contacts with the same callsign.
+Shows a list of previous QSO contacts with the same callsign. Lookups run on
+a background thread; cached results and prefix matches from the callsign
+index are shown without waiting for it.
 """
 
 import logging
@@ -13,8 +15,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QDateTime, QThread, pyqtSignal, QObject
 from PyQt6.QtGui import QFont
 
-from src.database.models import Contact
+from src.database.previous_qsos import PreviousQSO, PreviousQSOLookup
 from src.database.repository import DatabaseRepository
+from src.ui.signals import get_app_signals
 from src.utils.timezone_utils import format_utc_time_for_display
 
 logger = logging.getLogger(__name__)
@@ -23,28 +26,45 @@ logger = logging.getLogger(__name__)
 class ContactLookupWorker(QObject):
     """Worker to perform database lookups in background thread"""
 
-    finished = pyqtSignal(str, list)  # callsign, contacts
-    error = pyqtSignal(str, str)  # callsign, error_message
+    finished = pyqtSignal(int, str, list)  # request_id, callsign, rows
+    error = pyqtSignal(int, str, str)  # request_id, callsign, error_message
+    index_loaded = pyqtSignal()
 
-    def __init__(self, db: DatabaseRepository):
+    def __init__(self, lookup: PreviousQSOLookup):
         super().__init__()
-        self.db = db
-        self.callsign = ""
+        self.lookup = lookup
+        self.latest_request = 0  # Set by the GUI thread; older requests are skipped
 
-    def lookup_contacts(self, callsign: str):
-        """Perform the contact lookup"""
-        self.callsign = callsign
+    def lookup_contacts(self, request_id: int, callsign: str):
+        """Perform the contact lookup unless a newer request superseded it"""
+        if request_id != self.latest_request:
+            logger.debug(f"Skipping superseded lookup for {callsign}")
+            return
         try:
-            contacts = self.db.get_contacts_by_callsign(callsign)
-            self.finished.emit(callsign, contacts)
+            rows = self.lookup.lookup(callsign)
+            self.finished.emit(request_id, callsign, rows)
         except Exception as e:
             logger.error(f"Error in background contact lookup for {callsign}: {e}", exc_info=True)
-            self.error.emit(callsign, str(e))
+            self.error.emit(request_id, callsign, str(e))
+
+    def load_index(self):
+        """Load the callsign index used for prefix matches"""
+        if self.lookup.index_loaded():
+            return
+        try:
+            self.lookup.load_index()
+            self.index_loaded.emit()
+        except Exception as e:
+            logger.error(f"Error loading callsign index: {e}", exc_info=True)
 
 
 class PreviousQSOsWidget(QWidget):
     """Widget to display previous QSOs with a specific callsign"""
 
+    # Queued to the worker thread
+    _lookup_requested = pyqtSignal(int, str)  # request_id, callsign
+    _index_requested = pyqtSignal()
+
     def __init__(self, db: DatabaseRepository, parent: Optional[QWidget] = None):
         """
         Initialize previous QSOs widget
@@ -67,18 +87,26 @@ class PreviousQSOsWidget(QWidget):
 
             self.db = db
             self.current_callsign = ""
+            self._request_id = 0
+            self._pending_prefix = ""  # Typed before the callsign index was ready
 
-            # Setup background thread for database queries
+            # Setup background thread for database queries (own read connection)
+            self.lookup = PreviousQSOLookup(db.db_path)
             self.worker_thread = QThread()
-            self.worker = ContactLookupWorker(db)
+            self.worker = ContactLookupWorker(self.lookup)
             self.worker.moveToThread(self.worker_thread)
 
             # Connect signals
+            self._lookup_requested.connect(self.worker.lookup_contacts)
+            self._index_requested.connect(self.worker.load_index)
             self.worker.finished.connect(self._on_lookup_finished)
             self.worker.error.connect(self._on_lookup_error)
+            self.worker.index_loaded.connect(self._on_index_loaded)
+            get_app_signals().contacts_batch_changed.connect(self._on_contacts_changed)
 
-            # Start worker thread
+            # Start worker thread and build the callsign index in the background
             self.worker_thread.start()
+            self._index_requested.emit()
 
             self._init_ui()
             logger.info("PreviousQSOsWidget initialized successfully with background thread")
@@ -154,6 +182,9 @@ class PreviousQSOsWidget(QWidget):
         try:
             callsign = callsign.strip().upper()
             self.current_callsign = callsign
+            self._request_id += 1
+            self.worker.latest_request = self._request_id
+            self._pending_prefix = ""
 
             if not callsign:
                 # Clear the table if callsign is empty
@@ -164,6 +195,11 @@ class PreviousQSOsWidget(QWidget):
                 logger.debug("Callsign cleared - table cleared")
                 return
 
+            cached = self.lookup.cached(callsign)
+            if cached is not None:
+                self._show_contacts(callsign, cached)
+                return
+
             # Show loading indicator
             self.qsos_table.setRowCount(0)
             self.no_qsos_label.setText(f"Loading QSOs for {callsign}...")
@@ -171,26 +207,63 @@ class PreviousQSOsWidget(QWidget):
             self.no_qsos_label.show()
 
             # Trigger background lookup
-            self.worker.lookup_contacts(callsign)
+            self._lookup_requested.emit(self._request_id, callsign)
             logger.debug(f"Background lookup started for {callsign}")
 
         except Exception as e:
             logger.error(f"Error in update_callsign: {e}", exc_info=True)
 
-    def _on_lookup_finished(self, callsign: str, contacts: List[Contact]) -> None:
+    def show_matches(self, text: str) -> None:
+        """
+        Show worked callsigns starting with partially typed input (instant)
+
+        Answered from the in-memory callsign index; the full lookup follows
+        through update_callsign once typing pauses.
+
+        Args:
+            text: Current callsign input
+        """
+        prefix = text.strip().upper()
+        if not prefix or prefix == self.current_callsign:
+            return
+        if not self.lookup.index_loaded():
+            self._pending_prefix = prefix
+            self._index_requested.emit()
+            return
+
+        matches = self.lookup.matches(prefix)
+        self.qsos_table.setRowCount(0)
+        self.qsos_table.hide()
+        if matches:
+            self.no_qsos_label.setText(f"Worked before: {', '.join(matches)}")
+        else:
+            self.no_qsos_label.setText(f"No previous QSOs starting with {prefix}")
+        self.no_qsos_label.show()
+
+    def _on_lookup_finished(self, request_id: int, callsign: str, contacts: List[PreviousQSO]) -> None:
         """
         Handle completion of background contact lookup
 
         Args:
+            request_id: Request the result answers
             callsign: The callsign that was looked up
-            contacts: List of contacts found
+            contacts: Previous QSOs found, most recent first
         """
-        try:
-            # Only update if this is still the current callsign
-            if callsign != self.current_callsign:
-                logger.debug(f"Ignoring stale lookup result for {callsign} (current: {self.current_callsign})")
-                return
+        # Only update if this is still the current request
+        if request_id != self._request_id:
+            logger.debug(f"Ignoring stale lookup result for {callsign} (current: {self.current_callsign})")
+            return
+        self._show_contacts(callsign, contacts)
 
+    def _show_contacts(self, callsign: str, contacts: List[PreviousQSO]) -> None:
+        """
+        Display the previous QSOs of a callsign
+
+        Args:
+            callsign: The callsign that was looked up
+            contacts: Previous QSOs found, most recent first
+        """
+        try:
             if not contacts:
                 # No previous QSOs
                 self.qsos_table.setRowCount(0)
@@ -209,16 +282,17 @@ class PreviousQSOsWidget(QWidget):
         except Exception as e:
             logger.error(f"Error handling lookup result for {callsign}: {e}", exc_info=True)
 
-    def _on_lookup_error(self, callsign: str, error_msg: str) -> None:
+    def _on_lookup_error(self, request_id: int, callsign: str, error_msg: str) -> None:
         """
         Handle error from background contact lookup
 
         Args:
+            request_id: Request that failed
             callsign: The callsign that was being looked up
             error_msg: Error message
         """
-        # Only update if this is still the current callsign
-        if callsign != self.current_callsign:
+        # Only update if this is still the current request
+        if request_id != self._request_id:
             return
 
         self.qsos_table.setRowCount(0)
@@ -227,24 +301,38 @@ class PreviousQSOsWidget(QWidget):
         self.no_qsos_label.show()
         logger.error(f"Error loading QSOs for {callsign}: {error_msg}")
 
-    def _populate_table(self, contacts: List[Contact]) -> None:
+    def _on_index_loaded(self) -> None:
+        """Callsign index is ready: answer the input typed so far"""
+        logger.debug("Callsign index ready for prefix matches")
+        prefix, self._pending_prefix = self._pending_prefix, ""
+        if prefix:
+            self.show_matches(prefix)
+
+    def _on_contacts_changed(self, change_type: str, metadata: dict) -> None:
+        """
+        Drop cached lookups after contacts changed
+
+        A single added contact is merged into the callsign index; any other
+        change rebuilds it in the background.
+        """
+        callsign = metadata.get('callsign') if change_type == 'added' else None
+        self.lookup.invalidate(callsign)
+        if not self.lookup.index_loaded():
+            self._index_requested.emit()
+        if self.current_callsign:
+            self.update_callsign(self.current_callsign)
+
+    def _populate_table(self, contacts: List[PreviousQSO]) -> None:
         """
         Populate the table with contact information
 
         Args:
-            contacts: List of Contact objects to display
+            contacts: Previous QSOs to display, most recent first
         """
         try:
-            # Sort contacts by date/time (most recent first)
-            sorted_contacts = sorted(
-                contacts,
-                key=lambda c: (c.qso_date or "", c.time_on or ""),
-                reverse=True
-            )
-
-            self.qsos_table.setRowCount(len(sorted_contacts))
+            self.qsos_table.setRowCount(len(contacts))
 
-            for row, contact in enumerate(sorted_contacts):
+            for row, contact in enumerate(contacts):
                 try:
                     # Date
                     date_text = contact.qso_date if contact.qso_date else "-"
@@ -319,7 +407,7 @@ class PreviousQSOsWidget(QWidget):
                 except Exception as e:
                     logger.error(f"Error populating row {row}: {e}", exc_info=True)
 
-            logger.debug(f"Successfully populated table with {len(sorted_contacts)} rows")
+            logger.debug(f"Successfully populated table with {len(contacts)} rows")
 
         except Exception as e:
             logger.error(f"Error in _populate_table: {e}", exc_info=True)
@@ -332,6 +420,7 @@ class PreviousQSOsWidget(QWidget):
                 self.worker_thread.quit()
                 self.worker_thread.wait()
                 logger.info("Previous QSOs worker thread stopped")
+            self.lookup.close()
         except Exception as e:
             logger.error(f"Error stopping worker thread: {e}", exc_info=True)
         finally:
@@ -14,12 +14,13 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QProgressBar, QTableWidget,
     QTableWidgetItem, QHeaderView, QPushButton
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor
 
 from src.database.repository import DatabaseRepository
 from src.awards.rag_chew import RagChewAward
-from src.ui.signals import get_app_signals
+from src.ui.award_service import get_award_service
+from src.ui.refresh_scheduler import get_refresh_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -41,15 +42,15 @@ class RagChewProgressWidget(QWidget):
         super().__init__(parent)
         self.db = db
 
+        # Award calculations run on the shared pool; results arrive via signal
+        self._award_service = get_award_service(db)
+        self._award_service.result_ready.connect(self._on_award_result)
+        self._award_service.job_failed.connect(self._on_award_failed)
+
         self._init_ui()
-        self.refresh()
 
-        # Connect to signals for auto-refresh
-        signals = get_app_signals()
-        signals.contacts_changed.connect(self.refresh)
-        signals.contact_added.connect(self.refresh)
-        signals.contact_modified.connect(self.refresh)
-        signals.contact_deleted.connect(self.refresh)
+        # Refresh on contact changes while visible (loads on first show)
+        get_refresh_scheduler().register(self)
 
     def _init_ui(self) -> None:
         """Initialize UI components"""
@@ -223,24 +224,17 @@ class RagChewProgressWidget(QWidget):
         return group
 
     def refresh(self) -> None:
-        """Refresh award progress from database"""
+        """Refresh award progress (calculated on the award service pool)"""
+        self._award_service.submit(
+            "rag_chew",
+            lambda contacts: RagChewAward(None).calculate_progress(contacts)
+        )
+
+    def _on_award_result(self, award_id: str, progress: dict) -> None:
+        """Update the display with a finished Rag Chew calculation"""
+        if award_id != "rag_chew":
+            return
         try:
-            session = self.db.get_session()
-
-            # Get all contacts
-            from src.database.models import Contact
-            contacts = session.query(Contact).all()
-            logger.info(f"Rag Chew Award: Fetched {len(contacts)} total contacts from database")
-            contact_dicts = [self._contact_to_dict(c) for c in contacts]
-            logger.debug(f"Rag Chew Award: Converted {len(contact_dicts)} contacts to dict format")
-
-            # Keep session open - award class may need it
-            # session.close()  # REMOVED: Session closed too early
-
-            # Calculate Rag Chew progress
-            rag_chew = RagChewAward(session)
-            progress = rag_chew.calculate_progress(contact_dicts)
-
             current_minutes = progress['current_minutes']
             required = progress['required']
             level = progress['level']
@@ -321,44 +315,10 @@ class RagChewProgressWidget(QWidget):
 
             self.band_table.setItem(row, 2, status_item)
 
-    def _calculate_duration(self, time_on: str, time_off: str) -> Optional[int]:
-        """
-        Calculate QSO duration in minutes from time_on and time_off (HHMM format)
-
-        Args:
-            time_on: Start time in HHMM format (e.g., "1430")
-            time_off: End time in HHMM format (e.g., "1500")
-
-        Returns:
-            Duration in minutes, or None if calculation fails
-        """
-        try:
-            if not time_on or not time_off:
-                return None
-
-            # Parse HHMM format
-            on_hours = int(time_on[:2])
-            on_minutes = int(time_on[2:4])
-            off_hours = int(time_off[:2])
-            off_minutes = int(time_off[2:4])
-
-            # Convert to total minutes since midnight
-            on_total = on_hours * 60 + on_minutes
-            off_total = off_hours * 60 + off_minutes
-
-            # Calculate duration
-            if off_total >= on_total:
-                # Same day
-                duration = off_total - on_total
-            else:
-                # Wrapped to next day (e.g., 2300 to 0030)
-                duration = (1440 - on_total) + off_total  # 1440 = 24 * 60 minutes
-
-            # Return duration in minutes (minimum 0)
-            return max(0, duration)
-        except (ValueError, IndexError):
-            logger.debug(f"Failed to calculate duration from {time_on} to {time_off}")
-            return None
+    def _on_award_failed(self, award_id: str, message: str) -> None:
+        """Show a failed Rag Chew calculation"""
+        if award_id == "rag_chew":
+            self.status_label.setText(f"Error: {message}")
 
     def _create_actions_section(self) -> QGroupBox:
         """Create actions section with report and application generation buttons"""
@@ -402,21 +362,3 @@ class RagChewProgressWidget(QWidget):
             logger.error(f"Error opening award application dialog: {e}", exc_info=True)
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Failed to open application dialog: {str(e)}")
-
-    def _contact_to_dict(self, contact) -> dict:
-        """Convert Contact ORM object to dictionary"""
-        # Calculate duration from time_on and time_off
-        duration = None
-        if contact.time_on and contact.time_off:
-            duration = self._calculate_duration(contact.time_on, contact.time_off)
-
-        return {
-            'callsign': contact.callsign,
-            'mode': contact.mode,
-            'band': contact.band,
-            'qso_date': contact.qso_date,
-            'qso_time': contact.time_on,
-            'skcc_number': contact.skcc_number,
-            'key_type': contact.key_type,
-            'duration': duration,
-        }
@@ -0,0 +1,194 @@
+"""
+Visibility-aware refresh scheduling for data-driven widgets.
+
+Award and statistics widgets register here instead of connecting to the
+contact change signals themselves:
+- A contact change only marks registered widgets dirty
+- Dirty widgets are refreshed after a short coalescing delay, and only while
+  visible; a hidden widget is refreshed when it is shown
+- Each flush runs within a time budget, starting with the widget that holds
+  keyboard focus, so one busy panel can't stall the event loop
+"""
+
+import logging
+import time
+from functools import partial
+from typing import Callable, Dict, Optional
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from src.ui.signals import get_app_signals
+
+logger = logging.getLogger(__name__)
+
+COALESCE_DELAY_MS = 100  # Changes arriving within this window cause one refresh
+FRAME_BUDGET_MS = 50  # Refresh time per flush before yielding to the event loop
+
+
+class _RefreshEntry:
+    """A registered widget and its refresh state"""
+
+    __slots__ = ("widget", "refresh", "priority", "dirty")
+
+    def __init__(self, widget: QWidget, refresh: Callable[[], None], priority: int):
+        self.widget = widget
+        self.refresh = refresh
+        self.priority = priority
+        self.dirty = True  # Nothing loaded yet: refresh on first show
+
+
+class RefreshScheduler(QObject):
+    """Coalesces contact changes into refreshes of the visible widgets only"""
+
+    def __init__(self, coalesce_ms: int = COALESCE_DELAY_MS, budget_ms: int = FRAME_BUDGET_MS):
+        """
+        Initialize scheduler
+
+        Args:
+            coalesce_ms: Delay between the first change of a burst and the refresh
+            budget_ms: Refresh time per flush before remaining widgets wait for the next one
+        """
+        super().__init__()
+        self._entries: Dict[int, _RefreshEntry] = {}
+        self._budget = budget_ms / 1000.0
+        self._coalesce_ms = coalesce_ms
+        self.refresh_count = 0
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+
+        get_app_signals().contacts_batch_changed.connect(self._on_contacts_changed)
+
+    def register(
+        self, widget: QWidget, refresh: Optional[Callable[[], None]] = None, priority: int = 0
+    ) -> None:
+        """
+        Refresh a widget on contact changes while it is visible
+
+        The widget starts dirty, so it loads its data the first time it is shown.
+
+        Args:
+            widget: Widget to manage
+            refresh: Refresh callable (defaults to widget.refresh)
+            priority: Higher values refresh first within a flush
+        """
+        key = id(widget)
+        self._entries[key] = _RefreshEntry(widget, refresh or widget.refresh, priority)
+        widget.installEventFilter(self)
+        widget.destroyed.connect(partial(self._forget, key))
+        if widget.isVisible():
+            self._schedule(0)
+
+    def unregister(self, widget: QWidget) -> None:
+        """Stop managing a widget"""
+        if self._entries.pop(id(widget), None) is not None:
+            widget.removeEventFilter(self)
+
+    def mark_dirty(self, widget: Optional[QWidget] = None) -> None:
+        """
+        Request a refresh of one widget (or all of them)
+
+        Args:
+            widget: Registered widget, or None for every registered widget
+        """
+        if widget is None:
+            for entry in self._entries.values():
+                entry.dirty = True
+        else:
+            entry = self._entries.get(id(widget))
+            if entry is None:
+                return
+            entry.dirty = True
+        self._schedule(self._coalesce_ms)
+
+    def is_dirty(self, widget: QWidget) -> bool:
+        """Check if a widget has a refresh pending"""
+        entry = self._entries.get(id(widget))
+        return entry is not None and entry.dirty
+
+    def flush(self) -> int:
+        """
+        Refresh the dirty visible widgets, focused widget first, within the time budget
+
+        Returns:
+            Number of widgets refreshed
+        """
+        pending = [
+            entry for entry in list(self._entries.values()) if entry.dirty and self._is_visible(entry)
+        ]
+        focus = QApplication.focusWidget()
+        pending.sort(
+            key=lambda entry: (
+                focus is not None and (entry.widget is focus or entry.widget.isAncestorOf(focus)),
+                entry.priority,
+            ),
+            reverse=True,
+        )
+
+        started = time.monotonic()
+        refreshed = 0
+        for entry in pending:
+            if refreshed and time.monotonic() - started >= self._budget:
+                # Let the event loop paint before continuing
+                self._schedule(0)
+                break
+            self._refresh(entry)
+            refreshed += 1
+        return refreshed
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Refresh a dirty widget as soon as it is shown"""
+        if event.type() == QEvent.Type.Show:
+            entry = self._entries.get(id(obj))
+            if entry is not None and entry.dirty:
+                self._refresh(entry)
+        return False
+
+    def _forget(self, key: int, *_) -> None:
+        """Drop the entry of a destroyed widget"""
+        self._entries.pop(key, None)
+
+    def _on_contacts_changed(self, change_type: str, metadata: dict) -> None:
+        """Mark every widget dirty on any contact change"""
+        self.mark_dirty()
+
+    def _schedule(self, delay_ms: int) -> None:
+        """Start the flush timer unless a flush is already pending sooner"""
+        if not self._flush_timer.isActive() or self._flush_timer.remainingTime() > delay_ms:
+            self._flush_timer.start(delay_ms)
+
+    def _refresh(self, entry: _RefreshEntry) -> None:
+        """Run one widget's refresh"""
+        entry.dirty = False
+        self.refresh_count += 1
+        try:
+            entry.refresh()
+        except Exception as e:
+            logger.error(f"Error refreshing {type(entry.widget).__name__}: {e}", exc_info=True)
+
+    def _is_visible(self, entry: _RefreshEntry) -> bool:
+        """Check visibility, dropping widgets whose C++ object is gone"""
+        try:
+            return entry.widget.isVisible()
+        except RuntimeError:
+            self._entries.pop(id(entry.widget), None)
+            return False
+
+
+# Global scheduler instance
+_refresh_scheduler = None
+
+
+def get_refresh_scheduler() -> RefreshScheduler:
+    """
+    Get the global refresh scheduler instance.
+
+    Returns:
+        RefreshScheduler: The global scheduler instance
+    """
+    global _refresh_scheduler
+    if _refresh_scheduler is None:
+        _refresh_scheduler = RefreshScheduler()
+    return _refresh_scheduler
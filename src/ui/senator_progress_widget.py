@@ -11,22 +11,26 @@ from typing import Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QProgressBar, QPushButton
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 
 from src.database.repository import DatabaseRepository
+from src.services.job_scheduler import PRIORITY_LOW, get_job_scheduler
 from src.services.senator_fetcher import SenatorFetcher
-from src.ui.signals import get_app_signals
+from src.ui.refresh_scheduler import get_refresh_scheduler
 
 logger = logging.getLogger(__name__)
 
 # Senator color (dark purple)
 SENATOR_COLOR = "#6B2C91"
+SENATOR_LIST_JOB = "senator_list"
 
 
 class SenatorProgressWidget(QWidget):
     """Displays SKCC Senator award progress with auto-updating member list"""
 
+    list_synced = pyqtSignal(object)  # MemberListChanges from the list update job (None = failed)
+
     def __init__(self, db: DatabaseRepository, parent: Optional[QWidget] = None):
         """
         Initialize Senator progress widget
@@ -39,22 +43,15 @@ class SenatorProgressWidget(QWidget):
         self.db = db
 
         self._init_ui()
-        self.refresh()
-
-        # Connect to signals instead of polling timer for refresh
-        signals = get_app_signals()
-        signals.contacts_changed.connect(self.refresh)
-        signals.contact_added.connect(self.refresh)
-        signals.contact_modified.connect(self.refresh)
-        signals.contact_deleted.connect(self.refresh)
 
-        # Auto-update Senator list daily (keep as scheduled timer)
-        self.update_list_timer = QTimer()
-        self.update_list_timer.timeout.connect(self._update_senator_list)
-        self.update_list_timer.start(3600000)  # Every hour, check if update needed
+        # Refresh on contact changes while visible (loads on first show)
+        get_refresh_scheduler().register(self)
 
-        # Defer initial update of Senator list to avoid blocking GUI startup
-        QTimer.singleShot(500, self._update_senator_list)
+        # Check hourly for a new Senator list on the job scheduler, once the user is idle
+        self.list_synced.connect(self._on_senator_list_synced)
+        get_job_scheduler().add_job(
+            SENATOR_LIST_JOB, self._update_senator_list, interval=3600, priority=PRIORITY_LOW,
+        )
 
     def _init_ui(self) -> None:
         """Initialize UI components"""
@@ -314,18 +311,32 @@ class SenatorProgressWidget(QWidget):
                 label.setStyleSheet("color: #666666;")
 
     def _update_senator_list(self) -> None:
-        """Update Senator member list from SKCC if needed"""
+        """Update Senator member list from SKCC if needed (runs on a job scheduler thread)"""
+        session = self.db.get_session()
         try:
-            session = self.db.get_session()
-            success = SenatorFetcher.refresh_senator_list(session, force=False)
+            changes = SenatorFetcher.sync_senator_list(session, force=False)
+        finally:
             session.close()
 
-            if success:
+        # Apply on the GUI thread; a failed download is retried with backoff
+        self.list_synced.emit(changes)
+        if changes is None:
+            raise RuntimeError("Senator holders list update failed")
+
+    def _on_senator_list_synced(self, changes) -> None:
+        """Apply a background Senator list update"""
+        if changes is None:
+            self.list_status_label.setText("Senator holders list update failed")
+            return
+        try:
+            self.db.apply_member_list_changes(changes)
+            session = self.db.get_session()
+            try:
                 member_count = SenatorFetcher.get_senator_member_count(session)
-                self.list_status_label.setText(f"✓ Senator holders list updated • {member_count} Senator holders")
-                logger.info(f"Senator list refreshed: {member_count} members")
-            else:
-                self.list_status_label.setText("Senator holders list update failed")
+            finally:
+                session.close()
+            self.list_status_label.setText(f"✓ Senator holders list updated • {member_count} Senator holders")
+            logger.info(f"Senator list refreshed: {member_count} members")
 
         except Exception as e:
             logger.error(f"Error updating Senator list: {e}")
@@ -337,10 +348,11 @@ class SenatorProgressWidget(QWidget):
             self.list_status_label.setText("Updating Senator holders list...")
 
             session = self.db.get_session()
-            success = SenatorFetcher.refresh_senator_list(session, force=True)
+            changes = SenatorFetcher.sync_senator_list(session, force=True)
             session.close()
 
-            if success:
+            if changes is not None:
+                self.db.apply_member_list_changes(changes)
                 member_count = SenatorFetcher.get_senator_member_count(session)
                 self.list_status_label.setText(f"✓ Senator list updated • {member_count} Senator holders")
                 logger.info(f"Manual Senator list update: {member_count} members")
@@ -396,6 +408,6 @@ class SenatorProgressWidget(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to open application dialog: {str(e)}")
 
     def closeEvent(self, event):
-        """Cleanup timers on close"""
-        self.update_list_timer.stop()
+        """Stop the list update job on close"""
+        get_job_scheduler().remove_job(SENATOR_LIST_JOB)
         super().closeEvent(event)
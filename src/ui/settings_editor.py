@@ -584,7 +584,7 @@ class SettingsEditor(QWidget):
             return
 
         try:
-            import urllib.request
+            import urllib.error
             import urllib.parse
             import xml.etree.ElementTree as ET
 
@@ -597,12 +597,8 @@ class SettingsEditor(QWidget):
             })
 
             # Test authentication
-            try:
-                from src.utils.network import urlopen_with_retries
-                opener = urlopen_with_retries(f"{qrz_url}?{params}", timeout=10, retries=3, backoff=0.5)
-            except Exception:
-                opener = urllib.request.urlopen(f"{qrz_url}?{params}", timeout=10)
-            with opener as response:
+            from src.utils.network import urlopen_with_retries
+            with urlopen_with_retries(f"{qrz_url}?{params}", timeout=10, retries=3, backoff=0.5) as response:
                 data = response.read()
                 root = ET.fromstring(data)
 
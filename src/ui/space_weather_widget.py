@@ -6,16 +6,16 @@ Displays current space weather conditions and HF propagation forecasts.
 
 import logging
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QProgressBar,
     QPushButton, QGridLayout
 )
-from PyQt6.QtCore import QTimer, Qt, QMetaObject, pyqtSlot, pyqtSignal
+from PyQt6.QtCore import Qt, QMetaObject, pyqtSlot, pyqtSignal
 from PyQt6.QtGui import QFont
-import threading
 
+from src.services.job_scheduler import get_job_scheduler
 from src.services.space_weather_fetcher import SpaceWeatherFetcher
 from src.services.voacap_muf_fetcher import VOACAPMUFFetcher, MUFPrediction
 from src.utils.cache import TTLCache
@@ -23,6 +23,8 @@ from src.config.settings import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+SPACE_WEATHER_JOB = "space_weather"
+
 
 class SpaceWeatherWidget(QWidget):
     """Displays current space weather conditions and HF propagation status"""
@@ -37,6 +39,9 @@ class SpaceWeatherWidget(QWidget):
     FONT_XLARGE = 1.8  # 18pt equivalent
     FONT_HUGE = 2.3    # 23pt+ equivalent
 
+    # Hours after the current one shown in the MUF timeline
+    MUF_TIMELINE_HOURS = 6
+
     def _get_font(self, size_multiplier: float = FONT_NORMAL, bold: bool = False) -> QFont:
         """Get a properly scaled font based on application default font and multiplier"""
         font = QFont()  # Get application default font
@@ -77,16 +82,17 @@ class SpaceWeatherWidget(QWidget):
         # Connect data_fetched signal to slot (thread-safe way to update UI from background thread)
         self.data_fetched.connect(self._on_data_fetched_signal)
 
-        # Defer initial refresh to avoid blocking GUI initialization
-        # Uses QTimer.singleShot to defer until event loop is running
-        # This allows the window to render immediately while network data loads in background
-        # Use 500ms delay to ensure event loop is fully active during startup
-        QTimer.singleShot(500, self._refresh_in_background)
+        # Show last known conditions and forecast immediately while fresh data loads
+        self._show_last_known_conditions()
+        self._show_cached_forecast()
 
-        # Auto-refresh every 15 minutes (MUF changes frequently with solar conditions)
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self._refresh_in_background)
-        self.refresh_timer.start(900000)  # 15 minutes
+        # Refresh on the job scheduler every 15 minutes (MUF changes frequently with
+        # solar conditions). Not deferred until idle: the first fetch replaces the
+        # last known conditions shown above, a few seconds after startup
+        get_job_scheduler().add_job(
+            SPACE_WEATHER_JOB, self._fetch_conditions, delay=5.0, interval=900,
+            defer_until_idle=False, backoff_base=120.0, backoff_max=900.0,
+        )
 
     def _init_ui(self) -> None:
         """Initialize UI components"""
@@ -121,7 +127,7 @@ class SpaceWeatherWidget(QWidget):
         # Refresh button and status
         controls_layout = QHBoxLayout()
         refresh_btn = QPushButton("Refresh Now")
-        refresh_btn.clicked.connect(self.refresh)
+        refresh_btn.clicked.connect(self._refresh_in_background)
         controls_layout.addWidget(refresh_btn)
 
         self.update_status_label = QLabel("Loading...")
@@ -252,6 +258,12 @@ class SpaceWeatherWidget(QWidget):
 
         layout.addLayout(bar_layout)
 
+        # Next hours from the precomputed forecast table
+        self.muf_timeline_label = QLabel("Next hours: --")
+        self.muf_timeline_label.setFont(self._get_font(self.FONT_NORMAL))
+        self.muf_timeline_label.setWordWrap(True)
+        layout.addWidget(self.muf_timeline_label)
+
         # MUF explanation
         info_label = QLabel(
             "MUF (Maximum Usable Frequency) is the highest frequency that reliably supports skywave propagation.\n"
@@ -325,48 +337,41 @@ class SpaceWeatherWidget(QWidget):
         return group
 
     def _refresh_in_background(self) -> None:
-        """Start refresh operation in background thread to avoid blocking UI"""
-        def background_refresh():
-            """Background thread function to fetch data (non-blocking)"""
-            try:
-                # Try cache first
-                cached = self.cache.get("current_conditions")
-                if cached is not None:
-                    logger.debug("Using cached space weather data")
-                    # Emit signal to update UI on main thread (thread-safe)
-                    self.data_fetched.emit(cached)
-                    return
-
-                # Fetch new data (blocking network calls - but in background thread!)
-                logger.debug("Fetching current space weather data from NOAA (background thread)")
-                conditions = self.fetcher.get_current_conditions()
-                logger.debug(f"Fetched conditions: {conditions}")
-                solar = self.fetcher.get_solar_data()
-                logger.debug(f"Fetched solar data: {solar}")
-
-                if conditions is None or solar is None:
-                    logger.warning(f"Incomplete data fetch - conditions={conditions is not None}, solar={solar is not None}")
-
-                # Combine data
-                data = {**(conditions or {}), **(solar or {})}
-                logger.debug(f"Combined data: {data}")
-
-                # Cache the results
-                self.cache.set("current_conditions", data)
+        """Run the refresh job now on the job scheduler to avoid blocking UI"""
+        get_job_scheduler().run_now(SPACE_WEATHER_JOB)
 
+    def _fetch_conditions(self) -> None:
+        """Fetch current conditions (runs on a job scheduler thread, non-blocking)"""
+        try:
+            # Try cache first
+            cached = self.cache.get("current_conditions")
+            if cached is not None:
+                logger.debug("Using cached space weather data")
                 # Emit signal to update UI on main thread (thread-safe)
-                logger.info("✓ Emitting data_fetched signal to main thread")
-                self.data_fetched.emit(data)
+                self.data_fetched.emit(cached)
+                return
+
+            # Fetch new data (concurrent blocking network calls - but in background thread!)
+            logger.debug("Fetching current space weather data from NOAA (background thread)")
+            data = self.fetcher.get_all_conditions()
+            logger.debug(f"Combined data: {data}")
+
+            # Cache the results
+            self.cache.set("current_conditions", data)
 
-            except Exception as e:
-                logger.error(f"Error refreshing space weather: {e}", exc_info=True)
-                # Update status label with error on main thread
-                error_msg = f"Error: {str(e)[:100]}"  # Increased from 50 to 100 chars for better error visibility
-                QMetaObject.invokeMethod(self.update_status_label, "setText", Qt.ConnectionType.QueuedConnection, error_msg)
+            # Build or load today's MUF forecast off the GUI thread
+            self._warm_muf_forecast(data)
 
-        # Start the background thread to fetch data
-        thread = threading.Thread(target=background_refresh, daemon=True)
-        thread.start()
+            # Emit signal to update UI on main thread (thread-safe)
+            logger.info("✓ Emitting data_fetched signal to main thread")
+            self.data_fetched.emit(data)
+
+        except Exception as e:
+            logger.error(f"Error refreshing space weather: {e}", exc_info=True)
+            # Update status label with error on main thread
+            error_msg = f"Error: {str(e)[:100]}"  # Increased from 50 to 100 chars for better error visibility
+            QMetaObject.invokeMethod(self.update_status_label, "setText", Qt.ConnectionType.QueuedConnection, error_msg)
+            raise  # Retried with backoff by the scheduler
 
     @pyqtSlot(dict)
     def _on_data_fetched_signal(self, data: dict) -> None:
@@ -398,53 +403,6 @@ class SpaceWeatherWidget(QWidget):
             logger.error(f"Error updating space weather display: {e}", exc_info=True)
             self.update_status_label.setText(f"Error: {str(e)[:50]}")
 
-    def refresh(self) -> None:
-        """Refresh space weather data (synchronous - for manual refresh button)"""
-        try:
-            # Try cache first
-            cached = self.cache.get("current_conditions")
-            if cached is not None:
-                logger.debug("Using cached space weather data")
-                self._update_ui(cached)
-                self._update_muf_display(cached)
-                return
-
-            # Fetch new data
-            logger.debug("Fetching current space weather data from NOAA")
-            conditions = self.fetcher.get_current_conditions()
-            solar = self.fetcher.get_solar_data()
-
-            # Combine data
-            data = {**conditions, **solar}
-
-            # Cache the results
-            self.cache.set("current_conditions", data)
-
-            # Update UI
-            self._update_ui(data)
-            self._update_muf_display(data)
-
-            # Update timestamp and data sources
-            self.update_status_label.setText(f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
-
-            # Show data source information
-            sources = []
-            if data.get('kp_index') is not None:
-                sources.append("K-index: NOAA SWPC")
-            if data.get('solar_flux_index') is not None:
-                sources.append("Solar Flux: NOAA/HamQSL")
-            if data.get('sunspot_count') is not None or data.get('sunspot_ssn') is not None:
-                sunspot_source = data.get('sunspot_source', 'NOAA/HamQSL')
-                sources.append(f"Sunspots: {sunspot_source}")
-            if sources:
-                self.data_source_label.setText(f"Data: {' | '.join(sources)}")
-            else:
-                self.data_source_label.setText("Data: Calculated estimate")
-
-        except Exception as e:
-            logger.error(f"Error refreshing space weather: {e}")
-            self.update_status_label.setText(f"Error: {str(e)[:50]}")
-
     def _update_ui(self, data: dict) -> None:
         """Update UI with space weather data"""
         # Current conditions
@@ -581,38 +539,92 @@ class SpaceWeatherWidget(QWidget):
 
             # Store predictions for reference
             self.current_muf_predictions = predictions
+            self._show_muf_predictions(predictions)
+            self._update_muf_timeline(sfi_val, kp_val, home_grid)
+
+        except Exception as e:
+            logger.error(f"Error updating MUF display: {e}", exc_info=True)
+            self.muf_value_label.setText("-- MHz")
+            self.muf_bar_display.setText(f"█░░░░░░░░░░░░░░░░░░ Error: {str(e)[:30]}")
+
+    def _show_muf_predictions(self, predictions: Dict[str, MUFPrediction]) -> None:
+        """Display the maximum MUF value across band predictions"""
+        # Find the maximum MUF value from all predictions
+        max_muf = 0
+        best_band = None
+        if predictions:
+            for band_name, prediction in predictions.items():
+                if prediction.muf_value > max_muf:
+                    max_muf = prediction.muf_value
+                    best_band = band_name
+
+        # Display the maximum MUF value
+        self.muf_value_label.setText(f"{max_muf:.0f} MHz")
+        self.muf_value_label.setStyleSheet("color: #1E7D5E;")  # Green
 
-            # Find the maximum MUF value from all predictions
-            max_muf = 0
-            best_band = None
-            if predictions:
-                for band_name, prediction in predictions.items():
-                    if prediction.muf_value > max_muf:
-                        max_muf = prediction.muf_value
-                        best_band = band_name
+        # Create visual bar representation (0-60 MHz scale)
+        filled_blocks = int((max_muf / 60.0) * 20)
+        filled_blocks = min(filled_blocks, 20)
+        bar = "█" * filled_blocks + "░" * (20 - filled_blocks)
 
-            # Display the maximum MUF value
-            self.muf_value_label.setText(f"{max_muf:.0f} MHz")
-            self.muf_value_label.setStyleSheet("color: #1E7D5E;")  # Green
+        self.muf_bar_display.setText(bar)
+        self.muf_status_label.setText(f"Maximum MUF: {max_muf:.0f} MHz (from {best_band})")
 
-            # Create visual bar representation (0-60 MHz scale)
-            filled_blocks = int((max_muf / 60.0) * 20)
-            filled_blocks = min(filled_blocks, 20)
-            bar = "█" * filled_blocks + "░" * (20 - filled_blocks)
+        logger.info(f"Updated MUF display: Max MUF = {max_muf:.1f} MHz from {best_band}")
 
-            self.muf_bar_display.setText(bar)
-            self.muf_status_label.setText(f"Maximum MUF: {max_muf:.0f} MHz (from {best_band})")
+    def _update_muf_timeline(self, sfi: int, k_index: int, home_grid: str) -> None:
+        """Display the maximum MUF for the current and next few UTC hours"""
+        timeline = self.muf_fetcher.get_forecast_engine().get_timeline(
+            sfi, k_index, home_grid, hours=self.MUF_TIMELINE_HOURS
+        )
+        slots = []
+        for slot_time, predictions in timeline:
+            max_muf = max((p.muf_value for p in predictions.values()), default=0)
+            slots.append(f"{slot_time.hour:02d}Z {max_muf:.0f}")
+        self.muf_timeline_label.setText("Next hours (MHz): " + " | ".join(slots))
+
+    def _warm_muf_forecast(self, data: dict) -> None:
+        """Build or load the forecast table so display updates are lookups (background thread)"""
+        try:
+            sfi = data.get('solar_flux_index')
+            kp = data.get('kp_index')
+            if sfi is None or kp is None:
+                return
+            home_grid = self.config.get("general.home_grid", "FN20qd")
+            self.muf_fetcher.get_forecast_engine().get_table(int(float(sfi)), int(float(kp)), home_grid)
+        except (ValueError, TypeError) as e:
+            logger.debug(f"Skipping MUF forecast warm-up: {e}")
 
-            logger.info(f"Updated MUF display: Max MUF = {max_muf:.1f} MHz from {best_band}")
+    def _show_last_known_conditions(self) -> None:
+        """Show space weather from the on-disk response cache, if any"""
+        try:
+            data = self.fetcher.get_last_known_conditions()
+            if data is None:
+                return
+            self._update_ui(data)
+            self.update_status_label.setText("Showing last known data - updating...")
+        except Exception as e:
+            logger.debug(f"Could not show last known space weather: {e}")
+
+    def _show_cached_forecast(self) -> None:
+        """Show the most recent persisted MUF forecast for the home grid, if any"""
+        try:
+            home_grid = self.config.get("general.home_grid", "FN20qd")
+            table = self.muf_fetcher.get_forecast_engine().load_latest(home_grid)
+            if table is None:
+                return
 
+            self.muf_location_label.setText(f"Location: {home_grid} (your home grid)")
+            self.current_muf_predictions = table.get_predictions(datetime.now(timezone.utc).hour)
+            self._show_muf_predictions(self.current_muf_predictions)
+            self._update_muf_timeline(table.sfi, table.k_index, home_grid)
+            self.update_status_label.setText(f"Cached forecast (SFI={table.sfi}, K={table.k_index}) - updating...")
         except Exception as e:
-            logger.error(f"Error updating MUF display: {e}", exc_info=True)
-            self.muf_value_label.setText("-- MHz")
-            self.muf_bar_display.setText(f"█░░░░░░░░░░░░░░░░░░ Error: {str(e)[:30]}")
+            logger.debug(f"Could not show cached MUF forecast: {e}")
 
     def closeEvent(self, event) -> None:
         """Clean up on close"""
-        self.refresh_timer.stop()
+        get_job_scheduler().remove_job(SPACE_WEATHER_JOB)
         self.fetcher.close()
         self.muf_fetcher.close()
         super().closeEvent(event)
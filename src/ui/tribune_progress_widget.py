@@ -11,22 +11,26 @@ from typing import Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QProgressBar, QPushButton
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 
 from src.database.repository import DatabaseRepository
+from src.services.job_scheduler import PRIORITY_LOW, get_job_scheduler
 from src.services.tribune_fetcher import TribuneFetcher
-from src.ui.signals import get_app_signals
+from src.ui.refresh_scheduler import get_refresh_scheduler
 
 logger = logging.getLogger(__name__)
 
 # Tribune color (steel blue)
 TRIBUNE_COLOR = "#1E88E5"
+TRIBUNE_LIST_JOB = "tribune_list"
 
 
 class TribuneProgressWidget(QWidget):
     """Displays SKCC Tribune award progress with auto-updating member list"""
 
+    list_synced = pyqtSignal(object)  # MemberListChanges from the list update job (None = failed)
+
     def __init__(self, db: DatabaseRepository, parent: Optional[QWidget] = None):
         """
         Initialize Tribune progress widget
@@ -39,22 +43,15 @@ class TribuneProgressWidget(QWidget):
         self.db = db
 
         self._init_ui()
-        self.refresh()
-
-        # Connect to signals instead of polling timer for refresh
-        signals = get_app_signals()
-        signals.contacts_changed.connect(self.refresh)
-        signals.contact_added.connect(self.refresh)
-        signals.contact_modified.connect(self.refresh)
-        signals.contact_deleted.connect(self.refresh)
 
-        # Auto-update Tribune list daily (keep as scheduled timer)
-        self.update_list_timer = QTimer()
-        self.update_list_timer.timeout.connect(self._update_tribune_list)
-        self.update_list_timer.start(3600000)  # Every hour, check if update needed
+        # Refresh on contact changes while visible (loads on first show)
+        get_refresh_scheduler().register(self)
 
-        # Defer initial update of Tribune list to avoid blocking GUI startup
-        QTimer.singleShot(500, self._update_tribune_list)
+        # Check hourly for a new Tribune list on the job scheduler, once the user is idle
+        self.list_synced.connect(self._on_tribune_list_synced)
+        get_job_scheduler().add_job(
+            TRIBUNE_LIST_JOB, self._update_tribune_list, interval=3600, priority=PRIORITY_LOW,
+        )
 
     def _init_ui(self) -> None:
         """Initialize UI components"""
@@ -313,18 +310,32 @@ class TribuneProgressWidget(QWidget):
                 label.setStyleSheet("color: #666666;")
 
     def _update_tribune_list(self) -> None:
-        """Update Tribune member list from SKCC if needed"""
+        """Update Tribune member list from SKCC if needed (runs on a job scheduler thread)"""
+        session = self.db.get_session()
         try:
-            session = self.db.get_session()
-            success = TribuneFetcher.refresh_tribune_list(session, force=False)
+            changes = TribuneFetcher.sync_tribune_list(session, force=False)
+        finally:
             session.close()
 
-            if success:
+        # Apply on the GUI thread; a failed download is retried with backoff
+        self.list_synced.emit(changes)
+        if changes is None:
+            raise RuntimeError("Tribune holders list update failed")
+
+    def _on_tribune_list_synced(self, changes) -> None:
+        """Apply a background Tribune list update"""
+        if changes is None:
+            self.list_status_label.setText("Tribune holders list update failed")
+            return
+        try:
+            self.db.apply_member_list_changes(changes)
+            session = self.db.get_session()
+            try:
                 member_count = TribuneFetcher.get_tribune_member_count(session)
-                self.list_status_label.setText(f"✓ Tribune holders list updated • {member_count} Tribune holders")
-                logger.info(f"Tribune list refreshed: {member_count} members")
-            else:
-                self.list_status_label.setText("Tribune holders list update failed")
+            finally:
+                session.close()
+            self.list_status_label.setText(f"✓ Tribune holders list updated • {member_count} Tribune holders")
+            logger.info(f"Tribune list refreshed: {member_count} members")
 
         except Exception as e:
             logger.error(f"Error updating Tribune list: {e}")
@@ -336,10 +347,11 @@ class TribuneProgressWidget(QWidget):
             self.list_status_label.setText("Updating Tribune holders list...")
 
             session = self.db.get_session()
-            success = TribuneFetcher.refresh_tribune_list(session, force=True)
+            changes = TribuneFetcher.sync_tribune_list(session, force=True)
             session.close()
 
-            if success:
+            if changes is not None:
+                self.db.apply_member_list_changes(changes)
                 member_count = TribuneFetcher.get_tribune_member_count(session)
                 self.list_status_label.setText(f"✓ Tribune list updated • {member_count} Tribune holders")
                 logger.info(f"Manual Tribune list update: {member_count} members")
@@ -395,6 +407,6 @@ class TribuneProgressWidget(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to open application dialog: {str(e)}")
 
     def closeEvent(self, event):
-        """Cleanup timers on close"""
-        self.update_list_timer.stop()
+        """Stop the list update job on close"""
+        get_job_scheduler().remove_job(TRIBUNE_LIST_JOB)
         super().closeEvent(event)
@@ -17,12 +17,13 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox, QLabel, QProgressBar, QTableWidget,
     QTableWidgetItem, QHeaderView, QPushButton
 )
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor
 
 from src.database.repository import DatabaseRepository
 from src.awards.wac import WACAward
-from src.ui.signals import get_app_signals
+from src.ui.award_service import get_award_service
+from src.ui.refresh_scheduler import get_refresh_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -49,42 +50,6 @@ CONTINENT_NAMES = {
 }
 
 
-class WACRefreshWorker(QThread):
-    """Worker thread for refreshing WAC award progress - NO DATABASE ACCESS"""
-    finished = pyqtSignal(dict)  # Emits progress data
-
-    def __init__(self, contact_dicts: list, session_for_award):
-        super().__init__()
-        self.contact_dicts = contact_dicts
-        self.session_for_award = session_for_award
-
-    def run(self):
-        """Run WAC calculation in background thread - data already fetched"""
-        try:
-            logger.debug(f"WAC Award: Processing {len(self.contact_dicts)} contacts")
-
-            # Calculate WAC progress (using pre-fetched data)
-            wac_award = WACAward(self.session_for_award)
-            progress = wac_award.calculate_progress(self.contact_dicts)
-
-            logger.info(f"WAC Award: Calculated progress - {progress['current']}/6 continents worked")
-
-            self.finished.emit(progress)
-        except Exception as e:
-            logger.error(f"Error in WAC refresh worker: {e}", exc_info=True)
-            # Emit empty progress on error
-            self.finished.emit({
-                'current': 0,
-                'required': 6,
-                'achieved': False,
-                'progress_pct': 0.0,
-                'level': 'Error',
-                'continents_worked': [],
-                'continent_details': {},
-                'band_details': {},
-            })
-
-
 class WACProgressWidget(QWidget):
     """Displays SKCC WAC award progress with continent tracking"""
 
@@ -98,18 +63,16 @@ class WACProgressWidget(QWidget):
         """
         super().__init__(parent)
         self.db = db
-        self._refresh_worker: Optional[WACRefreshWorker] = None
+
+        # Award calculations run on the shared pool; results arrive via signal
+        self._award_service = get_award_service(db)
+        self._award_service.result_ready.connect(self._on_award_result)
+        self._award_service.job_failed.connect(self._on_award_failed)
 
         self._init_ui()
-        # Defer initial refresh to avoid blocking GUI startup
-        QTimer.singleShot(450, self.refresh)
 
-        # Connect to signals for auto-refresh
-        signals = get_app_signals()
-        signals.contacts_changed.connect(self.refresh)
-        signals.contact_added.connect(self.refresh)
-        signals.contact_modified.connect(self.refresh)
-        signals.contact_deleted.connect(self.refresh)
+        # Refresh on contact changes while visible (loads on first show)
+        get_refresh_scheduler().register(self)
 
     def _init_ui(self) -> None:
         """Initialize UI components"""
@@ -259,155 +222,109 @@ class WACProgressWidget(QWidget):
         return group
 
     def refresh(self) -> None:
-        """Refresh award progress - fetch data on main thread, calculate in background"""
-        # Don't start new refresh if one is already running
-        if self._refresh_worker and self._refresh_worker.isRunning():
-            logger.debug("WAC refresh worker already running, skipping")
-            return
+        """Refresh award progress (calculated on the award service pool)"""
+        self._award_service.submit(
+            "wac", lambda contacts: WACAward(None).calculate_progress(contacts)
+        )
 
-        # Fetch data on MAIN THREAD (thread-safe)
+    def _on_award_result(self, award_id: str, progress: dict) -> None:
+        """Update the display with a finished WAC calculation"""
+        if award_id != "wac":
+            return
         try:
-            from src.database.models import Contact
-            session = self.db.get_session()
-            contacts = session.query(Contact).all()
-            logger.info(f"WAC Award: Fetched {len(contacts)} total contacts from database")
-
-            # Convert to dictionaries (main thread)
-            contact_dicts = []
-            for c in contacts:
-                contact_dicts.append({
-                    'callsign': c.callsign,
-                    'mode': c.mode,
-                    'skcc_number': c.skcc_number,
-                    'key_type': c.key_type,
-                    'qso_date': c.qso_date,
-                    'band': c.band,
-                })
+            # Extract progress values
+            continents_worked = progress['continents_worked']
+            continent_details = progress['continent_details']
+            achieved = progress['achieved']
+            current = progress['current']
+
+            logger.info(f"WAC Award: Calculated progress - {current}/6 continents worked, achieved={achieved}")
+            if current > 0:
+                logger.info(f"WAC Award: Continents worked: {', '.join(sorted(continents_worked))}")
+
+            # Update overall progress bar
+            self.progress_bar.setValue(current)
+
+            # Update status label
+            if achieved:
+                status_text = "✅ WAC Award Achieved!"
+            else:
+                missing = 6 - current
+                status_text = f"Working toward WAC - {missing} continent(s) needed"
+
+            self.status_label.setText(
+                f"{status_text} • {current}/6 continents worked"
+            )
+
+            # Update continent indicators
+            for continent_code, continent_name in CONTINENT_NAMES.items():
+                count = continent_details.get(continent_code, 0)
+                is_worked = continent_code in continents_worked
+
+                indicator = "☑" if is_worked else "☐"
+                label_text = f"{indicator} {continent_name} ({count} QSOs)"
+
+                label = self.continent_labels[continent_code]
+                label.setText(label_text)
+
+                if is_worked:
+                    label.setStyleSheet(
+                        f"color: {WAC_COLOR}; font-weight: bold;"
+                    )
+                else:
+                    label.setStyleSheet("")
+
+            # Update details table
+            self.details_table.setRowCount(0)
+
+            continents_order = ['NA', 'SA', 'EU', 'AF', 'AS', 'OC']
+            for continent_code in continents_order:
+                continent_name = CONTINENT_NAMES[continent_code]
+                count = continent_details.get(continent_code, 0)
+
+                row = self.details_table.rowCount()
+                self.details_table.insertRow(row)
+
+                # Continent name
+                name_item = QTableWidgetItem(continent_name)
+                name_item.setFont(QFont("Arial", 9))
+                self.details_table.setItem(row, 0, name_item)
+
+                # Contact count
+                count_item = QTableWidgetItem(str(count))
+                count_item.setFont(QFont("Arial", 9))
+                if continent_code in continents_worked:
+                    count_item.setForeground(QColor(WAC_COLOR))
+                self.details_table.setItem(row, 1, count_item)
+
+            # Update statistics
+            self.continents_worked_label.setText(f"Continents Worked: {current}/6")
+
+            total_contacts = sum(continent_details.values())
+            self.total_contacts_label.setText(f"Total Qualifying Contacts: {total_contacts}")
+
+            # Update missing continents
+            if achieved:
+                self.missing_label.setText("✅ All continents achieved!")
+                self.missing_label.setStyleSheet(f"color: {WAC_COLOR}; font-weight: bold;")
+            else:
+                missing_continents = [
+                    CONTINENT_NAMES[code]
+                    for code in continents_order
+                    if code not in continents_worked
+                ]
+                missing_text = "Missing: " + ", ".join(missing_continents)
+                self.missing_label.setText(missing_text)
+                self.missing_label.setStyleSheet("color: #666666;")
+
         except Exception as e:
-            logger.error(f"Error fetching WAC data: {e}", exc_info=True)
-            return
+            logger.error(f"Error handling WAC refresh completion: {e}", exc_info=True)
+            self.status_label.setText(f"Error: {str(e)}")
 
-        def on_refresh_finished(progress: dict):
-            """Handle refresh completion on main thread"""
-            try:
-                # Check if widget is still valid (not being destroyed)
-                if not self or not hasattr(self, 'progress_bar'):
-                    logger.debug("WAC widget destroyed, skipping UI update")
-                    if hasattr(self, '_refresh_worker') and self._refresh_worker:
-                        try:
-                            self._refresh_worker.wait(100)
-                            self._refresh_worker.deleteLater()
-                        except:
-                            pass
-                    return
-
-                if self._refresh_worker:
-                    # Wait for thread to fully exit before deletion
-                    self._refresh_worker.wait(500)
-
-                    # Disconnect signal before deletion
-                    try:
-                        self._refresh_worker.finished.disconnect()
-                    except:
-                        pass
-
-                    self._refresh_worker.deleteLater()
-                    self._refresh_worker = None
-
-                # Extract progress values
-                continents_worked = progress['continents_worked']
-                continent_details = progress['continent_details']
-                achieved = progress['achieved']
-                current = progress['current']
-
-                logger.info(f"WAC Award: Calculated progress - {current}/6 continents worked, achieved={achieved}")
-                if current > 0:
-                    logger.info(f"WAC Award: Continents worked: {', '.join(sorted(continents_worked))}")
-
-                # Update overall progress bar
-                self.progress_bar.setValue(current)
-
-                # Update status label
-                if achieved:
-                    status_text = "✅ WAC Award Achieved!"
-                else:
-                    missing = 6 - current
-                    status_text = f"Working toward WAC - {missing} continent(s) needed"
-
-                self.status_label.setText(
-                    f"{status_text} • {current}/6 continents worked"
-                )
-
-                # Update continent indicators
-                for continent_code, continent_name in CONTINENT_NAMES.items():
-                    count = continent_details.get(continent_code, 0)
-                    is_worked = continent_code in continents_worked
-
-                    indicator = "☑" if is_worked else "☐"
-                    label_text = f"{indicator} {continent_name} ({count} QSOs)"
-
-                    label = self.continent_labels[continent_code]
-                    label.setText(label_text)
-
-                    if is_worked:
-                        label.setStyleSheet(
-                            f"color: {WAC_COLOR}; font-weight: bold;"
-                        )
-                    else:
-                        label.setStyleSheet("")
-
-                # Update details table
-                self.details_table.setRowCount(0)
-
-                continents_order = ['NA', 'SA', 'EU', 'AF', 'AS', 'OC']
-                for continent_code in continents_order:
-                    continent_name = CONTINENT_NAMES[continent_code]
-                    count = continent_details.get(continent_code, 0)
-
-                    row = self.details_table.rowCount()
-                    self.details_table.insertRow(row)
-
-                    # Continent name
-                    name_item = QTableWidgetItem(continent_name)
-                    name_item.setFont(QFont("Arial", 9))
-                    self.details_table.setItem(row, 0, name_item)
-
-                    # Contact count
-                    count_item = QTableWidgetItem(str(count))
-                    count_item.setFont(QFont("Arial", 9))
-                    if continent_code in continents_worked:
-                        count_item.setForeground(QColor(WAC_COLOR))
-                    self.details_table.setItem(row, 1, count_item)
-
-                # Update statistics
-                self.continents_worked_label.setText(f"Continents Worked: {current}/6")
-
-                total_contacts = sum(continent_details.values())
-                self.total_contacts_label.setText(f"Total Qualifying Contacts: {total_contacts}")
-
-                # Update missing continents
-                if achieved:
-                    self.missing_label.setText("✅ All continents achieved!")
-                    self.missing_label.setStyleSheet(f"color: {WAC_COLOR}; font-weight: bold;")
-                else:
-                    missing_continents = [
-                        CONTINENT_NAMES[code]
-                        for code in continents_order
-                        if code not in continents_worked
-                    ]
-                    missing_text = "Missing: " + ", ".join(missing_continents)
-                    self.missing_label.setText(missing_text)
-                    self.missing_label.setStyleSheet("color: #666666;")
-
-            except Exception as e:
-                logger.error(f"Error handling WAC refresh completion: {e}", exc_info=True)
-                self.status_label.setText(f"Error: {str(e)}")
-
-        # Start background worker with pre-fetched data (no DB access in worker)
-        self._refresh_worker = WACRefreshWorker(contact_dicts, session)
-        self._refresh_worker.finished.connect(on_refresh_finished)
-        self._refresh_worker.start()
-        logger.debug("Started background WAC refresh worker with pre-fetched data")
+    def _on_award_failed(self, award_id: str, message: str) -> None:
+        """Show a failed WAC calculation"""
+        if award_id == "wac":
+            self.status_label.setText(f"Error: {message}")
 
     def _create_actions_section(self) -> QGroupBox:
         """Create actions section with report and application generation buttons"""
@@ -451,29 +368,3 @@ class WACProgressWidget(QWidget):
             logger.error(f"Error opening award application dialog: {e}", exc_info=True)
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Failed to open application dialog: {str(e)}")
-
-    def closeEvent(self, event) -> None:
-        """Clean up when widget is closed"""
-        try:
-            # Stop any running worker thread with quick timeout
-            if self._refresh_worker and self._refresh_worker.isRunning():
-                self._refresh_worker.quit()
-                if not self._refresh_worker.wait(500):  # Wait max 500ms
-                    logger.warning("WAC refresh worker didn't stop in time, terminating...")
-                    self._refresh_worker.terminate()
-                    self._refresh_worker.wait(100)
-        except Exception as e:
-            logger.error(f"Error cleaning up WAC widget: {e}", exc_info=True)
-        super().closeEvent(event)
-
-    def _contact_to_dict(self, contact) -> dict:
-        """Convert Contact ORM object to dictionary"""
-        return {
-            'callsign': contact.callsign,
-            'mode': contact.mode,
-            'band': contact.band,
-            'qso_date': contact.qso_date,
-            'qso_time': contact.time_on,
-            'skcc_number': contact.skcc_number,
-            'key_type': contact.key_type,
-        }
@@ -28,12 +28,16 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QObject
 from PyQt6.QtGui import QColor, QFont
 
-from src.skcc import SkccSkimmerSubprocess, SkimmerConnectionState, SKCCSpot
+from src.skcc import SkccSkimmerSubprocess, SkimmerConnectionState, SKCCSpot, SpotAggregator, SpotCluster
 from src.config.settings import get_config_manager
+from src.services.job_scheduler import PRIORITY_LOW, get_job_scheduler
+from src.utils.continents import continent_from_callsign
 from src.database.models import Contact
 
 logger = logging.getLogger(__name__)
 
+SPOT_ARCHIVE_JOB = "spot_archive"
+
 
 class SKCCSpotStatusIndicator(QLabel):
     """Status indicator for SKCC Skimmer connection"""
@@ -69,6 +73,13 @@ class SKCCSpotRow:
         self.speed = f"{spot.speed} WPM" if spot.speed else ""
         self.reporter = spot.reporter
         self.time = spot.timestamp.strftime("%H:%M:%S")
+        # Clusters carry consensus details; a single spot counts as one reporter
+        reporter_count = getattr(spot, "reporter_count", 1)
+        median_strength = getattr(spot, "median_strength", spot.strength)
+        self.heard = str(reporter_count)
+        self.heard_tooltip = (
+            f"Heard by {reporter_count} reporter(s): best {spot.strength} dB, median {median_strength:g} dB"
+        )
         self.age_seconds = (datetime.now(timezone.utc) - spot.timestamp).total_seconds()
 
     def get_age_string(self) -> str:
@@ -100,13 +111,44 @@ class SKCCSpotWidget(QWidget):
         """
         super().__init__(parent)
         self.db = db
-        self.spots: List[SKCCSpot] = []
-        self.filtered_spots: List[SKCCSpot] = []
+        # One cluster per active signal, merging reports from all skimmers (±0.5 kHz, 10 minutes)
+        self.spot_aggregator = SpotAggregator(tolerance_khz=0.5, window_seconds=600, max_clusters=200)
+        self.spots: List[SpotCluster] = []
+        self.filtered_spots: List[SpotCluster] = []
 
-        # RBN Fetcher for real-time CW spots from Telegraphy.de
+        # RBN Fetcher for real-time CW spots from Telegraphy.de (plus optional cluster/skimmer feeds)
         from src.rbn.rbn_fetcher import RBNFetcher
 
-        self.rbn_fetcher = RBNFetcher()
+        config = get_config_manager()
+        # Optionally run the feeds in a worker process that owns the archive (see _toggle_spot_worker)
+        self.use_spot_worker = config.get("dx_cluster.worker_process", False)
+        self.spot_worker = None
+        self._spot_worker_state = None
+        self.spot_archive = None
+        if config.get("dx_cluster.archive_enabled", True) and not self.use_spot_worker:
+            from src.rbn.spot_archive import SpotArchive
+
+            try:
+                self.spot_archive = SpotArchive(
+                    config.config_dir / "spot_archive.db",
+                    retention_days=config.get("dx_cluster.archive_retention_days", 90),
+                )
+            except Exception as e:
+                logger.warning(f"Spot archive unavailable: {e}")
+        if self.spot_archive is not None:
+            # Flush and retention write SQLite, so they run on the job scheduler instead of the GUI thread
+            get_job_scheduler().add_job(
+                SPOT_ARCHIVE_JOB, self._maintain_spot_archive, delay=30, interval=30,
+                priority=PRIORITY_LOW, defer_until_idle=False,
+            )
+        cluster_enabled = config.get("dx_cluster.enabled", True)
+        self.rbn_fetcher = RBNFetcher(
+            cluster_host=config.get("dx_cluster.host", "") if cluster_enabled else None,
+            cluster_port=config.get("dx_cluster.port", 7300),
+            skimmer_path=config.get("skcc.skimmer_path", "") or None,
+            dedup_window_seconds=config.get("dx_cluster.dedup_window_seconds", 120),
+            archive=self.spot_archive,
+        )
 
         # Worked callsigns cache for "Unworked only" filter
         self._worked_callsigns_cache: set[str] = set()
@@ -121,10 +163,6 @@ class SKCCSpotWidget(QWidget):
         # Load caches on startup (non-blocking)
         QTimer.singleShot(100, self._load_startup_caches)
 
-        # Duplicate detection: track last time each callsign+frequency was shown (4-hour cooldown)
-        self.last_shown_time: Dict[str, datetime] = {}
-        self.duplicate_cooldown_seconds = 14400  # 4 hours
-
         self._is_shutting_down = False  # Flag to prevent new operations during shutdown
 
         # Config manager for persisting band selections
@@ -140,6 +178,10 @@ class SKCCSpotWidget(QWidget):
         self._init_ui()
         self._load_band_selections()  # Load saved band selections
 
+        # Polls the spot worker's ring buffer (worker process mode only)
+        self._spot_worker_timer = QTimer()
+        self._spot_worker_timer.timeout.connect(self._poll_spot_worker)
+
         # Auto-cleanup timer (runs periodically to clean up old spots)
         self.cleanup_timer = QTimer()
         self.cleanup_timer.timeout.connect(self._cleanup_old_spots)
@@ -263,9 +305,9 @@ class SKCCSpotWidget(QWidget):
 
         # Spots table
         self.spots_table = QTableWidget()
-        self.spots_table.setColumnCount(8)
+        self.spots_table.setColumnCount(9)
         self.spots_table.setHorizontalHeaderLabels(
-            ["Callsign", "Frequency", "Mode", "Speed", "SKCC#", "Reporter", "Time", "Age"]
+            ["Callsign", "Frequency", "Mode", "Speed", "SKCC#", "Reporter", "Time", "Age", "Heard"]
         )
         self.spots_table.itemSelectionChanged.connect(self._on_spot_selected)
 
@@ -318,6 +360,12 @@ class SKCCSpotWidget(QWidget):
         )
         self.spots_table.setColumnWidth(7, 45)
 
+        # Column 8: Heard - number of skimmers reporting the signal
+        self.spots_table.horizontalHeader().setSectionResizeMode(
+            8, QHeaderView.ResizeMode.ResizeToContents
+        )
+        self.spots_table.setColumnWidth(8, 40)
+
         layout.addWidget(self.spots_table)
 
         self.setLayout(layout)
@@ -383,12 +431,11 @@ class SKCCSpotWidget(QWidget):
         try:
             self.sync_btn.setEnabled(False)
             self.status_label.setText(
-                "Status: Clearing cache and downloading fresh roster... (may take 30 seconds)"
+                "Status: Downloading fresh roster... (may take 30 seconds)"
             )
 
-            # Force fresh download by clearing cache first
-            logger.info("Force-clearing SKCC roster cache for fresh download...")
-            self.db.skcc_members.clear_cache()
+            # The current roster stays available until the new one is swapped in
+            logger.info("Forcing fresh SKCC roster download...")
 
             # Create background thread for roster download
             class RosterSyncThread(QThread):
@@ -400,7 +447,7 @@ class SKCCSpotWidget(QWidget):
 
                 def run(self):
                     try:
-                        success = self.db.skcc_members.sync_membership_data()
+                        success = self.db.skcc_members.sync_membership_data(force_refresh=True)
                         roster_count = self.db.skcc_members.get_member_count()
                         self.finished_signal.emit(success, roster_count)
                     except Exception as e:
@@ -449,7 +496,9 @@ class SKCCSpotWidget(QWidget):
     def _toggle_monitoring(self) -> None:
         """Toggle RBN spot monitoring on/off"""
         try:
-            if self.rbn_fetcher.is_running():
+            if self.use_spot_worker:
+                self._toggle_spot_worker()
+            elif self.rbn_fetcher.is_running():
                 self.rbn_fetcher.stop()
                 self.connect_btn.setText("Start Monitoring")
                 self.status_label.setText("Status: Stopped")
@@ -487,11 +536,75 @@ class SKCCSpotWidget(QWidget):
             self.status_label.setText(f"Error: {str(e)}")
             self.connect_btn.setEnabled(True)
 
+    def _is_monitoring(self) -> bool:
+        """Check if spot feeds are running (in-process or in the worker)"""
+        if self.use_spot_worker:
+            return self.spot_worker is not None and self.spot_worker.is_running()
+        return self.rbn_fetcher.is_running()
+
+    def _toggle_spot_worker(self) -> None:
+        """Start or stop the out-of-process spot worker"""
+        if self._is_monitoring():
+            self._spot_worker_timer.stop()
+            self.spot_worker.stop()
+            self.spot_worker = None
+            self._spot_worker_state = None
+            self.connect_btn.setText("Start Monitoring")
+            self.status_label.setText("Status: Stopped")
+            return
+
+        from src.rbn.spot_worker import SpotWorkerProcess
+
+        config = self.config_manager
+        my_callsign = config.get("general.operator_callsign", "").upper()
+        cluster_enabled = config.get("dx_cluster.enabled", True)
+        options = {
+            "callsign": my_callsign if my_callsign and my_callsign != "MYCALL" else None,
+            "cluster_host": config.get("dx_cluster.host", "") if cluster_enabled else None,
+            "cluster_port": config.get("dx_cluster.port", 7300),
+            "skimmer_path": config.get("skcc.skimmer_path", "") or None,
+            "dedup_window_seconds": config.get("dx_cluster.dedup_window_seconds", 120),
+            "roster_db_path": getattr(getattr(self.db, "skcc_members", None), "db_path", None),
+            "archive_path": (
+                str(config.config_dir / "spot_archive.db")
+                if config.get("dx_cluster.archive_enabled", True) else None
+            ),
+            "archive_retention_days": config.get("dx_cluster.archive_retention_days", 90),
+        }
+        self.spot_worker = SpotWorkerProcess(options)
+        if self.spot_worker.start():
+            self._spot_worker_timer.start(250)
+            self.connect_btn.setText("Stop Monitoring")
+            self.status_label.setText("Status: Starting spot worker...")
+        else:
+            self.spot_worker = None
+            self.connect_btn.setText("Start Monitoring")
+            self.status_label.setText("Status: Failed to start spot worker")
+
+    def _poll_spot_worker(self) -> None:
+        """Take new spots from the worker's ring buffer (runs on a 250 ms timer)"""
+        if self.spot_worker is None or self._is_shutting_down:
+            return
+        try:
+            spots = self.spot_worker.poll()
+            for spot in spots:
+                self.spot_aggregator.add(spot)
+            if spots:
+                self.spots = self.spot_aggregator.clusters()
+                self._on_filter_changed()
+
+            state = self.spot_worker.state
+            if state != self._spot_worker_state:
+                self._spot_worker_state = state
+                self._on_rbn_state_changed(state)
+        except Exception as e:
+            logger.error(f"Error polling spot worker: {e}", exc_info=True)
+
     def _auto_start_rbn_if_enabled(self) -> None:
         """Auto-start RBN monitoring if configured to do so"""
         try:
             auto_start = self.config_manager.get("skcc.auto_start_spots", True)
-            if auto_start and not self.rbn_fetcher.is_running():
+            if auto_start and not self._is_monitoring():
                 logger.info("Auto-starting RBN monitoring...")
                 self._toggle_monitoring()
         except Exception as e:
@@ -499,35 +612,20 @@ class SKCCSpotWidget(QWidget):
 
     def _handle_skimmer_spot(self, spot: SKCCSpot) -> None:
         """
-        Handle new spot from SKCC Skimmer
+        Handle new spot from SKCC Skimmer or RBN
 
-        Checks for duplicates and adds spot to display list.
+        Merges the report into the cluster for its signal (a repeat from another
+        skimmer updates the existing row instead of adding one).
         """
         try:
-            now = datetime.now(timezone.utc)
-            callsign = spot.callsign.upper()
-            spot_key = f"{callsign}_{spot.frequency:.3f}"
-
-            # Check if this callsign on this frequency was shown recently
-            if spot_key in self.last_shown_time:
-                time_since_last = (now - self.last_shown_time[spot_key]).total_seconds()
-                if time_since_last < self.duplicate_cooldown_seconds:
-                    logger.debug(
-                        f"Skipping duplicate spot: {callsign} on {spot.frequency:.3f} MHz (shown {time_since_last:.0f}s ago)"
-                    )
-                    return
-
-            # Add to display list and update tracking
-            self.last_shown_time[spot_key] = now
-            self.spots.insert(0, spot)
-            logger.debug(f"[UI] Added spot: {spot.callsign} - Total spots: {len(self.spots)}")
-
-            # Keep only recent spots in memory
-            if len(self.spots) > 200:
-                self.spots = self.spots[:200]
+            cluster, created = self.spot_aggregator.add(spot)
+            if created:
+                logger.debug(f"[UI] New signal: {cluster.callsign} - Total signals: {len(self.spot_aggregator)}")
+            else:
+                logger.debug(f"[UI] Updated signal: {cluster!r}")
+            self.spots = self.spot_aggregator.clusters()
 
-            # Update the display
-            logger.debug(f"[UI] Calling _on_filter_changed")
+            # Update the display (debounced, so report bursts cost one table refresh)
             self._on_filter_changed()
 
         except Exception as e:
@@ -547,9 +645,6 @@ class SKCCSpotWidget(QWidget):
         if not rbn_spot:
             return
 
-        print(f"*** SIGNAL RECEIVED: {rbn_spot.callsign} ***")  # Immediate stdout
-        logger.info(f"*** SIGNAL RECEIVED: {rbn_spot.callsign} ***")  # Also log
-
         try:
             # Convert RBN spot to SKCCSpot format
             from src.skcc.skcc_skimmer_subprocess import SKCCSpot
@@ -559,10 +654,10 @@ class SKCCSpotWidget(QWidget):
             if freq_mhz and freq_mhz > 1000:
                 freq_mhz = round(freq_mhz / 1000.0, 3)
 
-            # Look up SKCC number from roster
-            skcc_number = None
-            is_skcc_member = False
-            skcc_roster = self._get_skcc_roster_cached()
+            # Look up SKCC number from roster (SKCC Skimmer spots already carry it)
+            skcc_number = rbn_spot.skcc_number
+            is_skcc_member = bool(skcc_number)
+            skcc_roster = None if skcc_number else self._get_skcc_roster_cached()
             if skcc_roster:
                 callsign_upper = rbn_spot.callsign.upper()
                 member_info = skcc_roster.get(callsign_upper)
@@ -708,394 +803,8 @@ class SKCCSpotWidget(QWidget):
 
     @staticmethod
     def _get_continent_from_callsign(callsign: str) -> str:
-        """Determine continent from amateur radio callsign prefix.
-
-        Returns: One of 'North America', 'South America', 'Europe', 'Asia', 'Africa', 'Oceania', 'Antarctica', or 'Unknown'
-        """
-        if not callsign:
-            return "Unknown"
-
-        # Extract prefix (everything before first digit)
-        prefix = ""
-        for char in callsign.upper():
-            if char.isdigit():
-                break
-            if char.isalpha():
-                prefix += char
-
-        if not prefix:
-            return "Unknown"
-
-        # North America (W, K, N, VE, VA, VO, XE, etc.)
-        if (
-            prefix in ["W", "K", "N", "A"]
-            or prefix.startswith("V")
-            and len(callsign) > 2
-            and callsign[1] in ["E", "A", "O", "Y"]
-        ):
-            return "North America"
-        if prefix in ["XE", "XF"]:  # Mexico
-            return "North America"
-        if (
-            prefix.startswith("C") and len(callsign) > 2 and callsign[1] in ["M", "O"]
-        ):  # Cuba, various Caribbean
-            return "North America"
-        if prefix in ["KP", "KL", "WP", "NH", "NP"]:  # US territories
-            return "North America"
-        if prefix in ["TI", "YN", "HP", "HI", "YV", "HH"]:  # Central America/Caribbean
-            return "North America"
-
-        # South America
-        if prefix in ["PY", "PT", "PP", "PR", "PS", "PU", "PV", "PW", "PX"]:  # Brazil
-            return "South America"
-        if prefix in ["LU", "AY", "AZ", "L"]:  # Argentina
-            return "South America"
-        if prefix in ["CE", "CA", "CB", "CC", "CD", "XQ", "XR"]:  # Chile
-            return "South America"
-        if prefix in ["CP", "CX", "CV", "HC", "HK", "OA", "YV", "ZP"]:  # Various SA countries
-            return "South America"
-
-        # Europe
-        if prefix in ["G", "M", "GW", "GI", "GD", "GJ", "GM", "GU", "GB"]:  # UK
-            return "Europe"
-        if prefix in ["F", "TM", "TO", "TP", "TQ", "TV"]:  # France
-            return "Europe"
-        if prefix in [
-            "D",
-            "DA",
-            "DB",
-            "DC",
-            "DD",
-            "DE",
-            "DF",
-            "DG",
-            "DH",
-            "DI",
-            "DJ",
-            "DK",
-            "DL",
-            "DM",
-            "DN",
-            "DO",
-        ]:  # Germany
-            return "Europe"
-        if prefix in ["I", "IK", "IW", "IZ", "IT"]:  # Italy
-            return "Europe"
-        if prefix in ["EA", "EB", "EC", "ED", "EE", "EF", "EG", "EH", "AM"]:  # Spain
-            return "Europe"
-        if prefix in ["PA", "PB", "PC", "PD", "PE", "PF", "PG", "PH", "PI"]:  # Netherlands
-            return "Europe"
-        if prefix in ["OH", "OF", "OG", "OI", "OJ"]:  # Finland
-            return "Europe"
-        if prefix in [
-            "SM",
-            "SA",
-            "SB",
-            "SC",
-            "SD",
-            "SE",
-            "SF",
-            "SG",
-            "SH",
-            "SI",
-            "SJ",
-            "SK",
-            "SL",
-        ]:  # Sweden
-            return "Europe"
-        if prefix in [
-            "LA",
-            "LB",
-            "LC",
-            "LD",
-            "LE",
-            "LF",
-            "LG",
-            "LH",
-            "LI",
-            "LJ",
-            "LK",
-            "LL",
-            "LM",
-            "LN",
-        ]:  # Norway
-            return "Europe"
-        if prefix in ["ON", "OO", "OP", "OQ", "OR", "OS", "OT"]:  # Belgium
-            return "Europe"
-        if prefix in ["OZ", "OU", "OV", "OW"]:  # Denmark
-            return "Europe"
-        if prefix in ["SP", "SN", "SO", "SQ", "SR"]:  # Poland
-            return "Europe"
-        if prefix in ["OK", "OL"]:  # Czech Republic
-            return "Europe"
-        if prefix in ["HA", "HG"]:  # Hungary
-            return "Europe"
-        if prefix in ["YO", "YP", "YQ", "YR"]:  # Romania
-            return "Europe"
-        if prefix in ["YU", "YT", "YZ"]:  # Serbia/Yugoslavia
-            return "Europe"
-        if prefix in [
-            "LY",
-            "LZ",
-            "SV",
-            "SW",
-            "SX",
-            "SY",
-            "SZ",
-            "OM",
-            "S5",
-            "S50",
-            "S51",
-            "S52",
-            "S53",
-            "S54",
-            "S55",
-            "S56",
-            "S57",
-            "S58",
-            "S59",
-        ]:
-            return "Europe"
-        if prefix in ["EI", "EJ"]:  # Ireland
-            return "Europe"
-        if prefix in ["CT", "CR", "CS", "CU"]:  # Portugal
-            return "Europe"
-        if prefix in ["HB", "HE"]:  # Switzerland
-            return "Europe"
-        if prefix in ["OE"]:  # Austria
-            return "Europe"
-        if prefix in ["LX"]:  # Luxembourg
-            return "Europe"
-        if prefix.startswith("R") or prefix.startswith("U"):  # Russia/Ukraine
-            return "Europe"  # Western Russia/Ukraine considered Europe for amateur radio
-        if prefix in ["ER", "ES", "LY"]:  # Moldova, Estonia, Lithuania
-            return "Europe"
-        if prefix in ["YL"]:  # Latvia
-            return "Europe"
-        if prefix in ["9A"]:  # Croatia
-            return "Europe"
-        if prefix in ["9H"]:  # Malta
-            return "Europe"
-        if prefix in ["T9"]:  # Bosnia
-            return "Europe"
-
-        # Asia
-        if prefix in [
-            "JA",
-            "JE",
-            "JF",
-            "JG",
-            "JH",
-            "JI",
-            "JJ",
-            "JK",
-            "JL",
-            "JM",
-            "JN",
-            "JO",
-            "JP",
-            "JQ",
-            "JR",
-        ]:  # Japan
-            return "Asia"
-        if prefix in [
-            "B",
-            "BA",
-            "BD",
-            "BG",
-            "BH",
-            "BI",
-            "BJ",
-            "BL",
-            "BM",
-            "BT",
-            "BY",
-            "BZ",
-        ]:  # China
-            return "Asia"
-        if prefix in ["HL", "HM", "DS", "DT", "D7", "D8", "D9"]:  # South Korea
-            return "Asia"
-        if prefix in ["VU", "AT", "AU", "AV", "AW", "8T", "8U", "8V", "8W", "8X", "8Y"]:  # India
-            return "Asia"
-        if prefix in ["HS", "E2"]:  # Thailand
-            return "Asia"
-        if prefix in [
-            "YB",
-            "YC",
-            "YD",
-            "YE",
-            "YF",
-            "YG",
-            "YH",
-            "7A",
-            "7B",
-            "7C",
-            "7D",
-            "7E",
-            "7F",
-            "7G",
-            "7H",
-            "7I",
-        ]:  # Indonesia
-            return "Asia"
-        if prefix in ["9M", "9W"]:  # Malaysia
-            return "Asia"
-        if prefix in ["9V"]:  # Singapore
-            return "Asia"
-        if prefix in [
-            "DU",
-            "DV",
-            "DW",
-            "DX",
-            "DY",
-            "DZ",
-            "4D",
-            "4E",
-            "4F",
-            "4G",
-            "4H",
-            "4I",
-        ]:  # Philippines
-            return "Asia"
-        if prefix in ["XU"]:  # Cambodia
-            return "Asia"
-        if prefix in ["E5"]:  # Cook Islands (Oceania, but sometimes grouped with Asia)
-            return "Oceania"
-        if prefix in ["BV", "BW", "BX", "BU"]:  # Taiwan
-            return "Asia"
-        if prefix in ["VR", "VS", "XX"]:  # Hong Kong
-            return "Asia"
-        if prefix in ["A4"]:  # Oman
-            return "Asia"
-        if prefix in ["A6", "A7", "A9"]:  # UAE, Qatar, Bahrain
-            return "Asia"
-
-        # Africa
-        if prefix in ["5Z", "5Y"]:  # Kenya
-            return "Africa"
-        if prefix in ["CN", "5C", "5D", "5E", "5F", "5G"]:  # Morocco
-            return "Africa"
-        if prefix in ["5H", "5I"]:  # Tanzania
-            return "Africa"
-        if prefix in ["5N", "5O"]:  # Nigeria
-            return "Africa"
-        if prefix in ["5R", "5S"]:  # Madagascar
-            return "Africa"
-        if prefix in ["5T"]:  # Mauritania
-            return "Africa"
-        if prefix in ["5U"]:  # Niger
-            return "Africa"
-        if prefix in ["5V"]:  # Togo
-            return "Africa"
-        if prefix in ["5W"]:  # Western Samoa (actually Oceania)
-            return "Oceania"
-        if prefix in ["5X"]:  # Uganda
-            return "Africa"
-        if prefix in ["6V", "6W"]:  # Senegal
-            return "Africa"
-        if prefix in ["7Q", "7P"]:  # Malawi
-            return "Africa"
-        if prefix in ["9G"]:  # Ghana
-            return "Africa"
-        if prefix in ["9J"]:  # Zambia
-            return "Africa"
-        if prefix in ["9L"]:  # Sierra Leone
-            return "Africa"
-        if prefix in ["9Q"]:  # DR Congo
-            return "Africa"
-        if prefix in ["9U"]:  # Burundi
-            return "Africa"
-        if prefix in ["9X"]:  # Rwanda
-            return "Africa"
-        if prefix in ["ZS", "ZR", "ZT", "ZU"]:  # South Africa
-            return "Africa"
-        if prefix in ["D2", "D3", "D4"]:  # Angola
-            return "Africa"
-        if prefix in ["ET", "E3"]:  # Ethiopia
-            return "Africa"
-        if prefix in ["ST", "SU", "SS", "6A", "6B"]:  # Sudan
-            return "Africa"
-        if prefix in ["EL"]:  # Liberia
-            return "Africa"
-        if prefix in ["C5"]:  # The Gambia
-            return "Africa"
-        if prefix in ["C9", "CR", "D2"]:  # Mozambique
-            return "Africa"
-        if prefix in ["TU"]:  # Ivory Coast
-            return "Africa"
-        if prefix in ["TY", "TZ"]:  # Benin
-            return "Africa"
-        if prefix in ["XT"]:  # Burkina Faso
-            return "Africa"
-        if prefix in ["TT"]:  # Chad
-            return "Africa"
-        if prefix in ["TR"]:  # Gabon
-            return "Africa"
-        if prefix in ["TJ"]:  # Cameroon
-            return "Africa"
-        if prefix in ["TL"]:  # Central African Republic
-            return "Africa"
-        if prefix in ["TN"]:  # Congo
-            return "Africa"
-        if prefix in ["A2"]:  # Botswana
-            return "Africa"
-        if prefix in ["V5"]:  # Namibia
-            return "Africa"
-        if prefix in ["Z2", "Z8"]:  # Zimbabwe
-            return "Africa"
-        if prefix in ["3V", "3X"]:  # Tunisia
-            return "Africa"
-        if prefix in ["3C", "7O", "7P"]:  # Equatorial Guinea
-            return "Africa"
-        if prefix in ["3DA"]:  # Swaziland
-            return "Africa"
-
-        # Oceania
-        if prefix in [
-            "VK",
-            "VI",
-            "VJ",
-            "VL",
-            "VM",
-            "VN",
-            "VO",
-            "VP",
-            "VQ",
-            "VR",
-            "VZ",
-            "AX",
-        ]:  # Australia
-            return "Oceania"
-        if prefix in ["ZL", "ZK", "ZM"]:  # New Zealand
-            return "Oceania"
-        if prefix in ["DU", "KH"]:  # Some Pacific islands
-            return "Oceania"
-        if prefix in ["T2", "T3"]:  # Tuvalu, Kiribati
-            return "Oceania"
-        if prefix in ["YJ"]:  # Vanuatu
-            return "Oceania"
-        if prefix in ["3D2"]:  # Fiji
-            return "Oceania"
-        if prefix in ["FO", "FW"]:  # French Polynesia
-            return "Oceania"
-        if prefix in ["H4"]:  # Solomon Islands
-            return "Oceania"
-        if prefix in ["P2"]:  # Papua New Guinea
-            return "Oceania"
-        if prefix in ["T8"]:  # Palau
-            return "Oceania"
-        if prefix in ["V6"]:  # Micronesia
-            return "Oceania"
-        if prefix in ["V7"]:  # Marshall Islands
-            return "Oceania"
-        if prefix in ["V8"]:  # Brunei (Asia, but sometimes grouped)
-            return "Asia"
-
-        # Antarctica
-        if prefix in ["KC4", "CE9", "VP8", "R1AN", "DP0", "DP1", "3Y"]:  # Antarctic stations
-            return "Antarctica"
-
-        return "Unknown"
+        """Determine continent from amateur radio callsign prefix (see src.utils.continents)."""
+        return continent_from_callsign(callsign)
 
     def _apply_filters(self) -> None:
         """Apply filters to spots list (optimized for performance)"""
@@ -1154,7 +863,7 @@ class SKCCSpotWidget(QWidget):
 
             # Skip if continent filter is active and continent doesn't match
             if selected_continent != "All Continents":
-                continent = self._get_continent_from_callsign(s.callsign)
+                continent = s.continent or self._get_continent_from_callsign(s.callsign)
                 if continent != selected_continent:
                     logger.debug(
                         f"[FILTER] Skipping {s.callsign} {s.frequency}M - continent {continent} != {selected_continent}"
@@ -1169,6 +878,18 @@ class SKCCSpotWidget(QWidget):
             f"[FILTER] Filtered {len(self.filtered_spots)} spots from {len(filtered_spots)} total (bands: {selected_bands}, min_dB={min_strength}, unworked_only={check_unworked}, skcc_only={check_skcc_only}, continent={selected_continent})"
         )
         self._update_table()
+        self._prefetch_qrz_callsigns()
+
+    def _prefetch_qrz_callsigns(self) -> None:
+        """Warm the QRZ callsign cache with the spotted stations (if enabled)"""
+        if not self.config_manager.get("qrz.prefetch_spots", False):
+            return
+        try:
+            from src.qrz import get_qrz_service
+
+            get_qrz_service().prefetch_callsigns(s.callsign for s in self.filtered_spots)
+        except Exception as e:
+            logger.debug(f"QRZ prefetch skipped: {e}")
 
     def _update_table(self) -> None:
         """Update spots table with filtered spots"""
@@ -1196,8 +917,11 @@ class SKCCSpotWidget(QWidget):
                     QTableWidgetItem(row_data.reporter),
                     QTableWidgetItem(row_data.time),
                     QTableWidgetItem(row_data.get_age_string()),
+                    QTableWidgetItem(row_data.heard),
                 ]
 
+                items[8].setToolTip(row_data.heard_tooltip)
+
                 for col, item in enumerate(items):
                     item.setData(Qt.ItemDataRole.UserRole, spot)
                     self.spots_table.setItem(row, col, item)
@@ -1209,78 +933,6 @@ class SKCCSpotWidget(QWidget):
         finally:
             self.spots_table.setUpdatesEnabled(True)
 
-    def _on_skimmer_spot_line(self, line: str) -> None:
-        """Handle SKCC Skimmer console output line"""
-        try:
-            logger.info(f"[PARSING SPOT] {line}")
-
-            import re
-
-            # Extract callsign
-            callsign_match = re.search(r"\s([A-Z0-9]{2,})\s", line)
-            if not callsign_match:
-                logger.debug(f"  ✗ No callsign found in: {line}")
-                return
-            callsign = callsign_match.group(1).upper()
-            logger.debug(f"  ✓ Callsign: {callsign}")
-
-            # Extract SKCC number if present
-            skcc_match = re.search(r"\((\d+[A-Z]*)\)", line)
-            skcc_number = skcc_match.group(1) if skcc_match else None
-            logger.debug(f"  ✓ SKCC#: {skcc_number if skcc_number else 'None'}")
-
-            # Extract frequency (may not exist in Sked format)
-            freq_match = re.search(r"(\d+[.,]?\d*)\s*(kHz|MHz)", line)
-            if freq_match:
-                freq_str = freq_match.group(1).replace(",", ".")
-                freq_mhz = float(freq_str)
-                if "kHz" in freq_match.group(2):
-                    freq_mhz = freq_mhz / 1000
-            else:
-                # Sked format entries don't have frequency - use placeholder
-                freq_mhz = 0.0
-            logger.debug(f"  ✓ Frequency: {freq_mhz if freq_mhz else 'N/A'} MHz")
-
-            # Extract mode (RBN spots have this, Sked entries don't)
-            mode_match = re.search(r"\b(CW|SSB|LSB|USB|FM|RTTY|FT8|FT4)\b", line, re.IGNORECASE)
-            mode = mode_match.group(1).upper() if mode_match else "CW"
-            logger.debug(f"  ✓ Mode: {mode}")
-
-            # Extract signal strength (RBN spots have this)
-            signal_match = re.search(r"(\d+)\s*dB", line)
-            strength = int(signal_match.group(1)) if signal_match else 0
-            logger.debug(f"  ✓ Signal: {strength if strength else 'N/A'} dB")
-
-            # Extract speed (WPM) for CW
-            speed_match = re.search(r"(\d+)\s*WPM", line)
-            speed = int(speed_match.group(1)) if speed_match else None
-            logger.debug(f"  ✓ Speed: {speed if speed else 'None'} WPM")
-
-            # Skip if no frequency AND no SKCC number (not a valid spot)
-            if freq_mhz == 0.0 and not skcc_number:
-                logger.debug(f"  ✗ Skipping: no frequency and no SKCC number")
-                return
-
-            # Create SKCCSpot object
-            spot = SKCCSpot(
-                callsign=callsign,
-                frequency=freq_mhz,
-                mode=mode,
-                grid=None,
-                reporter="SKCC_Skimmer",
-                strength=strength,
-                speed=speed if mode == "CW" else None,
-                timestamp=datetime.now(timezone.utc),
-                is_skcc=True,
-                skcc_number=skcc_number,
-            )
-
-            logger.info(f"  ✅ SPOT CREATED: {callsign} on {freq_mhz if freq_mhz else 'Sked'}")
-            self._handle_skimmer_spot(spot)
-
-        except Exception as e:
-            logger.error(f"Error parsing SKCC Skimmer spot line '{line}': {e}", exc_info=True)
-
     def _on_skimmer_state_changed(self, state: SkimmerConnectionState) -> None:
         """Handle SKCC Skimmer state changes"""
         state_str = state.value.upper() if state else "UNKNOWN"
@@ -1304,6 +956,7 @@ class SKCCSpotWidget(QWidget):
         try:
             self.cleanup_timer.stop()
             self._filter_debounce_timer.stop()
+            get_job_scheduler().remove_job(SPOT_ARCHIVE_JOB)
 
             # Stop SKCC Skimmer subprocess if running
             if hasattr(self, "skcc_skimmer") and self.skcc_skimmer:
@@ -1311,6 +964,17 @@ class SKCCSpotWidget(QWidget):
                     logger.info("Stopping SKCC Skimmer subprocess...")
                     self.skcc_skimmer.stop()
 
+            # Stop spot feeds, then write any buffered spot history
+            self._spot_worker_timer.stop()
+            if self.spot_worker is not None:
+                self.spot_worker.stop()
+                self.spot_worker = None
+            if self.rbn_fetcher.is_running():
+                self.rbn_fetcher.stop()
+            if self.spot_archive is not None:
+                self.spot_archive.close()
+                self.spot_archive = None
+
         except Exception as e:
             logger.error(f"Error cleaning up spots widget: {e}", exc_info=True)
         super().closeEvent(event)
@@ -1341,26 +1005,24 @@ class SKCCSpotWidget(QWidget):
             logger.error(f"Error handling spot selection: {e}", exc_info=True)
 
     def _cleanup_old_spots(self) -> None:
-        """Periodic cleanup to remove old spots and shrink duplicate tracking."""
+        """Periodic cleanup: drop signals unheard for 10 minutes."""
         try:
-            # Remove spots older than 10 minutes
-            cutoff = datetime.now(timezone.utc) - timedelta(minutes=10)
-            before = len(self.spots)
-            self.spots = [s for s in self.spots if s.timestamp > cutoff]
-            removed = before - len(self.spots)
+            removed = self.spot_aggregator.expire()
+            self.spots = self.spot_aggregator.clusters()
             if removed > 0:
-                logger.info(f"[CLEANUP] Removed {removed} old spots (>{10} minutes)")
-
-            # Trim duplicate tracking older than 2 minutes
-            dup_cutoff = datetime.now(timezone.utc) - timedelta(minutes=2)
-            to_delete = [k for k, t in self.last_shown_time.items() if t < dup_cutoff]
-            for k in to_delete:
-                self.last_shown_time.pop(k, None)
-            if to_delete:
-                logger.debug(f"[CLEANUP] Cleared {len(to_delete)} entries from duplicate tracking")
+                logger.info(f"[CLEANUP] Removed {removed} old signals (>{10} minutes)")
         except Exception as e:
             logger.error(f"Error in cleanup: {e}", exc_info=True)
 
+    def _maintain_spot_archive(self) -> None:
+        """Flush buffered spot history and drop expired days (runs on a job scheduler thread)"""
+        archive = self.spot_archive
+        if archive is None:
+            return
+        # Write spot history even when spots arrive too slowly to fill a batch
+        archive.flush()
+        archive.enforce_retention()
+
     @staticmethod
     def _get_band_freq_range(band: str) -> Optional[tuple[float, float]]:
         """Return (low, high) MHz range for a given amateur HF band."""
@@ -0,0 +1,363 @@
+"""
+Acceleration Backend Registry
+
+Hot loops ("kernels") have a pure Python reference implementation plus
+optional accelerated implementations:
+- rust: the rust_grid_calc extension module (built separately with maturin)
+- numpy: vectorized NumPy code
+
+Each kernel picks its backend on first use: the setting
+performance.acceleration_backend (or the W4GNS_ACCELERATION environment
+variable) names a backend, and 'auto' prefers rust, then numpy, then python.
+A backend is only used if it is installed and reproduces the reference
+results on the kernel's self-check samples, so a stale or mismatched build
+falls back instead of corrupting data.
+
+Run ``python -m src.utils.acceleration`` for a timing report of every kernel.
+"""
+
+import logging
+import math
+import os
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Backends in 'auto' preference order (python is the reference and always available)
+BACKENDS = ('rust', 'numpy', 'python')
+
+AUTO = 'auto'
+SETTING_KEY = 'performance.acceleration_backend'
+ENV_VAR = 'W4GNS_ACCELERATION'
+
+
+def preferred_backend() -> str:
+    """
+    Get the configured backend preference
+
+    Returns:
+        'auto' or a backend name (environment variable overrides the setting)
+    """
+    value = os.environ.get(ENV_VAR)
+    if not value:
+        try:
+            from src.config.settings import get_config_manager
+            value = get_config_manager().get(SETTING_KEY, AUTO)
+        except Exception as e:
+            logger.debug(f"Could not read {SETTING_KEY}: {e}")
+            value = AUTO
+    value = str(value).strip().lower()
+    if value != AUTO and value not in BACKENDS:
+        logger.warning(f"Unknown acceleration backend '{value}', using auto")
+        return AUTO
+    return value
+
+
+class KernelTiming(NamedTuple):
+    """Benchmark result of one kernel backend"""
+    kernel: str
+    backend: str
+    active: bool
+    seconds: float
+
+
+class Kernel:
+    """A hot loop with a reference implementation and optional accelerated backends"""
+
+    def __init__(
+        self,
+        name: str,
+        reference: Callable[..., Any],
+        samples: Callable[[], Sequence[Tuple]],
+        benchmark: Callable[[], Tuple],
+        equivalent: Optional[Callable[[Any, Any], bool]] = None,
+    ):
+        """
+        Initialize kernel
+
+        Args:
+            name: Kernel name
+            reference: Pure Python implementation (defines the correct results)
+            samples: Returns argument tuples a backend must reproduce before it is used
+            benchmark: Returns one argument tuple sized for timing
+            equivalent: Result comparison (default: ==)
+        """
+        self.name = name
+        self.samples = samples
+        self.benchmark = benchmark
+        self.equivalent = equivalent or (lambda a, b: a == b)
+        self._loaders: Dict[str, Callable[[], Callable[..., Any]]] = {'python': lambda: reference}
+        self._implementations: Dict[str, Optional[Callable[..., Any]]] = {}
+        self._active: Optional[Callable[..., Any]] = None
+        self.backend: Optional[str] = None
+
+    def provide(self, backend: str, loader: Callable[[], Callable[..., Any]]) -> None:
+        """
+        Register an accelerated implementation
+
+        Args:
+            backend: Backend name (one of BACKENDS)
+            loader: Returns the implementation; raises ImportError/AttributeError if unavailable
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown acceleration backend '{backend}'")
+        self._loaders[backend] = loader
+        self._implementations.pop(backend, None)
+
+    def implementation(self, backend: str) -> Optional[Callable[..., Any]]:
+        """Get a backend's implementation, or None if it is not installed"""
+        if backend not in self._implementations:
+            loader = self._loaders.get(backend)
+            impl = None
+            if loader is not None:
+                try:
+                    impl = loader()
+                except (ImportError, AttributeError) as e:
+                    logger.debug(f"Kernel {self.name}: {backend} backend unavailable: {e}")
+            self._implementations[backend] = impl
+        return self._implementations[backend]
+
+    def available_backends(self) -> List[str]:
+        """Installed backends in preference order"""
+        return [backend for backend in BACKENDS if self.implementation(backend) is not None]
+
+    def check(self, backend: str) -> bool:
+        """
+        Check that a backend reproduces the reference results on the samples
+
+        Args:
+            backend: Backend name
+
+        Returns:
+            True if the backend is installed and matches the reference
+        """
+        impl = self.implementation(backend)
+        if impl is None:
+            return False
+        reference = self.implementation('python')
+        if impl is reference:
+            return True
+        for args in self.samples():
+            try:
+                matches = self.equivalent(impl(*args), reference(*args))
+            except Exception as e:
+                logger.warning(f"Kernel {self.name}: {backend} backend failed self-check: {e}")
+                return False
+            if not matches:
+                logger.warning(f"Kernel {self.name}: {backend} backend disagrees with the reference, not using it")
+                return False
+        return True
+
+    def select(self, preference: Optional[str] = None) -> str:
+        """
+        Choose the backend used by calls to this kernel
+
+        Args:
+            preference: 'auto' or a backend name (default: the configured preference)
+
+        Returns:
+            Name of the selected backend
+        """
+        preference = preference or preferred_backend()
+        if preference == AUTO:
+            candidates = list(BACKENDS)
+        elif preference in BACKENDS:
+            candidates = [preference, 'python']
+        else:
+            raise ValueError(f"Unknown acceleration backend '{preference}'")
+
+        for backend in candidates:
+            if self.check(backend):
+                break
+        if preference not in (AUTO, backend):
+            logger.warning(f"Kernel {self.name}: {preference} backend not usable, using {backend}")
+
+        self.backend = backend
+        self._active = self.implementation(backend)
+        logger.debug(f"Kernel {self.name}: using {backend} backend")
+        return backend
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if self._active is None:
+            self.select()
+        return self._active(*args, **kwargs)
+
+    def time(self, backend: str, repeat: int = 3) -> float:
+        """Best-of-repeat seconds for the benchmark input on one backend"""
+        impl = self.implementation(backend)
+        if impl is None:
+            raise ValueError(f"Kernel {self.name}: {backend} backend is not available")
+        args = self.benchmark()
+        best = math.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            impl(*args)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+
+_kernels: Dict[str, Kernel] = {}
+
+
+def register_kernel(kernel: Kernel) -> Kernel:
+    """Add a kernel to the registry"""
+    _kernels[kernel.name] = kernel
+    return kernel
+
+
+def get_kernel(name: str) -> Kernel:
+    """
+    Get a registered kernel
+
+    Raises:
+        KeyError: If no kernel has this name
+    """
+    return _kernels[name]
+
+
+def kernels() -> List[Kernel]:
+    """All registered kernels"""
+    return list(_kernels.values())
+
+
+def select_backends(preference: Optional[str] = None) -> Dict[str, str]:
+    """
+    Re-select the backend of every kernel (e.g. after the setting changed)
+
+    Args:
+        preference: 'auto' or a backend name (default: the configured preference)
+
+    Returns:
+        Dict of kernel name -> selected backend
+    """
+    return {kernel.name: kernel.select(preference) for kernel in _kernels.values()}
+
+
+def timing_report(repeat: int = 3) -> List[KernelTiming]:
+    """
+    Time every available backend of every kernel
+
+    Args:
+        repeat: Runs per backend (the best run is reported)
+
+    Returns:
+        One KernelTiming per kernel backend
+    """
+    results = []
+    for kernel in _kernels.values():
+        if kernel.backend is None:
+            kernel.select()
+        for backend in kernel.available_backends():
+            results.append(KernelTiming(kernel.name, backend, backend == kernel.backend,
+                                        kernel.time(backend, repeat)))
+    return results
+
+
+def format_timing_report(timings: List[KernelTiming]) -> str:
+    """Format a timing report as a text table"""
+    lines = [f"{'Kernel':<18}{'Backend':<10}{'Time (ms)':>12}{'Speedup':>10}"]
+    reference = {t.kernel: t.seconds for t in timings if t.backend == 'python'}
+    for t in timings:
+        speedup = reference[t.kernel] / t.seconds if t.seconds else math.inf
+        marker = "  *active" if t.active else ""
+        lines.append(f"{t.kernel:<18}{t.backend:<10}{t.seconds * 1000:>12.2f}{speedup:>9.1f}x{marker}")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Backend modules
+# ---------------------------------------------------------------------------
+
+def _rust(name: str) -> Callable[[], Callable[..., Any]]:
+    """Loader for a rust_grid_calc function"""
+    def load() -> Callable[..., Any]:
+        import rust_grid_calc
+        return getattr(rust_grid_calc, name)
+    return load
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+# Not registered: rust_grid_calc's batch_filter_spots filters on band names and
+# worked "CALL:BAND" keys, while the spots widget filters on frequency ranges,
+# worked callsigns and continent, so there is no Python reference for it to match.
+
+def _distances_python(home_grid: str, grids: Sequence[Optional[str]]) -> List[Optional[float]]:
+    from src.utils import geodesy
+    return geodesy.batch_distance_bearing(home_grid, grids, use_numpy=False)[0]
+
+
+def _distances_numpy() -> Callable[..., Any]:
+    from src.utils import geodesy
+    if not geodesy.HAS_NUMPY:
+        raise ImportError("NumPy is not installed")
+    # Vectorized above geodesy.NUMPY_BATCH_THRESHOLD grids, where it pays off
+    return geodesy.batch_distances
+
+
+def _distances_samples() -> List[Tuple]:
+    grids = ["FN20qd", "fn20QD", "EM29", "JO", "PM95vq12", "RR99xx", "AA00aa", "FN2", "ZZ00",
+             "FN20yy", None, "", "  FM06ew  ", "IO91wm"]
+    # Repeated past the NumPy threshold so the vectorized path is checked too
+    return [("FM06ew", grids), ("FM06ew", grids * 10), ("bad", grids), ("EM29", [])]
+
+
+def _distances_benchmark() -> Tuple:
+    fields = "ABCDEFGHIJKLMNOPQR"
+    grids = [f"{fields[i % 18]}{fields[(i // 18) % 18]}{i % 10}{(i // 10) % 10}" for i in range(50000)]
+    return ("FM06ew", grids)
+
+
+def _distances_equivalent(a: List[Optional[float]], b: List[Optional[float]]) -> bool:
+    # Vectorized trigonometry may differ from the scalar loop in the last bits
+    return len(a) == len(b) and all(
+        x is None and y is None or x is not None and y is not None and math.isclose(x, y, rel_tol=1e-9, abs_tol=1e-6)
+        for x, y in zip(a, b)
+    )
+
+
+def _parse_adi_python(content: str) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
+    from src.adif.parser import parse_adi_content
+    return parse_adi_content(content)
+
+
+def _parse_adi_samples() -> List[Tuple]:
+    return [
+        ("Header text <ADIF_VER:5>3.1.5 <PROGRAMID:6>W4GNS <EOH>\n"
+         "<CALL:5>W4GNS <QSO_DATE:8>20250101 <TIME_ON:4>1200 <BAND:3>40M <MODE:2>CW <EOR>\n"
+         "<call:4>K3Y <NAME:8>Joe Ünïc <COMMENT:0> <BAD:x>junk <QSO_DATE:8:D>20250102 <EOR>\n"
+         "  \n<EOR><CALL:3>N0A<EOR>trailing",),
+        ("<CALL:4>NOHD <MODE:2>CW<EOR>",),
+        ("",),
+    ]
+
+
+def _parse_adi_benchmark() -> Tuple:
+    fields = ("<QSO_DATE:8>20250101 <TIME_ON:4>1200 <BAND:3>40M <MODE:2>CW "
+              "<RST_SENT:3>599 <RST_RCVD:3>579 <SKCC:5>1234T <NAME:3>Bob <STATE:2>TN <EOR>\n")
+    records = []
+    for n in range(20000):
+        call = f"K{n}AA"
+        records.append(f"<CALL:{len(call)}>{call} {fields}")
+    return ("<ADIF_VER:5>3.1.5 <EOH>\n" + "".join(records),)
+
+
+BATCH_DISTANCES = register_kernel(Kernel(
+    'batch_distances', _distances_python, _distances_samples, _distances_benchmark,
+    equivalent=_distances_equivalent,
+))
+BATCH_DISTANCES.provide('numpy', _distances_numpy)
+BATCH_DISTANCES.provide('rust', _rust('batch_calculate_distances'))
+
+PARSE_ADI = register_kernel(Kernel(
+    'parse_adi', _parse_adi_python, _parse_adi_samples, _parse_adi_benchmark,
+))
+PARSE_ADI.provide('rust', _rust('parse_adi'))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(format_timing_report(timing_report()))
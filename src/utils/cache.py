@@ -129,6 +129,7 @@ class AwardProgressCache:
     TRIPLE_KEY_CACHE_KEY = "triple_key_progress"
     PFX_CACHE_KEY = "pfx_progress"
     POWER_STATS_CACHE_KEY = "power_statistics"
+    TIMELINE_CACHE_KEY = "award_timeline"
 
     # All cache keys for easy iteration (for bulk invalidation)
     ALL_AWARD_CACHE_KEYS = [
@@ -144,6 +145,7 @@ class AwardProgressCache:
         CANADIAN_MAPLE_CACHE_KEY,
         TRIPLE_KEY_CACHE_KEY,
         PFX_CACHE_KEY,
+        TIMELINE_CACHE_KEY,
     ]
 
     def __init__(self, ttl_seconds: int = 30):
@@ -0,0 +1,300 @@
+"""
+Geodesy Utilities - Maidenhead Grid Conversion, Distance and Bearing
+
+Standalone module with no dependency on the propagation services:
+- Memoized Maidenhead locator -> latitude/longitude conversion
+- Great-circle distance (haversine), initial bearing and path midpoint
+- Batch distance/bearing for arrays of grids in one NumPy pass
+
+NumPy is optional. When it is not installed, the batch functions fall back to
+a pure Python loop over the same memoized conversions.
+"""
+
+import logging
+import math
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+KM_TO_MILES = 0.621371
+
+# Below this many grids the NumPy setup cost outweighs the vectorized math
+NUMPY_BATCH_THRESHOLD = 64
+
+# Size of one square at each locator precision (degrees longitude, degrees latitude)
+_FIELD = (20.0, 10.0)
+_SQUARE = (2.0, 1.0)
+_SUBSQUARE = (2.0 / 24.0, 1.0 / 24.0)
+_EXTENDED = (2.0 / 240.0, 1.0 / 240.0)
+
+# Character -> index lookup tables (case-insensitive)
+_FIELD_INDEX = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQR")}
+_FIELD_INDEX.update({c.lower(): i for c, i in list(_FIELD_INDEX.items())})
+_SUBSQUARE_INDEX = {c: i for i, c in enumerate("abcdefghijklmnopqrstuvwx")}
+_SUBSQUARE_INDEX.update({c.upper(): i for c, i in list(_SUBSQUARE_INDEX.items())})
+_DIGIT_INDEX = {c: i for i, c in enumerate("0123456789")}
+
+# Memoization bound: covers every 4-char grid plus a very large log of 6-char grids
+GRID_CACHE_SIZE = 262144
+
+
+def normalize_grid(grid: Optional[str]) -> Optional[str]:
+    """
+    Normalize a Maidenhead locator to canonical case (e.g., "fn20QD" -> "FN20qd").
+
+    Args:
+        grid: Maidenhead locator (2, 4, 6 or 8 characters)
+
+    Returns:
+        Normalized locator, or None if the locator is not valid
+    """
+    if not grid:
+        return None
+    grid = grid.strip()
+    if grid_to_latlon(grid) is None:
+        return None
+    return grid[:2].upper() + grid[2:4] + grid[4:6].lower() + grid[6:8]
+
+
+@lru_cache(maxsize=GRID_CACHE_SIZE)
+def grid_to_latlon(grid: Optional[str]) -> Optional[Tuple[float, float]]:
+    """
+    Convert a Maidenhead locator to the latitude/longitude of its center.
+
+    Results are memoized, so repeated conversions of the same grid (home grid,
+    regulars, busy contest grids) cost a dictionary lookup.
+
+    Args:
+        grid: Maidenhead locator (e.g., "FN20qd"), case-insensitive
+
+    Returns:
+        (latitude, longitude) in degrees, or None if the locator is not valid
+    """
+    if not grid:
+        return None
+    grid = grid.strip()
+    length = len(grid)
+    if length not in (2, 4, 6, 8):
+        return None
+
+    try:
+        lon = _FIELD_INDEX[grid[0]] * _FIELD[0] - 180.0
+        lat = _FIELD_INDEX[grid[1]] * _FIELD[1] - 90.0
+        size = _FIELD
+
+        if length >= 4:
+            lon += _DIGIT_INDEX[grid[2]] * _SQUARE[0]
+            lat += _DIGIT_INDEX[grid[3]] * _SQUARE[1]
+            size = _SQUARE
+
+        if length >= 6:
+            lon += _SUBSQUARE_INDEX[grid[4]] * _SUBSQUARE[0]
+            lat += _SUBSQUARE_INDEX[grid[5]] * _SUBSQUARE[1]
+            size = _SUBSQUARE
+
+        if length == 8:
+            lon += _DIGIT_INDEX[grid[6]] * _EXTENDED[0]
+            lat += _DIGIT_INDEX[grid[7]] * _EXTENDED[1]
+            size = _EXTENDED
+    except KeyError:
+        return None
+
+    # Use the center of the smallest square given
+    return lat + size[1] / 2.0, lon + size[0] / 2.0
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance between two points.
+
+    Args:
+        lat1, lon1: First point in degrees
+        lat2, lon2: Second point in degrees
+
+    Returns:
+        Distance in kilometers
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def initial_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Initial great-circle bearing from the first point to the second.
+
+    Args:
+        lat1, lon1: Starting point in degrees
+        lat2, lon2: Destination point in degrees
+
+    Returns:
+        Bearing in degrees (0-360, 0 = north)
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dlambda = math.radians(lon2 - lon1)
+
+    x = math.sin(dlambda) * math.cos(phi2)
+    y = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(dlambda)
+    return (math.degrees(math.atan2(x, y)) + 360.0) % 360.0
+
+
+def midpoint(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+    """
+    Midpoint of the great-circle path between two points.
+
+    Args:
+        lat1, lon1: First point in degrees
+        lat2, lon2: Second point in degrees
+
+    Returns:
+        (latitude, longitude) of the midpoint in degrees, longitude in -180..180
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    lambda1 = math.radians(lon1)
+    dlambda = math.radians(lon2 - lon1)
+
+    bx = math.cos(phi2) * math.cos(dlambda)
+    by = math.cos(phi2) * math.sin(dlambda)
+    phi_m = math.atan2(math.sin(phi1) + math.sin(phi2), math.hypot(math.cos(phi1) + bx, by))
+    lambda_m = lambda1 + math.atan2(by, math.cos(phi1) + bx)
+    return math.degrees(phi_m), (math.degrees(lambda_m) + 540.0) % 360.0 - 180.0
+
+
+def grid_distance_km(grid1: str, grid2: str) -> Optional[float]:
+    """
+    Distance between the centers of two Maidenhead locators.
+
+    Args:
+        grid1: First locator (e.g., "FN20qd")
+        grid2: Second locator (e.g., "EM29nf")
+
+    Returns:
+        Distance in kilometers, or None if either locator is invalid
+    """
+    p1 = grid_to_latlon(grid1)
+    p2 = grid_to_latlon(grid2)
+    if p1 is None or p2 is None:
+        return None
+    return haversine_km(p1[0], p1[1], p2[0], p2[1])
+
+
+def grid_bearing(grid1: str, grid2: str) -> Optional[float]:
+    """
+    Initial bearing from one Maidenhead locator to another.
+
+    Args:
+        grid1: Starting locator
+        grid2: Destination locator
+
+    Returns:
+        Bearing in degrees (0-360), or None if either locator is invalid
+    """
+    p1 = grid_to_latlon(grid1)
+    p2 = grid_to_latlon(grid2)
+    if p1 is None or p2 is None:
+        return None
+    return initial_bearing(p1[0], p1[1], p2[0], p2[1])
+
+
+def batch_distance_bearing(
+    home_grid: str,
+    grids: Sequence[Optional[str]],
+    use_numpy: Optional[bool] = None,
+) -> Tuple[List[Optional[float]], List[Optional[float]]]:
+    """
+    Distance and bearing from a home grid to many grids in one pass.
+
+    The home grid is parsed once. Each distinct grid is decoded once through the
+    memoized converter; the trigonometry then runs as a single vectorized NumPy
+    expression (or a Python loop when NumPy is unavailable).
+
+    Args:
+        home_grid: Home station locator
+        grids: Contact locators (None/invalid entries are allowed)
+        use_numpy: Force NumPy on/off (default: use NumPy for large batches when installed)
+
+    Returns:
+        (distances_km, bearings_deg) lists aligned with ``grids``; None for invalid grids
+    """
+    count = len(grids)
+    home = grid_to_latlon(home_grid)
+    if home is None or count == 0:
+        return [None] * count, [None] * count
+
+    points = [grid_to_latlon(g) for g in grids]
+
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY and count >= NUMPY_BATCH_THRESHOLD
+    elif use_numpy and not HAS_NUMPY:
+        logger.debug("NumPy requested for batch geodesy but not installed, using Python")
+        use_numpy = False
+
+    if not use_numpy:
+        distances: List[Optional[float]] = []
+        bearings: List[Optional[float]] = []
+        for point in points:
+            if point is None:
+                distances.append(None)
+                bearings.append(None)
+            else:
+                distances.append(haversine_km(home[0], home[1], point[0], point[1]))
+                bearings.append(initial_bearing(home[0], home[1], point[0], point[1]))
+        return distances, bearings
+
+    valid = np.fromiter((p is not None for p in points), dtype=bool, count=count)
+    coords = np.array([p if p is not None else (0.0, 0.0) for p in points], dtype=np.float64)
+
+    phi1 = math.radians(home[0])
+    lambda1 = math.radians(home[1])
+    phi2 = np.radians(coords[:, 0])
+    dlambda = np.radians(coords[:, 1]) - lambda1
+    cos_phi2 = np.cos(phi2)
+
+    a = np.sin((phi2 - phi1) / 2) ** 2 + math.cos(phi1) * cos_phi2 * np.sin(dlambda / 2) ** 2
+    dist = 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+    x = np.sin(dlambda) * cos_phi2
+    y = math.cos(phi1) * np.sin(phi2) - math.sin(phi1) * cos_phi2 * np.cos(dlambda)
+    bear = (np.degrees(np.arctan2(x, y)) + 360.0) % 360.0
+
+    dist_list = dist.tolist()
+    bear_list = bear.tolist()
+    if not valid.all():
+        for i in np.flatnonzero(~valid).tolist():
+            dist_list[i] = None
+            bear_list[i] = None
+    return dist_list, bear_list
+
+
+def batch_distances(home_grid: str, grids: Sequence[Optional[str]]) -> List[Optional[float]]:
+    """
+    Distances from a home grid to many grids in one pass.
+
+    Args:
+        home_grid: Home station locator
+        grids: Contact locators
+
+    Returns:
+        Distances in kilometers aligned with ``grids`` (None for invalid grids)
+    """
+    return batch_distance_bearing(home_grid, grids)[0]
+
+
+def clear_cache() -> None:
+    """Clear the memoized grid conversions"""
+    grid_to_latlon.cache_clear()
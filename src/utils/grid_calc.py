@@ -1,12 +1,15 @@
 """
 Grid Square and Distance Calculations
 
-Pure Python implementation for thread-safe grid calculations.
+Thin wrappers over src.utils.geodesy (memoized grid conversion, vectorized
+batch distance/bearing) plus spot-matching helpers. Batch distances run on
+the 'batch_distances' acceleration kernel (see src.utils.acceleration).
 """
 
 import logging
 from typing import Optional, List, Tuple, Dict, Any
-from src.services.voacap_muf_fetcher import VOACAPMUFFetcher
+from src.utils import geodesy
+from src.utils.acceleration import BATCH_DISTANCES
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +26,7 @@ def calculate_distance(grid1: str, grid2: str) -> Optional[float]:
         Distance in kilometers, or None if invalid
     """
     try:
-        return VOACAPMUFFetcher._grid_distance(grid1, grid2)
+        return geodesy.grid_distance_km(grid1, grid2)
     except Exception as e:
         logger.debug(f"Error calculating distance {grid1} → {grid2}: {e}")
         return None
@@ -32,6 +35,9 @@ def calculate_distance(grid1: str, grid2: str) -> Optional[float]:
 def batch_calculate_distances(home_grid: str, grids: List[str]) -> List[Optional[float]]:
     """
     Calculate distances for multiple grid squares in one call.
+
+    Runs on the fastest installed backend that matches the Python reference
+    (Rust releases the GIL for the whole batch).
     
     Args:
         home_grid: Home station grid square
@@ -40,11 +46,7 @@ def batch_calculate_distances(home_grid: str, grids: List[str]) -> List[Optional
     Returns:
         List of distances in kilometers (None for invalid grids)
     """
-    # Python implementation
-    results = []
-    for grid in grids:
-        results.append(calculate_distance(home_grid, grid))
-    return results
+    return BATCH_DISTANCES(home_grid, grids)
 
 
 def calculate_bearing(grid1: str, grid2: str) -> Optional[float]:
@@ -59,17 +61,17 @@ def calculate_bearing(grid1: str, grid2: str) -> Optional[float]:
         Bearing in degrees (0-360), or None if invalid
     """
     try:
-        # Python fallback not implemented
-        logger.warning("Bearing calculation not yet implemented")
-        return None
+        return geodesy.grid_bearing(grid1, grid2)
     except Exception as e:
         logger.debug(f"Error calculating bearing {grid1} → {grid2}: {e}")
         return None
 
 
 def is_rust_available() -> bool:
-    """Check if Rust acceleration is available - always False, using Python only"""
-    return False
+    """Check if the Rust batch distance kernel is installed and in use"""
+    if BATCH_DISTANCES.backend is None:
+        BATCH_DISTANCES.select()
+    return BATCH_DISTANCES.backend == 'rust'
 
 
 # Award calculation functions
@@ -132,6 +134,9 @@ def count_unique_prefixes_rust(callsigns: List[str]) -> int:
 
 
 # Spot matcher functions (for RBN/DX Cluster real-time filtering)
+SPOT_MODES = ("CW", "SSB", "USB", "LSB", "FM", "RTTY", "FT8", "FT4")
+
+
 def parse_rbn_spot(line: str) -> Optional[Dict[str, Any]]:
     """
     Parse RBN telnet spot line.
@@ -142,7 +147,8 @@ def parse_rbn_spot(line: str) -> Optional[Dict[str, Any]]:
         line: RBN spot line from telnet connection
 
     Returns:
-        Dict with keys: callsign, frequency, snr, timestamp
+        Dict with keys: callsign, frequency (kHz), snr, timestamp, reporter,
+        mode (None if the line names none) and wpm (None if absent)
         None if line cannot be parsed
     """
     # IMPORTANT: Always use Python implementation for parse_rbn_spot
@@ -159,15 +165,27 @@ def parse_rbn_spot(line: str) -> Optional[Dict[str, Any]]:
         freq = float(parts[3])
         callsign = parts[4]
 
-        # Find SNR (look for "XX dB" pattern)
+        # Find SNR and speed (look for "XX dB" and "XX WPM" patterns)
         snr = 0
+        wpm = None
         for i in range(len(parts) - 1):
-            if parts[i + 1] == "dB":
+            unit = parts[i + 1]
+            if unit == "dB" or unit == "WPM":
                 try:
-                    snr = int(parts[i])
-                    break
+                    value = int(parts[i])
                 except ValueError:
-                    pass
+                    continue
+                if unit == "dB":
+                    snr = value
+                else:
+                    wpm = value
+
+        # Mode is the first known mode name after the callsign
+        mode = None
+        for part in parts[5:]:
+            if part.upper() in SPOT_MODES:
+                mode = part.upper()
+                break
 
         # Find timestamp (ends with Z)
         timestamp = ""
@@ -180,7 +198,10 @@ def parse_rbn_spot(line: str) -> Optional[Dict[str, Any]]:
             'callsign': callsign,
             'frequency': freq,
             'snr': snr,
-            'timestamp': timestamp
+            'timestamp': timestamp,
+            'reporter': parts[2].rstrip(':'),
+            'mode': mode,
+            'wpm': wpm,
         }
     except (ValueError, IndexError):
         return None
@@ -241,7 +262,7 @@ def determine_mode(freq_mhz: float, mode_hint: Optional[str] = None) -> str:
     # See: https://github.com/PyO3/pyo3/issues/1205
 
     # Python implementation (thread-safe)
-    if mode_hint and mode_hint.upper() in ["CW", "SSB", "USB", "LSB", "FM", "RTTY", "FT8", "FT4"]:
+    if mode_hint and mode_hint.upper() in SPOT_MODES:
         return mode_hint.upper()
     
     # Determine from frequency (CW portions)
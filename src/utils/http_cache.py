@@ -0,0 +1,279 @@
+"""
+HTTP Disk Cache - Conditional GETs with an Offline Fallback
+
+Caches HTTP response bodies on disk together with their ETag/Last-Modified
+validators:
+- Fresh entries are served without a request. Freshness is the caller's
+  max_age, or else the server's Cache-Control max-age / Expires
+  (no-cache always revalidates; no-store bodies are not written to disk)
+- Stale entries are revalidated with If-None-Match/If-Modified-Since; a
+  304 Not Modified response only refreshes the timestamp
+- When the network is unavailable, or the shared HTTP client is in offline
+  mode, the last stored body is served instead
+
+Requests go through the shared pooled client (src.utils.http_client).
+
+Entries survive restarts, so callers can render last-known data immediately.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils.http_client import HTTPClient, get_http_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10
+
+
+@dataclass
+class CacheEntry:
+    """Stored HTTP response body and its revalidation headers"""
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0  # Epoch seconds of the last successful fetch or revalidation
+    lifetime: Optional[float] = None  # Freshness lifetime the server sent (None = not given)
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since the entry was last fetched or revalidated"""
+        return (now if now is not None else time.time()) - self.fetched_at
+
+    def is_fresh(self, max_age: Optional[float]) -> bool:
+        """Check freshness against the caller's max_age, or else the server's lifetime"""
+        limit = max_age if max_age is not None else self.lifetime
+        return limit is not None and self.age() < limit
+
+
+def freshness_lifetime(headers: Any) -> Optional[float]:
+    """
+    Freshness lifetime of a response (RFC 9111 section 4.2.1)
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds from Cache-Control max-age (0 for no-cache), else Expires
+        minus Date, else None
+    """
+    directives = {}
+    for part in (headers.get('Cache-Control') or '').split(','):
+        name, _, value = part.strip().partition('=')
+        directives[name.lower()] = value.strip('"')
+    if 'no-cache' in directives:
+        return 0.0
+    if directives.get('max-age', '').isdigit():
+        return float(directives['max-age'])
+
+    expires = headers.get('Expires')
+    if expires:
+        try:
+            date = headers.get('Date')
+            served = parsedate_to_datetime(date).timestamp() if date else time.time()
+            return max(0.0, parsedate_to_datetime(expires).timestamp() - served)
+        except (TypeError, ValueError):
+            return 0.0  # Invalid Expires means already expired
+    return None
+
+
+def is_no_store(headers: Any) -> bool:
+    """Check whether a response may not be stored"""
+    return 'no-store' in (headers.get('Cache-Control') or '').lower()
+
+
+class HTTPDiskCache:
+    """On-disk HTTP response cache with conditional revalidation"""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        user_agent: str,
+        timeout: int = DEFAULT_TIMEOUT,
+        client: Optional[HTTPClient] = None
+    ):
+        """
+        Initialize HTTP cache
+
+        Args:
+            cache_dir: Directory holding one JSON file per cached URL
+            user_agent: User-Agent header for requests
+            timeout: Default request timeout in seconds
+            client: HTTP client (defaults to the shared client)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self._client = client
+        self._entries: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> HTTPClient:
+        """HTTP client used for requests"""
+        return self._client or get_http_client()
+
+    def _path(self, url: str) -> Path:
+        """Cache file path for a URL"""
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def get_cached(self, url: str) -> Optional[CacheEntry]:
+        """
+        Get the stored entry for a URL without touching the network
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Cache entry, or None if the URL has never been fetched
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is not None:
+            return entry
+
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                entry = CacheEntry(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable HTTP cache entry for {url}: {e}")
+            return None
+
+        with self._lock:
+            self._entries[url] = entry
+        return entry
+
+    def _store(self, entry: CacheEntry) -> None:
+        """Store an entry in memory and on disk"""
+        with self._lock:
+            self._entries[entry.url] = entry
+
+        path = self._path(entry.url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(entry), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write HTTP cache entry for {entry.url}: {e}")
+
+    def fetch(
+        self,
+        url: str,
+        max_age: Optional[float] = None,
+        timeout: Optional[int] = None,
+        offline: bool = False
+    ) -> str:
+        """
+        Get a response body, using the cache according to its freshness
+
+        Args:
+            url: Request URL
+            max_age: Seconds a stored body is served without revalidation
+                (None = use the server's Cache-Control/Expires lifetime)
+            timeout: Request timeout in seconds (defaults to the cache timeout)
+            offline: Never touch the network; serve any stored body regardless
+                of age (also when the shared client is in offline mode)
+
+        Returns:
+            Response body text
+
+        Raises:
+            urllib.error.URLError: If the request fails and nothing is cached
+        """
+        client = self.client
+        entry = self.get_cached(url)
+
+        if entry is not None and entry.is_fresh(max_age):
+            client.record_cache(url, 'cache_hits')
+            return entry.body
+
+        if entry is not None:
+            # Another process or fetcher instance may have refreshed the file
+            disk_entry = self._reload(url)
+            if disk_entry is not None and disk_entry.is_fresh(max_age):
+                client.record_cache(url, 'cache_hits')
+                return disk_entry.body
+            entry = disk_entry or entry
+
+        if offline or client.offline:
+            if entry is None:
+                raise urllib.error.URLError(f"Offline and no cached copy of {url}")
+            client.record_cache(url, 'cache_stale_served')
+            return entry.body
+
+        headers = {'User-Agent': self.user_agent}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        try:
+            with client.urlopen(url, timeout=timeout or self.timeout, headers=headers) as response:
+                body = response.read().decode('utf-8')
+                new_entry = CacheEntry(
+                    url=url,
+                    body=body,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    fetched_at=time.time(),
+                    lifetime=freshness_lifetime(response.headers)
+                )
+                no_store = is_no_store(response.headers)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and entry is not None:
+                logger.debug(f"Not modified: {url}")
+                client.record_cache(url, 'cache_revalidated')
+                entry.fetched_at = time.time()
+                lifetime = freshness_lifetime(e.headers) if e.headers else None
+                if lifetime is not None:
+                    entry.lifetime = lifetime
+                self._store(entry)
+                return entry.body
+            if entry is not None:
+                logger.warning(f"HTTP {e.code} from {url}, serving cached copy ({entry.age():.0f}s old)")
+                client.record_cache(url, 'cache_stale_served')
+                return entry.body
+            raise
+        except (urllib.error.URLError, OSError) as e:
+            if entry is not None:
+                logger.warning(f"Unable to reach {url} ({e}), serving cached copy ({entry.age():.0f}s old)")
+                client.record_cache(url, 'cache_stale_served')
+                return entry.body
+            if isinstance(e, urllib.error.URLError):
+                raise
+            raise urllib.error.URLError(e) from e
+
+        if no_store:
+            return new_entry.body
+        self._store(new_entry)
+        return new_entry.body
+
+    def _reload(self, url: str) -> Optional[CacheEntry]:
+        """Re-read an entry from disk, replacing the in-memory copy"""
+        with self._lock:
+            self._entries.pop(url, None)
+        return self.get_cached(url)
+
+    def clear(self) -> None:
+        """Remove all cached entries from memory and disk"""
+        with self._lock:
+            self._entries.clear()
+        try:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not clear HTTP cache: {e}")
@@ -0,0 +1,465 @@
+"""
+Shared HTTP Client - Keep-Alive Pools, Host Limits, Offline Mode and Metrics
+
+Every fetcher (SKCC roster and C/T/S lists, QRZ XML lookups, space weather,
+GIRO) reaches the network through one client instead of a fresh
+urllib.request.urlopen per request:
+- Connections are kept alive in a small pool per (scheme, host, port), so
+  repeated requests to the same server skip the TCP and TLS handshakes
+- One TLS context is shared, so CA certificates are loaded once
+- Each host has a concurrency limit and an optional minimum interval
+  between requests
+- In offline mode no request is sent; HTTPDiskCache serves stored bodies
+- Counters (requests, connections opened/reused, bytes, cache use) are kept
+  for diagnostics
+
+Responses stream like urllib's: read them inside a "with" block. The
+connection goes back to its pool once the body has been read to the end.
+Errors are raised as urllib.error.HTTPError/URLError, so callers written for
+urlopen keep working. When a proxy is configured in the environment,
+requests go through urllib.request (unpooled) so the proxy is honoured.
+"""
+
+import http.client
+import io
+import logging
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
+IDLE_CONNECTION_SECONDS = 30.0  # Idle connections older than this are closed, not reused
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+USER_AGENT = "W4GNS-Logger/1.0"
+
+# Errors meaning a kept-alive connection was closed by the server while idle
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+HostKey = Tuple[str, str, int]
+
+
+class HostPool:
+    """Kept-alive connections, concurrency slots and rate limit for one host"""
+
+    def __init__(
+        self,
+        key: HostKey,
+        max_connections: int,
+        min_interval: float,
+        ssl_context: ssl.SSLContext,
+    ):
+        """
+        Initialize host pool
+
+        Args:
+            key: (scheme, host, port)
+            max_connections: Most requests in flight to the host at once
+            min_interval: Seconds between the starts of consecutive requests
+            ssl_context: TLS context for HTTPS connections
+        """
+        self.key = key
+        self.max_connections = max(1, max_connections)
+        self.min_interval = min_interval
+        self._ssl_context = ssl_context
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self._idle: List[Tuple[http.client.HTTPConnection, float]] = []
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def acquire(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Wait for a free slot and the rate limit, then check out a connection
+
+        Args:
+            timeout: Longest wait for a slot in seconds
+
+        Returns:
+            (connection, reused)
+
+        Raises:
+            urllib.error.URLError: If no slot frees up in time
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise urllib.error.URLError(f"Too many concurrent requests to {self.key[1]}")
+
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.min_interval
+            conn = None
+            while self._idle:
+                candidate, released_at = self._idle.pop()
+                if now - released_at < IDLE_CONNECTION_SECONDS:
+                    conn = candidate
+                    break
+                candidate.close()
+        if wait > 0:
+            time.sleep(wait)
+
+        if conn is not None:
+            return conn, True
+        scheme, host, port = self.key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, context=self._ssl_context), False
+        return http.client.HTTPConnection(host, port), False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        """Return a connection (kept if reusable) and free its slot"""
+        try:
+            if reusable:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+            else:
+                conn.close()
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+
+class PooledResponse(io.RawIOBase):
+    """
+    Streaming response that hands its connection back to the pool
+
+    Compatible with the parts of urllib's response used by callers: read(),
+    iteration, headers, status, getcode(), geturl(), use in io.BufferedReader,
+    and "with" blocks.
+    """
+
+    def __init__(
+        self,
+        client: "HTTPClient",
+        pool: HostPool,
+        conn: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+        url: str,
+    ):
+        super().__init__()
+        self._client = client
+        self._pool = pool
+        self._conn = conn
+        self._response = response
+        self._released = False
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        count = self._response.readinto(buffer)
+        self._client._count(self._pool.key, bytes_received=count)
+        if count == 0:
+            self._release()
+        return count
+
+    def read(self, size: int = -1) -> bytes:
+        if size is not None and size >= 0:
+            return super().read(size)
+        data = self._response.read()
+        self._client._count(self._pool.key, bytes_received=len(data))
+        self._release()
+        return data
+
+    def getcode(self) -> int:
+        return self.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def info(self) -> Any:
+        return self.headers
+
+    def close(self) -> None:
+        self._release()
+        super().close()
+
+    def _release(self) -> None:
+        """Return the connection; it is only reusable after the whole body was read"""
+        if self._released:
+            return
+        self._released = True
+        reusable = self._response.isclosed() and not self._response.will_close
+        if not reusable:
+            self._response.close()
+        self._pool.release(self._conn, reusable)
+
+
+class HTTPClient:
+    """Pooled HTTP client shared by all network fetchers"""
+
+    def __init__(
+        self,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        min_interval: float = 0.0,
+        host_limits: Optional[Dict[str, Dict[str, float]]] = None,
+        offline: bool = False,
+        user_agent: str = USER_AGENT,
+    ):
+        """
+        Initialize HTTP client
+
+        Args:
+            max_connections_per_host: Default concurrency limit per host
+            min_interval: Default seconds between requests to one host
+            host_limits: Per-host overrides, e.g. {"xmldata.qrz.com":
+                {"max_connections": 1, "min_interval": 0.5}}
+            offline: Refuse network access (cached data only)
+            user_agent: User-Agent header when the caller sets none
+        """
+        self.max_connections_per_host = max_connections_per_host
+        self.min_interval = min_interval
+        self.host_limits = {host.lower(): dict(limits) for host, limits in (host_limits or {}).items()}
+        self.offline = offline
+        self.user_agent = user_agent
+        self._ssl_context = ssl.create_default_context()
+        self._pools: Dict[HostKey, HostPool] = {}
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Any] = {
+            'requests': 0,
+            'connections_opened': 0,
+            'connections_reused': 0,
+            'redirects': 0,
+            'http_errors': 0,
+            'network_errors': 0,
+            'offline_refused': 0,
+            'unpooled': 0,
+            'bytes_received': 0,
+            'cache_hits': 0,
+            'cache_revalidated': 0,
+            'cache_stale_served': 0,
+            'hosts': {},
+        }
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def urlopen(
+        self,
+        url: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        headers: Optional[Dict[str, str]] = None,
+        method: str = "GET",
+        data: Optional[bytes] = None,
+    ) -> Any:
+        """
+        Send a request, following redirects
+
+        Args:
+            url: Full http(s) URL
+            timeout: Connect/read timeout in seconds
+            headers: Extra request headers
+            method: HTTP method
+            data: Request body
+
+        Returns:
+            Streaming response (PooledResponse, or urllib's response when a
+            proxy is in use)
+
+        Raises:
+            urllib.error.HTTPError: For 3xx responses that are not followed
+                (304, no Location, non-GET/HEAD) and for 4xx/5xx responses
+            urllib.error.URLError: If offline or the request fails
+        """
+        headers = dict(headers or {})
+        if not any(name.lower() == 'user-agent' for name in headers):
+            headers['User-Agent'] = self.user_agent
+
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                raise urllib.error.URLError(f"Unsupported URL: {url}")
+            key = (parts.scheme, parts.hostname.lower(), parts.port or (443 if parts.scheme == "https" else 80))
+
+            if self.offline:
+                self._count(key, offline_refused=1)
+                raise urllib.error.URLError(f"Offline mode: not fetching {url}")
+
+            if self._uses_proxy(parts):
+                self._count(key, requests=1, unpooled=1)
+                request = urllib.request.Request(url, data=data, headers=headers, method=method)
+                return urllib.request.urlopen(request, timeout=timeout)
+
+            path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+            response = self._send(self._pool(key), url, path, method, data, headers, timeout)
+
+            location = response.headers.get('Location')
+            if response.status in REDIRECT_CODES and location and method in ("GET", "HEAD"):
+                response.read()
+                response.close()
+                self._count(key, redirects=1)
+                url = urllib.parse.urljoin(url, location)
+                continue
+
+            # Like urllib, a 3xx that is not followed is an error, not a body
+            if response.status >= 300:
+                body = response.read()
+                response.close()
+                self._count(key, http_errors=1)
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+            return response
+
+        raise urllib.error.URLError(f"Too many redirects: {url}")
+
+    def get(self, url: str, timeout: float = DEFAULT_TIMEOUT, headers: Optional[Dict[str, str]] = None) -> bytes:
+        """
+        Fetch a URL and return the whole body
+
+        Raises:
+            urllib.error.HTTPError, urllib.error.URLError: As urlopen()
+        """
+        with self.urlopen(url, timeout=timeout, headers=headers) as response:
+            return response.read()
+
+    def _send(
+        self,
+        pool: HostPool,
+        url: str,
+        path: str,
+        method: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> PooledResponse:
+        """Send one request on a pooled connection, retrying once if a kept-alive connection went stale"""
+        conn, reused = pool.acquire(timeout)
+        while True:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            self._count(pool.key, requests=1, connections_reused=int(reused), connections_opened=int(not reused))
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                response = conn.getresponse()
+                return PooledResponse(self, pool, conn, response, url)
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if not reused:
+                    pool.release(conn, False)
+                    self._count(pool.key, network_errors=1)
+                    raise urllib.error.URLError(e) from e
+                logger.debug(f"Kept-alive connection to {pool.key[1]} was closed, reconnecting")
+                reused = False  # Reconnects on the next request
+            except (OSError, http.client.HTTPException) as e:
+                pool.release(conn, False)
+                self._count(pool.key, network_errors=1)
+                raise urllib.error.URLError(e) from e
+
+    def _pool(self, key: HostKey) -> HostPool:
+        """Get or create the pool for a host"""
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                limits = self.host_limits.get(key[1], {})
+                pool = HostPool(
+                    key,
+                    int(limits.get('max_connections', self.max_connections_per_host)),
+                    float(limits.get('min_interval', self.min_interval)),
+                    self._ssl_context,
+                )
+                self._pools[key] = pool
+            return pool
+
+    @staticmethod
+    def _uses_proxy(parts: urllib.parse.SplitResult) -> bool:
+        """Check whether the environment routes this URL through a proxy"""
+        proxies = urllib.request.getproxies()
+        return parts.scheme in proxies and not urllib.request.proxy_bypass(parts.hostname)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def _count(self, key: Optional[HostKey] = None, **counters: int) -> None:
+        """Add to the global and per-host counters"""
+        with self._lock:
+            host = self._metrics['hosts'].setdefault(key[1], {}) if key else None
+            for name, value in counters.items():
+                if value:
+                    self._metrics[name] += value
+                    if host is not None:
+                        host[name] = host.get(name, 0) + value
+
+    def record_cache(self, url: str, outcome: str) -> None:
+        """
+        Count an HTTPDiskCache outcome
+
+        Args:
+            url: Request URL
+            outcome: 'cache_hits', 'cache_revalidated' or 'cache_stale_served'
+        """
+        host = (urllib.parse.urlsplit(url).hostname or '').lower()
+        self._count(("", host, 0), **{outcome: 1})
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of the counters, with per-host counts under 'hosts'"""
+        with self._lock:
+            snapshot = dict(self._metrics)
+            snapshot['hosts'] = {host: dict(counts) for host, counts in self._metrics['hosts'].items()}
+            snapshot['pooled_hosts'] = len(self._pools)
+            return snapshot
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
+
+
+# Global client instance
+_http_client: Optional[HTTPClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """
+    Get the global HTTP client, configured from the network settings
+
+    Returns:
+        HTTPClient shared by all fetchers
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            try:
+                from src.config.settings import get_config_manager
+
+                config = get_config_manager()
+                _http_client = HTTPClient(
+                    max_connections_per_host=int(config.get("network.max_connections_per_host",
+                                                            DEFAULT_MAX_CONNECTIONS_PER_HOST)),
+                    min_interval=float(config.get("network.min_request_interval", 0.0)),
+                    host_limits=config.get("network.host_limits", {}),
+                    offline=bool(config.get("network.offline", False)),
+                )
+            except Exception as e:
+                logger.warning(f"Could not load network settings, using defaults: {e}")
+                _http_client = HTTPClient()
+        return _http_client
+
+
+def shutdown_http_client() -> None:
+    """Close the global client's idle connections"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            logger.debug(f"HTTP client metrics: {_http_client.metrics()}")
+            _http_client.close()
+            _http_client = None
@@ -1,12 +1,16 @@
 """
 Network utilities: resilient urlopen with retries and exponential backoff.
+
+Requests go through the shared pooled client (src.utils.http_client).
 """
 from __future__ import annotations
 
 import time
-import urllib.request
+import urllib.error
 from typing import Optional, Dict
 
+from src.utils.http_client import get_http_client
+
 
 def urlopen_with_retries(
     url: str,
@@ -19,7 +23,7 @@ def urlopen_with_retries(
     """
     Open a URL with retries and exponential backoff.
 
-    Returns a file-like HTTPResponse object compatible with "with ... as resp".
+    Returns a file-like response object compatible with "with ... as resp".
 
     Args:
         url: Full URL string
@@ -29,20 +33,28 @@ def urlopen_with_retries(
         headers: Optional headers to include in the request
 
     Raises:
-        The last exception from urllib.request.urlopen if all retries fail.
+        The last exception from the HTTP client if all retries fail.
+        HTTP responses below 500 (including 304 Not Modified for conditional
+        requests) are raised immediately as HTTPError without retrying, as is
+        the URLError raised in offline mode.
     """
     if retries < 1:
         retries = 1
 
-    req = urllib.request.Request(url, headers=headers or {})
+    client = get_http_client()
 
     attempt = 0
     delay = max(0.0, backoff)
 
     while True:
         try:
-            return urllib.request.urlopen(req, timeout=timeout)
-        except Exception:
+            return client.urlopen(url, timeout=timeout, headers=headers)
+        except Exception as e:
+            # Client errors and 304 Not Modified will not change on retry
+            if isinstance(e, urllib.error.HTTPError) and e.code < 500:
+                raise
+            if client.offline:
+                raise
             attempt += 1
             if attempt >= retries:
                 # Re-raise last exception
@@ -0,0 +1,117 @@
+"""
+Unit Tests for the Acceleration Backend Registry
+
+Parity suite: every installed backend of every kernel must reproduce the pure
+Python reference. Rust cases run wherever rust_grid_calc is built.
+"""
+
+import random
+import unittest
+import logging
+
+from src.utils.acceleration import (
+    BATCH_DISTANCES, PARSE_ADI, Kernel, format_timing_report, kernels, timing_report,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def random_grids(count: int, seed: int = 7) -> list:
+    """Valid, lowercase, truncated and junk locators"""
+    rng = random.Random(seed)
+    grids = []
+    for _ in range(count):
+        grid = (rng.choice("ABCDEFGHIJKLMNOPQR") + rng.choice("ABCDEFGHIJKLMNOPQR")
+                + str(rng.randrange(10)) + str(rng.randrange(10))
+                + rng.choice("abcdefghijklmnopqrstuvwx") + rng.choice("ABCDEFGHIJKLMNOPQRSTUVWX")
+                + str(rng.randrange(10)) + str(rng.randrange(10)))
+        grids.append(rng.choice([grid, grid[:2], grid[:4], grid[:6], grid.lower(), grid[:5], "YZ12", None]))
+    return grids
+
+
+def random_adi(count: int, seed: int = 11) -> str:
+    """ADI text with lowercase tags, type specifiers, empty and unicode values"""
+    rng = random.Random(seed)
+    fields = ["<CALL:{len}>K{n}AA ", "<call:4>w1aw ", "<QSO_DATE:8:D>20250101 ", "<NAME:6>José \n",
+              "<COMMENT:0>", "<BAND:3>40M", "<MODE:2>CW\r\n", "<BAD:x>junk ", "<SKCC:5>1234T "]
+    records = []
+    for n in range(count):
+        chosen = rng.sample(fields, rng.randrange(len(fields)))
+        record = "".join(chosen).replace("{len}", str(len(f"K{n}AA"))).replace("{n}", str(n))
+        records.append(record + rng.choice(["<EOR>\n", "<EOR>", "<eor>\n"]))
+    return "ADIF export <ADIF_VER:5>3.1.5\n<PROGRAMID:5>W4GNS <EOH>\n" + "".join(records)
+
+
+class TestBackendParity(unittest.TestCase):
+    """Every installed backend matches the reference"""
+
+    def assert_parity(self, kernel: Kernel, *args):
+        reference = kernel.implementation('python')(*args)
+        for backend in kernel.available_backends():
+            with self.subTest(kernel=kernel.name, backend=backend):
+                self.assertTrue(kernel.equivalent(kernel.implementation(backend)(*args), reference))
+
+    def test_batch_distances(self):
+        """Distances agree for every grid shape, including invalid ones"""
+        for home in ("FM06ew", "fn20", "RR99xx09", "bogus"):
+            self.assert_parity(BATCH_DISTANCES, home, random_grids(5000))
+        self.assert_parity(BATCH_DISTANCES, "FM06ew", random_grids(10))  # Below the NumPy threshold
+
+    def test_parse_adi(self):
+        """Records and header agree, including malformed tags"""
+        self.assert_parity(PARSE_ADI, random_adi(3000))
+        self.assert_parity(PARSE_ADI, "<CALL:4>NOHD<EOR>")
+        self.assert_parity(PARSE_ADI, *PARSE_ADI.benchmark())
+
+    def test_selected_backends_pass_self_check(self):
+        """Auto selection only picks backends that reproduce the samples"""
+        for kernel in kernels():
+            backend = kernel.select('auto')
+            self.assertIn(backend, kernel.available_backends())
+            self.assertTrue(kernel.check(backend))
+
+
+class TestSelection(unittest.TestCase):
+    """Test backend selection and fallbacks"""
+
+    def make_kernel(self) -> Kernel:
+        return Kernel('double', lambda values: [v * 2 for v in values],
+                      samples=lambda: [([1, 2, 3],)], benchmark=lambda: (list(range(1000)),))
+
+    def test_mismatched_backend_rejected(self):
+        """A backend that disagrees with the reference falls back to python"""
+        kernel = self.make_kernel()
+        kernel.provide('numpy', lambda: (lambda values: [v * 2 + 1 for v in values]))
+        with self.assertLogs('src.utils.acceleration', level='WARNING'):
+            self.assertEqual(kernel.select('auto'), 'python')
+        self.assertEqual(kernel([4]), [8])
+
+    def test_override_and_unavailable_backend(self):
+        """An explicit preference wins; missing backends fall back to python"""
+        kernel = self.make_kernel()
+        kernel.provide('numpy', lambda: (lambda values: [v + v for v in values]))
+
+        def missing():
+            raise ImportError("not built")
+        kernel.provide('rust', missing)
+
+        self.assertEqual(kernel.available_backends(), ['numpy', 'python'])
+        self.assertEqual(kernel.select('auto'), 'numpy')
+        self.assertEqual(kernel.select('python'), 'python')
+        with self.assertLogs('src.utils.acceleration', level='WARNING'):
+            self.assertEqual(kernel.select('rust'), 'python')
+        with self.assertRaises(ValueError):
+            kernel.select('cuda')
+
+    def test_timing_report(self):
+        """The report covers each installed backend and marks the active one"""
+        timings = timing_report(repeat=1)
+        for kernel in kernels():
+            rows = [t for t in timings if t.kernel == kernel.name]
+            self.assertEqual([t.backend for t in rows], kernel.available_backends())
+            self.assertEqual([t.backend for t in rows if t.active], [kernel.backend])
+        self.assertIn("*active", format_timing_report(timings))
+
+
+if __name__ == "__main__":
+    unittest.main()
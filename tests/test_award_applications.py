@@ -0,0 +1,70 @@
+"""
+Unit Tests for Batch Award Application Generation
+
+Checks that generate_all_applications() loads the log once, matches the
+applications generated one at a time, and writes one file per award.
+"""
+
+import re
+import unittest
+import logging
+import tempfile
+from pathlib import Path
+
+from src.adif.award_application_generator import APPLICATION_AWARDS, AwardApplicationGenerator
+from src.database.models import Contact
+from src.database.repository import DatabaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+def without_timestamps(text: str) -> str:
+    """Drop the generation timestamps so two runs compare equal"""
+    return re.sub(r"(Application Date|Application Generated|Generated): .*", "", text)
+
+
+class TestGenerateAllApplications(unittest.TestCase):
+    """Test the shared-pass batch mode"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db = DatabaseRepository(str(Path(self.temp_dir.name) / "contacts.db"))
+        self.addCleanup(self.db.engine.dispose)
+        session = self.db.get_session()
+        for n in range(1, 121):
+            session.add(Contact(
+                callsign=f"K{n}AA", qso_date=f"2020{(n % 12) + 1:02d}01", time_on=f"{n % 24:02d}00",
+                time_off=f"{(n + 1) % 24:02d}00", band=("40M", "20M")[n % 2], mode="CW",
+                key_type=("STRAIGHT", "BUG", "SIDESWIPER")[n % 3], skcc_number=f"{n}T",
+                state="TN", country="United States", dxcc=291,
+            ))
+        session.commit()
+        session.close()
+        self.generator = AwardApplicationGenerator(self.db, "W4GNS", "1234")
+
+    def test_batch_matches_single_applications(self):
+        """Every application equals its one-at-a-time version, from one contact load"""
+        loads = []
+        original = self.db.get_contact_records
+        self.db.get_contact_records = lambda *a, **kw: loads.append(a) or original(*a, **kw)
+
+        results = self.generator.generate_all_applications(output_dir=self.temp_dir.name)
+        self.assertEqual(list(results), list(APPLICATION_AWARDS))
+        self.assertEqual(len(loads), 1)
+
+        for key, name in APPLICATION_AWARDS.items():
+            single = self.generator.generate_application(name)
+            self.assertEqual(without_timestamps(results[key]), without_timestamps(single), key)
+            self.assertTrue((Path(self.temp_dir.name) / f"{key}_application.txt").exists())
+
+    def test_subset_and_unknown_awards(self):
+        """A subset is generated in the requested order; unknown keys are rejected"""
+        results = self.generator.generate_all_applications(format='csv', awards=['was', 'centurion'])
+        self.assertEqual(list(results), ['was', 'centurion'])
+        with self.assertRaises(ValueError):
+            self.generator.generate_all_applications(awards=['bogus'])
+
+
+if __name__ == "__main__":
+    unittest.main()
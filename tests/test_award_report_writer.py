@@ -0,0 +1,97 @@
+"""
+Unit Tests for Streaming Award Report Writers
+
+Checks that write_report() streams the same report generate_report() builds,
+to paths, text streams and binary streams (optionally gzip-compressed), and
+reports validation progress.
+"""
+
+import io
+import re
+import gzip
+import unittest
+import logging
+import tempfile
+from pathlib import Path
+
+from src.adif.award_report_generator import AwardReportGenerator, write_lines
+from src.database.models import Contact
+from src.database.repository import DatabaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+def without_timestamps(text: str) -> str:
+    """Drop the generation timestamps so two runs compare equal"""
+    return re.sub(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} UTC", "", text)
+
+
+class TestWriteReport(unittest.TestCase):
+    """Test streaming reports against a temporary logbook"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db = DatabaseRepository(str(Path(self.temp_dir.name) / "contacts.db"))
+        self.addCleanup(self.db.engine.dispose)
+        session = self.db.get_session()
+        for n in range(1, 1201):
+            session.add(Contact(
+                callsign=f"K{n}AA", qso_date=f"20{10 + n % 10}0101", time_on=f"{n % 24:02d}00",
+                band="40M", mode=("CW", "SSB")[n % 4 == 0], key_type="STRAIGHT",
+                skcc_number=f"{n % 900}T", notes="ragchew, 2 hours" if n % 7 == 0 else None,
+            ))
+        session.commit()
+        session.close()
+        self.generator = AwardReportGenerator(self.db, "W4GNS", "1234")
+
+    def test_streamed_report_matches_generated_report(self):
+        """Every format streams the same text generate_report returns"""
+        for format in ('text', 'csv', 'tsv', 'html'):
+            expected = self.generator.generate_report('Centurion', format, achievement_date="20150101")
+            stream = io.StringIO()
+            count = self.generator.write_report('Centurion', stream, format, achievement_date="20150101")
+            self.assertEqual(without_timestamps(stream.getvalue()), without_timestamps(expected), format)
+            self.assertEqual(count, 480)
+
+    def test_gzip_destinations_and_progress(self):
+        """Paths and binary streams can be compressed; progress covers both passes"""
+        path = Path(self.temp_dir.name) / "reports" / "centurion.csv.gz"
+        calls = []
+        count = self.generator.write_report('Centurion', path, 'csv', compress=True,
+                                            progress=lambda done, total: calls.append((done, total)))
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            lines = f.read().split("\n")
+        self.assertEqual(len(lines), count + 1)
+        self.assertEqual(calls[0], (0, 900))
+        self.assertEqual(calls[-1], (900, 900))
+
+        stream = io.BytesIO()
+        calls.clear()
+        self.generator.write_report('Centurion', stream, 'text', compress=True,
+                                    progress=lambda done, total: calls.append((done, total)))
+        self.assertFalse(stream.closed)
+        self.assertIn("Total Contacts: 900", gzip.decompress(stream.getvalue()).decode('utf-8'))
+        self.assertEqual(calls[-1], (1800, 1800))  # Summary pass + contact list pass
+
+        with self.assertRaises(ValueError):
+            self.generator.write_report('Centurion', io.StringIO(), compress=True)
+        with self.assertRaises(ValueError):
+            self.generator.write_report('Bogus', io.StringIO())
+
+        # Unknown formats fall back to text, like generate_report always has
+        text, fallback = io.StringIO(), io.StringIO()
+        self.generator.write_report('Centurion', text, 'text')
+        self.generator.write_report('Centurion', fallback, 'xml')
+        self.assertEqual(without_timestamps(fallback.getvalue()), without_timestamps(text.getvalue()))
+
+    def test_write_lines_chunks(self):
+        """Chunked writes join lines exactly like str.join"""
+        lines = [f"line {n}" for n in range(7)]
+        stream = io.StringIO()
+        write_lines(stream, iter(lines), chunk_lines=3)
+        self.assertEqual(stream.getvalue(), "\n".join(lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit Tests for the Shared Award Computation Service
+
+Submits award jobs against a temporary logbook and checks deduplication,
+caching and that results of superseded data generations are dropped.
+"""
+
+import os
+import unittest
+import logging
+import tempfile
+import threading
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+
+from src.awards.was import WASAward
+from src.database.models import Contact
+from src.database.repository import DatabaseRepository
+from src.ui.award_service import AwardComputeService
+
+logger = logging.getLogger(__name__)
+
+
+class TestAwardComputeService(unittest.TestCase):
+    """Test job deduplication, result caching and invalidation"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db = DatabaseRepository(str(Path(self.temp_dir.name) / "contacts.db"))
+        self.addCleanup(self.db.engine.dispose)
+        session = self.db.get_session()
+        for callsign, state, skcc in (("W4GNS", "TN", "12345T"), ("K3Y", "PA", "1234S")):
+            session.add(Contact(callsign=callsign, qso_date="20250101", time_on="1200", band="40M",
+                                mode="CW", state=state, skcc_number=skcc, key_type="STRAIGHT"))
+        session.commit()
+        session.close()
+
+        self.service = AwardComputeService(self.db, max_workers=1)
+        self.addCleanup(self.service.shutdown)
+        self.results = []
+        self.service.result_ready.connect(lambda award_id, result: self.results.append((award_id, result)))
+
+    def wait_for(self, count: int, timeout_ms: int = 5000) -> None:
+        """Process events until count results arrived"""
+        waited = 0
+        while len(self.results) < count and waited < timeout_ms:
+            QTest.qWait(10)
+            waited += 10
+
+    def test_duplicate_and_cached_jobs(self):
+        """A duplicate in-flight job is merged; a repeat after completion comes from the cache"""
+        loads = []
+        original = self.service.contacts
+        self.service.contacts = lambda generation: loads.append(generation) or original(generation)
+
+        def compute(contacts):
+            return WASAward(None).calculate_progress(contacts)
+
+        first = self.service.submit("was", compute)
+        self.assertIs(self.service.submit("was", compute), first)
+        self.wait_for(1)
+        self.service.submit("was", compute)
+        self.wait_for(2)
+
+        self.assertEqual(len(self.results), 2)
+        self.assertEqual(self.results[0], self.results[1])
+        self.assertEqual(self.results[0][1]['current'], 2)
+        self.assertEqual(loads, [0])
+        self.assertEqual((self.service.stats['deduplicated'], self.service.stats['cached']), (1, 1))
+
+    def test_superseded_job_dropped(self):
+        """A job still running when the data changes never delivers its result"""
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow(contacts):
+            started.set()
+            release.wait(5)
+            return "stale"
+
+        self.service.submit("was", slow)
+        queued = self.service.submit("pfx", lambda contacts: "queued")
+        self.assertTrue(started.wait(5))
+
+        self.service.invalidate()
+        release.set()
+        self.assertTrue(queued.future.cancelled())
+        self.service.submit("was", lambda contacts: len(contacts))
+        self.wait_for(1)
+        QTest.qWait(50)
+
+        self.assertEqual(self.results, [("was", 2)])
+        self.assertEqual(self.service.stats['cancelled'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Unit Tests for the SKCC Award Timeline Replay
+
+Replays synthetic logs and checks that endorsement milestones land on the
+exact QSO, that prerequisites reached during the replay unlock later awards,
+and that the repository serves the replay from a temporary logbook.
+"""
+
+import unittest
+import logging
+import tempfile
+from pathlib import Path
+
+from src.awards.timeline import AwardTimeline, RagChewTrack, in_replay_order
+from src.database.models import Contact
+from src.database.repository import DatabaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+def make_contact(number: int, qso_date: str, time_on: str, **kwargs) -> dict:
+    """Build a CW contact dict with SKCC member number"""
+    contact = {
+        'id': number,
+        'callsign': f"K{number}AA",
+        'qso_date': qso_date,
+        'qso_time': time_on,
+        'band': '40M',
+        'mode': 'CW',
+        'key_type': 'STRAIGHT',
+        'skcc_number': f"{number}T",
+    }
+    contact.update(kwargs)
+    return contact
+
+
+def member_log(count: int, qso_date: str = "20200101") -> list:
+    """One contact per member, one minute apart"""
+    return [make_contact(n, qso_date, f"{n // 60:02d}{n % 60:02d}") for n in range(1, count + 1)]
+
+
+class TestAwardTimeline(unittest.TestCase):
+    """Test the single-pass replay"""
+
+    def test_centurion_milestone_at_exact_qso(self):
+        """The 100th member is the Centurion QSO; repeats don't count"""
+        contacts = member_log(120)
+        contacts.insert(50, make_contact(3, "20200101", "0050"))  # Repeat of member 3
+        timeline = AwardTimeline.replay(contacts)
+
+        self.assertEqual(timeline.centurion.count, 120)
+        milestone = timeline.centurion.milestone("Centurion")
+        self.assertEqual((milestone.callsign, milestone.time_on), ("K100AA", "0140"))
+        self.assertEqual(timeline.user_centurion_date, "20200101")
+        self.assertFalse(timeline.centurion_date_official)
+
+    def test_same_day_tribune_credit(self):
+        """Tribune QSOs earlier on the Centurion day count once Centurion is reached"""
+        contacts = member_log(100)
+        tribune_numbers = {str(n) for n in range(1, 101)}
+        early = AwardTimeline.replay(contacts, tribune_numbers=tribune_numbers)
+        self.assertEqual(early.tribune.count, 100)
+        self.assertEqual(early.tribune.date_of("Tribune x2"), "20200101")
+
+        # Contacts before the Centurion day never count for Tribune
+        contacts = [make_contact(n, "20191231", "1200") for n in (1,)] + member_log(100)[1:]
+        contacts.append(make_contact(1, "20200102", "0001"))
+        later = AwardTimeline.replay(contacts, tribune_numbers=tribune_numbers)
+        self.assertEqual(later.tribune.credited[-1]['qso_date'], "20200102")
+
+    def test_official_centurion_date_and_member_date(self):
+        """An official date gates Tribune; the member must have been a Centurion then"""
+        contacts = [make_contact(1, "20200101", "1200"), make_contact(2, "20200101", "1300"),
+                    make_contact(3, "20200301", "1200")]
+        timeline = AwardTimeline.replay(
+            contacts, tribune_numbers={"1", "2", "3"}, centurion_dates={"2": "20210101"},
+            user_centurion_date="20200101",
+        )
+        self.assertTrue(timeline.centurion_date_official)
+        self.assertEqual([c['id'] for c in timeline.tribune.credited], [1, 3])
+
+    def test_senator_after_tribune_x8(self):
+        """Senator counts only once Tribune x8 is reached (same-day QSOs included)"""
+        contacts = [make_contact(n, "20200101", f"{n // 60:02d}{n % 60:02d}") for n in range(1, 451)]
+        contacts.insert(0, make_contact(999, "20191201", "1200"))
+        timeline = AwardTimeline.replay(
+            contacts, tribune_numbers={str(n) for n in range(1, 451)}, senator_numbers={"999"},
+            user_centurion_date="20190101",
+        )
+        self.assertEqual(timeline.tribune_x8_date, "20200101")
+        self.assertEqual(timeline.tribune.level, "Tribune x9")
+        self.assertEqual(timeline.senator.count, 450)  # Member 999 was worked before Tribune x8
+        self.assertNotIn("999", timeline.senator.members)
+
+    def test_rag_chew_rules(self):
+        """Duration comes from time_off, back-to-back contacts are rejected, levels are dated"""
+        track = RagChewTrack()
+        contacts = [
+            make_contact(1, "20200101", "1200", time_off="1500"),
+            make_contact(1, "20200102", "1200", time_off="1300"),  # Back-to-back
+            make_contact(2, "20200103", "2300", time_off="0100"),
+            make_contact(3, "20200104", "1200", time_off="1220"),  # Too short
+        ]
+        for contact in contacts:
+            track.feed(contact)
+        self.assertEqual(track.minutes, 300)
+        self.assertEqual(track.back_to_back_rejected, 1)
+        self.assertEqual(track.level, "Rag Chew")
+        self.assertEqual(track.date_of("Rag Chew"), "20200103")
+
+    def test_out_of_order_rejected(self):
+        """Feeding contacts out of order is an error; in_replay_order sorts only when needed"""
+        contacts = [make_contact(1, "20200102", "1200"), make_contact(2, "20200101", "1200")]
+        timeline = AwardTimeline()
+        timeline.feed(contacts[0])
+        with self.assertRaises(ValueError):
+            timeline.feed(contacts[1])
+
+        ordered = in_replay_order(contacts)
+        self.assertEqual([c['id'] for c in ordered], [2, 1])
+        self.assertIs(in_replay_order(ordered), ordered)
+
+
+class TestRepositoryTimeline(unittest.TestCase):
+    """Test the replay against a temporary logbook"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db = DatabaseRepository(str(Path(self.temp_dir.name) / "contacts.db"))
+        self.addCleanup(self.db.engine.dispose)
+        session = self.db.get_session()
+        for contact in member_log(105):
+            session.add(Contact(callsign=contact['callsign'], qso_date=contact['qso_date'],
+                                time_on=contact['qso_time'], band="40M", mode="CW",
+                                key_type="STRAIGHT", skcc_number=contact['skcc_number']))
+        session.add(Contact(callsign="N0SSB", qso_date="20200101", time_on="0300", band="20M",
+                            mode="SSB", skcc_number="7"))
+        session.commit()
+        session.close()
+
+    def test_replay_cached_and_analyzed(self):
+        """The replay is cached and drives the Centurion analysis"""
+        timeline = self.db.replay_award_timeline()
+        self.assertIs(self.db.replay_award_timeline(), timeline)
+        self.assertEqual(timeline.contacts_replayed, 105)
+
+        progress = self.db.analyze_centurion_award_progress()
+        self.assertEqual(progress['unique_members'], 105)
+        self.assertEqual(progress['milestones'][0].callsign, "K100AA")
+
+
+if __name__ == "__main__":
+    unittest.main()
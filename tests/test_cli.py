@@ -0,0 +1,93 @@
+"""
+Unit Tests for the Headless Command-Line Interface
+
+Runs the commands against a temporary database and checks that the CLI
+never imports Qt.
+"""
+
+import io
+import sys
+import json
+import unittest
+import logging
+import tempfile
+import subprocess
+from pathlib import Path
+from contextlib import redirect_stdout
+
+from src.cli import main
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class TestCommands(unittest.TestCase):
+    """Test commands end to end with --json output"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.dir = Path(self.temp_dir.name)
+        self.db = str(self.dir / "contacts.db")
+        records = "".join(
+            f"<CALL:5>K{n}AA <QSO_DATE:8>2020010{n % 9 + 1} <TIME_ON:4>12{n % 60:02d} <BAND:3>40M "
+            f"<MODE:2>CW <SKCC:4>{n}T <GRIDSQUARE:4>EM{n % 10}9 <EOR>\n"
+            for n in range(100, 220)
+        )
+        (self.dir / "in.adi").write_text("<ADIF_VER:5>3.1.5 <EOH>\n" + records)
+
+    def run_json(self, *argv) -> dict:
+        """Run one command and return its parsed JSON output"""
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            code = main(["--db", self.db, "--json", *argv])
+        result = json.loads(stdout.getvalue())
+        result['exit_code'] = code
+        return result
+
+    def test_import_export_and_awards(self):
+        """Imported contacts are exported, counted and credited"""
+        result = self.run_json("import", str(self.dir / "in.adi"))
+        self.assertEqual((result['exit_code'], result['imported']), (0, 120))
+        self.assertEqual(self.run_json("import", str(self.dir / "in.adi"))['skipped'], 120)
+
+        result = self.run_json("export", str(self.dir / "out.adi"), "--since", "20200109")
+        self.assertEqual(result['exported'], 13)
+        self.assertEqual((self.dir / "out.adi").read_text().count("<EOR>"), 13)
+
+        result = self.run_json("awards")
+        centurion = next(a for a in result['awards'] if a['award'] == 'Centurion')
+        self.assertEqual((centurion['current'], centurion['achieved']), (120, True))
+
+        result = self.run_json("awards", "--report", "Centurion", "--output", str(self.dir / "c.csv"),
+                               "--format", "csv")
+        self.assertEqual(result['contacts'], 120)
+
+    def test_maintenance_commands(self):
+        """Backfill, vacuum and backup report their results"""
+        self.run_json("import", str(self.dir / "in.adi"))
+        self.assertEqual(self.run_json("backfill", "--home-grid", "FM06ew")['updated'], 120)
+        self.assertIn('reclaimed', self.run_json("vacuum"))
+        result = self.run_json("backup", "--destination", str(self.dir / "backups"), "--keep", "2")
+        self.assertTrue(Path(result['backup_file']).exists())
+        result = self.run_json("backup", "--keep", "2")
+        self.assertEqual(Path(result['backup_file']).parent, self.dir / "backups" / "contacts")
+
+    def test_errors_exit_nonzero(self):
+        """Failures are reported as JSON with exit code 1"""
+        result = self.run_json("import", str(self.dir / "missing.adi"))
+        self.assertEqual(result['exit_code'], 1)
+        self.assertIn('error', result)
+
+    def test_does_not_import_qt(self):
+        """Running a command never loads PyQt6"""
+        code = ("import sys; from src.cli import main; "
+                f"main(['--db', {self.db!r}, '--json', 'awards']); "
+                "sys.exit(any(m.startswith('PyQt6') for m in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True)
+        self.assertEqual(result.returncode, 0, result.stderr.decode())
+
+
+if __name__ == "__main__":
+    unittest.main()
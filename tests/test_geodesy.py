@@ -0,0 +1,103 @@
+"""
+Unit Tests for Geodesy Utilities
+
+Tests for Maidenhead conversion, distance/bearing and batch calculations.
+"""
+
+import unittest
+import logging
+
+from src.utils import geodesy
+from src.utils.grid_calc import batch_calculate_distances, calculate_bearing, calculate_distance
+
+logger = logging.getLogger(__name__)
+
+
+class TestGridConversion(unittest.TestCase):
+    """Test Maidenhead locator decoding"""
+
+    def test_four_char_grid_center(self):
+        """FN20 spans 76W-74W, 40N-41N; center is 75W, 40.5N"""
+        lat, lon = geodesy.grid_to_latlon("FN20")
+        self.assertAlmostEqual(lat, 40.5, places=6)
+        self.assertAlmostEqual(lon, -75.0, places=6)
+
+    def test_six_char_grid_center(self):
+        """FN20qd subsquare center"""
+        lat, lon = geodesy.grid_to_latlon("FN20qd")
+        self.assertAlmostEqual(lat, 40.0 + 3.5 / 24.0, places=6)
+        self.assertAlmostEqual(lon, -76.0 + 16.5 * 2.0 / 24.0, places=6)
+
+    def test_case_insensitive(self):
+        """Locator case does not change the result"""
+        self.assertEqual(geodesy.grid_to_latlon("fn20QD"), geodesy.grid_to_latlon("FN20qd"))
+
+    def test_invalid_grids(self):
+        """Malformed locators return None"""
+        for grid in (None, "", "F", "FN2", "ZZ00", "FN2x", "FN20zz", "FN20qd5"):
+            self.assertIsNone(geodesy.grid_to_latlon(grid), grid)
+
+
+class TestDistanceAndBearing(unittest.TestCase):
+    """Test distance and bearing calculations"""
+
+    def test_known_distance(self):
+        """FN20 to IO91 (New Jersey to London) is roughly 5,600 km"""
+        distance = geodesy.grid_distance_km("FN20", "IO91")
+        self.assertAlmostEqual(distance, 5600, delta=150)
+
+    def test_same_grid_is_zero(self):
+        """Distance to the same grid is zero"""
+        self.assertAlmostEqual(geodesy.grid_distance_km("EM29nf", "EM29nf"), 0.0, places=6)
+
+    def test_bearing_east_to_europe(self):
+        """Europe is north-east of the US east coast"""
+        bearing = geodesy.grid_bearing("FN20qd", "JO00aa")
+        self.assertGreater(bearing, 20.0)
+        self.assertLess(bearing, 70.0)
+
+    def test_grid_calc_wrappers(self):
+        """grid_calc delegates to geodesy and returns None for invalid grids"""
+        self.assertAlmostEqual(
+            calculate_distance("FN20qd", "CM87wj"), geodesy.grid_distance_km("FN20qd", "CM87wj")
+        )
+        self.assertIsNone(calculate_distance("FN20qd", "XX"))
+        self.assertIsNotNone(calculate_bearing("FN20qd", "CM87wj"))
+
+
+class TestBatchCalculations(unittest.TestCase):
+    """Test batch distance/bearing over arrays of grids"""
+
+    def setUp(self):
+        """Build a batch with valid, duplicate and invalid grids"""
+        self.grids = ["CM87wj", "IO91", None, "bad", "PM95", "FN20qd", "CM87wj"] * 20
+
+    def test_python_matches_scalar(self):
+        """Python batch path matches the scalar functions"""
+        distances, bearings = geodesy.batch_distance_bearing("FN20qd", self.grids, use_numpy=False)
+        for grid, distance, bearing in zip(self.grids, distances, bearings):
+            self.assertEqual(distance, geodesy.grid_distance_km("FN20qd", grid))
+            self.assertEqual(bearing, geodesy.grid_bearing("FN20qd", grid))
+
+    @unittest.skipUnless(geodesy.HAS_NUMPY, "NumPy not installed")
+    def test_numpy_matches_python(self):
+        """NumPy batch path matches the Python path"""
+        py_dist, py_bear = geodesy.batch_distance_bearing("FN20qd", self.grids, use_numpy=False)
+        np_dist, np_bear = geodesy.batch_distance_bearing("FN20qd", self.grids, use_numpy=True)
+        for a, b in zip(py_dist + py_bear, np_dist + np_bear):
+            if a is None:
+                self.assertIsNone(b)
+            else:
+                self.assertAlmostEqual(a, b, places=6)
+
+    def test_invalid_home_grid(self):
+        """An invalid home grid yields None for every entry"""
+        self.assertEqual(batch_calculate_distances("??", ["FN20"] * 3), [None, None, None])
+
+    def test_empty_batch(self):
+        """Empty input returns empty lists"""
+        self.assertEqual(geodesy.batch_distance_bearing("FN20qd", []), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Unit Tests for the Shared HTTP Client
+
+Runs against a local HTTP/1.1 keep-alive stub server and checks connection
+reuse, redirects and errors, per-host limits, offline mode and cache freshness.
+"""
+
+import tempfile
+import threading
+import time
+import unittest
+import logging
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.utils.http_cache import HTTPDiskCache, freshness_lifetime
+from src.utils.http_client import HTTPClient
+
+logger = logging.getLogger(__name__)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Serves small bodies over kept-alive connections"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.connections.add(self.client_address)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            if self.path == "/moved":
+                self.reply(302, b"", Location="/data")
+            elif self.path == "/nowhere":
+                self.reply(302, b"no location")
+            elif self.path == "/missing":
+                self.reply(404, b"not here")
+            elif self.path == "/cached" and self.headers.get("If-None-Match") == '"v1"':
+                self.reply(304, b"")
+            elif self.path == "/cached":
+                self.reply(200, b"cached body", ETag='"v1"', **{"Cache-Control": "max-age=300"})
+            elif self.path == "/drop":
+                # Closes the connection without announcing it
+                self.reply(200, b"bye")
+                self.close_connection = True
+            else:
+                self.reply(200, f"body of {self.path}".encode("utf-8"))
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def reply(self, status: int, body: bytes, **headers: str) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep test output quiet"""
+
+
+class TestHTTPClient(unittest.TestCase):
+    """Test the client against the stub server"""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.connections = set()
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.delay = 0.0
+        thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.client = HTTPClient()
+        self.addCleanup(self.client.close)
+
+    def test_keep_alive_reuse(self):
+        """Sequential requests share one connection"""
+        for n in range(5):
+            self.assertEqual(self.client.get(f"{self.base_url}/item{n}"), f"body of /item{n}".encode("utf-8"))
+        metrics = self.client.metrics()
+        self.assertEqual((metrics['connections_opened'], metrics['connections_reused']), (1, 4))
+        self.assertEqual(len(self.server.connections), 1)
+        self.assertEqual(metrics['hosts']['127.0.0.1']['requests'], 5)
+        self.assertEqual(metrics['bytes_received'], sum(len(f"body of /item{n}") for n in range(5)))
+
+    def test_redirects_errors_and_stale_connections(self):
+        """Redirects are followed, errors raise HTTPError, dropped connections reconnect"""
+        with self.client.urlopen(f"{self.base_url}/moved") as response:
+            self.assertEqual((response.status, response.read()), (200, b"body of /data"))
+            self.assertTrue(response.geturl().endswith("/data"))
+
+        with self.assertRaises(urllib.error.HTTPError) as raised:
+            self.client.urlopen(f"{self.base_url}/missing")
+        self.assertEqual((raised.exception.code, raised.exception.read()), (404, b"not here"))
+
+        with self.assertRaises(urllib.error.HTTPError) as raised:
+            self.client.urlopen(f"{self.base_url}/nowhere")
+        self.assertEqual((raised.exception.code, raised.exception.read()), (302, b"no location"))
+
+        self.assertEqual(self.client.get(f"{self.base_url}/drop"), b"bye")
+        self.assertEqual(self.client.get(f"{self.base_url}/after"), b"body of /after")
+        self.assertEqual(len(self.server.connections), 2)
+
+    def test_host_limits(self):
+        """Concurrent requests to one host are capped; min_interval spaces them out"""
+        self.server.delay = 0.05
+        client = HTTPClient(host_limits={"127.0.0.1": {"max_connections": 2}})
+        self.addCleanup(client.close)
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            bodies = list(executor.map(client.get, [f"{self.base_url}/p{n}" for n in range(6)]))
+        self.assertEqual(len(bodies), 6)
+        self.assertEqual(self.server.max_in_flight, 2)
+        self.assertLessEqual(client.metrics()['connections_opened'], 2)
+
+        self.server.delay = 0.0
+        spaced = HTTPClient(min_interval=0.05)
+        self.addCleanup(spaced.close)
+        started = time.monotonic()
+        for n in range(3):
+            spaced.get(f"{self.base_url}/s{n}")
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+
+    def test_cache_freshness_and_offline(self):
+        """Server max-age keeps a body fresh; offline mode serves the stored copy"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cache = HTTPDiskCache(Path(temp_dir.name), "test", client=self.client)
+
+        url = f"{self.base_url}/cached"
+        self.assertEqual(cache.fetch(url), "cached body")
+        self.assertEqual(cache.fetch(url), "cached body")
+        self.assertEqual(self.server.requests.count("/cached"), 1)
+        self.assertEqual(cache.fetch(url, max_age=0), "cached body")  # Revalidated with 304
+        self.assertEqual(self.client.metrics()['cache_revalidated'], 1)
+
+        self.client.offline = True
+        self.assertEqual(cache.fetch(url, max_age=0), "cached body")
+        with self.assertRaises(urllib.error.URLError):
+            cache.fetch(f"{self.base_url}/never")
+        with self.assertRaises(urllib.error.URLError):
+            self.client.urlopen(url)
+        self.assertEqual(self.server.requests.count("/cached"), 2)
+
+        headers = Message()
+        headers['Date'] = "Mon, 01 Sep 2025 00:00:00 GMT"
+        headers['Expires'] = "Mon, 01 Sep 2025 01:00:00 GMT"
+        self.assertEqual(freshness_lifetime(headers), 3600)
+        headers['Cache-Control'] = "public, no-cache"
+        self.assertEqual(freshness_lifetime(headers), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Unit Tests for the Background Job Scheduler
+
+Runs jobs on real pool threads against a controllable clock to check
+priority ordering, the concurrency limit, backoff, jitter and idle deferral.
+"""
+
+import random
+import threading
+import time
+import unittest
+import logging
+
+from src.services.job_scheduler import PRIORITY_HIGH, PRIORITY_LOW, JobScheduler, backoff_delay
+
+logger = logging.getLogger(__name__)
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+class TestJobScheduler(unittest.TestCase):
+    """Test dispatching with run_pending() and a fake clock"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = JobScheduler(max_concurrent=1, idle_seconds=30, clock=self.clock, rng=random.Random(7))
+        self.addCleanup(self.scheduler.stop)
+
+    def test_priority_and_concurrency_limit(self):
+        """Only max_concurrent jobs run at once, highest priority first"""
+        release = threading.Event()
+        order = []
+
+        def job(name):
+            def run():
+                order.append(name)
+                release.wait(2)
+            return run
+
+        for name, priority in (("low", PRIORITY_LOW), ("high", PRIORITY_HIGH), ("normal", 50)):
+            self.scheduler.add_job(name, job(name), priority=priority, defer_until_idle=False)
+
+        self.assertEqual(self.scheduler.run_pending(), ["high"])
+        self.assertEqual(self.scheduler.run_pending(), [])
+        release.set()
+        self.assertTrue(wait_for(lambda: self.scheduler.get_job("high") is None))
+        self.assertEqual(self.scheduler.run_pending(), ["normal"])
+        self.assertTrue(wait_for(lambda: self.scheduler.get_job("normal") is None))
+        self.assertEqual(self.scheduler.run_pending(), ["low"])
+        self.assertTrue(wait_for(lambda: order == ["high", "normal", "low"]))
+
+    def test_backoff_then_interval(self):
+        """Failures back off exponentially; success resets to the jittered interval"""
+        attempts = []
+
+        def flaky():
+            attempts.append(self.clock.now)
+            if len(attempts) < 3:
+                raise RuntimeError("offline")
+
+        job = self.scheduler.add_job("flaky", flaky, interval=3600, jitter=0.1, defer_until_idle=False,
+                                     backoff_base=60, backoff_max=600)
+        for expected_delay in (60, 120):
+            self.scheduler.run_pending()
+            self.assertTrue(wait_for(lambda: not job.running and job.runs == len(attempts)))
+            self.assertEqual(job.next_run - self.clock.now, expected_delay)
+            self.assertEqual(job.last_error, "offline")
+            self.clock.now = job.next_run
+
+        self.scheduler.run_pending()
+        self.assertTrue(wait_for(lambda: job.runs == 3 and not job.running))
+        self.assertEqual((job.failures, job.last_error), (0, None))
+        self.assertTrue(3240 <= job.next_run - self.clock.now <= 3960)
+        self.assertEqual([backoff_delay(n, 60, 600) for n in range(1, 6)], [60, 120, 240, 480, 600])
+
+    def test_idle_deferral(self):
+        """Deferred jobs wait for idle_seconds without activity; run_now overrides"""
+        ran = []
+        self.scheduler.add_job("roster", lambda: ran.append("roster"))
+        self.assertEqual(self.scheduler.run_pending(), [])
+
+        self.clock.now += 20
+        self.scheduler.notify_activity()
+        self.clock.now += 20
+        self.assertEqual(self.scheduler.run_pending(), [])
+        self.clock.now += 10
+        self.assertEqual(self.scheduler.run_pending(), ["roster"])
+
+        # One-shot jobs are dropped once they succeed
+        self.assertTrue(wait_for(lambda: self.scheduler.get_job("roster") is None))
+        self.scheduler.add_job("backup", lambda: ran.append("backup"), interval=60)
+        self.scheduler.notify_activity()
+        self.assertEqual(self.scheduler.run_pending(), [])
+        self.assertTrue(self.scheduler.run_now("backup"))
+        self.assertEqual(self.scheduler.run_pending(), ["backup"])
+        self.assertTrue(wait_for(lambda: ran == ["roster", "backup"]))
+
+
+class TestDispatcher(unittest.TestCase):
+    """Test the dispatcher thread with the real clock"""
+
+    def test_periodic_job_and_stop(self):
+        """An interval job repeats until removed; stop() ends the dispatcher"""
+        runs = []
+        scheduler = JobScheduler(max_concurrent=2, idle_seconds=0)
+        scheduler.start()
+        self.addCleanup(scheduler.stop)
+        scheduler.add_job("tick", lambda: runs.append(time.monotonic()), interval=0.02, jitter=0.5)
+        self.assertTrue(wait_for(lambda: len(runs) >= 3))
+        self.assertTrue(scheduler.remove_job("tick"))
+        scheduler.stop()
+        self.assertFalse(scheduler.is_running())
+
+
+if __name__ == "__main__":
+    unittest.main()
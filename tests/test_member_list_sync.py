@@ -0,0 +1,194 @@
+"""
+Unit Tests for the Incremental C/T/S Member List Sync
+
+Runs the Centurion list parser through the shared sync engine against a
+local stub server that supports ETag revalidation.
+"""
+
+import unittest
+import logging
+import tempfile
+import threading
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+from src.database.models import CenturionMember
+from src.database.repository import DatabaseRepository
+from src.services.centurion_fetcher import CenturionFetcher
+from src.services.member_list_sync import MemberListSync
+
+logger = logging.getLogger(__name__)
+
+HEADER = "cnr|call|skccnr|name|city|state|cdate|cendorsements"
+
+LIST_V1 = "\n".join([
+    HEADER,
+    "1|K3Y|1|Key One|Anytown|PA|15 Jan 2010|",
+    "2|W4GNS|14276|Gary|Raleigh|NC|02 Mar 2015|x2",
+    "3|N0ABC|20001|Ann|Omaha|NE|10 Jun 2018|",
+])
+
+LIST_V2 = "\n".join([
+    HEADER,
+    "1|K3Y|1|Key One|Anytown|PA|15 Jan 2010|",
+    "2|W4GNS|14276|Gary|Raleigh|NC|02 Mar 2015|x3",  # Endorsement changed
+    "4|K1NEW|30003|Newt|Boston|MA|01 Jan 2024|",  # Added; N0ABC removed
+])
+
+
+class StubListHandler(BaseHTTPRequestHandler):
+    """Serves server.body with an ETag derived from server.version"""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.headers.get("If-None-Match"))
+        etag = f'"v{server.version}"'
+        if server.send_etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        data = server.body.encode("utf-8")
+        self.send_response(200)
+        if server.send_etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        """Keep test output quiet"""
+
+
+class TestMemberListSync(unittest.TestCase):
+    """Test conditional download, diffing and in-place cache patching"""
+
+    def setUp(self):
+        """Start stub server and create a temporary logbook"""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubListHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.body = LIST_V1
+        self.server.version = 1
+        self.server.send_etag = True
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = DatabaseRepository(str(Path(self.temp_dir.name) / "contacts.db"))
+
+        source = CenturionFetcher.list_sync().source
+        url = f"http://127.0.0.1:{self.server.server_address[1]}/centurionlist.txt"
+        # max_age_hours=0 makes every sync due, so each call revalidates
+        self.sync = MemberListSync(replace(source, url=url, max_age_hours=0))
+        self.session = self.db.get_session()
+
+    def tearDown(self):
+        """Stop stub server and close the database"""
+        self.session.close()
+        self.db.engine.dispose()
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def publish(self, body: str) -> None:
+        """Change the list served by the stub"""
+        self.server.body = body
+        self.server.version += 1
+
+    def stored(self):
+        """Map of SKCC number to (id, callsign, endorsements)"""
+        self.session.expire_all()
+        return {m.skcc_number: (m.id, m.callsign, m.endorsements) for m in self.session.query(CenturionMember)}
+
+    def test_initial_sync_inserts_all(self):
+        """The first sync inserts every member"""
+        changes = self.sync.sync(self.session)
+        self.assertEqual(changes.inserted, {"1", "14276", "20001"})
+        self.assertFalse(changes.updated or changes.deleted)
+        self.assertEqual(self.stored()["14276"][1:], ("W4GNS", "x2"))
+
+    def test_not_modified_skips_parse_and_write(self):
+        """A 304 leaves the table untouched"""
+        self.sync.sync(self.session)
+        before = self.stored()
+        changes = self.sync.sync(self.session)
+        self.assertTrue(changes.not_modified)
+        self.assertFalse(changes.has_changes)
+        self.assertEqual(self.server.requests, [None, '"v1"'])
+        self.assertEqual(self.stored(), before)
+
+    def test_diff_applies_only_changes(self):
+        """Only added, changed and removed members are written; other rows keep their ids"""
+        self.sync.sync(self.session)
+        before = self.stored()
+        self.publish(LIST_V2)
+
+        changes = self.sync.sync(self.session)
+        self.assertEqual(changes.inserted, {"30003"})
+        self.assertEqual(changes.updated, {"14276"})
+        self.assertEqual(changes.deleted, {"20001"})
+        self.assertEqual(changes.unchanged, 1)
+
+        after = self.stored()
+        self.assertEqual(after["1"], before["1"])
+        self.assertEqual(after["14276"][0], before["14276"][0])
+        self.assertEqual(after["14276"][2], "x3")
+        self.assertNotIn("20001", after)
+
+    def test_content_hash_without_validators(self):
+        """An identical body is recognized even when the server sends no ETag"""
+        self.server.send_etag = False
+        self.sync.sync(self.session)
+        changes = self.sync.sync(self.session)
+        self.assertTrue(changes.not_modified)
+
+    def test_callsign_swap(self):
+        """Two members exchanging callsigns does not violate the unique index"""
+        self.sync.sync(self.session)
+        self.publish(LIST_V1.replace("|W4GNS|", "|TEMP|").replace("|N0ABC|", "|W4GNS|").replace("|TEMP|", "|N0ABC|"))
+        changes = self.sync.sync(self.session)
+        self.assertEqual(changes.updated, {"14276", "20001"})
+        self.assertEqual(self.stored()["20001"][1], "W4GNS")
+
+    def test_emptied_table_downloads_unconditionally(self):
+        """Validators are ignored when the stored rows no longer match them"""
+        self.sync.sync(self.session)
+        self.session.query(CenturionMember).delete()
+        self.session.commit()
+        changes = self.sync.sync(self.session)
+        self.assertEqual(len(changes.inserted), 3)
+        self.assertIsNone(self.server.requests[-1])
+
+    def test_repository_cache_patched(self):
+        """Member sets are patched in place instead of reloaded"""
+        self.sync.sync(self.session)
+        self.assertTrue(self.db.check_skcc_member_status("20001")['is_centurion'])
+        self.publish(LIST_V2)
+        changes = self.sync.sync(self.session)
+
+        self.db.apply_member_list_changes(changes)
+        self.assertTrue(self.db._member_sets_loaded)
+        self.assertFalse(self.db.check_skcc_member_status("20001")['is_centurion'])
+        self.assertTrue(self.db.check_skcc_member_status("30003C")['is_centurion'])
+
+    def test_repository_cache_invalidated_by_updates(self):
+        """A sync that only updates rows still invalidates award caches"""
+        self.sync.sync(self.session)
+        self.assertTrue(self.db.check_skcc_member_status("14276")['is_centurion'])
+        self.publish(LIST_V1.replace("2015|x2", "2015|x3"))
+        changes = self.sync.sync(self.session)
+        self.assertEqual((changes.inserted, changes.updated, changes.deleted), (set(), {"14276"}, set()))
+
+        with patch.object(self.db.award_cache, "invalidate_all_award_caches") as invalidate:
+            self.db.apply_member_list_changes(changes)
+        invalidate.assert_called_once_with()
+        self.assertNotIn("14276", self.db._member_cache)
+        self.assertTrue(self.db.check_skcc_member_status("14276")['is_centurion'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Unit Tests for the 24-Hour MUF Forecast Table
+
+Tests table construction, lookups, disk persistence and fetcher integration.
+"""
+
+import unittest
+import logging
+import tempfile
+from datetime import date, datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from src.services.muf_forecast import (
+    HAS_NUMPY, LOCAL_REGION, TARGET_REGIONS, MUFForecastEngine, MUFForecastTable
+)
+from src.services.voacap_muf_fetcher import HF_BANDS, VOACAPMUFFetcher
+
+logger = logging.getLogger(__name__)
+
+TEST_DAY = date(2025, 6, 21)
+
+
+class TestForecastTable(unittest.TestCase):
+    """Test forecast table construction and lookups"""
+
+    def setUp(self):
+        """Set up engine with a temporary cache directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.fetcher = VOACAPMUFFetcher(forecast_cache_dir=Path(self.temp_dir.name))
+        self.engine = MUFForecastEngine(cache_dir=Path(self.temp_dir.name), fetcher=self.fetcher)
+
+    def tearDown(self):
+        """Clean up"""
+        self.fetcher.close()
+        self.temp_dir.cleanup()
+
+    def test_table_shape(self):
+        """Table covers 24 hours x all regions x all bands"""
+        table = self.engine.get_table(150, 2, "FN20qd", TEST_DAY)
+        self.assertEqual(len(table.muf), 24)
+        self.assertEqual(len(table.muf[0]), 1 + len(TARGET_REGIONS))
+        self.assertEqual(len(table.muf[0][0]), len(HF_BANDS))
+        self.assertEqual(len(table.zenith), 24)
+
+    def test_local_region_matches_scalar_model(self):
+        """Local predictions equal direct calls to calculate_empirical_muf"""
+        table = MUFForecastEngine(fetcher=self.fetcher, use_numpy=False).build_table(
+            "FN20qd", 150, 2, TEST_DAY
+        )
+        lat = self.fetcher._grid_to_latitude("FN20qd")
+        lon = self.fetcher._grid_to_longitude("FN20qd")
+        for hour in (0, 6, 12, 18, 23):
+            utc_time = datetime(2025, 6, 21, hour, 30, tzinfo=timezone.utc)
+            for band, (low, high) in HF_BANDS.items():
+                expected = self.fetcher.calculate_empirical_muf(
+                    150, 2, lat, (low + high) / 2.0, longitude=lon, utc_time=utc_time
+                )
+                self.assertEqual(table.get_muf(hour, band), expected, f"{band} at {hour}Z")
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy not installed")
+    def test_numpy_matches_python(self):
+        """Vectorized build matches the scalar build"""
+        for sfi, k_index in ((70, 0), (150, 5), (220, 8)):
+            py_table = MUFForecastEngine(fetcher=self.fetcher, use_numpy=False).build_table(
+                "JO01", sfi, k_index, TEST_DAY
+            )
+            np_table = MUFForecastEngine(fetcher=self.fetcher, use_numpy=True).build_table(
+                "JO01", sfi, k_index, TEST_DAY
+            )
+            for py_hour, np_hour in zip(py_table.muf, np_table.muf):
+                for py_row, np_row in zip(py_hour, np_hour):
+                    for a, b in zip(py_row, np_row):
+                        self.assertAlmostEqual(a, b, delta=0.1)
+
+    def test_unknown_region_rejected(self):
+        """Unknown region names raise ValueError"""
+        table = self.engine.get_table(150, 2, "FN20qd", TEST_DAY)
+        with self.assertRaises(ValueError):
+            table.get_predictions(12, "Atlantis")
+
+    def test_timeline_crosses_midnight(self):
+        """Timeline continues into the next UTC day"""
+        start = datetime(2025, 6, 21, 22, 15, tzinfo=timezone.utc)
+        timeline = self.engine.get_timeline(150, 2, "FN20qd", hours=6, utc_time=start)
+        self.assertEqual(len(timeline), 7)
+        self.assertEqual([slot.hour for slot, _ in timeline], [22, 23, 0, 1, 2, 3, 4])
+        self.assertEqual(timeline[-1][0].date(), date(2025, 6, 22))
+        self.assertIn("20m", timeline[0][1])
+
+
+class TestForecastPersistence(unittest.TestCase):
+    """Test the on-disk forecast cache"""
+
+    def setUp(self):
+        """Set up temporary cache directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+        self.fetcher = VOACAPMUFFetcher(forecast_cache_dir=self.cache_dir)
+
+    def tearDown(self):
+        """Clean up"""
+        self.fetcher.close()
+        self.temp_dir.cleanup()
+
+    def test_table_survives_restart(self):
+        """A new engine loads the table from disk instead of rebuilding it"""
+        first = MUFForecastEngine(cache_dir=self.cache_dir, fetcher=self.fetcher)
+        table = first.get_table(150, 2, "FN20qd", TEST_DAY)
+
+        second = MUFForecastEngine(cache_dir=self.cache_dir, fetcher=self.fetcher)
+        with patch.object(second, 'build_table') as build:
+            loaded = second.get_table(150, 2, "FN20qd", TEST_DAY)
+            build.assert_not_called()
+        self.assertEqual(loaded.muf, table.muf)
+        self.assertEqual(loaded.home_grid, "FN20qd")
+
+    def test_load_latest(self):
+        """load_latest finds the table for a grid without knowing SFI/K"""
+        engine = MUFForecastEngine(cache_dir=self.cache_dir, fetcher=self.fetcher)
+        engine.get_table(120, 4, "EM29nf", TEST_DAY)
+        latest = engine.load_latest("EM29nf", TEST_DAY)
+        self.assertIsNotNone(latest)
+        self.assertEqual((latest.sfi, latest.k_index), (120, 4))
+        self.assertIsNone(engine.load_latest("FN20qd", TEST_DAY))
+
+    def test_corrupt_file_rebuilt(self):
+        """An unreadable cache file is ignored and replaced"""
+        engine = MUFForecastEngine(cache_dir=self.cache_dir, fetcher=self.fetcher)
+        path = engine._table_path("FN20qd", 150, 2, TEST_DAY)
+        path.write_text("{not json")
+        table = engine.get_table(150, 2, "FN20qd", TEST_DAY)
+        self.assertIsInstance(table, MUFForecastTable)
+        self.assertIsNotNone(MUFForecastEngine(cache_dir=self.cache_dir).load_latest("FN20qd", TEST_DAY))
+
+    def test_old_tables_pruned(self):
+        """Tables outside the retention window are removed on save"""
+        engine = MUFForecastEngine(cache_dir=self.cache_dir, fetcher=self.fetcher)
+        engine.get_table(150, 2, "FN20qd", date(2025, 6, 1))
+        engine.get_table(150, 2, "FN20qd", TEST_DAY)
+        self.assertEqual([p.name for p in self.cache_dir.glob("*.json")], ["FN20QD_150_2_2025-06-21.json"])
+
+
+class TestFetcherIntegration(unittest.TestCase):
+    """Test that the fetcher serves empirical predictions from the table"""
+
+    def setUp(self):
+        """Set up fetcher with GIRO unavailable"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.fetcher = VOACAPMUFFetcher(forecast_cache_dir=Path(self.temp_dir.name))
+        patcher = patch.object(self.fetcher, 'get_giro_muf', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up"""
+        self.fetcher.close()
+        self.temp_dir.cleanup()
+
+    def test_predictions_follow_the_hour(self):
+        """Predictions at different hours come from the table, not a stale cache"""
+        noon = datetime(2025, 6, 21, 16, 0, tzinfo=timezone.utc)
+        night = datetime(2025, 6, 21, 5, 0, tzinfo=timezone.utc)
+        table = self.fetcher.get_forecast_engine().get_table(150, 2, "FN20qd", TEST_DAY)
+
+        day_preds = self.fetcher.get_band_muf_predictions(150, 2, "FN20qd", utc_time=noon)
+        night_preds = self.fetcher.get_band_muf_predictions(150, 2, "FN20qd", utc_time=night)
+        self.assertEqual(day_preds["20m"].muf_value, table.get_muf(16, "20m", LOCAL_REGION))
+        self.assertEqual(night_preds["20m"].muf_value, table.get_muf(5, "20m", LOCAL_REGION))
+
+    def test_best_band_uses_table(self):
+        """get_best_band_now still returns a recommendation"""
+        predictions = self.fetcher.get_band_muf_predictions(180, 1, "FN20qd")
+        result = self.fetcher.get_best_band_now(predictions, "FN20qd", 180, 1)
+        self.assertIn(result['time_period'], ("Daytime", "Terminator (Best!)", "Nighttime"))
+        self.assertIsNotNone(result['zenith_angle'])
+
+
+if __name__ == "__main__":
+    unittest.main()
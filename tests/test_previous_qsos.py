@@ -0,0 +1,126 @@
+"""
+Unit Tests for the Previous QSO Lookup
+
+Checks projected rows, the per-callsign cache and its invalidation, prefix
+matches from the callsign index, and that the widget answers asynchronously.
+"""
+
+import os
+import unittest
+import logging
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+
+from src.database.models import Contact
+from src.database.previous_qsos import PreviousQSO, PreviousQSOLookup
+from src.database.repository import DatabaseRepository
+from src.ui.previous_qsos_widget import PreviousQSOsWidget
+
+logger = logging.getLogger(__name__)
+
+
+class LogbookTestCase(unittest.TestCase):
+    """Temporary logbook with a few contacts"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db = DatabaseRepository(str(Path(self.temp_dir.name) / "contacts.db"))
+        self.addCleanup(self.db.engine.dispose)
+        session = self.db.get_session()
+        for callsign, date in (("W4GNS", "20240101"), ("W4GNS", "20250301"), ("W4GXX", "20250101"),
+                               ("K3Y", "20250102")):
+            session.add(Contact(callsign=callsign, qso_date=date, time_on="1200", band="40M", mode="CW"))
+        session.commit()
+        session.close()
+
+    def add_contact(self, callsign: str) -> None:
+        """Log a contact through the repository (emits the change signal)"""
+        self.db.add_contact(Contact(callsign=callsign, qso_date="20250401", time_on="1300",
+                                    band="20M", mode="CW"))
+
+
+class TestPreviousQSOLookup(LogbookTestCase):
+    """Test the lookup without Qt"""
+
+    def setUp(self):
+        super().setUp()
+        self.lookup = PreviousQSOLookup(self.db.db_path)
+        self.addCleanup(self.lookup.close)
+
+    def test_projected_rows_cached(self):
+        """Rows are projections, most recent first, and a repeat is served from the cache"""
+        rows = self.lookup.lookup("W4GNS")
+        self.assertIsInstance(rows[0], PreviousQSO)
+        self.assertEqual([r.qso_date for r in rows], ["20250301", "20240101"])
+        self.assertIs(self.lookup.cached("W4GNS"), rows)
+        self.assertIs(self.lookup.lookup("W4GNS"), rows)
+        self.assertEqual(self.lookup.stats['queries'], 1)
+
+        self.lookup.invalidate()
+        self.assertIsNone(self.lookup.cached("W4GNS"))
+
+    def test_prefix_matches(self):
+        """Prefixes are answered from the index; an added callsign is merged in"""
+        self.assertEqual(self.lookup.matches("W4G"), [])  # Index not loaded yet
+        self.assertEqual(self.lookup.load_index(), 3)
+        self.assertEqual(self.lookup.matches("W4G"), ["W4GNS", "W4GXX"])
+        self.assertEqual(self.lookup.matches("W4G", limit=1), ["W4GNS"])
+        self.assertEqual(self.lookup.matches("N1"), [])
+
+        self.lookup.invalidate("w4gaa")
+        self.assertEqual(self.lookup.matches("W4G"), ["W4GAA", "W4GNS", "W4GXX"])
+        self.lookup.invalidate()
+        self.assertFalse(self.lookup.index_loaded())
+
+
+class TestPreviousQSOsWidget(LogbookTestCase):
+    """Test the widget's background lookups"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        super().setUp()
+        self.widget = PreviousQSOsWidget(self.db)
+        self.addCleanup(self.widget.deleteLater)
+        self.addCleanup(self.widget.close)
+
+    def wait_until(self, condition, timeout_ms: int = 5000) -> None:
+        """Process events until condition() holds"""
+        waited = 0
+        while not condition() and waited < timeout_ms:
+            QTest.qWait(10)
+            waited += 10
+
+    def test_latest_request_wins(self):
+        """Only the last requested callsign is shown; a change refreshes it"""
+        self.widget.update_callsign("k3y")
+        self.widget.update_callsign("w4gns")
+        self.wait_until(lambda: self.widget.qsos_table.rowCount() == 2)
+        self.assertEqual(self.widget.qsos_table.item(0, 0).text(), "2025-03-01")
+        QTest.qWait(50)  # A late K3Y result must not replace it
+        self.assertEqual(self.widget.qsos_table.rowCount(), 2)
+
+        self.add_contact("W4GNS")
+        self.wait_until(lambda: self.widget.qsos_table.rowCount() == 3)
+        self.assertEqual(self.widget.qsos_table.rowCount(), 3)
+
+    def test_prefix_matches_while_typing(self):
+        """Partial input lists worked callsigns without a database query"""
+        self.wait_until(self.widget.lookup.index_loaded)
+        self.widget.show_matches("w4g")
+        self.assertEqual(self.widget.no_qsos_label.text(), "Worked before: W4GNS, W4GXX")
+        self.widget.show_matches("N1")
+        self.assertEqual(self.widget.no_qsos_label.text(), "No previous QSOs starting with N1")
+        self.assertEqual(self.widget.lookup.stats['queries'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
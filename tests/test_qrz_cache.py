@@ -0,0 +1,188 @@
+"""
+Unit Tests for the Persistent QRZ Callsign Cache
+
+Tests TTL and negative caching, persistence, and lookup coalescing in QRZService.
+"""
+
+import unittest
+import logging
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from src.qrz.callsign_cache import CallsignCache
+from src.qrz.qrz_api import QRZAPIClient, CallsignInfo
+from src.qrz.qrz_service import QRZService
+
+logger = logging.getLogger(__name__)
+
+FOUND_XML = """<?xml version="1.0"?>
+<QRZDatabase version="1.34" xmlns="http://xmldata.qrz.com">
+  <Callsign><call>{call}</call><fname>Gary</fname><grid>EM85</grid><dxcc>291</dxcc></Callsign>
+  <Session><Key>abc</Key></Session>
+</QRZDatabase>"""
+
+NOT_FOUND_XML = """<?xml version="1.0"?>
+<QRZDatabase version="1.34" xmlns="http://xmldata.qrz.com">
+  <Session><Error>Not found: {call}</Error><Key>abc</Key></Session>
+</QRZDatabase>"""
+
+
+class FakeResponse:
+    """Minimal urlopen response"""
+
+    def __init__(self, body: str):
+        self.body = body.encode("utf-8")
+
+    def read(self):
+        return self.body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class FakeQRZ:
+    """Stands in for urlopen_with_retries and counts requests per callsign"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def __call__(self, url, **kwargs):
+        call = url.split("callsign=")[1].split("&")[0]
+        with self.lock:
+            self.requests.append(call)
+        time.sleep(self.delay)
+        template = NOT_FOUND_XML if call.startswith("NOCALL") else FOUND_XML
+        return FakeResponse(template.format(call=call))
+
+
+class TestCallsignCache(unittest.TestCase):
+    """Test the SQLite callsign cache"""
+
+    def setUp(self):
+        """Set up temporary database"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "qrz_cache.db"
+
+    def tearDown(self):
+        """Clean up"""
+        self.temp_dir.cleanup()
+
+    def test_round_trip_and_persistence(self):
+        """Cached info survives reopening the database"""
+        cache = CallsignCache(self.db_path)
+        cache.put("w4gns", CallsignInfo(callsign="W4GNS", fname="Gary", dxcc=291, lotw_member=True))
+        cache.close()
+
+        reopened = CallsignCache(self.db_path)
+        hit, info = reopened.get("W4GNS")
+        self.assertTrue(hit)
+        self.assertEqual(info.fname, "Gary")
+        self.assertEqual(info.dxcc, 291)
+        self.assertTrue(info.lotw_member)
+        reopened.close()
+
+    def test_negative_entries(self):
+        """Not-found results are hits with no info until their own TTL expires"""
+        cache = CallsignCache(self.db_path, ttl_seconds=3600, negative_ttl_seconds=0.05)
+        cache.put("NOCALL1", None)
+        self.assertEqual(cache.get("NOCALL1"), (True, None))
+        time.sleep(0.1)
+        self.assertEqual(cache.get("NOCALL1"), (False, None))
+        self.assertEqual(cache.purge_expired(), 1)
+        cache.close()
+
+    def test_expired_positive_entry_is_miss(self):
+        """Entries older than the TTL are not served"""
+        cache = CallsignCache(ttl_seconds=0.05)
+        cache.put("K1ABC", CallsignInfo(callsign="K1ABC"))
+        self.assertTrue(cache.contains("K1ABC"))
+        time.sleep(0.1)
+        self.assertFalse(cache.contains("K1ABC"))
+
+    def test_fresh_callsigns_batch(self):
+        """fresh_callsigns reports cached calls in one query"""
+        cache = CallsignCache()
+        cache.put("K1ABC", CallsignInfo(callsign="K1ABC"))
+        cache.put("NOCALL2", None)
+        self.assertEqual(cache.fresh_callsigns(["k1abc", "W1AW", "NOCALL2", ""]), {"K1ABC", "NOCALL2"})
+        self.assertEqual(cache.stats(), {'found': 1, 'not_found': 1})
+
+
+class TestQRZClientCaching(unittest.TestCase):
+    """Test that the API client uses the cache for hits and misses"""
+
+    def test_found_and_not_found_cached(self):
+        """Repeated lookups do not hit QRZ again"""
+        fake = FakeQRZ()
+        client = QRZAPIClient("user", "pass")
+        with patch("src.utils.network.urlopen_with_retries", fake):
+            self.assertEqual(client.lookup_callsign("W4GNS").fname, "Gary")
+            self.assertEqual(client.lookup_callsign("w4gns").fname, "Gary")
+            self.assertIsNone(client.lookup_callsign("NOCALL3"))
+            self.assertIsNone(client.lookup_callsign("NOCALL3"))
+        self.assertEqual(fake.requests, ["W4GNS", "NOCALL3"])
+        self.assertEqual(client.get_session_info()['cached_callsigns'], 2)
+
+
+class TestQRZServiceCoalescing(unittest.TestCase):
+    """Test in-flight lookup sharing and prefetch"""
+
+    def setUp(self):
+        """Set up an authenticated service with an in-memory cache"""
+        self.service = QRZService()
+        self.service.callsign_cache = CallsignCache()
+        self.service.api_client = QRZAPIClient("user", "pass", cache=self.service.callsign_cache)
+        self.service.authenticated = True
+        self.fake = FakeQRZ(delay=0.2)
+        patcher = patch("src.utils.network.urlopen_with_retries", self.fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.service.shutdown)
+
+    def test_concurrent_lookups_share_one_request(self):
+        """Focus-out and stable-timer lookups for one call issue a single query"""
+        results = []
+        done = threading.Event()
+
+        def callback(info):
+            results.append(info)
+            if len(results) == 2:
+                done.set()
+
+        self.service.lookup_callsign_async("W4GNS", callback)
+        self.service.lookup_callsign_async("w4gns", callback)
+        self.assertTrue(done.wait(5))
+        self.assertEqual(self.fake.requests, ["W4GNS"])
+        self.assertEqual([info.callsign for info in results], ["W4GNS", "W4GNS"])
+
+    def test_cached_lookup_is_immediate(self):
+        """A cached callsign is delivered synchronously"""
+        self.service.callsign_cache.put("K1ABC", CallsignInfo(callsign="K1ABC"))
+        results = []
+        self.service.lookup_callsign_async("K1ABC", results.append)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(self.fake.requests, [])
+
+    def test_prefetch_skips_cached_and_bounds_queue(self):
+        """Prefetch only queues uncached callsigns, up to the pending limit"""
+        self.service.callsign_cache.put("K1ABC", CallsignInfo(callsign="K1ABC"))
+        with patch.object(self.service, 'is_enabled', return_value=True):
+            queued = self.service.prefetch_callsigns(["K1ABC", "W1AW", "w1aw", "N0XYZ", "AA1A"], max_pending=2)
+        self.assertEqual(queued, 2)
+
+        for future in list(self.service._inflight.values()):
+            future.result(timeout=5)
+        self.assertTrue(self.service.callsign_cache.contains("W1AW"))
+        self.assertNotIn("K1ABC", self.fake.requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
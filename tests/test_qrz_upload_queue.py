@@ -0,0 +1,216 @@
+"""
+Unit Tests for the Durable QRZ Logbook Upload Queue
+
+Runs against a local keep-alive stub of the QRZ logbook API.
+"""
+
+import unittest
+import logging
+import sqlite3
+import tempfile
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from src.database.models import Base
+from src.qrz.upload_queue import QRZUploadQueue, adif_from_contact
+
+logger = logging.getLogger(__name__)
+
+
+class StubLogbookHandler(BaseHTTPRequestHandler):
+    """Answers INSERT requests according to the callsign in the ADIF record"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length", 0))
+        fields = urllib.parse.parse_qs(self.rfile.read(length).decode("utf-8"))
+        adif = fields.get("ADIF", [""])[0]
+        with server.lock:
+            server.requests.append(adif)
+            server.clients.add(self.client_address)
+
+        status = 200
+        if server.unavailable:
+            status, body = 503, "busy"
+        elif "BADCALL" in adif:
+            body = "RESULT=FAIL&REASON=invalid qso_date&COUNT=0"
+        elif "DUPCALL" in adif:
+            body = "RESULT=FAIL&REASON=Unable to add QSO to database: duplicate&COUNT=0"
+        else:
+            body = "RESULT=OK&LOGID=1&COUNT=1"
+
+        data = body.encode("utf-8")
+        self.send_response(status)
+        if status == 503:
+            self.send_header("Retry-After", "120")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        """Keep test output quiet"""
+
+
+class UploadQueueTestCase(unittest.TestCase):
+    """Base class with a stub logbook API and a temporary logbook database"""
+
+    def setUp(self):
+        """Start stub server and create the contacts table"""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubLogbookHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.clients = set()
+        self.server.unavailable = False
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+        self.api_url = f"http://127.0.0.1:{self.server.server_address[1]}/api"
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.temp_dir.name) / "contacts.db")
+        engine = create_engine(f"sqlite:///{self.db_path}")
+        Base.metadata.create_all(engine)
+        engine.dispose()
+
+    def tearDown(self):
+        """Stop stub server"""
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def make_queue(self, **kwargs) -> QRZUploadQueue:
+        """Create a queue against the stub API"""
+        kwargs.setdefault("min_interval", 0)
+        queue = QRZUploadQueue(self.db_path, api_key="TEST-KEY", api_url=self.api_url, **kwargs)
+        self.addCleanup(queue.close)
+        return queue
+
+    def add_contacts(self, callsigns, uploaded=False):
+        """Insert contacts directly into the logbook"""
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.executemany(
+                "INSERT INTO contacts (callsign, qso_date, time_on, band, mode, frequency, qrz_uploaded) "
+                "VALUES (?, '20250101', '1200', '20M', 'CW', 14.055, ?)",
+                [(call, 1 if uploaded else 0) for call in callsigns]
+            )
+        conn.close()
+
+    def uploaded_flags(self):
+        """Map of callsign to qrz_uploaded"""
+        conn = sqlite3.connect(self.db_path)
+        rows = dict(conn.execute("SELECT callsign, qrz_uploaded FROM contacts").fetchall())
+        conn.close()
+        return rows
+
+
+class TestUploadQueue(UploadQueueTestCase):
+    """Test queueing, batching and retry behavior"""
+
+    def test_adif_from_contact(self):
+        """Stored ADIF fields are converted to the logbook format"""
+        adif = adif_from_contact("w4gns", "20250101", "1234", 14055.0, "CW", None, "579", 5.0, "BUG")
+        self.assertIn("<CALL:5>W4GNS", adif)
+        self.assertIn("<TIME_ON:6>123400", adif)
+        self.assertIn("<FREQ:6>14.055", adif)
+        self.assertIn("<RST_SENT:2>59", adif)
+        self.assertIn("<COMMENT:13>Key Type: BUG", adif)
+        self.assertIsNone(adif_from_contact("W4GNS", None, "1234", 14.055, "CW", "599", "599"))
+
+    def test_bulk_import_uploaded_over_one_connection(self):
+        """Pending contacts are queued once and sent over a single kept-alive connection"""
+        self.add_contacts([f"K{i}ABC" for i in range(30)])
+        self.add_contacts(["W1AW"], uploaded=True)
+        queue = self.make_queue(batch_size=100)
+
+        self.assertEqual(queue.enqueue_contacts(), 30)
+        self.assertEqual(queue.enqueue_contacts(), 0)
+        self.assertEqual(queue.depth(), 30)
+
+        self.assertEqual(queue.process_due(), 30)
+        self.assertEqual(queue.depth(), 0)
+        self.assertEqual(len(self.server.requests), 30)
+        self.assertEqual(len(self.server.clients), 1)
+        self.assertTrue(all(self.uploaded_flags().values()))
+        stats = queue.stats()
+        self.assertEqual(stats['uploaded'], 30)
+        self.assertGreater(stats['per_minute'], 0)
+
+    def test_rejected_record_backs_off_then_fails(self):
+        """A rejected record is retried later and finally marked failed"""
+        queue = self.make_queue(max_attempts=2)
+        results = []
+        queue.enqueue(adif_from_contact("BADCALL", "20250101", "1200", 14.055, "CW", "599", "599"),
+                      callback=results.append)
+
+        self.assertEqual(queue.process_due(), 1)
+        self.assertEqual(queue.process_due(), 0)  # Backing off
+        self.assertEqual(queue.stats()['retrying'], 1)
+
+        queue._db.execute("UPDATE qrz_upload_queue SET next_attempt_at = 0")
+        self.assertEqual(queue.process_due(), 1)
+        self.assertEqual(results, [False])
+        self.assertEqual(queue.depth(), 0)
+        self.assertEqual(queue.stats()['failed'], 1)
+        self.assertEqual(queue.retry_failed(), 1)
+        self.assertEqual(queue.depth(), 1)
+
+    def test_duplicate_counts_as_uploaded(self):
+        """A record QRZ already has is marked uploaded"""
+        self.add_contacts(["DUPCALL"])
+        queue = self.make_queue()
+        queue.enqueue_contacts()
+        queue.process_due()
+        self.assertEqual(self.uploaded_flags(), {"DUPCALL": 1})
+
+    def test_unavailable_pauses_queue(self):
+        """503 pauses the whole queue without consuming record attempts"""
+        self.add_contacts(["K1ABC", "K2ABC"])
+        queue = self.make_queue()
+        queue.enqueue_contacts()
+        self.server.unavailable = True
+
+        self.assertEqual(queue.process_due(), 0)
+        self.assertEqual(len(self.server.requests), 1)
+        stats = queue.stats()
+        self.assertGreaterEqual(stats['paused_for'], 110)
+        self.assertEqual((stats['pending'], stats['retrying']), (2, 0))
+
+        self.assertEqual(queue.process_due(), 0)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_queue_survives_restart(self):
+        """Queued records are still pending after reopening the database"""
+        self.add_contacts(["K1ABC"])
+        self.make_queue().enqueue_contacts()
+        self.assertEqual(self.make_queue().depth(), 1)
+
+    def test_worker_drains_queue(self):
+        """The worker thread uploads queued records and runs callbacks"""
+        queue = self.make_queue()
+        done = threading.Event()
+        results = []
+
+        def callback(ok):
+            results.append(ok)
+            if len(results) == 3:
+                done.set()
+
+        for call in ("K1ABC", "K2ABC", "K3ABC"):
+            queue.enqueue(adif_from_contact(call, "20250101", "1200", 14.055, "CW", "599", "599"),
+                          callback=callback)
+        queue.start()
+        self.assertTrue(done.wait(5))
+        self.assertEqual(results, [True, True, True])
+        queue.stop()
+        self.assertFalse(queue.is_running())
+
+
+if __name__ == "__main__":
+    unittest.main()
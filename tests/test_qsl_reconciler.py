@@ -0,0 +1,123 @@
+"""
+Unit Tests for QSL Confirmation Reconciliation
+
+Applies LoTW/eQSL style reports to a temporary log and checks the fuzzy
+matching rules, the written flags and QSLRecords, and the unmatched report.
+"""
+
+import io
+import unittest
+import logging
+import tempfile
+from pathlib import Path
+
+from src.adif.parser import iter_adi_records
+from src.adif.qsl_reconciler import LogIndex, QSLReconciler, mode_group
+from src.database.models import Contact, QSLRecord
+from src.database.repository import DatabaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+def adi_record(**fields) -> str:
+    return "".join(f"<{name.lower()}:{len(value)}>{value}\n" for name, value in fields.items()) + "<eor>\n"
+
+
+def lotw_report(*records: str) -> io.StringIO:
+    return io.StringIO("ARRL Logbook of the World Status Report\n<PROGRAMID:4>LoTW\n<eoh>\n" + "".join(records))
+
+
+class TestMatching(unittest.TestCase):
+    """Test the in-memory index"""
+
+    def setUp(self):
+        self.index = LogIndex()
+        self.index.add(1, "K1ABC", "40M", "CW", None, "20250301", "2355")
+        self.index.add(2, "K1ABC", "40M", "CW", None, "20250301", "2330")
+        self.index.add(3, "W1AW", None, "USB", "14.250", "20250301", "1200")
+
+    def test_time_window_and_midnight(self):
+        """The closest QSO within the window wins, across midnight too"""
+        self.assertEqual(self.index.match("k1abc", "40m", "CW", None, "20250301", "235000"), 1)
+        self.assertEqual(self.index.match("K1ABC", "40M", "CW", None, "20250301", "2325"), 2)
+        self.assertEqual(self.index.match("K1ABC", "40M", "CW", None, "20250302", "0010"), 1)
+        self.assertIsNone(self.index.match("K1ABC", "40M", "CW", None, "20250302", "0030", time_window=10))
+        self.assertIsNone(self.index.match("K1ABC", "20M", "CW", None, "20250301", "2355"))
+
+    def test_band_from_frequency_and_mode_group(self):
+        """A frequency stands in for the band; submodes match their group"""
+        self.assertEqual(self.index.match("W1AW", "20M", "SSB", None, "20250301", "1210"), 3)
+        self.assertIsNone(self.index.match("W1AW", "20M", "FT8", None, "20250301", "1200"))
+        self.assertEqual([mode_group(m) for m in ("cw", "LSB", "FT8", "SSTV", "")],
+                         ["CW", "PHONE", "DATA", "IMAGE", ""])
+
+    def test_streamed_records(self):
+        """Lowercase tags and the header are handled in small chunks"""
+        report = lotw_report(adi_record(CALL="K1ABC", BAND="40m"), adi_record(CALL="W1AW"))
+        self.assertEqual(list(iter_adi_records(report, chunk_size=5)),
+                         [{'CALL': "K1ABC\n", 'BAND': "40m\n"}, {'CALL': "W1AW\n"}])
+
+
+class TestReconciler(unittest.TestCase):
+    """Test applying reports to a temporary log"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db = DatabaseRepository(str(Path(self.temp_dir.name) / "contacts.db"))
+        self.addCleanup(self.db.engine.dispose)
+        session = self.db.get_session()
+        for n in range(50):
+            session.add(Contact(callsign=f"K{n}AA", qso_date="20250301", time_on=f"12{n:02d}",
+                                band="40M", mode="CW"))
+        session.commit()
+        session.close()
+
+    def flagged(self, column: str) -> int:
+        session = self.db.get_session()
+        try:
+            return session.query(Contact).filter(getattr(Contact, column) == 'Y').count()
+        finally:
+            session.close()
+
+    def test_lotw_report(self):
+        """Matches are flagged and recorded once; unmatched ones are returned"""
+        records = [
+            adi_record(CALL=f"K{n}AA", BAND="40m", MODE="CW", QSO_DATE="20250301",
+                       TIME_ON=f"12{n + 3:02d}00", QSL_RCVD="Y", QSLRDATE="20250310")
+            for n in range(40)
+        ]
+        records.append(adi_record(CALL="N0PE", BAND="40M", MODE="CW", QSO_DATE="20250301",
+                                  TIME_ON="1200", QSL_RCVD="Y"))
+        records.append(adi_record(CALL="K45AA", BAND="40M", MODE="CW", QSO_DATE="20250301",
+                                  TIME_ON="1245", QSL_RCVD="N"))
+
+        result = QSLReconciler(self.db).reconcile(lotw_report(*records), 'lotw')
+        self.assertEqual((result['confirmations'], result['matched'], result['not_confirmed']), (41, 40, 1))
+        self.assertEqual((result['flagged'], result['recorded']), (40, 40))
+        self.assertEqual([r['CALL'] for r in result['unmatched']], ["N0PE"])
+        self.assertEqual(self.flagged('lotw_qsl_rcvd'), 40)
+
+        session = self.db.get_session()
+        try:
+            record = session.query(QSLRecord).first()
+            self.assertEqual((record.confirmation_type, record.confirmed_date, record.confirmation_source),
+                             ("LOTW", "20250310", "LoTW"))
+        finally:
+            session.close()
+
+        again = QSLReconciler(self.db).reconcile(lotw_report(*records), 'lotw')
+        self.assertEqual((again['matched'], again['recorded']), (40, 0))
+
+    def test_eqsl_dry_run(self):
+        """A dry run matches without writing"""
+        report = lotw_report(adi_record(CALL="K1AA", BAND="40M", MODE="CW", QSO_DATE="20250301", TIME_ON="1201"))
+        result = QSLReconciler(self.db).reconcile(report, 'eqsl', dry_run=True)
+        self.assertEqual((result['matched'], result['flagged']), (1, 0))
+        self.assertEqual(self.flagged('eqsl_qsl_rcvd'), 0)
+        with self.assertRaises(ValueError):
+            QSLReconciler(self.db).reconcile(io.StringIO(""), 'clublog')
+
+
+if __name__ == "__main__":
+    unittest.main()
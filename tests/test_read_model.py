@@ -0,0 +1,80 @@
+"""
+Unit Tests for the Contact Read Model
+
+Checks that projected records behave like the award dicts and like contact
+objects, and that the repository serves filtered, ordered projections.
+"""
+
+import unittest
+import logging
+import tempfile
+from pathlib import Path
+
+from src.adif.exporter import ADIFExporter
+from src.awards.centurion import CenturionAward
+from src.database.models import Contact
+from src.database.read_model import ALL_COLUMNS, make_record, record_type
+from src.database.repository import DatabaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TestContactRecord(unittest.TestCase):
+    """Test record semantics"""
+
+    def test_mapping_and_attributes(self):
+        """Records read like dicts (NULL reads as the default) and like contacts"""
+        record = make_record(('callsign', 'time_on', 'key_type'), ("W4GNS", "1200", None))
+
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual(record['callsign'], "W4GNS")
+        self.assertEqual(record.get('qso_time'), "1200")  # Alias of time_on
+        self.assertEqual(record.get('key_type', ''), '')
+        self.assertEqual(record.get('state', 'none'), 'none')  # Not projected
+        self.assertIsNone(record.state)
+        self.assertNotIn('state', record)
+        self.assertEqual(dict(record), {'callsign': "W4GNS", 'time_on': "1200", 'key_type': None})
+        with self.assertRaises(KeyError):
+            record['state']
+        with self.assertRaises(AttributeError):
+            record.not_a_column
+
+    def test_record_types(self):
+        """One class per projection; unknown columns are rejected"""
+        self.assertIs(record_type(('callsign', 'band')), record_type(['callsign', 'band']))
+        with self.assertRaises(ValueError):
+            record_type(('callsign', 'bogus'))
+
+
+class TestRepositoryRecords(unittest.TestCase):
+    """Test projected queries against a temporary logbook"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db = DatabaseRepository(str(Path(self.temp_dir.name) / "contacts.db"))
+        self.addCleanup(self.db.engine.dispose)
+        session = self.db.get_session()
+        for callsign, date, mode in (("K3Y", "20250102", "CW"), ("W4GNS", "20250101", "CW"),
+                                     ("N0SSB", "20250103", "SSB")):
+            session.add(Contact(callsign=callsign, qso_date=date, time_on="1200", band="40M",
+                                mode=mode, skcc_number="1234T"))
+        session.commit()
+        session.close()
+
+    def test_filtered_ordered_projection(self):
+        """Criteria and ordering are applied in SQL; award classes accept records"""
+        records = self.db.get_contact_records(Contact.mode == "CW", order_by=(Contact.qso_date,))
+        self.assertEqual([r.callsign for r in records], ["W4GNS", "K3Y"])
+        self.assertTrue(CenturionAward(None).validate(records[0]))  # Blank key type counts
+
+    def test_export_from_records(self):
+        """The ADIF exporter writes records with every column"""
+        records = self.db.get_contact_records(Contact.callsign == "W4GNS", columns=ALL_COLUMNS)
+        adif = ADIFExporter()._build_record(records[0])
+        self.assertIn("<CALL:5>W4GNS", adif)
+        self.assertIn("<SKCC:5>1234T", adif)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Unit Tests for the Visibility-Aware Refresh Scheduler
+
+Registers stand-in panels in a tab widget and checks which of them refresh
+when contact changes arrive.
+"""
+
+import os
+import unittest
+import logging
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication, QTabWidget, QWidget
+
+from src.ui.refresh_scheduler import RefreshScheduler
+from src.ui.signals import get_app_signals
+
+logger = logging.getLogger(__name__)
+
+
+class CountingPanel(QWidget):
+    """Panel that counts its refreshes"""
+
+    def __init__(self):
+        super().__init__()
+        self.refreshes = 0
+
+    def refresh(self):
+        self.refreshes += 1
+
+
+class TestRefreshScheduler(unittest.TestCase):
+    """Test dirty marking, coalescing and visibility"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.scheduler = RefreshScheduler(coalesce_ms=20)
+        self.addCleanup(self.scheduler.deleteLater)
+        self.tabs = QTabWidget()
+        self.addCleanup(self.tabs.deleteLater)
+        self.visible, self.hidden = CountingPanel(), CountingPanel()
+        self.tabs.addTab(self.visible, "Visible")
+        self.tabs.addTab(self.hidden, "Hidden")
+        self.scheduler.register(self.visible)
+        self.scheduler.register(self.hidden)
+        self.tabs.show()
+        QTest.qWait(50)
+
+    def test_first_show_loads_visible_panel_only(self):
+        """Registered panels load when first shown, not before"""
+        self.assertEqual((self.visible.refreshes, self.hidden.refreshes), (1, 0))
+        self.assertTrue(self.scheduler.is_dirty(self.hidden))
+
+    def test_burst_coalesced_and_hidden_deferred(self):
+        """A burst of changes refreshes the visible panel once; the hidden one waits until shown"""
+        signals = get_app_signals()
+        for _ in range(10):
+            signals.emit_contact_change('added', {'callsign': 'W4GNS'})
+        QTest.qWait(100)
+        self.assertEqual((self.visible.refreshes, self.hidden.refreshes), (2, 0))
+
+        self.tabs.setCurrentWidget(self.hidden)
+        self.assertEqual(self.hidden.refreshes, 1)
+        QTest.qWait(50)
+        self.assertEqual((self.visible.refreshes, self.hidden.refreshes), (2, 1))
+
+    def test_flush_budget_yields(self):
+        """Refreshes beyond the time budget are left for the next flush"""
+        scheduler = RefreshScheduler(coalesce_ms=0, budget_ms=0)
+        self.addCleanup(scheduler.deleteLater)
+        panels = [CountingPanel() for _ in range(3)]
+        for panel in panels:
+            self.addCleanup(panel.deleteLater)
+            panel.show()
+            scheduler.register(panel)
+        QTest.qWait(20)  # Let the first-show flushes run
+        start = [p.refreshes for p in panels]
+
+        scheduler.mark_dirty()
+        self.assertEqual(scheduler.flush(), 1)
+        QTest.qWait(50)
+        self.assertEqual([p.refreshes - s for p, s in zip(panels, start)], [1, 1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
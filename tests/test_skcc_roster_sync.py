@@ -0,0 +1,160 @@
+"""
+Unit Tests for Streaming SKCC Roster Sync
+
+Tests incremental CSV/HTML parsing, the staging-table swap, and that the
+live roster stays readable while a download is in progress.
+"""
+
+import unittest
+import logging
+import io
+import sqlite3
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from src.database import skcc_membership
+from src.database.skcc_membership import SKCCMembershipManager
+
+logger = logging.getLogger(__name__)
+
+CSV_ROSTER = "SKCC#,Callsign,Name,JoinDate,Level\n" + "".join(
+    f"{n},K{n}ABC,Member {n},2020-01-01,C\n" for n in range(1, 5001)
+)
+
+HTML_ROSTER = """<html><body><table>
+<tr><th>SKCC#</th><th>Call</th><th>Name</th></tr>
+<tr><td>1</td><td><a href="#">k3y</a></td><td>Key &amp; One</td></tr>
+<tr><td>14276T</td><td>W4GNS</td><td>Gary</td><td>2015-03-02</td><td>T</td></tr>
+<tr><td>x</td><td>BAD</td></tr>
+</table></body></html>"""
+
+
+class FakeResponse(io.RawIOBase):
+    """Binary HTTP response delivering its body in small reads"""
+
+    def __init__(self, body: str, content_type: str = "text/plain"):
+        self._data = io.BytesIO(body.encode("utf-8"))
+        self.headers = {'content-type': content_type}
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._data.read(min(len(buffer), 1000))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class TestRosterParsing(unittest.TestCase):
+    """Test the incremental parsers"""
+
+    def setUp(self):
+        """Set up manager on a temporary database"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = SKCCMembershipManager(str(Path(self.temp_dir.name) / "roster.db"))
+
+    def tearDown(self):
+        """Clean up"""
+        self.temp_dir.cleanup()
+
+    def test_html_split_across_chunks(self):
+        """Rows split at arbitrary chunk boundaries are parsed like the whole page"""
+        chunks = [HTML_ROSTER[i:i + 7] for i in range(0, len(HTML_ROSTER), 7)]
+        members = list(self.manager.iter_roster_html(chunks))
+        self.assertEqual([m['skcc_number'] for m in members], ["1", "14276T"])
+        self.assertEqual(members[0]['call_sign'], "K3Y")
+        self.assertEqual(members[0]['member_name'], "Key & One")
+        self.assertEqual(members[1]['current_suffix'], "T")
+        self.assertEqual(self.manager.parse_roster_html(HTML_ROSTER), members)
+
+    def test_stream_detects_format(self):
+        """CSV and HTML downloads are both recognized from the stream"""
+        csv_members = list(self.manager.iter_roster_stream(FakeResponse(CSV_ROSTER)))
+        self.assertEqual(len(csv_members), 5000)
+        self.assertEqual(csv_members[-1]['call_sign'], "K5000ABC")
+
+        html_members = list(self.manager.iter_roster_stream(FakeResponse(HTML_ROSTER), "text/html"))
+        self.assertEqual(len(html_members), 2)
+
+    def test_mislabelled_content_type_falls_back(self):
+        """A roster parsing to nothing in the guessed format is parsed in the other one"""
+        csv_members = list(self.manager.iter_roster_stream(FakeResponse(CSV_ROSTER), "text/html"))
+        self.assertEqual(len(csv_members), 5000)
+        self.assertEqual(csv_members[0]['call_sign'], "K1ABC")
+
+        table = HTML_ROSTER[HTML_ROSTER.index("<tr>"):HTML_ROSTER.index("</table>")]
+        preamble = "SKCC roster " * 6000 + "\n"  # Pushes the table past the sniffed head
+        html_members = list(self.manager.iter_roster_stream(FakeResponse(preamble + table), "text/plain"))
+        self.assertEqual(len(html_members), 2)
+
+
+class TestRosterSwap(unittest.TestCase):
+    """Test staging and the atomic table swap"""
+
+    def setUp(self):
+        """Set up manager with an existing roster"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.temp_dir.name) / "roster.db")
+        self.manager = SKCCMembershipManager(self.db_path)
+        self.manager.load_test_data()
+
+    def tearDown(self):
+        """Clean up"""
+        self.temp_dir.cleanup()
+
+    def test_live_roster_readable_during_sync(self):
+        """Lookups see the old roster until the new one is swapped in"""
+        seen_during_sync = []
+
+        def members():
+            for n in range(1, 3001):
+                if n == 2500:
+                    seen_during_sync.append(self.manager.get_member_by_callsign("W4GNS"))
+                yield {'skcc_number': str(n), 'call_sign': f"K{n}ABC"}
+
+        self.assertEqual(self.manager.replace_roster(members()), 3000)
+        self.assertEqual(seen_during_sync[0]['skcc_number'], "1")
+        self.assertIsNone(self.manager.get_member_by_callsign("W4GNS"))
+        self.assertEqual(self.manager.get_member("2999")['call_sign'], "K2999ABC")
+
+        conn = sqlite3.connect(self.db_path)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE tbl_name='skcc_members'")}
+        conn.close()
+        self.assertNotIn(skcc_membership.STAGING_TABLE, tables)
+        self.assertTrue({"idx_skcc_number", "idx_call_sign", "idx_last_updated"} <= indexes)
+
+    def test_failed_parse_keeps_roster(self):
+        """A download that yields no members fails but leaves the live roster in place"""
+        with patch("src.utils.network.urlopen_with_retries", return_value=FakeResponse("<html>maintenance</html>", "text/html")):
+            self.assertFalse(self.manager.sync_membership_data(force_refresh=True))
+        self.assertEqual(self.manager.get_member_count(), 10)
+
+    def test_sync_streams_download(self):
+        """A full sync replaces the roster from the streamed response"""
+        with patch("src.utils.network.urlopen_with_retries", return_value=FakeResponse(CSV_ROSTER, "text/csv")):
+            self.assertTrue(self.manager.sync_membership_data(force_refresh=True))
+        self.assertEqual(self.manager.get_member_count(), 5000)
+        self.assertEqual(self.manager.get_member_by_callsign("K42ABC")['skcc_number'], "42")
+
+    def test_cache_members_batch(self):
+        """Batch caching upserts all rows and skips entries without a number"""
+        cached = self.manager.cache_members_batch([
+            {'skcc_number': '1', 'call_sign': 'W4GNS', 'member_name': 'Renamed'},
+            {'call_sign': 'NONUM'},
+            {'skcc_number': '11', 'call_sign': 'K1NEW'},
+        ])
+        self.assertEqual(cached, 2)
+        self.assertEqual(self.manager.get_member('1')['member_name'], 'Renamed')
+        self.assertEqual(self.manager.get_member_count(), 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Unit Tests for the SKCC Skimmer Output Reader
+
+Tests single-pass spot line parsing and the bounded console reader.
+"""
+
+import unittest
+import logging
+import io
+import tempfile
+
+from src.skcc import SkccSkimmerSubprocess, parse_spot_line
+from src.skcc.skcc_skimmer_subprocess import DIAGNOSTIC_LINE_COUNT
+
+logger = logging.getLogger(__name__)
+
+
+class FakeProcess:
+    """Finished subprocess whose stdout is an in-memory stream"""
+
+    def __init__(self, output: str):
+        self.stdout = io.StringIO(output)
+
+    def poll(self):
+        return 0
+
+
+class TestSpotLineParsing(unittest.TestCase):
+    """Test classification and field extraction"""
+
+    def test_rbn_spot(self):
+        """An RBN spot line yields all of its fields"""
+        spot = parse_spot_line("12:34:56 + W4GNS (14276T) on 14055.5 kHz CW 18 dB 22 WPM by K3LR")
+        self.assertEqual(spot.callsign, "W4GNS")
+        self.assertEqual(spot.skcc_number, "14276T")
+        self.assertAlmostEqual(spot.frequency, 14.0555)
+        self.assertEqual((spot.mode, spot.strength, spot.speed), ("CW", 18, 22))
+        self.assertEqual(spot.reporter, "SKCC_Skimmer")
+
+    def test_fields_in_any_order(self):
+        """Optional fields are found regardless of their position"""
+        spot = parse_spot_line("0412Z K3Y 25 WPM 7.055 MHz ft8 (1)")
+        self.assertEqual((spot.callsign, spot.skcc_number, spot.frequency), ("K3Y", "1", 7.055))
+        self.assertEqual(spot.mode, "FT8")
+        self.assertIsNone(spot.speed)
+
+    def test_sked_entry_without_frequency(self):
+        """A line with only an SKCC number becomes a Sked spot"""
+        spot = parse_spot_line("1830Z N0ABC (20001S) QRS please")
+        self.assertEqual((spot.callsign, spot.frequency, spot.mode), ("N0ABC", 0.0, "CW"))
+
+    def test_non_spot_lines(self):
+        """Status messages and lines without a number or frequency are rejected"""
+        for line in (
+            "12:00:00 Connected to RBN",
+            "1200Z Retrieving Centurion ROSTER page",
+            "Reading ADI file",
+            "",
+        ):
+            self.assertIsNone(parse_spot_line(line), line)
+            self.assertFalse(SkccSkimmerSubprocess._is_spot_line(line), line)
+        self.assertIsNone(parse_spot_line("12:34:56 + W4GNS heard"))
+        self.assertTrue(SkccSkimmerSubprocess._is_spot_line("1200Z W4GNS (1) CW"))
+
+
+class TestOutputReader(unittest.TestCase):
+    """Test the console reader thread body"""
+
+    def setUp(self):
+        """Create a manager pointing at an empty directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.skimmer = SkccSkimmerSubprocess(skimmer_path=self.temp_dir.name)
+
+    def tearDown(self):
+        """Clean up"""
+        self.temp_dir.cleanup()
+
+    def test_emits_spots_and_bounds_history(self):
+        """Spots are delivered as SKCCSpot objects and only recent lines are kept"""
+        lines = []
+        for i in range(1000):
+            lines.append(f"Reading line {i}")
+            lines.append(f"12:00:{i % 60:02d} + K{i}ABC ({i}C) on 14.055 MHz CW")
+        self.skimmer.process = FakeProcess("\n".join(lines) + "\n\n")
+        spots = []
+        self.skimmer.on_spot = spots.append
+
+        self.skimmer._read_output()
+
+        self.assertEqual(len(spots), 1000)
+        self.assertEqual(spots[-1].callsign, "K999ABC")
+        self.assertEqual(spots[-1].skcc_number, "999C")
+        recent = self.skimmer.recent_output()
+        self.assertEqual(len(recent), DIAGNOSTIC_LINE_COUNT)
+        self.assertEqual(recent[-1], lines[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
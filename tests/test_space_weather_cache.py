@@ -0,0 +1,223 @@
+"""
+Unit Tests for Cached, Concurrent Space Weather Fetching
+
+Runs against a local stub HTTP server that supports ETag/Last-Modified
+revalidation and records how requests arrive.
+"""
+
+import unittest
+import logging
+import json
+import tempfile
+import threading
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+from src.services import space_weather_fetcher
+from src.services.space_weather_fetcher import SpaceWeatherFetcher
+from src.utils.http_cache import HTTPDiskCache
+
+logger = logging.getLogger(__name__)
+
+LAST_MODIFIED = "Mon, 01 Sep 2025 00:00:00 GMT"
+
+STUB_RESPONSES = {
+    "/scales.json": {"0": {"TimeStamp": "2025-09-01 00:00:00",
+                           "G": {"Scale": "0", "Text": "none"},
+                           "R": {"Scale": "0", "Text": "none"},
+                           "S": {"Scale": "0", "Text": "none"}}},
+    "/kp.json": [["time_tag", "kp", "observed", "noaa_scale"],
+                 ["2025-09-01 00:00:00", "2.33", "observed", None]],
+    "/f107.json": [{"time_tag": "2025-09-01", "flux": 165.0}],
+    "/sunspots.json": [{"time-tag": "2025-08", "smoothed_ssn": 120.5}],
+    "/solar.xml": "<solar><solardata><sunspots>142</sunspots></solardata></solar>",
+    "/stations.json": [{"station": {"code": "WP937"}, "mufd": 21.4}],
+    "/areas.json": [{"time_tag": "2025-09-01", "area": 520}],
+}
+
+# Server freshness lifetimes sent by the stub
+STUB_CACHE_CONTROL = {"/stations.json": "max-age=600"}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves STUB_RESPONSES with validators and honors conditional requests"""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            payload = STUB_RESPONSES.get(self.path)
+            if payload is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            etag = f'"{self.path}-v1"'
+            if self.headers.get("If-None-Match") == etag:
+                with server.lock:
+                    server.not_modified += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            body = payload if isinstance(payload, str) else json.dumps(payload)
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", LAST_MODIFIED)
+            if self.path in STUB_CACHE_CONTROL:
+                self.send_header("Cache-Control", STUB_CACHE_CONTROL[self.path])
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format, *args):
+        """Keep test output quiet"""
+
+
+class StubServerTestCase(unittest.TestCase):
+    """Base class starting a stub server and a temporary cache directory"""
+
+    def setUp(self):
+        """Start stub server"""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.not_modified = 0
+        self.server.delay = 0.0
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Stop stub server"""
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def url(self, path: str) -> str:
+        """Full stub URL for a path"""
+        return self.base_url + path
+
+
+class TestHTTPDiskCache(StubServerTestCase):
+    """Test freshness, revalidation and offline fallback"""
+
+    def test_fresh_entry_skips_network(self):
+        """A second fetch within max_age is served from the cache"""
+        cache = HTTPDiskCache(self.cache_dir, "test")
+        first = cache.fetch(self.url("/kp.json"), max_age=60)
+        second = cache.fetch(self.url("/kp.json"), max_age=60)
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_stale_entry_revalidated(self):
+        """A stale entry sends If-None-Match and accepts 304 Not Modified"""
+        cache = HTTPDiskCache(self.cache_dir, "test")
+        body = cache.fetch(self.url("/kp.json"), max_age=0)
+        entry = cache.get_cached(self.url("/kp.json"))
+        self.assertEqual(entry.last_modified, LAST_MODIFIED)
+
+        self.assertEqual(cache.fetch(self.url("/kp.json"), max_age=0), body)
+        self.assertEqual(self.server.not_modified, 1)
+
+    def test_cache_survives_restart(self):
+        """A new cache instance serves the stored body offline"""
+        HTTPDiskCache(self.cache_dir, "test").fetch(self.url("/scales.json"), max_age=60)
+        reopened = HTTPDiskCache(self.cache_dir, "test")
+        body = reopened.fetch(self.url("/scales.json"), max_age=0, offline=True)
+        self.assertIn("TimeStamp", body)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_outage_serves_stale_copy(self):
+        """When the server is unreachable the stale body is returned"""
+        cache = HTTPDiskCache(self.cache_dir, "test", timeout=2)
+        body = cache.fetch(self.url("/f107.json"), max_age=0)
+        self.server.shutdown()
+        self.server.server_close()
+        self.assertEqual(cache.fetch(self.url("/f107.json"), max_age=0), body)
+
+    def test_missing_without_cache_raises(self):
+        """Offline with nothing cached raises URLError"""
+        cache = HTTPDiskCache(self.cache_dir, "test")
+        with self.assertRaises(urllib.error.URLError):
+            cache.fetch(self.url("/kp.json"), max_age=60, offline=True)
+        with self.assertRaises(urllib.error.URLError):
+            cache.fetch(self.url("/missing.json"), max_age=60)
+
+
+class TestSpaceWeatherFetcherCache(StubServerTestCase):
+    """Test SpaceWeatherFetcher against the stub endpoints"""
+
+    def setUp(self):
+        """Point the NOAA/HamQSL endpoints at the stub server"""
+        super().setUp()
+        endpoints = {
+            "NOAA_SCALES": "/scales.json",
+            "NOAA_KP_FORECAST": "/kp.json",
+            "NOAA_F107_FLUX": "/f107.json",
+            "NOAA_SUNSPOTS": "/sunspots.json",
+            "HAMQSL_SOLAR_XML": "/solar.xml",
+        }
+        # Stub endpoints keep the max age of the endpoint they stand in for
+        max_ages = {self.url(path): space_weather_fetcher.ENDPOINT_MAX_AGE[getattr(space_weather_fetcher, name)]
+                    for name, path in endpoints.items()}
+        patchers = [patch.dict(space_weather_fetcher.ENDPOINT_MAX_AGE, max_ages)]
+        patchers += [patch.object(space_weather_fetcher, name, self.url(path)) for name, path in endpoints.items()]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.fetcher = SpaceWeatherFetcher(cache_dir=self.cache_dir)
+        self.addCleanup(self.fetcher.close)
+
+    def test_refresh_fetches_concurrently(self):
+        """A full refresh overlaps requests and fetches each endpoint once"""
+        self.server.delay = 0.2
+        data = self.fetcher.get_all_conditions()
+
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertEqual(len(self.server.requests), len(set(self.server.requests)))
+        self.assertAlmostEqual(data['kp_index'], 2.33)
+        self.assertEqual(data['solar_flux_index'], 165.0)
+        self.assertEqual(data['sunspot_count'], 142)
+        self.assertEqual(data['sunspot_ssn'], 120.5)
+
+    def test_unlisted_endpoint_uses_server_lifetime(self):
+        """URLs without a configured max age follow Cache-Control, else revalidate"""
+        for _ in range(2):
+            self.fetcher._fetch_json(self.url("/stations.json"))
+            self.fetcher._fetch_json(self.url("/areas.json"))
+        self.assertEqual(self.server.requests.count("/stations.json"), 1)
+        self.assertEqual(self.server.requests.count("/areas.json"), 2)
+        self.assertEqual(self.server.not_modified, 1)
+
+    def test_last_known_conditions_offline(self):
+        """Last known data is available from a new fetcher without the network"""
+        self.assertIsNone(self.fetcher.get_last_known_conditions())
+        self.fetcher.get_all_conditions()
+        self.server.shutdown()
+
+        restarted = SpaceWeatherFetcher(cache_dir=self.cache_dir)
+        data = restarted.get_last_known_conditions()
+        self.assertIsNotNone(data)
+        self.assertAlmostEqual(data['kp_index'], 2.33)
+        self.assertEqual(data['solar_flux_index'], 165.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit Tests for the Spot Consensus Aggregator
+
+Tests clustering of multi-skimmer reports, in-place updates and expiry.
+"""
+
+import unittest
+import logging
+from datetime import datetime, timedelta, timezone
+
+from src.skcc import SKCCSpot, SpotAggregator
+
+logger = logging.getLogger(__name__)
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def report(callsign, freq, reporter, snr, seconds=0, wpm=20, skcc=None):
+    """Build a spot as a skimmer would report it"""
+    return SKCCSpot(
+        callsign=callsign, frequency=freq, mode="CW", grid=None, reporter=reporter,
+        strength=snr, speed=wpm, timestamp=START + timedelta(seconds=seconds), skcc_number=skcc,
+    )
+
+
+class TestSpotAggregator(unittest.TestCase):
+    """Test clustering and the consensus summary"""
+
+    def setUp(self):
+        """Create aggregator with a 10 minute window"""
+        self.aggregator = SpotAggregator(tolerance_khz=0.5, window_seconds=600)
+
+    def test_reports_merge_into_one_cluster(self):
+        """Near-identical frequencies from different skimmers become one signal"""
+        snrs = [12, 30, 18, 6, 24]
+        for i, snr in enumerate(snrs):
+            cluster, created = self.aggregator.add(
+                report("w4gns", 14.0550 + (i - 2) * 0.0002, f"SK{i}", snr, seconds=i, wpm=20 + i)
+            )
+            self.assertEqual(created, i == 0)
+
+        self.assertEqual(len(self.aggregator), 1)
+        self.assertIs(self.aggregator.clusters()[0], cluster)
+        self.assertEqual(cluster.callsign, "W4GNS")
+        self.assertEqual(cluster.reporter_count, 5)
+        self.assertEqual((cluster.strength, cluster.reporter), (30, "SK1"))
+        self.assertEqual(cluster.median_strength, 18)
+        self.assertEqual(cluster.speed, 22)
+        self.assertAlmostEqual(cluster.frequency, 14.055)
+        self.assertEqual((cluster.first_seen, cluster.last_seen), (START, START + timedelta(seconds=4)))
+
+    def test_repeat_from_same_reporter_replaces_it(self):
+        """A skimmer reporting again updates its entry instead of adding one"""
+        self.aggregator.add(report("K3Y", 7.026, "SK1", 10))
+        cluster, _ = self.aggregator.add(report("K3Y", 7.026, "SK1", 15, seconds=60, skcc="1"))
+        self.assertEqual(cluster.reporter_count, 1)
+        self.assertEqual(cluster.strength, 15)
+        self.assertEqual(cluster.skcc_number, "1")
+
+    def test_separate_signals(self):
+        """Different frequencies and callsigns form separate clusters, newest first"""
+        self.aggregator.add(report("W4GNS", 14.055, "SK1", 10))
+        self.aggregator.add(report("W4GNS", 14.0560, "SK1", 10, seconds=1))  # 1 kHz away
+        self.aggregator.add(report("K3Y", 14.055, "SK1", 10, seconds=2))
+        clusters = self.aggregator.clusters()
+        self.assertEqual(len(clusters), 3)
+        self.assertEqual(clusters[0].callsign, "K3Y")
+
+    def test_sliding_window(self):
+        """Old reports leave the summary and silent clusters expire"""
+        self.aggregator.add(report("W4GNS", 14.055, "SK1", 30))
+        self.aggregator.add(report("W4GNS", 14.055, "SK2", 10, seconds=500))
+        self.aggregator.add(report("K3Y", 7.026, "SK1", 10, seconds=100))
+
+        self.assertEqual(self.aggregator.expire(START + timedelta(seconds=750)), 1)
+        cluster = self.aggregator.clusters()[0]
+        self.assertEqual((cluster.callsign, cluster.reporter_count, cluster.strength), ("W4GNS", 1, 10))
+
+        # A report after the window starts a new cluster
+        cluster, created = self.aggregator.add(report("W4GNS", 14.055, "SK3", 10, seconds=2000))
+        self.assertTrue(created)
+
+    def test_max_clusters(self):
+        """The least recently heard signals are dropped beyond the limit"""
+        aggregator = SpotAggregator(max_clusters=3)
+        for i in range(5):
+            aggregator.add(report(f"K{i}ABC", 14.05, "SK1", 10, seconds=i))
+        self.assertEqual([c.callsign for c in aggregator.clusters()], ["K4ABC", "K3ABC", "K2ABC"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Unit Tests for the Day-Partitioned Spot Archive
+
+Tests batched writes, partition retention and the aggregate queries.
+"""
+
+import unittest
+import logging
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from src.rbn import RBNSpot, SpotArchive, SpotStreamService
+from src.rbn.spot_archive import partition_name
+
+logger = logging.getLogger(__name__)
+
+# Early today, so retention (measured from the real clock) keeps the test data
+NOW = datetime.now(timezone.utc).replace(hour=0, minute=30, second=0, microsecond=0)
+
+
+def days_ago(days: int) -> str:
+    """Partition name for a day relative to NOW"""
+    return partition_name(NOW - timedelta(days=days))
+
+
+def spot(callsign, freq, reporter, when, snr=10):
+    """Build a received spot"""
+    return RBNSpot(callsign=callsign, frequency=freq, reporter=reporter, strength=snr, timestamp=when)
+
+
+class TestSpotArchive(unittest.TestCase):
+    """Test storage, retention and queries"""
+
+    def setUp(self):
+        """Create archive in a temporary directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "spot_archive.db"
+        self.archive = SpotArchive(self.db_path, retention_days=30, batch_size=1000)
+
+    def tearDown(self):
+        """Clean up"""
+        self.archive.close()
+        self.temp_dir.cleanup()
+
+    def test_batched_day_partitions(self):
+        """Buffered spots are written in one flush into per-day tables"""
+        for day in range(3):
+            for n in range(10):
+                self.archive.add(spot("W4GNS", 14.055, f"SK{n}", NOW - timedelta(days=day, minutes=n)))
+
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name LIKE 'spots_%' "
+                                      "AND type = 'table'").fetchone()[0], 0)
+        self.assertEqual(self.archive.flush(), 30)
+        self.assertEqual(self.archive.partitions(), [days_ago(2), days_ago(1), days_ago(0)])
+        self.assertEqual(conn.execute(f"SELECT freq, band FROM {days_ago(0)} LIMIT 1").fetchone(), (140550, "20M"))
+        conn.close()
+        self.assertEqual(self.archive.spot_count(days=2, now=NOW), 20)
+
+    def test_batch_size_triggers_write(self):
+        """Reaching the batch size writes without an explicit flush"""
+        archive = SpotArchive(None, batch_size=5)
+        self.addCleanup(archive.close)
+        for n in range(5):
+            archive.add(spot("K3Y", 7.026, f"SK{n}", NOW))
+        self.assertEqual(len(archive.partitions()), 1)
+
+    def test_retention_drops_whole_partitions(self):
+        """Partitions older than the retention period are dropped as tables"""
+        for day in (0, 29, 30, 45):
+            self.archive.add(spot("W4GNS", 14.055, "SK1", NOW - timedelta(days=day)))
+        self.archive.flush()  # Creating partitions applies retention
+        self.assertEqual(self.archive.partitions(), [days_ago(29), days_ago(0)])
+        self.assertEqual(self.archive.enforce_retention(NOW + timedelta(days=1)), 1)
+
+        reopened = SpotArchive(self.db_path, retention_days=30)
+        self.assertEqual(reopened.partitions(), [days_ago(0)])
+        reopened.close()
+
+    def test_skimmers_by_band_hour(self):
+        """Distinct skimmers are counted per band and hour across days"""
+        base = NOW.replace(hour=14)
+        for day in range(3):
+            for reporter in ("SK1", "SK2", "SK3"):
+                self.archive.add(spot("W4GNS", 14.055, reporter, base - timedelta(days=day), snr=5 + day))
+        self.archive.add(spot("W4GNS", 7.026, "SK4", base.replace(hour=2)))
+        self.archive.add(spot("K3Y", 14.055, "SK9", base))
+        self.archive.add(spot("W4GNS", 14.055, "SK5", base - timedelta(days=40)))  # Outside range
+
+        rows = self.archive.skimmers_by_band_hour("w4gns", days=30, now=NOW)
+        self.assertEqual(rows, [
+            {'band': "20M", 'hour': 14, 'skimmers': 3, 'spots': 9, 'best_snr': 7},
+            {'band': "40M", 'hour': 2, 'skimmers': 1, 'spots': 1, 'best_snr': 10},
+        ])
+
+    def test_activity_hours(self):
+        """Hours are counted once per day a member was heard"""
+        for day in range(5):
+            for minute in (0, 10, 20):
+                self.archive.add(spot("K3Y", 7.026, "SK1", NOW.replace(hour=1, minute=minute) - timedelta(days=day)))
+        self.archive.add(spot("K3Y", 7.026, "SK1", NOW.replace(hour=18)))
+        self.assertEqual(self.archive.activity_hours("K3Y", days=30, now=NOW), {1: 5, 18: 1})
+        self.assertEqual(self.archive.activity_hours("NOBODY", now=NOW), {})
+
+    def test_stream_service_records_reports(self):
+        """The stream archives every delivered report, including other skimmers' reports"""
+        service = SpotStreamService([], archive=self.archive)
+        service.publish(spot("W4GNS", 14.055, "SK1", NOW))
+        service.publish(spot("W4GNS", 14.055, "SK1", NOW))  # Same report via a second feed
+        service.publish(spot("W4GNS", 14.055, "SK2", NOW))
+        self.assertEqual(service.duplicate_count, 1)
+        self.assertEqual(self.archive.spot_count(now=NOW), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
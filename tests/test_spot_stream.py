@@ -0,0 +1,186 @@
+"""
+Unit Tests for the asyncio Spot Stream Service
+
+Drives the telnet sources with a local fake cluster server and the skimmer
+source with a stand-in run script.
+"""
+
+import unittest
+import logging
+import socketserver
+import tempfile
+import threading
+from pathlib import Path
+
+from src.rbn import RBNFetcher, RBNConnectionState
+from src.rbn.spot_stream import (
+    SpotDeduplicator,
+    SpotStreamService,
+    RBNTelnetSource,
+    SkimmerProcessSource,
+    TelnetSpotSource,
+    spot_from_cluster_line,
+)
+
+logger = logging.getLogger(__name__)
+
+SPOT_W4GNS = b"DX de K3LR-#:     14025.0  W4GNS          CW    24 dB  23 WPM  CQ      1234Z\r\n"
+SPOT_K3Y = b"DX de W3LPL-#:     7026.1  K3Y            CW     6 dB  18 WPM  CQ      1235Z\r\n"
+
+
+class FakeClusterHandler(socketserver.StreamRequestHandler):
+    """Prompts for a callsign, sends server.chunks, then records commands"""
+
+    def handle(self):
+        server = self.server
+        self.wfile.write(b"Please enter your call: ")
+        with server.lock:
+            server.commands.append(self.rfile.readline().strip().decode())
+        for chunk in server.chunks:
+            self.wfile.write(chunk)
+        for line in self.rfile:
+            with server.lock:
+                server.commands.append(line.strip().decode())
+
+
+class FakeClusterServer(socketserver.ThreadingTCPServer):
+    """Fake telnet cluster node on an ephemeral port"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, chunks):
+        super().__init__(("127.0.0.1", 0), FakeClusterHandler)
+        self.lock = threading.Lock()
+        self.commands = []
+        self.chunks = chunks
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+
+class SpotCollector:
+    """Collects delivered spots and signals when enough have arrived"""
+
+    def __init__(self, expected: int):
+        self.spots = []
+        self.expected = expected
+        self.done = threading.Event()
+
+    def __call__(self, spot):
+        self.spots.append(spot)
+        if len(self.spots) >= self.expected:
+            self.done.set()
+
+
+class TestSpotParsing(unittest.TestCase):
+    """Test line conversion and deduplication"""
+
+    def test_cluster_line(self):
+        """A "DX de" line becomes a spot with the frequency in MHz"""
+        spot = spot_from_cluster_line(SPOT_K3Y.decode().strip())
+        self.assertEqual((spot.callsign, spot.frequency, spot.mode), ("K3Y", 7.0261, "CW"))
+        self.assertEqual((spot.reporter, spot.strength, spot.speed), ("W3LPL-#", 6, 18))
+        self.assertIsNone(spot_from_cluster_line("To ALL de K3LR: hello"))
+
+    def test_dedup_window(self):
+        """Repeats are dropped until the window passes"""
+        now = [0.0]
+        dedup = SpotDeduplicator(window_seconds=60, clock=lambda: now[0])
+        self.assertTrue(dedup.is_new("W4GNS", 14.0251))
+        self.assertFalse(dedup.is_new("w4gns", 14.0249))  # Same kHz
+        self.assertTrue(dedup.is_new("W4GNS", 14.0251, "K3LR-#"))  # Another skimmer
+        self.assertFalse(dedup.is_new("W4GNS", 14.0250, "K3LR-#"))
+        self.assertTrue(dedup.is_new("W4GNS", 14.0270))
+        now[0] = 61.0
+        self.assertTrue(dedup.is_new("W4GNS", 14.0251))
+        self.assertEqual(len(dedup), 1)
+
+
+class TestSpotStreamService(unittest.TestCase):
+    """Test sources running on the service loop"""
+
+    def start_server(self, chunks) -> FakeClusterServer:
+        """Start a fake cluster node"""
+        server = FakeClusterServer(chunks)
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def run_service(self, sources, expected: int) -> SpotCollector:
+        """Run sources until the expected number of spots is delivered"""
+        service = SpotStreamService(sources)
+        collector = SpotCollector(expected)
+        service.set_callbacks(on_spot=collector)
+        self.assertTrue(service.start())
+        collector.done.wait(5)
+        service.stop()
+        self.assertFalse(service.is_running())
+        self.assertEqual(service.state, RBNConnectionState.STOPPED)
+        self.service = service
+        return collector
+
+    def test_rbn_login_and_split_lines(self):
+        """The RBN source logs in and parses lines split across arbitrary chunks"""
+        data = b"Welcome\r\n" + SPOT_W4GNS + SPOT_K3Y
+        server = self.start_server([data[i:i + 7] for i in range(0, len(data), 7)])
+        source = RBNTelnetSource("N0CALL", "127.0.0.1", server.port)
+
+        collector = self.run_service([source], expected=2)
+        self.assertEqual([s.callsign for s in collector.spots], ["W4GNS", "K3Y"])
+        self.assertEqual(source.line_count, 3)
+        self.assertEqual(server.commands[:3], ["N0CALL", "set/raw", "set/nodupes"])
+
+    def test_duplicates_across_sources(self):
+        """The same spot from two feeds is delivered once"""
+        rbn = self.start_server([SPOT_W4GNS])
+        cluster = self.start_server([SPOT_W4GNS, SPOT_K3Y])
+        sources = [
+            RBNTelnetSource("N0CALL", "127.0.0.1", rbn.port),
+            TelnetSpotSource("127.0.0.1", cluster.port, "N0CALL", name="cluster"),
+        ]
+        collector = self.run_service(sources, expected=2)
+        self.assertEqual(sorted(s.callsign for s in collector.spots), ["K3Y", "W4GNS"])
+        stats = self.service.stats()
+        self.assertEqual((stats['spots'], stats['duplicates']), (2, 1))
+        self.assertEqual(stats['sources']['cluster']['spots'], 2)
+
+    def test_skimmer_subprocess(self):
+        """SKCC Skimmer output is read from the child process and parsed"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir)
+            (path / "skcc_skimmer.py").write_text("")
+            (path / "run").write_text(
+                "echo 'Reading ADI file'\n"
+                "echo '12:00:01 + K3Y (1) on 14.055 MHz CW 20 dB'\n"
+                "sleep 10\n"
+            )
+            source = SkimmerProcessSource(path)
+            collector = self.run_service([source], expected=1)
+
+        self.assertEqual(len(collector.spots), 1)
+        spot = collector.spots[0]
+        self.assertEqual((spot.callsign, spot.skcc_number, spot.frequency), ("K3Y", "1", 14.055))
+        self.assertEqual(source.recent_output()[0], "Reading ADI file")
+
+    def test_fetcher_facade(self):
+        """RBNFetcher runs the stream and forwards spots"""
+        server = self.start_server([SPOT_K3Y])
+        fetcher = RBNFetcher()
+        fetcher.HOST, fetcher.PORT = "127.0.0.1", server.port
+        fetcher.my_callsign = "N0CALL"
+        collector = SpotCollector(1)
+        fetcher.set_callbacks(on_spot=collector)
+
+        self.assertTrue(fetcher.start())
+        self.assertTrue(collector.done.wait(5))
+        self.assertTrue(fetcher.is_running())
+        fetcher.stop()
+        self.assertFalse(fetcher.is_running())
+        self.assertEqual(collector.spots[0].callsign, "K3Y")
+
+
+if __name__ == "__main__":
+    unittest.main()
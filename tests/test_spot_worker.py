@@ -0,0 +1,177 @@
+"""
+Unit Tests for the Spot Worker Process and its Shared-Memory Ring Buffer
+
+Runs the worker against a local fake RBN node and reads its spots back
+through the ring, the way the spots widget does.
+"""
+
+import unittest
+import logging
+import socketserver
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+from src.database.skcc_membership import SKCCMembershipManager
+from src.rbn import RBNConnectionState, SpotRingBuffer, SpotWorkerProcess
+from src.rbn import spot_worker
+from src.rbn.spot_ring import HEADER_SIZE, RECORD_SIZE
+from src.skcc.skcc_skimmer_subprocess import SKCCSpot
+
+logger = logging.getLogger(__name__)
+
+SPOTS = (
+    b"DX de K3LR-#:     14025.0  W4GNS          CW    24 dB  23 WPM  CQ      1234Z\r\n"
+    b"DX de W3LPL-#:     7026.1  DL1ABC         CW     6 dB  18 WPM  CQ      1235Z\r\n"
+)
+
+
+class FakeRBNHandler(socketserver.StreamRequestHandler):
+    """Prompts for a callsign, sends the spots, then waits for the client to leave"""
+
+    def handle(self):
+        self.wfile.write(b"Please enter your call: ")
+        self.rfile.readline()
+        self.wfile.write(SPOTS)
+        for _ in self.rfile:
+            pass
+
+
+class FakeRBNServer(socketserver.ThreadingTCPServer):
+    """Fake RBN telnet node on an ephemeral port"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeRBNHandler)
+
+
+def make_spot(callsign: str, frequency: float, **fields) -> SKCCSpot:
+    """SKCCSpot with defaults for the fields a test doesn't care about"""
+    values = dict(
+        mode="CW", grid=None, reporter="K3LR-#", strength=12, speed=22,
+        timestamp=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc), is_skcc=False,
+    )
+    values.update(fields)
+    return SKCCSpot(callsign=callsign, frequency=frequency, **values)
+
+
+class TestSpotRingBuffer(unittest.TestCase):
+    """Test publishing and reading fixed-size records"""
+
+    def make_ring(self, capacity: int) -> SpotRingBuffer:
+        """Create a ring that is freed after the test"""
+        ring = SpotRingBuffer(capacity=capacity, create=True)
+        self.addCleanup(ring.unlink)
+        self.addCleanup(ring.close)
+        return ring
+
+    def test_round_trip(self):
+        """A reader attached by name gets the published fields back"""
+        ring = self.make_ring(8)
+        ring.publish(make_spot("k3y", 14.0551, is_skcc=True, skcc_number="1234T",
+                               grid="FM18", continent="North America"))
+        ring.publish(make_spot("DL1ABC", 7.0261, speed=None))
+        ring.set_state(RBNConnectionState.RUNNING)
+
+        reader = SpotRingBuffer(ring.name)
+        self.addCleanup(reader.close)
+        spots, next_seq, missed = reader.read(0)
+        self.assertEqual((len(spots), next_seq, missed), (2, 2, 0))
+        self.assertEqual(reader.state, RBNConnectionState.RUNNING)
+
+        k3y, dl = spots
+        self.assertEqual((k3y.callsign, k3y.frequency, k3y.skcc_number, k3y.is_skcc), ("K3Y", 14.0551, "1234T", True))
+        self.assertEqual((k3y.grid, k3y.continent, k3y.reporter, k3y.speed), ("FM18", "North America", "K3LR-#", 22))
+        self.assertEqual(k3y.timestamp, datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc))
+        self.assertEqual((dl.speed, dl.skcc_number, dl.continent), (None, None, None))
+        self.assertEqual(reader.read(next_seq), ([], 2, 0))
+
+    def test_overrun_and_torn_records(self):
+        """A reader more than a buffer behind skips ahead; a slot being written is skipped"""
+        ring = self.make_ring(4)
+        for i in range(10):
+            ring.publish(make_spot(f"W{i}AA", 14.0 + i / 1000))
+
+        spots, next_seq, missed = ring.read(0)
+        self.assertEqual([s.callsign for s in spots], ["W6AA", "W7AA", "W8AA", "W9AA"])
+        self.assertEqual((next_seq, missed), (10, 6))
+
+        ring.publish(make_spot("W0XX", 14.1))
+        ring.publish(make_spot("W1XX", 14.2))
+        # Slot of sequence 11 caught mid-write
+        struct.pack_into("<Q", ring._shm.buf, HEADER_SIZE + (10 % 4) * RECORD_SIZE, 0)
+        spots, next_seq, missed = ring.read(10)
+        self.assertEqual([s.callsign for s in spots], ["W1XX"])
+        self.assertEqual((next_seq, missed), (12, 1))
+
+
+class TestSpotWorkerProcess(unittest.TestCase):
+    """Test the worker process end to end"""
+
+    def setUp(self):
+        self.server = FakeRBNServer()
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.db_path = str(Path(temp_dir.name) / "contacts.db")
+        SKCCMembershipManager(self.db_path)  # Creates the roster table
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("INSERT INTO skcc_members (call_sign, skcc_number) VALUES ('W4GNS', '12345T')")
+        conn.commit()
+        conn.close()
+
+    def poll_until(self, worker: SpotWorkerProcess, condition, timeout: float = 20.0) -> list:
+        """Poll the worker like the GUI timer until condition(spots) holds"""
+        spots = []
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            spots.extend(worker.poll())
+            if condition(spots):
+                break
+            time.sleep(0.05)
+        return spots
+
+    def test_spots_enriched_and_worker_restarted(self):
+        """Spots arrive enriched through the ring, and a killed worker comes back"""
+        worker = SpotWorkerProcess({
+            "callsign": "N0CALL",
+            "rbn_host": "127.0.0.1",
+            "rbn_port": self.server.server_address[1],
+            "roster_db_path": self.db_path,
+        }, capacity=64)
+        self.assertTrue(worker.start())
+        self.addCleanup(worker.stop)
+
+        spots = self.poll_until(worker, lambda s: len(s) >= 2)
+        self.assertEqual([s.callsign for s in spots], ["W4GNS", "DL1ABC"])
+        self.assertEqual((spots[0].skcc_number, spots[0].continent), ("12345T", "North America"))
+        self.assertEqual((spots[1].is_skcc, spots[1].continent), (False, "Europe"))
+        self.assertEqual(worker.state, RBNConnectionState.RUNNING)
+
+        worker._process.kill()
+        worker._process.join(5)
+        self.assertEqual(worker.state, RBNConnectionState.ERROR)
+        with mock.patch.object(spot_worker, "RESTART_DELAY_SECONDS", 0):
+            # The restarted worker reconnects; the node resends, but the spots are new to it
+            spots = self.poll_until(worker, lambda s: len(s) >= 2)
+        self.assertEqual(worker.restarts, 1)
+        self.assertEqual(len(spots), 2)
+        self.assertEqual(worker.stats()['spots'], 4)
+
+        worker.stop()
+        self.assertFalse(worker.is_running())
+        self.assertEqual(worker.state, RBNConnectionState.STOPPED)
+
+
+if __name__ == "__main__":
+    unittest.main()
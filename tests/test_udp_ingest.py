@@ -0,0 +1,170 @@
+"""
+Unit Tests for UDP QSO Ingestion
+
+Encodes WSJT-X and N1MM Logger+ broadcasts, checks the parsers, and runs
+the service on loopback sockets against a temporary database.
+"""
+
+import socket
+import struct
+import unittest
+import logging
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from src.database.models import Contact
+from src.database.repository import DatabaseRepository
+from src.integrations.udp_ingest import (
+    WSJTX_LOGGED_ADIF, WSJTX_MAGIC, WSJTX_QSO_LOGGED, QSOIngestService, parse_datagram,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def qstring(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return struct.pack(">I", len(data)) + data
+
+
+def qdatetime(value: datetime) -> bytes:
+    julian_day = value.date().toordinal() + 1721425
+    msecs = ((value.hour * 60 + value.minute) * 60 + value.second) * 1000
+    return struct.pack(">qIB", julian_day, msecs, 1)  # Qt::UTC
+
+
+def wsjtx_message(message_type: int, body: bytes) -> bytes:
+    return struct.pack(">III", WSJTX_MAGIC, 2, message_type) + qstring("WSJT-X") + body
+
+
+def wsjtx_qso_logged(call: str, when: datetime, frequency_hz: int = 7074000) -> bytes:
+    return wsjtx_message(WSJTX_QSO_LOGGED, b"".join([
+        qdatetime(when), qstring(call), qstring("EM73"), struct.pack(">Q", frequency_hz),
+        qstring("FT8"), qstring("-10"), qstring("-12"), qstring("5"), qstring(""), qstring("Bob"),
+        qdatetime(when), qstring(""), qstring("W4GNS"), qstring("EM86"), qstring(""), qstring(""),
+        qstring(""),
+    ]))
+
+
+def wsjtx_logged_adif(call: str, when: datetime) -> bytes:
+    adif = (f"<adif_ver:5>3.1.0<programid:6>WSJT-X<EOH>\n<call:{len(call)}>{call}"
+            f"<qso_date:8>{when:%Y%m%d}<time_on:6>{when:%H%M%S}<band:3>40m"
+            f"<mode:3>FT8<freq:8>7.074000<EOR>")
+    return wsjtx_message(WSJTX_LOGGED_ADIF, qstring(adif))
+
+
+def n1mm_contact(call: str, when: datetime, tag: str = "contactinfo") -> bytes:
+    return (f'<?xml version="1.0" encoding="utf-8"?>\n<{tag}><app>N1MM</app>'
+            f"<contestname>SKCC</contestname><timestamp>{when:%Y-%m-%d %H:%M:%S}</timestamp>"
+            f"<mycall>W4GNS</mycall><band>7</band><rxfreq>702500</rxfreq><txfreq>702500</txfreq>"
+            f"<mode>CW</mode><call>{call}</call><snt>599</snt><rcv>579</rcv></{tag}>").encode("utf-8")
+
+
+class TestParsers(unittest.TestCase):
+    """Test datagram parsing"""
+
+    def test_wsjtx_messages(self):
+        """QSOLogged and LoggedADIF map to the same contact; others are ignored"""
+        when = datetime(2025, 3, 1, 14, 5, 30)
+        logged = parse_datagram(wsjtx_qso_logged("K1ABC", when))
+        self.assertEqual(len(logged), 1)
+        self.assertEqual(logged[0]['callsign'], "K1ABC")
+        self.assertEqual((logged[0]['qso_date'], logged[0]['time_on']), ("20250301", "140530"))
+        self.assertEqual((logged[0]['band'], logged[0]['frequency']), ("40M", "7.074000"))
+        self.assertEqual(logged[0]['station_callsign'], "W4GNS")
+
+        adif = parse_datagram(wsjtx_logged_adif("K1ABC", when))
+        self.assertEqual((adif[0]['callsign'], adif[0]['qso_date'], adif[0]['mode']), ("K1ABC", "20250301", "FT8"))
+
+        heartbeat = wsjtx_message(0, struct.pack(">I", 3) + qstring("2.6.1") + qstring(""))
+        self.assertEqual(parse_datagram(heartbeat), [])
+        with self.assertRaises(ValueError):
+            parse_datagram(wsjtx_qso_logged("K1ABC", when)[:40])
+
+    def test_n1mm_packets(self):
+        """contactinfo becomes a contact; other packets and junk do not"""
+        when = datetime(2025, 3, 1, 14, 5, 30)
+        record, = parse_datagram(n1mm_contact("k2xyz", when))
+        self.assertEqual((record['callsign'], record['band'], record['frequency']), ("K2XYZ", "40M", "7.02500"))
+        self.assertEqual((record['rst_sent'], record['contest_id']), ("599", "SKCC"))
+        self.assertEqual(parse_datagram(n1mm_contact("K2XYZ", when, tag="contactdelete")), [])
+        self.assertEqual(parse_datagram(b"hello"), [])
+        with self.assertRaises(ValueError):
+            parse_datagram(b"<contactinfo><call>K2XYZ</call>")
+
+
+class TestQSOIngestService(unittest.TestCase):
+    """Test the listener end to end on loopback sockets"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db = DatabaseRepository(str(Path(self.temp_dir.name) / "contacts.db"))
+        self.addCleanup(self.db.engine.dispose)
+        self.db.add_contact(Contact(callsign="W1OLD", qso_date="20250301", time_on="1200",
+                                    band="40M", mode="CW"))
+
+    def test_batched_inserts_and_dupes(self):
+        """Every QSO is logged once, in a few transactions with one callback each"""
+        batches = []
+        service = QSOIngestService(self.db, [("127.0.0.1", 0), ("127.0.0.1", 0)],
+                                   batch_size=25, flush_interval=0.2, on_batch=batches.append)
+        self.assertTrue(service.start())
+        self.addCleanup(service.stop)
+        wsjtx_address, n1mm_address = service.bound_addresses
+
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(sender.close)
+        for n in range(60):
+            when = datetime(2025, 3, 2, n // 60, n % 60, 15)
+            # WSJT-X reports each QSO twice
+            sender.sendto(wsjtx_qso_logged(f"K{n}FT", when), wsjtx_address)
+            sender.sendto(wsjtx_logged_adif(f"K{n}FT", when), wsjtx_address)
+            sender.sendto(n1mm_contact(f"N{n}CW", when), n1mm_address)
+        sender.sendto(n1mm_contact("W1OLD", datetime(2025, 3, 1, 12, 0, 0)), n1mm_address)
+
+        deadline = datetime.now().timestamp() + 5
+        while service.stats['datagrams'] < 181 and datetime.now().timestamp() < deadline:
+            service.wait_idle(0.1)
+        self.assertTrue(service.wait_idle())
+
+        self.assertEqual(service.stats['imported'], 120)
+        self.assertEqual(service.stats['duplicates'], 61)
+        self.assertEqual(self.db.get_contact_count(), 121)
+        self.assertEqual(sum(result['imported'] for result in batches), 120)
+        self.assertEqual(len(batches), service.stats['batches'])
+        self.assertLessEqual(len(batches), 12)
+
+    def test_stop_writes_queued_records(self):
+        """Records queued before stop() are still written"""
+        service = QSOIngestService(self.db, [("127.0.0.1", 0)], flush_interval=5.0)
+        self.assertTrue(service.start())
+        for n in range(10):
+            service.submit(n1mm_contact(f"N{n}CW", datetime(2025, 3, 3, 10, n, 0)))
+        service.stop()
+        self.assertFalse(service.is_running())
+        self.assertEqual(self.db.get_contact_count(), 11)
+
+    def test_outside_changes_reload_keys(self):
+        """Contacts added or deleted outside the service are seen after a change signal"""
+        service = QSOIngestService(self.db, [("127.0.0.1", 0)], flush_interval=0.05)
+        self.assertTrue(service.start())
+        self.addCleanup(service.stop)
+
+        self.db.add_contact(Contact(callsign="W2GUI", qso_date="20250304", time_on="0900",
+                                    band="40M", mode="CW"))
+        old = self.db.get_contacts_by_callsign("W1OLD")[0]
+        self.db.delete_contact(old.id)
+        service.on_contacts_changed('added', {'callsign': "W2GUI"})
+        service.on_contacts_changed('deleted', {'callsign': "W1OLD"})
+
+        service.submit(n1mm_contact("W2GUI", datetime(2025, 3, 4, 9, 0, 0)))
+        service.submit(n1mm_contact("W1OLD", datetime(2025, 3, 1, 12, 0, 0)))
+        self.assertTrue(service.wait_idle())
+
+        self.assertEqual(len(self.db.get_contacts_by_callsign("W2GUI")), 1)
+        self.assertEqual(len(self.db.get_contacts_by_callsign("W1OLD")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()